@@ -1,14 +1,22 @@
 """CLI command modules."""
 
+from shift_solver.cli.commands.batch import solve_batch
+from shift_solver.cli.commands.bench import bench
 from shift_solver.cli.commands.generate import generate
 from shift_solver.cli.commands.io_commands import export_schedule, import_data
+from shift_solver.cli.commands.model_stats import model_stats
+from shift_solver.cli.commands.repair import repair
 from shift_solver.cli.commands.samples import generate_samples
 from shift_solver.cli.commands.validate import validate
 
 __all__ = [
+    "bench",
     "generate",
     "generate_samples",
     "import_data",
     "export_schedule",
+    "model_stats",
+    "repair",
+    "solve_batch",
     "validate",
 ]
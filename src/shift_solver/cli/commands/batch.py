@@ -0,0 +1,176 @@
+"""Solve-batch command for comparing what-if scenarios."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import click
+import yaml
+
+from shift_solver.cli.commands.generate import (
+    _calculate_period_dates,
+    _load_shift_types,
+    _to_date,
+)
+from shift_solver.cli.commands.validate import (
+    _load_availability,
+    _load_requests,
+    _load_workers,
+)
+from shift_solver.solver import ShiftSolver
+from shift_solver.solver.batch import Scenario
+
+
+@click.command("solve-batch")
+@click.option(
+    "--scenarios",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="YAML or JSON file listing the scenarios",
+)
+@click.option(
+    "--start-date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="Schedule start date (YYYY-MM-DD)",
+)
+@click.option(
+    "--end-date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="Schedule end date (YYYY-MM-DD)",
+)
+@click.option(
+    "--workers",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Workers CSV file",
+)
+@click.option(
+    "--availability",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Availability CSV file",
+)
+@click.option(
+    "--requests",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Requests CSV file",
+)
+@click.option(
+    "--time-limit",
+    type=int,
+    default=60,
+    show_default=True,
+    help="Time limit in seconds for each scenario",
+)
+@click.option(
+    "--processes",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Scenarios solved in parallel (default: physical core count)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Write the comparison table to this JSON file",
+)
+@click.pass_context
+def solve_batch(
+    ctx: click.Context,
+    scenarios: Path,
+    start_date: datetime,
+    end_date: datetime,
+    workers: Path,
+    availability: Path | None,
+    requests: Path | None,
+    time_limit: int,
+    processes: int | None,
+    output: Path | None,
+) -> None:
+    """Solve what-if scenarios against one base input and compare them.
+
+    The scenarios file holds a list (or a "scenarios" key with a list) of
+    entries with a name and optional deltas:
+
+    \b
+      - name: more_nights
+        workers_required: {night: 2}
+        removed_workers: [W003]
+        availability:
+          - {worker_id: W001, start_date: 2026-12-24, end_date: 2026-12-26}
+    """
+    config_path = ctx.obj.get("config_path")
+    verbose = ctx.obj.get("verbose", 0)
+
+    scenario_list = _load_scenarios(scenarios)
+    click.echo(f"Solving {len(scenario_list)} scenarios")
+
+    start = _to_date(start_date)
+    end = _to_date(end_date)
+    solver = ShiftSolver(
+        workers=_load_workers(workers, {}, verbose),
+        shift_types=_load_shift_types(config_path, verbose),
+        period_dates=_calculate_period_dates(start, end),
+        schedule_id=f"SCH-{start.strftime('%Y%m%d')}",
+        availabilities=_load_availability(availability, verbose),
+        requests=_load_requests(requests, verbose),
+    )
+
+    try:
+        result = solver.solve_batch(
+            scenario_list, time_limit_seconds=time_limit, processes=processes
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    rows = result.table()
+    _print_table(rows)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w") as f:
+            json.dump({"scenarios": rows}, f, indent=2)
+        click.echo(f"Comparison written to: {output}")
+
+
+def _load_scenarios(path: Path) -> list[Scenario]:
+    """Load scenarios from a YAML or JSON file."""
+    try:
+        data = yaml.safe_load(path.read_text())
+        if isinstance(data, dict):
+            data = data.get("scenarios")
+        if not isinstance(data, list) or not data:
+            raise ValueError("expected a non-empty list of scenarios")
+        return [Scenario.from_dict(entry) for entry in data]
+    except Exception as e:
+        raise click.ClickException(f"Error loading scenarios: {e}") from e
+
+
+def _print_table(rows: list[dict[str, Any]]) -> None:
+    """Print the comparison table."""
+    width = max(len("Scenario"), *(len(row["scenario"]) for row in rows))
+    click.echo(
+        f"\n{'Scenario':<{width}}  {'Status':<12} {'Objective':>10} "
+        f"{'Time (s)':>9} {'Min':>4} {'Max':>4} {'Std dev':>8}"
+    )
+    for row in rows:
+        objective = "-" if row["objective"] is None else f"{row['objective']:.0f}"
+        std_dev = "-" if row["std_deviation"] is None else f"{row['std_deviation']:.2f}"
+        click.echo(
+            f"{row['scenario']:<{width}}  {row['status']:<12} {objective:>10} "
+            f"{row['solve_time_seconds']:>9.2f} "
+            f"{_cell(row['min_assignments']):>4} {_cell(row['max_assignments']):>4} "
+            f"{std_dev:>8}"
+        )
+
+
+def _cell(value: Any) -> str:
+    """Format an optional table cell."""
+    return "-" if value is None else str(value)
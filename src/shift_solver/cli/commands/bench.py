@@ -0,0 +1,213 @@
+"""Bench command for the solver benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from shift_solver.cli.commands.generate import _build_output_data
+from shift_solver.solver.benchmark import (
+    PHASES,
+    SCENARIO_FAMILIES,
+    BenchmarkResult,
+    BenchmarkRunner,
+    compare_reports,
+)
+
+if TYPE_CHECKING:
+    from shift_solver.models import Schedule
+
+
+@click.command("bench")
+@click.option(
+    "--family",
+    "families",
+    type=click.Choice(list(SCENARIO_FAMILIES)),
+    multiple=True,
+    help="Scenario family to run (repeatable; default: all)",
+)
+@click.option(
+    "--time-limit",
+    type=float,
+    default=30,
+    show_default=True,
+    help="Search time limit in seconds per scenario",
+)
+@click.option(
+    "--target-gap",
+    type=click.FloatRange(min=0),
+    default=0.01,
+    show_default=True,
+    help="Relative gap for the time-to-target-gap phase",
+)
+@click.option(
+    "--num-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="CP-SAT search workers (default: CP-SAT default)",
+)
+@click.option(
+    "--repeats",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Runs per scenario; timings are medians",
+)
+@click.option(
+    "--deterministic-time",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="CP-SAT deterministic time limit per search (pair with --seed, "
+    "--num-workers and --reproducible for load-independent runs)",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=None,
+    help="CP-SAT random seed",
+)
+@click.option(
+    "--reproducible",
+    is_flag=True,
+    help="Interleave parallel search workers so seeded runs repeat "
+    "(lower search throughput)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Write the JSON report to this file",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Earlier JSON report to check for regressions",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.25,
+    show_default=True,
+    help="Allowed slowdown per phase relative to the baseline",
+)
+@click.option(
+    "--min-delta",
+    type=click.FloatRange(min=0),
+    default=0.05,
+    show_default=True,
+    help="Slowdowns below this many seconds are never regressions",
+)
+def bench(
+    families: tuple[str, ...],
+    time_limit: float,
+    target_gap: float,
+    num_workers: int | None,
+    repeats: int,
+    deterministic_time: float | None,
+    seed: int | None,
+    reproducible: bool,
+    output: Path | None,
+    baseline: Path | None,
+    tolerance: float,
+    min_delta: float,
+) -> None:
+    """Time each solve phase over scaling scenario families.
+
+    Phases are the feasibility check, model build, CP-SAT presolve, time
+    to first solution, time to the target gap, schedule extraction and
+    writing the schedule JSON. With --baseline, exits with an error when a
+    phase is slower than the baseline beyond --tolerance and --min-delta.
+    """
+    baseline_report = _load_report(baseline) if baseline else None
+    scenarios = [
+        scenario
+        for family in families or SCENARIO_FAMILIES
+        for scenario in SCENARIO_FAMILIES[family]
+    ]
+    click.echo(f"Running {len(scenarios)} benchmark scenarios")
+    _print_header()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = BenchmarkRunner(
+            time_limit_seconds=time_limit,
+            target_gap=target_gap,
+            num_workers=num_workers,
+            repeats=repeats,
+            deterministic_time_limit=deterministic_time,
+            random_seed=seed,
+            reproducible=reproducible,
+            persist=lambda schedule: _write_schedule(schedule, Path(tmp)),
+        )
+        report = runner.run(scenarios, on_result=_print_row)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+        click.echo(f"Report written to: {output}")
+
+    if baseline_report is not None:
+        try:
+            regressions = compare_reports(
+                baseline_report, report, tolerance=tolerance, min_seconds=min_delta
+            )
+        except ValueError as e:
+            raise click.ClickException(str(e)) from e
+        if regressions:
+            for regression in regressions:
+                click.echo(f"  REGRESSION {regression.describe()}")
+            raise click.ClickException(
+                f"{len(regressions)} phase regressions against {baseline}"
+            )
+        click.echo(f"No regressions against {baseline}")
+
+
+def _load_report(path: Path) -> dict[str, Any]:
+    """Load a JSON benchmark report."""
+    try:
+        report = json.loads(path.read_text())
+        if not isinstance(report, dict) or "results" not in report:
+            raise ValueError("missing results")
+        if "format_version" not in report:
+            raise ValueError("missing format_version")
+        return report
+    except Exception as e:
+        raise click.ClickException(f"Error loading baseline report: {e}") from e
+
+
+def _write_schedule(schedule: Schedule, directory: Path) -> None:
+    """Write a schedule the way the generate command does."""
+    with open(directory / f"{schedule.schedule_id}.json", "w") as f:
+        json.dump(_build_output_data(schedule), f, indent=2)
+
+
+_COLUMNS = {
+    "feasibility": "Check",
+    "build": "Build",
+    "presolve": "Presolve",
+    "first_solution": "First",
+    "target_gap": "Gap",
+    "extraction": "Extract",
+    "persistence": "Persist",
+}
+
+
+def _print_header() -> None:
+    """Print the timing table header."""
+    phases = " ".join(f"{_COLUMNS[phase]:>8}" for phase in PHASES)
+    click.echo(f"\n{'Scenario':<22} {'Status':<10} {phases}")
+
+
+def _print_row(result: BenchmarkResult) -> None:
+    """Print one scenario's phase timings in seconds."""
+    cells = []
+    for phase in PHASES:
+        seconds = getattr(result.phases, phase)
+        cells.append(f"{'-' if seconds is None else f'{seconds:.3f}':>8}")
+    click.echo(f"{result.scenario.name:<22} {result.status:<10} {' '.join(cells)}")
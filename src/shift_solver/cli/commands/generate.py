@@ -48,6 +48,31 @@ if TYPE_CHECKING:
     default=None,
     help="Custom time limit in seconds",
 )
+@click.option(
+    "--deterministic-time",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="CP-SAT deterministic time limit; with --seed, --num-workers and "
+    "--reproducible the solve repeats exactly regardless of machine load",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=None,
+    help="CP-SAT random seed",
+)
+@click.option(
+    "--reproducible",
+    is_flag=True,
+    help="Interleave parallel search workers so seeded runs repeat "
+    "(lower search throughput)",
+)
+@click.option(
+    "--num-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="CP-SAT search workers (default: CP-SAT default)",
+)
 @click.option(
     "--demo",
     is_flag=True,
@@ -61,6 +86,10 @@ def generate(
     output: Path,
     quick_solve: bool,
     time_limit: int | None,
+    deterministic_time: float | None,
+    seed: int | None,
+    reproducible: bool,
+    num_workers: int | None,
     demo: bool,
 ) -> None:
     """Generate an optimized schedule for the specified date range."""
@@ -99,11 +128,23 @@ def generate(
         schedule_id=f"SCH-{start.strftime('%Y%m%d')}",
     )
 
-    result = solver.solve(time_limit_seconds=solve_time)
+    result = solver.solve(
+        time_limit_seconds=solve_time,
+        num_workers=num_workers,
+        deterministic_time_limit=deterministic_time,
+        random_seed=seed,
+        reproducible=reproducible,
+    )
 
     if result.success:
         click.echo(f"Solution found! Status: {result.status_name}")
         click.echo(f"Solve time: {result.solve_time_seconds:.2f}s")
+        search = result.statistics.get("cp_sat")
+        if verbose and search:
+            click.echo(
+                f"Search: {search['deterministic_time']:.3f} deterministic time, "
+                f"{search['conflicts']} conflicts, {search['branches']} branches"
+            )
 
         schedule = result.schedule
         assert schedule is not None
@@ -141,6 +182,8 @@ def _load_shift_types(config_path: Path | None, verbose: int) -> list[ShiftType]
                     duration_hours=st.duration_hours,
                     is_undesirable=st.is_undesirable,
                     workers_required=st.workers_required,
+                    min_workers=st.min_workers,
+                    max_workers=st.max_workers,
                 )
                 for st in cfg.shift_types
             ]
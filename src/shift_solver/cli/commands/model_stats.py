@@ -0,0 +1,166 @@
+"""Model-stats command for sizing a model before solving it."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import click
+
+from shift_solver.cli.commands.generate import (
+    _calculate_period_dates,
+    _load_shift_types,
+    _to_date,
+)
+from shift_solver.cli.commands.validate import (
+    _load_availability,
+    _load_requests,
+    _load_workers,
+)
+from shift_solver.solver import ModelStats, ShiftSolver
+
+# Presolve rules listed in the summary
+TOP_RULES = 10
+
+
+@click.command("model-stats")
+@click.option(
+    "--start-date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="Schedule start date (YYYY-MM-DD)",
+)
+@click.option(
+    "--end-date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="Schedule end date (YYYY-MM-DD)",
+)
+@click.option(
+    "--workers",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Workers CSV file",
+)
+@click.option(
+    "--availability",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Availability CSV file",
+)
+@click.option(
+    "--requests",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Requests CSV file",
+)
+@click.option(
+    "--time-limit",
+    type=float,
+    default=60,
+    show_default=True,
+    help="Time limit in seconds for presolve",
+)
+@click.option(
+    "--num-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="CP-SAT search workers the memory estimate assumes (default: CPU count)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Write the statistics to this JSON file",
+)
+@click.pass_context
+def model_stats(
+    ctx: click.Context,
+    start_date: datetime,
+    end_date: datetime,
+    workers: Path,
+    availability: Path | None,
+    requests: Path | None,
+    time_limit: float,
+    num_workers: int | None,
+    output: Path | None,
+) -> None:
+    """Report the model size without solving it.
+
+    Builds the model, runs CP-SAT presolve only and prints the variables,
+    constraints and objective terms each constraint adds, the variable
+    domains, what presolve removed and an estimated memory footprint.
+    """
+    config_path = ctx.obj.get("config_path")
+    verbose = ctx.obj.get("verbose", 0)
+
+    start = _to_date(start_date)
+    end = _to_date(end_date)
+    solver = ShiftSolver(
+        workers=_load_workers(workers, {}, verbose),
+        shift_types=_load_shift_types(config_path, verbose),
+        period_dates=_calculate_period_dates(start, end),
+        schedule_id=f"SCH-{start.strftime('%Y%m%d')}",
+        availabilities=_load_availability(availability, verbose),
+        requests=_load_requests(requests, verbose),
+    )
+
+    stats = solver.analyze(time_limit_seconds=time_limit, num_workers=num_workers)
+    _print_stats(stats)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w") as f:
+            json.dump(stats.to_dict(), f, indent=2)
+        click.echo(f"Statistics written to: {output}")
+
+
+def _print_stats(stats: ModelStats) -> None:
+    """Print the per-constraint table and the model summary."""
+    width = max(len("Constraint"), *(len(row.constraint_id) for row in stats.rows))
+    header = (
+        f"{'Constraint':<{width}}  {'Variables':>10} {'Constraints':>11} "
+        f"{'Terms':>10} {'Objective':>9}"
+    )
+    click.echo(f"\n{header}")
+    for row in stats.rows:
+        click.echo(
+            f"{row.constraint_id:<{width}}  {row.variables:>10} "
+            f"{row.constraints:>11} {row.terms:>10} {row.objective_terms:>9}"
+        )
+    click.echo(
+        f"{'Total':<{width}}  {stats.variables:>10} {stats.constraints:>11} "
+        f"{stats.terms:>10} {stats.objective_terms:>9}"
+    )
+
+    click.echo(
+        f"\nDomains: {stats.boolean_variables} Boolean, "
+        f"{stats.integer_variables} integer (largest {stats.max_domain_size} values)"
+    )
+    click.echo(f"Build time: {stats.build_time_seconds:.2f}s")
+
+    presolve = stats.presolve
+    click.echo(f"\nPresolve: {presolve.status} in {presolve.time_seconds:.2f}s")
+    for name in ("variables", "constraints", "terms"):
+        after = getattr(presolve, name)
+        if after is None:
+            continue
+        reduction = stats.reduction(name)
+        removed = "" if reduction is None else f" ({reduction:.0%} removed)"
+        click.echo(f"  {name:<12} {getattr(stats, name):>10} -> {after:>10}{removed}")
+    rules = sorted(presolve.rules.items(), key=lambda item: item[1], reverse=True)
+    for rule, count in rules[:TOP_RULES]:
+        click.echo(f"  {count:>8}x {rule}")
+
+    click.echo(
+        f"\nEstimated memory: {_megabytes(stats.estimated_memory_bytes)} "
+        f"(model {_megabytes(stats.model_bytes)}, "
+        f"{stats.search_workers} x presolved {_megabytes(stats.presolved_model_bytes)})"
+    )
+
+
+def _megabytes(num_bytes: int) -> str:
+    """Format a byte count in MB."""
+    return f"{num_bytes / 1024 / 1024:.1f} MB"
@@ -0,0 +1,157 @@
+"""Repair command for minimally updating a published schedule."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+import click
+
+from shift_solver.cli.commands.generate import _build_output_data
+from shift_solver.cli.commands.validate import (
+    _load_availability,
+    _load_requests,
+    _load_shift_types,
+    _load_workers,
+)
+from shift_solver.cli.helpers import build_schedule_from_json
+from shift_solver.solver import ShiftSolver
+
+
+@click.command()
+@click.option(
+    "--schedule",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Published schedule JSON file to repair",
+)
+@click.option(
+    "--new-availability",
+    type=click.Path(exists=True, path_type=Path),
+    required=True,
+    help="Availability CSV with the changes since publication",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    required=True,
+    help="Output file for the repaired schedule (JSON)",
+)
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Configuration file with shift type definitions",
+)
+@click.option(
+    "--workers",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Workers CSV file",
+)
+@click.option(
+    "--availability",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Availability CSV the schedule was generated with",
+)
+@click.option(
+    "--requests",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Requests CSV file",
+)
+@click.option(
+    "--time-limit",
+    type=int,
+    default=60,
+    show_default=True,
+    help="Time limit in seconds",
+)
+@click.option(
+    "--window",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Extra periods re-optimized on each side of an affected period",
+)
+@click.pass_context
+def repair(
+    ctx: click.Context,
+    schedule: Path,
+    new_availability: Path,
+    output: Path,
+    config: Path | None,
+    workers: Path | None,
+    availability: Path | None,
+    requests: Path | None,
+    time_limit: int,
+    window: int,
+) -> None:
+    """Repair a published schedule with as few changes as possible."""
+    verbose = ctx.obj.get("verbose", 0)
+
+    click.echo(f"Repairing schedule: {schedule}")
+
+    try:
+        with open(schedule) as f:
+            schedule_data = json.load(f)
+    except Exception as e:
+        raise click.ClickException(f"Error reading schedule: {e}") from e
+
+    shift_types = _load_shift_types(config, schedule_data, verbose)
+    worker_list = _load_workers(workers, schedule_data, verbose)
+    availabilities = _load_availability(availability, verbose)
+    request_list = _load_requests(requests, verbose)
+    new_availabilities = _load_availability(new_availability, verbose)
+
+    published = build_schedule_from_json(
+        schedule_data, workers=worker_list, shift_types=shift_types
+    )
+    period_dates = [
+        (date.fromisoformat(p["period_start"]), date.fromisoformat(p["period_end"]))
+        for p in schedule_data.get("periods", [])
+    ]
+    if not period_dates:
+        raise click.ClickException("Schedule has no periods")
+
+    solver = ShiftSolver(
+        workers=worker_list,
+        shift_types=shift_types,
+        period_dates=period_dates,
+        schedule_id=published.schedule_id,
+        availabilities=availabilities,
+        requests=request_list,
+    )
+    result = solver.repair(
+        published,
+        new_availabilities,
+        time_limit_seconds=time_limit,
+        window_periods=window,
+    )
+
+    if not result.success or result.schedule is None:
+        click.echo(f"No repair found. Status: {result.status_name}")
+        raise click.ClickException("Failed to repair schedule")
+
+    stats = result.statistics["repair"]
+    click.echo(f"Repair status: {result.status_name}")
+    click.echo(f"Affected periods: {stats['affected_periods']}")
+    click.echo(f"Changed assignments: {stats['changed_assignments']}")
+    if verbose:
+        for change in stats["changes"]:
+            click.echo(
+                f"  {change['action']}: {change['worker_id']} "
+                f"{change['shift_type_id']} (period {change['period']})"
+            )
+
+    output_data = _build_output_data(result.schedule)
+    output_data["repair"] = stats
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(output_data, f, indent=2)
+
+    click.echo(f"Repaired schedule written to: {output}")
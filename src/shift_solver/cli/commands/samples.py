@@ -5,7 +5,7 @@ from pathlib import Path
 
 import click
 
-from shift_solver.io import SampleGenerator
+from shift_solver.io import BulkSampleGenerator, SampleGenerator
 
 
 @click.command("generate-samples")
@@ -46,6 +46,23 @@ from shift_solver.io import SampleGenerator
     default=None,
     help="Random seed for reproducible generation",
 )
+@click.option(
+    "--bulk",
+    is_flag=True,
+    help="Stream a large benchmark corpus with vectorized sampling",
+)
+@click.option(
+    "--vacations-per-year",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Bulk mode: vacations per worker and year (default: from preset)",
+)
+@click.option(
+    "--requests-per-day",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Bulk mode: requests per worker and day (default: from preset)",
+)
 def generate_samples(
     output_dir: Path,
     industry: str,
@@ -53,6 +70,9 @@ def generate_samples(
     months: int,
     output_format: str,
     seed: int | None,
+    bulk: bool,
+    vacations_per_year: float | None,
+    requests_per_day: float | None,
 ) -> None:
     """Generate sample input files for testing."""
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -61,7 +81,16 @@ def generate_samples(
     click.echo(f"  Workers: {num_workers}")
     click.echo(f"  Duration: {months} months")
 
-    generator = SampleGenerator(industry=industry, seed=seed)
+    generator: SampleGenerator | BulkSampleGenerator
+    if bulk:
+        generator = BulkSampleGenerator(
+            industry=industry,
+            seed=seed or 0,
+            vacations_per_year=vacations_per_year,
+            requests_per_day=requests_per_day,
+        )
+    else:
+        generator = SampleGenerator(industry=industry, seed=seed)
 
     # Calculate date range
     start_date, end_date = _calculate_date_range(months)
@@ -79,12 +108,15 @@ def generate_samples(
     if output_format in ("excel", "both"):
         excel_dir = output_dir / "excel" if output_format == "both" else output_dir
         excel_dir.mkdir(parents=True, exist_ok=True)
-        generator.generate_to_excel(
-            output_file=excel_dir / "sample_data.xlsx",
-            num_workers=num_workers,
-            start_date=start_date,
-            end_date=end_date,
-        )
+        try:
+            generator.generate_to_excel(
+                output_file=excel_dir / "sample_data.xlsx",
+                num_workers=num_workers,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        except ValueError as e:
+            raise click.ClickException(str(e)) from e
         click.echo(f"  Excel file written to: {excel_dir / 'sample_data.xlsx'}")
 
     click.echo("Sample data generation complete!")
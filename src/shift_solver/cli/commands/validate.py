@@ -131,6 +131,8 @@ def _load_shift_types(
                     duration_hours=st.duration_hours,
                     is_undesirable=st.is_undesirable,
                     workers_required=st.workers_required,
+                    min_workers=st.min_workers,
+                    max_workers=st.max_workers,
                 )
                 for st in cfg.shift_types
             ]
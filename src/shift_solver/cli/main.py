@@ -6,10 +6,14 @@ import click
 
 from shift_solver import __version__
 from shift_solver.cli.commands import (
+    bench,
     export_schedule,
     generate,
     generate_samples,
     import_data,
+    model_stats,
+    repair,
+    solve_batch,
     validate,
 )
 from shift_solver.config import ShiftSolverConfig
@@ -138,6 +142,10 @@ cli.add_command(generate_samples)
 cli.add_command(import_data)
 cli.add_command(export_schedule)
 cli.add_command(validate)
+cli.add_command(repair)
+cli.add_command(solve_batch)
+cli.add_command(bench)
+cli.add_command(model_stats)
 
 
 if __name__ == "__main__":
@@ -172,6 +172,8 @@ class ShiftTypeConfig(BaseModel):
     duration_hours: float = Field(gt=0, le=24)
     is_undesirable: bool = Field(default=False)
     workers_required: int = Field(default=1, ge=1)
+    min_workers: int | None = Field(default=None, ge=0)
+    max_workers: int | None = Field(default=None, ge=1)
     required_attributes: dict[str, Any] = Field(default_factory=dict)
     applicable_days: list[int] | None = Field(default=None)
 
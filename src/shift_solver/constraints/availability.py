@@ -58,7 +58,7 @@ class AvailabilityConstraint(BaseConstraint):
         # Build lookup for valid worker IDs
         valid_worker_ids = {w.id for w in workers}
 
-        for availability in availabilities:
+        for idx, availability in enumerate(availabilities):
             # Skip if worker doesn't exist
             if availability.worker_id not in valid_worker_ids:
                 continue
@@ -82,8 +82,29 @@ class AvailabilityConstraint(BaseConstraint):
                         period=period_idx,
                         shift_types=shift_types,
                         specific_shift_id=availability.shift_type_id,
+                        group=self._group(idx, availability),
                     )
 
+    @staticmethod
+    def _group(idx: int, availability: Availability) -> dict[str, Any]:
+        """Assumption group fields for one availability record."""
+        shift = (
+            f" for shift '{availability.shift_type_id}'"
+            if availability.shift_type_id
+            else ""
+        )
+        return {
+            "group": f"availability:{idx}",
+            "message": (
+                f"Worker '{availability.worker_id}' unavailable{shift} from "
+                f"{availability.start_date} to {availability.end_date}"
+            ),
+            "worker_id": availability.worker_id,
+            "shift_type_id": availability.shift_type_id,
+            "start_date": str(availability.start_date),
+            "end_date": str(availability.end_date),
+        }
+
     def _periods_overlap(
         self,
         avail_start: date,
@@ -100,6 +121,7 @@ class AvailabilityConstraint(BaseConstraint):
         period: int,
         shift_types: list[ShiftType],
         specific_shift_id: str | None = None,
+        group: dict[str, Any] | None = None,
     ) -> None:
         """
         Add unavailability constraints for a worker in a period.
@@ -109,7 +131,9 @@ class AvailabilityConstraint(BaseConstraint):
             period: Period index
             shift_types: Available shift types
             specific_shift_id: If set, only block this shift type; else block all
+            group: Assumption group fields of the availability record
         """
+        group = group or {}
         if specific_shift_id:
             # Block only the specific shift type
             try:
@@ -118,8 +142,7 @@ class AvailabilityConstraint(BaseConstraint):
                 )
             except KeyError:
                 return
-            self.model.add(assignment_var == 0)
-            self._constraint_count += 1
+            self._add_hard_constraint(self.model.add(assignment_var == 0), **group)
         else:
             # Block all shift types
             for shift_type in shift_types:
@@ -129,5 +152,4 @@ class AvailabilityConstraint(BaseConstraint):
                     )
                 except KeyError:
                     continue
-                self.model.add(assignment_var == 0)
-                self._constraint_count += 1
+                self._add_hard_constraint(self.model.add(assignment_var == 0), **group)
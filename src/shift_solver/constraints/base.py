@@ -1,7 +1,7 @@
 """Base class for all constraints."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from ortools.sat.python import cp_model
@@ -26,6 +26,25 @@ class ConstraintConfig:
         return self.parameters.get(key, default)
 
 
+@dataclass
+class AssumptionGroup:
+    """A group of hard constraints guarded by one assumption literal.
+
+    Attributes:
+        key: Unique group identifier (e.g. "coverage:day:p3")
+        constraint_id: ID of the constraint that created the group
+        literal: Enforcement literal shared by the group's constraints
+        message: Human-readable description of the group
+        details: Extra fields describing the group (period_index, worker_id...)
+    """
+
+    key: str
+    constraint_id: str
+    literal: cp_model.IntVar
+    message: str
+    details: dict[str, Any] = field(default_factory=dict)
+
+
 class BaseConstraint(ABC):
     """
     Abstract base class for all constraints.
@@ -57,9 +76,13 @@ class BaseConstraint(ABC):
         self.variables = variables
         self.config = config or ConstraintConfig()
         self._constraint_count = 0
-        self._violation_variables: dict[str, cp_model.IntVar] = {}
+        self._violation_variables: dict[str, cp_model.LinearExprT] = {}
         self._violation_priorities: dict[str, int] = {}
         self._violation_variable_types: dict[str, str] = {}
+        # When set, hard constraints are guarded by per-group literals that
+        # can be passed to CP-SAT as assumptions (see assumption_groups)
+        self.track_assumptions = False
+        self._assumption_groups: dict[str, AssumptionGroup] = {}
 
     @property
     def is_enabled(self) -> bool:
@@ -82,7 +105,7 @@ class BaseConstraint(ABC):
         return self._constraint_count
 
     @property
-    def violation_variables(self) -> dict[str, cp_model.IntVar]:
+    def violation_variables(self) -> dict[str, cp_model.LinearExprT]:
         """Get violation variables (for soft constraints)."""
         return self._violation_variables
 
@@ -103,6 +126,11 @@ class BaseConstraint(ABC):
         """
         return self._violation_variable_types
 
+    @property
+    def assumption_groups(self) -> dict[str, AssumptionGroup]:
+        """Get assumption groups created while track_assumptions was set."""
+        return self._assumption_groups
+
     @abstractmethod
     def apply(self, **context: Any) -> None:
         """
@@ -117,9 +145,35 @@ class BaseConstraint(ABC):
         """
         pass
 
-    def _add_hard_constraint(self, _constraint: cp_model.Constraint) -> None:
-        """Add a hard constraint and increment counter."""
+    def _add_hard_constraint(
+        self,
+        constraint: cp_model.Constraint,
+        group: str | None = None,
+        message: str = "",
+        **details: Any,
+    ) -> None:
+        """
+        Count a hard constraint and, when tracking, guard it by its group.
+
+        Args:
+            constraint: Constraint already added to the model
+            group: Assumption group key; constraints sharing a key share
+                one enforcement literal
+            message: Description of the group (used on first sight)
+            **details: Extra group fields (used on first sight)
+        """
         self._constraint_count += 1
+        if not self.track_assumptions or group is None:
+            return
+        if group not in self._assumption_groups:
+            self._assumption_groups[group] = AssumptionGroup(
+                key=group,
+                constraint_id=self.constraint_id,
+                literal=self.model.new_bool_var(f"assume_{group}"),
+                message=message,
+                details=details,
+            )
+        constraint.only_enforce_if(self._assumption_groups[group].literal)
 
     def _create_violation_var(self, name: str) -> cp_model.IntVar:
         """Create and track a violation variable for soft constraints."""
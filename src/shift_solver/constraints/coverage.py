@@ -24,6 +24,13 @@ class CoverageConstraint(BaseConstraint):
     a shift applies. If a shift has no applicable days in a period, zero
     workers are required.
 
+    Configured soft (is_hard=False), coverage becomes elastic: staffing may
+    fall anywhere in the shift type's [min_workers, max_workers] range, and
+    each worker short of the minimum or over the maximum is a penalized
+    slack unit, so coverage never makes the model infeasible. Slack is
+    weighted by the constraint weight times the understaffing_weight and
+    overstaffing_weight parameters (default: 1 each).
+
     Required context:
         - workers: list[Worker] - available workers
         - shift_types: list[ShiftType] - shift types with workers_required
@@ -41,6 +48,48 @@ class CoverageConstraint(BaseConstraint):
     ) -> None:
         """Initialize coverage constraint."""
         super().__init__(model, variables, config)
+        # (shift_type_id, period) -> staffing equality, so workers_required
+        # can be patched on an already built model (hard mode only)
+        self.staffing_constraints: dict[tuple[str, int], cp_model.Constraint] = {}
+        # (shift_type_id, period) -> (shortfall, excess, min, max) in elastic mode
+        self.staffing_slack: dict[
+            tuple[str, int], tuple[cp_model.IntVar, cp_model.IntVar, int, int]
+        ] = {}
+
+    @property
+    def is_elastic(self) -> bool:
+        """Whether staffing is a penalized [min, max] range, not an equality."""
+        return not self.is_hard
+
+    def coverage_gaps(self, solver: cp_model.CpSolver) -> list[dict[str, Any]]:
+        """
+        List the under- and overstaffed shifts of a solved elastic model.
+
+        Args:
+            solver: Solver that found a solution for the model
+
+        Returns:
+            One dict per (period, shift type) with nonzero slack, holding
+            period_index, shift_type_id, shortfall, excess, min_workers and
+            max_workers; empty in hard mode
+        """
+        gaps = []
+        for (shift_type_id, period), slack in self.staffing_slack.items():
+            shortfall_var, excess_var, minimum, maximum = slack
+            shortfall = solver.Value(shortfall_var)
+            excess = solver.Value(excess_var)
+            if shortfall or excess:
+                gaps.append(
+                    {
+                        "period_index": period,
+                        "shift_type_id": shift_type_id,
+                        "shortfall": shortfall,
+                        "excess": excess,
+                        "min_workers": minimum,
+                        "max_workers": maximum,
+                    }
+                )
+        return gaps
 
     def apply(self, **context: Any) -> None:
         """
@@ -136,8 +185,10 @@ class CoverageConstraint(BaseConstraint):
                     var = self.variables.get_assignment_var(
                         worker.id, period, shift_type.id
                     )
-                    self.model.add(var == 0)
-                    self._constraint_count += 1
+                    self._add_hard_constraint(
+                        self.model.add(var == 0),
+                        **self._group(shift_type, period, required=0),
+                    )
                 return
 
         # Collect assignment variables for all workers for this shift
@@ -146,6 +197,69 @@ class CoverageConstraint(BaseConstraint):
             for worker in workers
         ]
 
+        if self.is_elastic:
+            self._add_elastic_coverage(assignment_vars, shift_type, period)
+            return
+
         # Sum of assignments must equal workers_required
-        self.model.add(sum(assignment_vars) == shift_type.workers_required)
-        self._constraint_count += 1
+        constraint = self.model.add(sum(assignment_vars) == shift_type.workers_required)
+        self.staffing_constraints[(shift_type.id, period)] = constraint
+        self._add_hard_constraint(
+            constraint,
+            **self._group(shift_type, period, required=shift_type.workers_required),
+        )
+
+    def _add_elastic_coverage(
+        self,
+        assignment_vars: list[cp_model.IntVar],
+        shift_type: ShiftType,
+        period: int,
+    ) -> None:
+        """
+        Add penalized shortfall/excess slack around the staffing range.
+
+        Args:
+            assignment_vars: Assignment variables of every worker for the shift
+            shift_type: Shift type requiring coverage
+            period: Period index
+        """
+        minimum, maximum = shift_type.staffing_range
+        staffed = sum(assignment_vars)
+        key = f"{shift_type.id}_p{period}"
+
+        shortfall = self.model.new_int_var(0, minimum, f"coverage_short_{key}")
+        excess = self.model.new_int_var(
+            0, max(len(assignment_vars) - maximum, 0), f"coverage_excess_{key}"
+        )
+        self.model.add(staffed + shortfall >= minimum)
+        self.model.add(staffed - excess <= maximum)
+        self._constraint_count += 2
+
+        self._violation_variables[f"short_{key}"] = shortfall
+        self._violation_priorities[f"short_{key}"] = int(
+            self.config.get_param("understaffing_weight", 1)
+        )
+        self._violation_variables[f"excess_{key}"] = excess
+        self._violation_priorities[f"excess_{key}"] = int(
+            self.config.get_param("overstaffing_weight", 1)
+        )
+        self.staffing_slack[(shift_type.id, period)] = (
+            shortfall,
+            excess,
+            minimum,
+            maximum,
+        )
+
+    @staticmethod
+    def _group(shift_type: ShiftType, period: int, required: int) -> dict[str, Any]:
+        """Assumption group fields for one shift type in one period."""
+        return {
+            "group": f"coverage:{shift_type.id}:p{period}",
+            "message": (
+                f"Coverage of shift '{shift_type.name}' in period {period} "
+                f"({required} worker{'s' if required != 1 else ''} required)"
+            ),
+            "period_index": period,
+            "shift_type_id": shift_type.id,
+            "workers_required": required,
+        }
@@ -10,23 +10,41 @@ from shift_solver.models import ShiftType, Worker
 if TYPE_CHECKING:
     from shift_solver.solver.types import SolverVariables
 
+# Supported values of the "encoding" parameter
+FAIRNESS_ENCODINGS = ("spread", "deviation", "lexicographic")
+
 
 class FairnessConstraint(BaseConstraint):
     """
     Soft constraint for fair distribution of undesirable shifts.
 
-    Minimizes the spread (max - min) of undesirable shift assignments
-    across all workers. This encourages an even distribution of less
-    desirable shifts like nights and weekends.
+    Penalizes uneven distribution of undesirable shift assignments across
+    workers, encouraging an even share of less desirable shifts like
+    nights and weekends. All encodings work on the per-worker total
+    variables (undesirable_totals, or sums of shift_counts when filtering
+    by category):
+
+        - spread: max - min of the totals (default)
+        - deviation: sum over workers of |n * total - sum of totals|, the
+          absolute deviation from the mean scaled by the n workers to stay
+          integral; linear, so its LP relaxation is the tightest
+        - lexicographic: minimize the maximum total first and, among
+          schedules with that maximum, raise the minimum
 
     Required context:
         - workers: list[Worker] - available workers
         - shift_types: list[ShiftType] - shift types (checks is_undesirable)
         - num_periods: int - number of scheduling periods
 
+    Optional context:
+        - worker_active: dict[str, BoolVar] - worker activation literals
+            (staffing optimization); inactive workers are left out of the
+            minimum so the spread is measured over active workers only
+
     Config parameters:
         - categories: list[str] - if set, only count shifts in these categories
             (default: use is_undesirable flag on shift types)
+        - encoding: str - one of FAIRNESS_ENCODINGS (default: "spread")
     """
 
     constraint_id = "fairness"
@@ -46,12 +64,15 @@ class FairnessConstraint(BaseConstraint):
         """
         Apply fairness constraint to the model.
 
-        Creates variables to track the maximum and minimum undesirable
-        shift counts across workers, and a spread variable representing
-        their difference.
+        Creates the variables of the configured encoding over the
+        per-worker undesirable shift totals.
 
         Args:
             **context: Must include workers, shift_types, num_periods
+
+        Raises:
+            ValueError: If the encoding is unknown, or is "deviation" while
+                worker activation literals are in the context
         """
         if not self.is_enabled:
             return
@@ -59,6 +80,20 @@ class FairnessConstraint(BaseConstraint):
         workers: list[Worker] = context["workers"]
         shift_types: list[ShiftType] = context["shift_types"]
         num_periods: int = context["num_periods"]
+        worker_active: dict[str, cp_model.IntVar] = (
+            context.get("worker_active") or {}
+        )
+
+        encoding: str = self.config.get_param("encoding", "spread")
+        if encoding not in FAIRNESS_ENCODINGS:
+            raise ValueError(
+                f"Unknown fairness encoding '{encoding}'. "
+                f"Available: {list(FAIRNESS_ENCODINGS)}"
+            )
+        if encoding == "deviation" and worker_active:
+            raise ValueError(
+                "fairness encoding 'deviation' does not support worker activation"
+            )
 
         if len(workers) < 2:
             # No fairness to balance with 0 or 1 workers
@@ -82,35 +117,37 @@ class FairnessConstraint(BaseConstraint):
         # Calculate the total number of undesirable shifts per worker
         # Using custom count if categories filter is applied, otherwise use pre-built totals
         worker_totals: list[cp_model.IntVar] = []
+        total_worker_ids: list[str] = []
 
         if categories:
-            # Need to compute custom totals for the filtered categories
+            # Sum the per-type counts of the filtered categories
             for worker in workers:
-                assignments = []
-                for period in range(num_periods):
-                    for shift_id in undesirable_shift_ids:
-                        try:
-                            var = self.variables.get_assignment_var(
-                                worker.id, period, shift_id
-                            )
-                            assignments.append(var)
-                        except KeyError:
-                            continue
-
-                if assignments:
+                counts = []
+                for shift_id in sorted(undesirable_shift_ids):
+                    try:
+                        counts.append(
+                            self.variables.get_shift_count_var(worker.id, shift_id)
+                        )
+                    except KeyError:
+                        continue
+
+                if counts:
                     total_var = self.model.new_int_var(
                         0,
-                        len(assignments),
+                        num_periods * len(counts),
                         f"fairness_total_{worker.id}",
                     )
-                    self.model.add(total_var == sum(assignments))
+                    self.model.add(total_var == sum(counts))
+                    self._constraint_count += 1
                     worker_totals.append(total_var)
+                    total_worker_ids.append(worker.id)
         else:
             # Use the pre-computed undesirable_totals from VariableBuilder
             for worker in workers:
                 try:
                     total_var = self.variables.get_undesirable_total_var(worker.id)
                     worker_totals.append(total_var)
+                    total_worker_ids.append(worker.id)
                 except KeyError:
                     continue
 
@@ -120,35 +157,117 @@ class FairnessConstraint(BaseConstraint):
         # Calculate maximum possible undesirable shifts per worker
         max_possible = num_periods * len(undesirable_shift_ids)
 
-        # Create max_undesirable variable (max across all workers)
+        if encoding == "deviation":
+            self._apply_deviation(worker_totals, total_worker_ids, max_possible)
+            return
+
+        max_undesirable = self._add_max(
+            worker_totals, max_possible, exact=encoding == "spread"
+        )
+        min_undesirable = self._add_min(
+            worker_totals,
+            total_worker_ids,
+            max_possible,
+            worker_active,
+            exact=encoding == "spread",
+        )
+        self._violation_variables["max_undesirable"] = max_undesirable
+        self._violation_variables["min_undesirable"] = min_undesirable
+        self._violation_variable_types["max_undesirable"] = "auxiliary"
+        self._violation_variable_types["min_undesirable"] = "auxiliary"
+
+        if encoding == "lexicographic":
+            # One unit of the maximum outweighs any change of the minimum
+            lexicographic = self.model.new_int_var(
+                0, (max_possible + 2) * max_possible, "fairness_lexicographic"
+            )
+            self.model.add(
+                lexicographic
+                == (max_possible + 1) * max_undesirable
+                + (max_possible - min_undesirable)
+            )
+            self._constraint_count += 1
+            self._violation_variables["lexicographic"] = lexicographic
+            self._violation_variable_types["lexicographic"] = "objective_target"
+            return
+
+        # Create spread variable (max - min)
+        spread = self.model.new_int_var(0, max_possible, "fairness_spread")
+        self.model.add(spread == max_undesirable - min_undesirable)
+        self._constraint_count += 1
+
+        # Store spread as the violation variable for objective building
+        self._violation_variables["spread"] = spread
+        self._violation_variable_types["spread"] = "objective_target"
+
+    def _add_max(
+        self, worker_totals: list[cp_model.IntVar], max_possible: int, exact: bool
+    ) -> cp_model.IntVar:
+        """
+        Create the maximum of the totals.
+
+        The linear bounds alone suffice when the maximum is only minimized;
+        exact adds the max equality so the variable always holds the maximum.
+        """
         max_undesirable = self.model.new_int_var(
             0, max_possible, "fairness_max_undesirable"
         )
         for total in worker_totals:
             self.model.add(max_undesirable >= total)
-        self.model.add_max_equality(max_undesirable, worker_totals)
-        self._constraint_count += len(worker_totals) + 1
+        self._constraint_count += len(worker_totals)
+        if exact:
+            self.model.add_max_equality(max_undesirable, worker_totals)
+            self._constraint_count += 1
+        return max_undesirable
 
-        # Create min_undesirable variable (min across all workers)
+    def _add_min(
+        self,
+        worker_totals: list[cp_model.IntVar],
+        total_worker_ids: list[str],
+        max_possible: int,
+        worker_active: dict[str, cp_model.IntVar],
+        exact: bool,
+    ) -> cp_model.IntVar:
+        """
+        Create the minimum of the (active workers') totals.
+
+        Like _add_max, exact adds the min equality; it is skipped with
+        worker activation, where the minimum is pushed up to the smallest
+        active total by the objective instead.
+        """
         min_undesirable = self.model.new_int_var(
             0, max_possible, "fairness_min_undesirable"
         )
+        if worker_active:
+            for worker_id, total in zip(total_worker_ids, worker_totals, strict=True):
+                self.model.add(min_undesirable <= total).only_enforce_if(
+                    worker_active[worker_id]
+                )
+            self._constraint_count += len(worker_totals)
+            return min_undesirable
+
         for total in worker_totals:
             self.model.add(min_undesirable <= total)
-        self.model.add_min_equality(min_undesirable, worker_totals)
-        self._constraint_count += len(worker_totals) + 1
+        self._constraint_count += len(worker_totals)
+        if exact:
+            self.model.add_min_equality(min_undesirable, worker_totals)
+            self._constraint_count += 1
+        return min_undesirable
 
-        # Create spread variable (max - min)
-        spread = self.model.new_int_var(0, max_possible, "fairness_spread")
-        self.model.add(spread == max_undesirable - min_undesirable)
-        self._constraint_count += 1
-
-        # Store spread as the violation variable for objective building
-        self._violation_variables["spread"] = spread
-        self._violation_variables["max_undesirable"] = max_undesirable
-        self._violation_variables["min_undesirable"] = min_undesirable
-
-        # Mark variable types for ObjectiveBuilder
-        self._violation_variable_types["spread"] = "objective_target"
-        self._violation_variable_types["max_undesirable"] = "auxiliary"
-        self._violation_variable_types["min_undesirable"] = "auxiliary"
+    def _apply_deviation(
+        self,
+        worker_totals: list[cp_model.IntVar],
+        total_worker_ids: list[str],
+        max_possible: int,
+    ) -> None:
+        """Add one scaled absolute deviation from the mean per worker."""
+        num_workers = len(worker_totals)
+        grand_total = sum(worker_totals)
+        for worker_id, total in zip(total_worker_ids, worker_totals, strict=True):
+            name = f"fairness_deviation_{worker_id}"
+            deviation = self.model.new_int_var(0, num_workers * max_possible, name)
+            self.model.add(deviation >= num_workers * total - grand_total)
+            self.model.add(deviation >= grand_total - num_workers * total)
+            self._constraint_count += 2
+            self._violation_variables[name] = deviation
+            self._violation_variable_types[name] = "objective_target"
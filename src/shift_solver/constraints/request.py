@@ -48,7 +48,7 @@ class RequestConstraint(BaseConstraint):
         """
         Apply request constraint to the model.
 
-        Creates violation variables for each unfulfilled request.
+        Adds one violation literal per (worker, shift, period, polarity).
         For positive requests, violation occurs when worker is NOT assigned.
         For negative requests, violation occurs when worker IS assigned.
 
@@ -126,7 +126,8 @@ class RequestConstraint(BaseConstraint):
         For negative requests: violation if assigned
 
         When is_hard=True, enforces the request as a hard constraint.
-        When is_hard=False, creates violation variables for soft penalties.
+        When is_hard=False, registers the assignment literal (or its negation)
+        as the violation, weighted by the summed priority of its requests.
         """
         for period in periods:
             try:
@@ -141,37 +142,39 @@ class RequestConstraint(BaseConstraint):
                 # Hard constraint: enforce directly
                 if request.is_positive:
                     # Must be assigned
-                    self.model.add(assignment_var >= 1)
+                    constraint = self.model.add(assignment_var >= 1)
                 else:
                     # Must NOT be assigned
-                    self.model.add(assignment_var == 0)
-                self._constraint_count += 1
+                    constraint = self.model.add(assignment_var == 0)
+                self._add_hard_constraint(
+                    constraint,
+                    group=f"request:{request_idx}",
+                    message=(
+                        f"Hard request: worker '{request.worker_id}' "
+                        f"{'must' if request.is_positive else 'must not'} work "
+                        f"shift '{request.shift_type_id}' from "
+                        f"{request.start_date} to {request.end_date}"
+                    ),
+                    worker_id=request.worker_id,
+                    shift_type_id=request.shift_type_id,
+                    start_date=str(request.start_date),
+                    end_date=str(request.end_date),
+                )
             else:
-                # Soft constraint: create violation variable
+                # Soft constraint: the violation is the assignment literal
+                # itself (negated for positive requests), so no auxiliary
+                # variable is needed. Requests with the same worker, shift,
+                # period and polarity share one term with summed priority.
+                polarity = "pos" if request.is_positive else "neg"
                 violation_name = (
                     f"req_viol_{request.worker_id}_{request.shift_type_id}"
-                    f"_p{period}_r{request_idx}"
+                    f"_p{period}_{polarity}"
                 )
+                if violation_name in self._violation_variables:
+                    self._violation_priorities[violation_name] += request.priority
+                    continue
 
-                if request.is_positive:
-                    # Positive request: violation when NOT assigned
-                    # violation = (assignment == 0)
-                    violation_var = self.model.new_bool_var(violation_name)
-                    self.model.add(assignment_var == 0).only_enforce_if(violation_var)
-                    self.model.add(assignment_var >= 1).only_enforce_if(
-                        violation_var.negated()
-                    )
-                else:
-                    # Negative request: violation when assigned
-                    # violation = (assignment == 1)
-                    violation_var = self.model.new_bool_var(violation_name)
-                    self.model.add(assignment_var >= 1).only_enforce_if(violation_var)
-                    self.model.add(assignment_var == 0).only_enforce_if(
-                        violation_var.negated()
-                    )
-
-                # Store violation variable and priority separately
-                # Priority is stored in _violation_priorities dict for ObjectiveBuilder
-                self._violation_variables[violation_name] = violation_var
+                self._violation_variables[violation_name] = (
+                    assignment_var.negated() if request.is_positive else assignment_var
+                )
                 self._violation_priorities[violation_name] = request.priority
-                self._constraint_count += 2
@@ -86,5 +86,10 @@ class RestrictionConstraint(BaseConstraint):
             )
         except KeyError:
             return
-        self.model.add(assignment_var == 0)
-        self._constraint_count += 1
+        self._add_hard_constraint(
+            self.model.add(assignment_var == 0),
+            group=f"restriction:{worker_id}:{shift_type_id}",
+            message=f"Worker '{worker_id}' is restricted from shift '{shift_type_id}'",
+            worker_id=worker_id,
+            shift_type_id=shift_type_id,
+        )
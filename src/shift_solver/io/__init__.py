@@ -3,7 +3,11 @@
 from shift_solver.io.csv_loader import CSVLoader, CSVLoaderError
 from shift_solver.io.excel_handler import ExcelExporter, ExcelHandlerError, ExcelLoader
 from shift_solver.io.plotly_handler import PlotlyHandlerError, PlotlyVisualizer
-from shift_solver.io.sample_generator import IndustryPreset, SampleGenerator
+from shift_solver.io.sample_generator import (
+    BulkSampleGenerator,
+    IndustryPreset,
+    SampleGenerator,
+)
 
 __all__ = [
     "CSVLoader",
@@ -14,6 +18,7 @@ __all__ = [
     "PlotlyVisualizer",
     "PlotlyHandlerError",
     "SampleGenerator",
+    "BulkSampleGenerator",
     "IndustryPreset",
 ]
 
@@ -0,0 +1,76 @@
+"""Search progress chart: incumbent objective against bound over time."""
+
+import plotly.graph_objects as go
+
+from shift_solver.io.plotly_handler.utils import get_default_layout
+from shift_solver.solver.search_log import SearchTimeline
+
+_INCUMBENT_COLOR = "#1f77b4"
+_BOUND_COLOR = "#d62728"
+
+
+def _extend(
+    points: list[tuple[float, float]], end: float | None
+) -> tuple[list[float], list[float]]:
+    """Split (time, value) points into x/y, holding the last value to end."""
+    x = [t for t, _ in points]
+    y = [value for _, value in points]
+    if points and end is not None and end > x[-1]:
+        x.append(end)
+        y.append(y[-1])
+    return x, y
+
+
+def create_search_progress_chart(timeline: SearchTimeline) -> go.Figure:
+    """Create a step chart of the incumbent objective and the proven bound."""
+    fig = go.Figure()
+    end = timeline.wall_time_seconds
+
+    incumbent = timeline.incumbent_history()
+    subsolvers = [
+        event.subsolver
+        for event in timeline.events
+        if event.kind == "solution" and event.objective is not None
+    ]
+    x, y = _extend(incumbent, end)
+    fig.add_trace(
+        go.Scatter(
+            x=x,
+            y=y,
+            mode="lines+markers",
+            line_shape="hv",
+            name="Incumbent",
+            line_color=_INCUMBENT_COLOR,
+            hovertext=subsolvers + [""] * (len(x) - len(subsolvers)),
+            hovertemplate="%{x:.2f}s: %{y}<br>%{hovertext}<extra></extra>",
+        )
+    )
+
+    x, y = _extend(timeline.bound_history(), end)
+    fig.add_trace(
+        go.Scatter(
+            x=x,
+            y=y,
+            mode="lines",
+            line_shape="hv",
+            name="Bound",
+            line_color=_BOUND_COLOR,
+            hovertemplate="%{x:.2f}s: %{y}<extra></extra>",
+        )
+    )
+
+    if timeline.search_start_seconds is not None:
+        fig.add_vline(
+            x=timeline.search_start_seconds,
+            line_dash="dash",
+            line_color="gray",
+            annotation_text="Search start",
+        )
+
+    layout = get_default_layout(
+        title="Objective and Bound Over Time",
+        xaxis_title="Time (s)",
+        yaxis_title="Objective",
+    )
+    fig.update_layout(**layout)
+    return fig
@@ -1,9 +1,11 @@
 """Sample data generator package."""
 
+from shift_solver.io.sample_generator.bulk import BulkSampleGenerator
 from shift_solver.io.sample_generator.generator import SampleGenerator
 from shift_solver.io.sample_generator.presets import IndustryPreset
 
 __all__ = [
     "SampleGenerator",
+    "BulkSampleGenerator",
     "IndustryPreset",
 ]
@@ -0,0 +1,456 @@
+"""High-volume sample data generation for benchmark corpora."""
+
+from collections.abc import Iterator
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from shift_solver.io.sample_generator.names import FIRST_NAMES, LAST_NAMES
+from shift_solver.io.sample_generator.presets import IndustryPreset
+from shift_solver.models import Availability, SchedulingRequest, ShiftType, Worker
+
+# Workers per generated block; every block draws from its own seeded stream,
+# so a corpus is a prefix of any larger corpus with the same seed
+BLOCK_WORKERS = 1024
+
+# Rows per sheet Excel can hold, header included
+EXCEL_MAX_ROWS = 1_048_576
+
+WORKER_COLUMNS = ["id", "name", "worker_type", "restricted_shifts"]
+SHIFT_TYPE_COLUMNS = [
+    "id",
+    "name",
+    "category",
+    "start_time",
+    "end_time",
+    "duration_hours",
+    "workers_required",
+    "is_undesirable",
+]
+AVAILABILITY_COLUMNS = [
+    "worker_id",
+    "start_date",
+    "end_date",
+    "availability_type",
+    "shift_type_id",
+]
+REQUEST_COLUMNS = [
+    "worker_id",
+    "start_date",
+    "end_date",
+    "request_type",
+    "shift_type_id",
+    "priority",
+]
+
+# Stream identifiers mixed into the seed of each block
+_WORKERS, _AVAILABILITY, _REQUESTS = range(3)
+
+
+class BulkSampleGenerator:
+    """
+    Generates large sample corpora with vectorized NumPy sampling.
+
+    Workers are produced in blocks of BLOCK_WORKERS. Each block draws from
+    a NumPy generator seeded with (seed, table, block), and only one block
+    of rows is held in memory at a time, so CSV and Excel output stream
+    with flat memory regardless of corpus size. Availability records are
+    vacations of 3-10 days at vacations_per_year per worker; requests are
+    single-day shift requests at requests_per_day per worker.
+
+    Usage:
+        gen = BulkSampleGenerator(industry="warehouse", seed=7)
+        gen.generate_to_csv(out_dir, 10_000, date(2026, 1, 1), date(2028, 12, 31))
+        kwargs = gen.solver_inputs(200, date(2026, 1, 5), date(2026, 6, 28))
+    """
+
+    def __init__(
+        self,
+        industry: str = "retail",
+        seed: int = 0,
+        vacations_per_year: float | None = None,
+        requests_per_day: float | None = None,
+        staffing_ratio: float | None = None,
+    ) -> None:
+        """
+        Initialize the generator.
+
+        Args:
+            industry: Industry preset to use (retail, healthcare, warehouse)
+            seed: Seed of every random stream
+            vacations_per_year: Vacations per worker and year (default:
+                twelve times the preset's vacation probability)
+            requests_per_day: Requests per worker and day (default: the
+                preset's request probability per week)
+            staffing_ratio: Scale the preset's workers_required so that one
+                period needs this fraction of the workers (default: keep
+                the preset's requirements)
+
+        Raises:
+            ValueError: If industry is unknown or a rate is negative
+        """
+        self.preset = IndustryPreset.get(industry)
+        self.seed = seed
+        self.vacations_per_year = (
+            12 * self.preset.vacation_probability
+            if vacations_per_year is None
+            else vacations_per_year
+        )
+        self.requests_per_day = (
+            self.preset.request_probability / 7
+            if requests_per_day is None
+            else requests_per_day
+        )
+        if self.vacations_per_year < 0 or self.requests_per_day < 0:
+            raise ValueError("vacations_per_year and requests_per_day must be >= 0")
+        if staffing_ratio is not None and staffing_ratio <= 0:
+            raise ValueError("staffing_ratio must be positive")
+        self.staffing_ratio = staffing_ratio
+
+    def generate_shift_types(self, num_workers: int) -> list[ShiftType]:
+        """
+        Generate shift types from the industry preset.
+
+        Args:
+            num_workers: Corpus size, used to scale requirements when
+                staffing_ratio is set
+
+        Returns:
+            List of ShiftType objects
+        """
+        presets = self.preset.shift_types
+        required = [st["workers_required"] for st in presets]
+        if self.staffing_ratio is not None:
+            demand = self.staffing_ratio * num_workers
+            total = sum(required)
+            required = [max(1, round(demand * r / total)) for r in required]
+        return [
+            ShiftType(
+                id=st["id"],
+                name=st["name"],
+                category=st["category"],
+                start_time=st["start_time"],
+                end_time=st["end_time"],
+                duration_hours=st["duration_hours"],
+                workers_required=workers_required,
+                is_undesirable=st.get("is_undesirable", False),
+            )
+            for st, workers_required in zip(presets, required, strict=True)
+        ]
+
+    def iter_workers(self, num_workers: int) -> Iterator[pd.DataFrame]:
+        """Yield worker rows (WORKER_COLUMNS) one block at a time."""
+        shift_ids = np.array([st["id"] for st in self.preset.shift_types])
+        first_names = np.array(FIRST_NAMES)
+        last_names = np.array(LAST_NAMES)
+        worker_types = np.array(self.preset.worker_types)
+        for block, ids in self._blocks(num_workers):
+            rng = self._rng(_WORKERS, block)
+            n = len(ids)
+            names = np.char.add(
+                np.char.add(first_names[rng.integers(0, len(first_names), n)], " "),
+                last_names[rng.integers(0, len(last_names), n)],
+            )
+            restricted = np.where(
+                rng.random(n) < self.preset.restriction_probability,
+                shift_ids[rng.integers(0, len(shift_ids), n)],
+                "",
+            )
+            yield pd.DataFrame(
+                {
+                    "id": ids,
+                    "name": names,
+                    "worker_type": worker_types[
+                        rng.integers(0, len(worker_types), n)
+                    ],
+                    "restricted_shifts": restricted,
+                }
+            )
+
+    def iter_availability(
+        self, num_workers: int, start_date: date, end_date: date
+    ) -> Iterator[pd.DataFrame]:
+        """Yield vacation rows (AVAILABILITY_COLUMNS) one block at a time."""
+        days = self._horizon_days(start_date, end_date)
+        rate = self.vacations_per_year * days / 365
+        for block, ids in self._blocks(num_workers):
+            rng = self._rng(_AVAILABILITY, block)
+            owners = np.repeat(ids, rng.poisson(rate, len(ids)))
+            n = len(owners)
+            offsets = rng.integers(0, days, n)
+            lengths = rng.integers(3, 10, n, endpoint=True)
+            ends = np.minimum(offsets + lengths - 1, days - 1)
+            yield pd.DataFrame(
+                {
+                    "worker_id": owners,
+                    "start_date": _iso_dates(start_date, offsets),
+                    "end_date": _iso_dates(start_date, ends),
+                    "availability_type": "unavailable",
+                    "shift_type_id": "",
+                }
+            )
+
+    def iter_requests(
+        self, num_workers: int, start_date: date, end_date: date
+    ) -> Iterator[pd.DataFrame]:
+        """Yield single-day request rows (REQUEST_COLUMNS) per block."""
+        days = self._horizon_days(start_date, end_date)
+        shift_ids = np.array([st["id"] for st in self.preset.shift_types])
+        request_types = np.array(["positive", "negative"])
+        for block, ids in self._blocks(num_workers):
+            rng = self._rng(_REQUESTS, block)
+            counts = rng.poisson(self.requests_per_day * days, len(ids))
+            owners = np.repeat(ids, counts)
+            n = len(owners)
+            dates = _iso_dates(start_date, rng.integers(0, days, n))
+            yield pd.DataFrame(
+                {
+                    "worker_id": owners,
+                    "start_date": dates,
+                    "end_date": dates,
+                    "request_type": request_types[rng.integers(0, 2, n)],
+                    "shift_type_id": shift_ids[rng.integers(0, len(shift_ids), n)],
+                    "priority": rng.integers(1, 3, n, endpoint=True),
+                }
+            )
+
+    def generate_to_csv(
+        self,
+        output_dir: Path,
+        num_workers: int,
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, int]:
+        """
+        Stream a corpus to CSV files in the SampleGenerator layout.
+
+        Creates workers.csv, shift_types.csv, availability.csv and
+        requests.csv.
+
+        Returns:
+            Rows written per file name
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _stream_csv(
+            output_dir / "shift_types.csv",
+            iter([_shift_types_frame(self.generate_shift_types(num_workers))]),
+        )
+        return {
+            "workers.csv": _stream_csv(
+                output_dir / "workers.csv", self.iter_workers(num_workers)
+            ),
+            "availability.csv": _stream_csv(
+                output_dir / "availability.csv",
+                self.iter_availability(num_workers, start_date, end_date),
+            ),
+            "requests.csv": _stream_csv(
+                output_dir / "requests.csv",
+                self.iter_requests(num_workers, start_date, end_date),
+            ),
+        }
+
+    def generate_to_excel(
+        self,
+        output_file: Path,
+        num_workers: int,
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, int]:
+        """
+        Stream a corpus to an Excel workbook in the SampleGenerator layout.
+
+        Rows go through a write-only workbook, so memory stays flat, but a
+        sheet holds at most EXCEL_MAX_ROWS - 1 records; use CSV beyond that.
+
+        Returns:
+            Rows written per sheet name
+
+        Raises:
+            ValueError: If a sheet would exceed Excel's row limit
+        """
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        wb = openpyxl.Workbook(write_only=True)
+        counts = {
+            "Workers": _stream_sheet(
+                wb, "Workers", WORKER_COLUMNS, self.iter_workers(num_workers)
+            )
+        }
+        _stream_sheet(
+            wb,
+            "ShiftTypes",
+            SHIFT_TYPE_COLUMNS,
+            iter([_shift_types_frame(self.generate_shift_types(num_workers))]),
+        )
+        counts["Availability"] = _stream_sheet(
+            wb,
+            "Availability",
+            AVAILABILITY_COLUMNS,
+            self.iter_availability(num_workers, start_date, end_date),
+        )
+        counts["Requests"] = _stream_sheet(
+            wb,
+            "Requests",
+            REQUEST_COLUMNS,
+            self.iter_requests(num_workers, start_date, end_date),
+        )
+        wb.save(output_file)
+        return counts
+
+    def solver_inputs(
+        self,
+        num_workers: int,
+        start_date: date,
+        end_date: date,
+        period_length_days: int = 7,
+    ) -> dict[str, Any]:
+        """
+        Build ShiftSolver constructor arguments without going through files.
+
+        Args:
+            num_workers: Number of workers
+            start_date: First day of the first period
+            end_date: Last day of the horizon; a trailing partial period is
+                dropped
+            period_length_days: Days per period
+
+        Returns:
+            workers, shift_types, period_dates, schedule_id, availabilities
+            and requests for ShiftSolver(**kwargs)
+        """
+        days = self._horizon_days(start_date, end_date)
+        period_dates = [
+            (
+                start_date + timedelta(days=offset),
+                start_date + timedelta(days=offset + period_length_days - 1),
+            )
+            for offset in range(0, days - period_length_days + 1, period_length_days)
+        ]
+        workers = [
+            Worker(
+                id=str(row.id),
+                name=str(row.name),
+                worker_type=str(row.worker_type),
+                restricted_shifts=frozenset([str(row.restricted_shifts)])
+                if row.restricted_shifts
+                else frozenset(),
+            )
+            for chunk in self.iter_workers(num_workers)
+            for row in chunk.itertuples(index=False)
+        ]
+        availabilities = [
+            Availability(
+                worker_id=str(row.worker_id),
+                start_date=date.fromisoformat(str(row.start_date)),
+                end_date=date.fromisoformat(str(row.end_date)),
+                availability_type="unavailable",
+            )
+            for chunk in self.iter_availability(num_workers, start_date, end_date)
+            for row in chunk.itertuples(index=False)
+        ]
+        requests = [
+            SchedulingRequest(
+                worker_id=str(row.worker_id),
+                start_date=date.fromisoformat(str(row.start_date)),
+                end_date=date.fromisoformat(str(row.end_date)),
+                request_type=str(row.request_type),  # type: ignore
+                shift_type_id=str(row.shift_type_id),
+                priority=int(str(row.priority)),
+            )
+            for chunk in self.iter_requests(num_workers, start_date, end_date)
+            for row in chunk.itertuples(index=False)
+        ]
+        return {
+            "workers": workers,
+            "shift_types": self.generate_shift_types(num_workers),
+            "period_dates": period_dates,
+            "schedule_id": f"BULK-{self.preset.name}-{num_workers}-{self.seed}",
+            "availabilities": availabilities,
+            "requests": requests,
+        }
+
+    def _blocks(self, num_workers: int) -> Iterator[tuple[int, np.ndarray]]:
+        """Yield (block index, worker IDs) per block of workers."""
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        width = max(3, len(str(num_workers)))
+        for block, first in enumerate(range(0, num_workers, BLOCK_WORKERS)):
+            numbers = range(first + 1, min(first + BLOCK_WORKERS, num_workers) + 1)
+            yield block, np.array([f"W{i:0{width}d}" for i in numbers])
+
+    def _rng(self, stream: int, block: int) -> np.random.Generator:
+        """Random generator of one table's block."""
+        return np.random.default_rng([self.seed, stream, block])
+
+    @staticmethod
+    def _horizon_days(start_date: date, end_date: date) -> int:
+        """Number of days from start_date to end_date inclusive."""
+        days = (end_date - start_date).days + 1
+        if days < 1:
+            raise ValueError("end_date must not be before start_date")
+        return days
+
+
+def _shift_types_frame(shift_types: list[ShiftType]) -> pd.DataFrame:
+    """Shift type rows (SHIFT_TYPE_COLUMNS)."""
+    return pd.DataFrame(
+        [
+            [
+                st.id,
+                st.name,
+                st.category,
+                st.start_time.strftime("%H:%M"),
+                st.end_time.strftime("%H:%M"),
+                st.duration_hours,
+                st.workers_required,
+                str(st.is_undesirable).lower(),
+            ]
+            for st in shift_types
+        ],
+        columns=SHIFT_TYPE_COLUMNS,
+    )
+
+
+def _iso_dates(start_date: date, offsets: np.ndarray) -> np.ndarray:
+    """ISO date strings for day offsets from start_date."""
+    return np.datetime_as_string(np.datetime64(start_date, "D") + offsets, unit="D")
+
+
+def _stream_csv(path: Path, chunks: Iterator[pd.DataFrame]) -> int:
+    """Write DataFrame chunks to one CSV file; returns the rows written."""
+    rows = 0
+    with open(path, "w", newline="") as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, header=i == 0, index=False)
+            rows += len(chunk)
+    return rows
+
+
+def _cell(value: Any) -> Any:
+    """Convert a NumPy scalar to the Python value openpyxl expects."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _stream_sheet(
+    wb: openpyxl.Workbook,
+    title: str,
+    columns: list[str],
+    chunks: Iterator[pd.DataFrame],
+) -> int:
+    """Append DataFrame chunks to a new write-only sheet; returns the rows."""
+    ws = wb.create_sheet(title)
+    ws.append(columns)
+    rows = 0
+    for chunk in chunks:
+        rows += len(chunk)
+        if rows >= EXCEL_MAX_ROWS:
+            raise ValueError(
+                f"{title} exceeds Excel's limit of {EXCEL_MAX_ROWS - 1} rows; "
+                f"write CSV instead"
+            )
+        for row in chunk.itertuples(index=False):
+            ws.append([_cell(value) for value in row])
+    return rows
@@ -23,6 +23,10 @@ class ShiftType:
         is_undesirable: Whether this shift is considered undesirable for fairness
         workers_required: Default number of workers needed per period
         required_attributes: Worker attributes required to work this shift
+        min_workers: Fewest workers acceptable per period under elastic
+            coverage (default: workers_required, capped by max_workers)
+        max_workers: Most workers acceptable per period under elastic
+            coverage (default: workers_required, raised to min_workers)
     """
 
     id: str
@@ -37,6 +41,8 @@ class ShiftType:
         default_factory=dict, compare=False, hash=False
     )
     applicable_days: frozenset[int] | None = None  # 0=Mon, 6=Sun; None=all days
+    min_workers: int | None = None
+    max_workers: int | None = None
 
     def __post_init__(self) -> None:
         """Validate shift type fields after initialization."""
@@ -46,6 +52,16 @@ class ShiftType:
             raise ValueError("duration_hours must be positive")
         if self.workers_required < 1:
             raise ValueError("workers_required must be at least 1")
+        if self.min_workers is not None and self.min_workers < 0:
+            raise ValueError("min_workers cannot be negative")
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if (
+            self.min_workers is not None
+            and self.max_workers is not None
+            and self.min_workers > self.max_workers
+        ):
+            raise ValueError("min_workers cannot exceed max_workers")
         if self.applicable_days is not None:
             invalid = {d for d in self.applicable_days if d < 0 or d > 6}
             if invalid:
@@ -65,6 +81,8 @@ class ShiftType:
             and self.is_undesirable == other.is_undesirable
             and self.workers_required == other.workers_required
             and self.applicable_days == other.applicable_days
+            and self.min_workers == other.min_workers
+            and self.max_workers == other.max_workers
         )
 
     def __hash__(self) -> int:
@@ -80,9 +98,24 @@ class ShiftType:
                 self.is_undesirable,
                 self.workers_required,
                 self.applicable_days,
+                self.min_workers,
+                self.max_workers,
             )
         )
 
+    @property
+    def staffing_range(self) -> tuple[int, int]:
+        """Acceptable (min, max) workers per period under elastic coverage."""
+        minimum = self.min_workers
+        if minimum is None:
+            minimum = self.workers_required
+            if self.max_workers is not None:
+                minimum = min(minimum, self.max_workers)
+        maximum = self.max_workers
+        if maximum is None:
+            maximum = max(self.workers_required, minimum)
+        return minimum, maximum
+
     def is_applicable_on(self, day_of_week: int) -> bool:
         """
         Check if this shift applies on a given day of the week.
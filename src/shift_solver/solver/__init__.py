@@ -1,14 +1,33 @@
 """Solver module for shift-solver."""
 
+from shift_solver.solver.batch import BatchResult, BatchSolver, Scenario
+from shift_solver.solver.benchmark import BenchmarkRunner, BenchmarkScenario
 from shift_solver.solver.constraint_registry import (
     ConstraintRegistration,
     ConstraintRegistry,
     register_builtin_constraints,
 )
+from shift_solver.solver.core_allocator import AllocatedSolver, CoreAllocator
+from shift_solver.solver.greedy import GreedySchedule, GreedyScheduler
+from shift_solver.solver.infeasibility import InfeasibilityExplainer
+from shift_solver.solver.lns import LNSSolver
+from shift_solver.solver.model_stats import ModelAnalyzer, ModelStats
 from shift_solver.solver.objective_builder import ObjectiveBuilder, ObjectiveTerm
+from shift_solver.solver.parallel_build import ParallelModelBuilder
+from shift_solver.solver.portfolio import (
+    DEFAULT_PORTFOLIO,
+    PortfolioConfig,
+    PortfolioSolver,
+    PortfolioStats,
+)
+from shift_solver.solver.reconfigurable import ReconfigurableModel
+from shift_solver.solver.repair import ScheduleRepairer
 from shift_solver.solver.result import SolverResult
+from shift_solver.solver.search_log import SearchTimeline
 from shift_solver.solver.shift_solver import ShiftSolver
 from shift_solver.solver.solution_extractor import SolutionExtractor
+from shift_solver.solver.solution_pool import SolutionPool, SolutionPoolSolver
+from shift_solver.solver.staffing import StaffingOptimizer, StaffingPoint
 from shift_solver.solver.types import SolverVariables
 from shift_solver.solver.variable_builder import VariableBuilder
 
@@ -20,6 +39,31 @@ __all__ = [
     "ObjectiveTerm",
     "ShiftSolver",
     "SolverResult",
+    "SearchTimeline",
+    "PortfolioConfig",
+    "PortfolioSolver",
+    "PortfolioStats",
+    "DEFAULT_PORTFOLIO",
+    "LNSSolver",
+    "ScheduleRepairer",
+    "ReconfigurableModel",
+    "ParallelModelBuilder",
+    "BatchSolver",
+    "CoreAllocator",
+    "AllocatedSolver",
+    "BatchResult",
+    "Scenario",
+    "BenchmarkRunner",
+    "BenchmarkScenario",
+    "ModelAnalyzer",
+    "ModelStats",
+    "SolutionPool",
+    "SolutionPoolSolver",
+    "StaffingOptimizer",
+    "StaffingPoint",
+    "InfeasibilityExplainer",
+    "GreedyScheduler",
+    "GreedySchedule",
     "ConstraintRegistry",
     "ConstraintRegistration",
     "register_builtin_constraints",
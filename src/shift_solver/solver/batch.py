@@ -0,0 +1,325 @@
+"""Batch solving of what-if scenarios that share a base model."""
+
+import multiprocessing
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat.python import cp_model
+
+from shift_solver.constraints.coverage import CoverageConstraint
+from shift_solver.models import Availability
+from shift_solver.solver.core_allocator import CoreAllocator
+from shift_solver.solver.result import SolverResult
+from shift_solver.validation.schedule_validator import ScheduleValidator
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A what-if variation of the base input.
+
+    Attributes:
+        name: Identifier used in the comparison table
+        workers_required: Shift type ID to a new workers_required
+        removed_workers: IDs of workers left out of the schedule
+        availabilities: Extra availability records (holidays, leave)
+    """
+
+    name: str
+    workers_required: dict[str, int] = field(default_factory=dict)
+    removed_workers: frozenset[str] = frozenset()
+    availabilities: tuple[Availability, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Scenario":
+        """Create a scenario from a parsed YAML/JSON mapping."""
+        return cls(
+            name=str(data["name"]),
+            workers_required={
+                str(k): int(v) for k, v in (data.get("workers_required") or {}).items()
+            },
+            removed_workers=frozenset(data.get("removed_workers") or ()),
+            availabilities=tuple(
+                Availability(
+                    worker_id=str(a["worker_id"]),
+                    start_date=date.fromisoformat(str(a["start_date"])),
+                    end_date=date.fromisoformat(str(a["end_date"])),
+                    availability_type=a.get("availability_type", "unavailable"),
+                    shift_type_id=a.get("shift_type_id"),
+                )
+                for a in data.get("availability") or ()
+            ),
+        )
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch of scenarios, in scenario order."""
+
+    results: dict[str, SolverResult] = field(default_factory=dict)
+
+    def table(self) -> list[dict[str, Any]]:
+        """
+        Build the comparison table.
+
+        Returns:
+            One row per scenario with status, objective, solve time and the
+            fairness statistics of its schedule (None when unsolved)
+        """
+        rows = []
+        for name, result in self.results.items():
+            fairness = result.statistics.get("fairness", {})
+            rows.append(
+                {
+                    "scenario": name,
+                    "status": result.status_name,
+                    "objective": result.objective_value,
+                    "solve_time_seconds": round(result.solve_time_seconds, 3),
+                    "min_assignments": fairness.get("min_assignments"),
+                    "max_assignments": fairness.get("max_assignments"),
+                    "std_deviation": fairness.get("std_deviation"),
+                    "average_undesirable": fairness.get("average_undesirable"),
+                }
+            )
+        return rows
+
+
+def _solve_scenario(
+    model_text: str,
+    time_limit_seconds: float,
+    num_workers: int,
+    assignment_indices: list[int],
+) -> tuple[int, str, float | None, float, list[int]]:
+    """Solve one patched model in a worker process."""
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+    model = cp_model.CpModel()
+    model.proto.parse_text_format(model_text)
+    solver = ShiftSolver._create_solver(
+        time_limit_seconds=time_limit_seconds, num_workers=num_workers
+    )
+    start = time.time()
+    status = solver.Solve(model)
+    wall_time = time.time() - start
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return status, solver.StatusName(status), None, wall_time, []
+    values = [int(solver.response_proto.solution[i]) for i in assignment_indices]
+    objective = solver.ObjectiveValue() if model.proto.has_objective() else 0.0
+    return status, solver.StatusName(status), objective, wall_time, values
+
+
+class BatchSolver:
+    """
+    Solves many what-if scenarios against one base input.
+
+    The base model is built once per distinct set of removed workers
+    (headcount changes alter the fairness terms, so they cannot be patched
+    in). Each scenario clones it and patches the clone: coverage equalities
+    get the new workers_required and assignments blocked by the extra
+    availability records get a zero domain. The patched models are solved
+    in a process pool and compared in BatchResult.table().
+
+    Usage:
+        batch = BatchSolver(shift_solver, processes=4)
+        result = batch.solve(scenarios, time_limit_seconds=60)
+        for row in result.table():
+            print(row["scenario"], row["objective"])
+    """
+
+    def __init__(
+        self,
+        shift_solver: "ShiftSolver",
+        processes: int | None = None,
+        num_workers_per_scenario: int = 1,
+        allocator: CoreAllocator | None = None,
+    ) -> None:
+        """
+        Initialize the batch solver.
+
+        Args:
+            shift_solver: Solver holding the base input
+            processes: Size of the process pool (default: the batch's lease
+                of allocator cores divided by num_workers_per_scenario)
+            num_workers_per_scenario: CP-SAT search workers per scenario
+            allocator: Core budget leased from while the pool runs when
+                processes is not given (default: CoreAllocator.shared())
+        """
+        self.shift_solver = shift_solver
+        self.processes = processes
+        self.num_workers_per_scenario = num_workers_per_scenario
+        self.allocator = allocator
+
+    def solve(
+        self, scenarios: Sequence[Scenario], time_limit_seconds: float = 60
+    ) -> BatchResult:
+        """
+        Solve every scenario.
+
+        Args:
+            scenarios: Scenarios with unique names
+            time_limit_seconds: Time limit for each scenario
+
+        Returns:
+            BatchResult with one SolverResult per scenario; solved results
+            carry the schedule's statistics["fairness"]
+
+        Raises:
+            ValueError: If names repeat or a scenario refers to an unknown
+                shift type or worker
+        """
+        names = [scenario.name for scenario in scenarios]
+        if len(set(names)) != len(names):
+            raise ValueError("scenario names must be unique")
+
+        bases: dict[frozenset[str], ShiftSolver] = {}
+        jobs: list[tuple[Scenario, ShiftSolver, str, list[int]]] = []
+        for scenario in scenarios:
+            if scenario.removed_workers not in bases:
+                bases[scenario.removed_workers] = self._base_solver(
+                    scenario.removed_workers
+                )
+            base = bases[scenario.removed_workers]
+            model = self._patched_model(base, scenario)
+            assert base._variables is not None
+            indices = [var.index for *_, var in base._variables.all_assignment_vars()]
+            jobs.append((scenario, base, str(model.proto), indices))
+
+        if self.processes is not None:
+            outcomes = self._run_jobs(jobs, self.processes, time_limit_seconds)
+        else:
+            allocator = self.allocator or CoreAllocator.shared()
+            max_cores = max(len(jobs), 1) * self.num_workers_per_scenario
+            with allocator.lease("batch", max_cores=max_cores) as lease:
+                processes = max(lease.cores // self.num_workers_per_scenario, 1)
+                outcomes = self._run_jobs(jobs, processes, time_limit_seconds)
+
+        batch = BatchResult()
+        for (scenario, base, _, _), outcome in zip(jobs, outcomes, strict=True):
+            batch.results[scenario.name] = self._result(base, outcome)
+        return batch
+
+    def _run_jobs(
+        self,
+        jobs: list[tuple[Scenario, "ShiftSolver", str, list[int]]],
+        processes: int,
+        time_limit_seconds: float,
+    ) -> list[tuple[int, str, float | None, float, list[int]]]:
+        """Solve the patched models in a process pool, in job order."""
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(processes, len(jobs)) or 1, mp_context=ctx
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _solve_scenario,
+                    model_text,
+                    time_limit_seconds,
+                    self.num_workers_per_scenario,
+                    indices,
+                )
+                for _, _, model_text, indices in jobs
+            ]
+            return [future.result() for future in futures]
+
+    def _base_solver(self, removed_workers: frozenset[str]) -> "ShiftSolver":
+        """Build the base model for one headcount."""
+        from shift_solver.solver.shift_solver import ShiftSolver
+
+        kwargs = self.shift_solver._solver_kwargs()
+        unknown = removed_workers - {w.id for w in kwargs["workers"]}
+        if unknown:
+            raise ValueError(f"Unknown workers: {sorted(unknown)}")
+        kwargs["workers"] = [w for w in kwargs["workers"] if w.id not in removed_workers]
+        base = ShiftSolver(**kwargs)
+        base._build_model()
+        return base
+
+    def _patched_model(
+        self, base: "ShiftSolver", scenario: Scenario
+    ) -> cp_model.CpModel:
+        """Clone the base model and apply the scenario's deltas."""
+        assert base._model is not None and base._variables is not None
+        model = base._model.clone()
+
+        shift_ids = {st.id for st in base.shift_types}
+        unknown = set(scenario.workers_required) - shift_ids
+        if unknown:
+            raise ValueError(f"Unknown shift types: {sorted(unknown)}")
+        coverage = base._constraints.get("coverage")
+        if scenario.workers_required and (
+            isinstance(coverage, CoverageConstraint) and coverage.is_elastic
+        ):
+            raise ValueError(
+                "workers_required deltas need hard coverage; "
+                "elastic coverage has no staffing equality to patch"
+            )
+        if isinstance(coverage, CoverageConstraint):
+            for (shift_id, _), constraint in coverage.staffing_constraints.items():
+                if shift_id in scenario.workers_required:
+                    required = scenario.workers_required[shift_id]
+                    domain = model.proto.constraints[constraint.index].linear.domain
+                    domain[0] = domain[1] = required
+
+        proto_vars = model.proto.variables
+        for availability in scenario.availabilities:
+            if availability.availability_type != "unavailable":
+                continue
+            blocked = (
+                [availability.shift_type_id]
+                if availability.shift_type_id
+                else sorted(shift_ids)
+            )
+            for period, (p_start, p_end) in enumerate(base.period_dates):
+                if availability.start_date > p_end or availability.end_date < p_start:
+                    continue
+                for shift_id in blocked:
+                    try:
+                        var = base._variables.get_assignment_var(
+                            availability.worker_id, period, shift_id
+                        )
+                    except KeyError:
+                        continue
+                    domain = proto_vars[var.index].domain
+                    domain[0] = domain[1] = 0
+        return model
+
+    @staticmethod
+    def _result(
+        base: "ShiftSolver",
+        outcome: tuple[int, str, float | None, float, list[int]],
+    ) -> SolverResult:
+        """Turn a worker process outcome into a SolverResult."""
+        status, status_name, objective, wall_time, values = outcome
+        if objective is None:
+            return SolverResult(
+                success=False,
+                schedule=None,
+                status=status,
+                status_name=status_name,
+                solve_time_seconds=wall_time,
+            )
+        assert base._variables is not None
+        assigned = {
+            (w, p, s)
+            for (w, p, s, _), value in zip(
+                base._variables.all_assignment_vars(), values, strict=True
+            )
+            if value
+        }
+        schedule = base._extract_schedule(None, assigned=assigned)
+        validation = ScheduleValidator(schedule).validate()
+        return SolverResult(
+            success=True,
+            schedule=schedule,
+            status=status,
+            status_name=status_name,
+            solve_time_seconds=wall_time,
+            objective_value=objective,
+            statistics={"fairness": validation.statistics["fairness"]},
+        )
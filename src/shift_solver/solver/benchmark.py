@@ -0,0 +1,562 @@
+"""Benchmark suite: scenario families, per-phase timings and regression checks."""
+
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field, replace
+from datetime import date, datetime, timedelta
+from datetime import time as time_of_day
+from importlib.metadata import version
+from typing import Any
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.models import Schedule, SchedulingRequest, ShiftType, Worker
+from shift_solver.solver.search_log import SearchTimeline
+
+# Bump when the report layout changes; reports of another version are not
+# compared
+BENCHMARK_FORMAT_VERSION = 2
+
+# Phases in execution order; presolve is part of the CP-SAT solve, and
+# first_solution and target_gap are measured from the solve's start
+PHASES = (
+    "feasibility",
+    "build",
+    "presolve",
+    "first_solution",
+    "target_gap",
+    "extraction",
+    "persistence",
+)
+
+BENCHMARK_START = date(2026, 1, 5)
+
+# id, category, start, end, hours, undesirable
+_SHIFT_TEMPLATES = (
+    ("day", "day", time_of_day(7, 0), time_of_day(15, 0), 8.0, False),
+    ("evening", "evening", time_of_day(15, 0), time_of_day(23, 0), 8.0, False),
+    ("night", "night", time_of_day(23, 0), time_of_day(7, 0), 8.0, True),
+    ("weekend", "weekend", time_of_day(8, 0), time_of_day(20, 0), 12.0, True),
+)
+
+CONSTRAINT_MIXES: dict[str, dict[str, ConstraintConfig]] = {
+    # Coverage, restrictions and availability only
+    "hard": {
+        "fairness": ConstraintConfig(enabled=False),
+        "request": ConstraintConfig(enabled=False),
+    },
+    # Registry defaults: fairness and requests on top of the hard constraints
+    "default": {},
+    "full": {
+        "frequency": ConstraintConfig(
+            enabled=True,
+            is_hard=False,
+            weight=50,
+            parameters={"max_periods_between": 4},
+        ),
+        "sequence": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+        "max_absence": ConstraintConfig(
+            enabled=True,
+            is_hard=False,
+            weight=50,
+            parameters={"max_periods_absent": 6},
+        ),
+    },
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkScenario:
+    """A synthetic instance, generated deterministically from its fields.
+
+    Attributes:
+        name: Identifier used to match results across reports
+        num_workers: Number of workers
+        num_periods: Number of weekly periods
+        num_shift_types: Number of shift types (cycling day, evening,
+            night and weekend templates)
+        request_density: Expected requests per worker and period
+        constraint_mix: Key of CONSTRAINT_MIXES
+        seed: Seed for requests
+        industry: Generate workers, preset shift types, vacations and
+            requests with BulkSampleGenerator for this industry instead
+            (num_shift_types is then ignored)
+    """
+
+    name: str
+    num_workers: int = 20
+    num_periods: int = 8
+    num_shift_types: int = 3
+    request_density: float = 0.1
+    constraint_mix: str = "default"
+    seed: int = 0
+    industry: str | None = None
+
+    def shift_types(self) -> list[ShiftType]:
+        """Shift types staffed so that every period needs half the workers."""
+        required = max(1, self.num_workers // (2 * self.num_shift_types))
+        shift_types = []
+        for i in range(self.num_shift_types):
+            shift_id, category, start, end, hours, undesirable = _SHIFT_TEMPLATES[
+                i % len(_SHIFT_TEMPLATES)
+            ]
+            if i >= len(_SHIFT_TEMPLATES):
+                shift_id = f"{shift_id}_{i // len(_SHIFT_TEMPLATES) + 1}"
+            shift_types.append(
+                ShiftType(
+                    id=shift_id,
+                    name=shift_id.replace("_", " ").title(),
+                    category=category,
+                    start_time=start,
+                    end_time=end,
+                    duration_hours=hours,
+                    workers_required=required,
+                    is_undesirable=undesirable,
+                )
+            )
+        return shift_types
+
+    def solver_kwargs(self) -> dict[str, Any]:
+        """
+        Build ShiftSolver constructor arguments for this scenario.
+
+        Raises:
+            ValueError: If constraint_mix is unknown
+        """
+        if self.constraint_mix not in CONSTRAINT_MIXES:
+            raise ValueError(
+                f"Unknown constraint mix '{self.constraint_mix}'. "
+                f"Available: {list(CONSTRAINT_MIXES)}"
+            )
+        constraint_configs = dict(CONSTRAINT_MIXES[self.constraint_mix])
+        if self.industry is not None:
+            return self._bulk_solver_kwargs(constraint_configs)
+        rng = random.Random(self.seed)
+        workers = [
+            Worker(id=f"W{i:04d}", name=f"Worker {i}") for i in range(self.num_workers)
+        ]
+        shift_types = self.shift_types()
+        period_dates = [
+            (
+                BENCHMARK_START + timedelta(weeks=p),
+                BENCHMARK_START + timedelta(weeks=p, days=6),
+            )
+            for p in range(self.num_periods)
+        ]
+        requests = []
+        for worker in workers:
+            for start, end in period_dates:
+                if rng.random() < self.request_density:
+                    requests.append(
+                        SchedulingRequest(
+                            worker_id=worker.id,
+                            start_date=start,
+                            end_date=end,
+                            request_type=rng.choice(("positive", "negative")),
+                            shift_type_id=rng.choice(shift_types).id,
+                            priority=rng.randint(1, 3),
+                        )
+                    )
+        return {
+            "workers": workers,
+            "shift_types": shift_types,
+            "period_dates": period_dates,
+            "schedule_id": f"BENCH-{self.name}",
+            "requests": requests,
+            "constraint_configs": constraint_configs,
+        }
+
+    def _bulk_solver_kwargs(
+        self, constraint_configs: dict[str, ConstraintConfig]
+    ) -> dict[str, Any]:
+        """ShiftSolver arguments from the bulk generator's industry preset."""
+        from shift_solver.io.sample_generator.bulk import BulkSampleGenerator
+
+        assert self.industry is not None
+        generator = BulkSampleGenerator(
+            industry=self.industry,
+            seed=self.seed,
+            requests_per_day=self.request_density / 7,
+            staffing_ratio=0.5,
+        )
+        kwargs = generator.solver_inputs(
+            self.num_workers,
+            BENCHMARK_START,
+            BENCHMARK_START + timedelta(weeks=self.num_periods, days=-1),
+        )
+        kwargs["schedule_id"] = f"BENCH-{self.name}"
+        kwargs["constraint_configs"] = constraint_configs
+        return kwargs
+
+
+def _family(
+    family: str, axis: str, values: Sequence[Any], base: BenchmarkScenario
+) -> list[BenchmarkScenario]:
+    """Scenarios varying one field of base, named <family>-<value>."""
+    return [
+        replace(base, name=f"{family}-{value}", **{axis: value}) for value in values
+    ]
+
+
+_BASE_SCENARIO = BenchmarkScenario(name="base")
+
+# Scaling curves, each varying one dimension of the base scenario
+SCENARIO_FAMILIES: dict[str, list[BenchmarkScenario]] = {
+    family: _family(family, axis, values, _BASE_SCENARIO)
+    for family, axis, values in (
+        ("workers", "num_workers", (10, 20, 40, 80)),
+        ("periods", "num_periods", (4, 8, 16, 32)),
+        ("shift_types", "num_shift_types", (2, 3, 4, 6)),
+        ("requests", "request_density", (0.0, 0.1, 0.25, 0.5)),
+        ("constraints", "constraint_mix", tuple(CONSTRAINT_MIXES)),
+        ("industries", "industry", ("retail", "healthcare", "warehouse")),
+    )
+}
+
+
+@dataclass
+class PhaseTimings:
+    """Seconds spent in each phase of one run (None when not reached)."""
+
+    feasibility: float | None = None
+    build: float | None = None
+    presolve: float | None = None
+    first_solution: float | None = None
+    target_gap: float | None = None
+    extraction: float | None = None
+    persistence: float | None = None
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings and outcome of one scenario (medians over the repeats)."""
+
+    scenario: BenchmarkScenario
+    status: str
+    phases: PhaseTimings
+    objective: float | None = None
+    best_bound: float | None = None
+    num_variables: int = 0
+    num_constraints: int = 0
+    repeats: int = 1
+    # CP-SAT effort counters of the last search (see ShiftSolver.solve)
+    search: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the JSON report layout."""
+        return {
+            "scenario": asdict(self.scenario),
+            "status": self.status,
+            "objective": self.objective,
+            "best_bound": self.best_bound,
+            "num_variables": self.num_variables,
+            "num_constraints": self.num_constraints,
+            "repeats": self.repeats,
+            "phases": asdict(self.phases),
+            "search": self.search,
+        }
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A phase that got slower (or a milestone no longer reached)."""
+
+    scenario: str
+    phase: str
+    baseline: float | None
+    current: float | None
+
+    def describe(self) -> str:
+        """One-line summary for reports."""
+        if self.current is None:
+            return f"{self.scenario}: {self.phase} no longer reached"
+        assert self.baseline is not None
+        return (
+            f"{self.scenario}: {self.phase} {self.baseline:.3f}s -> "
+            f"{self.current:.3f}s ({self.current / self.baseline:.2f}x)"
+        )
+
+
+def gap(objective: float, bound: float) -> float:
+    """Relative gap between an incumbent and the best bound."""
+    return abs(objective - bound) / max(1.0, abs(objective))
+
+
+class BenchmarkRunner:
+    """
+    Runs benchmark scenarios and measures each solve phase separately.
+
+    Each run is one ShiftSolver.solve(). Its phases are the pre-solve
+    feasibility check, model build and schedule extraction (as timed by
+    solve() under statistics["phases"]), CP-SAT presolve and the search's
+    time to first solution and to target_gap (read from the search log)
+    and, when persist is given, persisting the schedule. Timings are
+    medians over repeats.
+
+    With reproducible, deterministic_time_limit, random_seed and
+    num_workers set, every search explores the same tree regardless of
+    machine load, so status, objective and the search counters repeat
+    exactly and only the timings vary.
+
+    Usage:
+        runner = BenchmarkRunner(time_limit_seconds=30, target_gap=0.01)
+        report = runner.run(SCENARIO_FAMILIES["workers"])
+        regressions = compare_reports(baseline_report, report)
+    """
+
+    def __init__(
+        self,
+        time_limit_seconds: float = 30,
+        target_gap: float = 0.01,
+        num_workers: int | None = None,
+        repeats: int = 1,
+        persist: Callable[[Schedule], None] | None = None,
+        deterministic_time_limit: float | None = None,
+        random_seed: int | None = None,
+        reproducible: bool = False,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            time_limit_seconds: Search time limit per run
+            target_gap: Relative gap for the time-to-target-gap phase
+            num_workers: CP-SAT search workers
+            repeats: Runs per scenario
+            persist: Writes a schedule; timed as the persistence phase
+            deterministic_time_limit: CP-SAT deterministic time limit per
+                search (time_limit_seconds still caps wall time)
+            random_seed: CP-SAT random seed
+            reproducible: Interleave parallel workers (see ShiftSolver.solve)
+
+        Raises:
+            ValueError: If repeats is below 1
+        """
+        if repeats < 1:
+            raise ValueError("repeats must be at least 1")
+        self.time_limit_seconds = time_limit_seconds
+        self.target_gap = target_gap
+        self.num_workers = num_workers
+        self.repeats = repeats
+        self.persist = persist
+        self.deterministic_time_limit = deterministic_time_limit
+        self.random_seed = random_seed
+        self.reproducible = reproducible
+
+    def run(
+        self,
+        scenarios: Sequence[BenchmarkScenario],
+        on_result: Callable[[BenchmarkResult], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run every scenario.
+
+        Args:
+            scenarios: Scenarios to run, in order
+            on_result: Called with each scenario's result as it completes
+
+        Returns:
+            Versioned JSON-serializable report (see report_metadata)
+        """
+        results = []
+        for scenario in scenarios:
+            result = self.run_scenario(scenario)
+            if on_result is not None:
+                on_result(result)
+            results.append(result.to_dict())
+        return {
+            **report_metadata(),
+            "settings": {
+                "time_limit_seconds": self.time_limit_seconds,
+                "target_gap": self.target_gap,
+                "num_workers": self.num_workers,
+                "repeats": self.repeats,
+                "deterministic_time_limit": self.deterministic_time_limit,
+                "random_seed": self.random_seed,
+                "reproducible": self.reproducible,
+            },
+            "results": results,
+        }
+
+    def run_scenario(self, scenario: BenchmarkScenario) -> BenchmarkResult:
+        """Run one scenario repeats times and keep the median timings."""
+        runs = [self._run_once(scenario) for _ in range(self.repeats)]
+        last = runs[-1]
+        last.phases = PhaseTimings(
+            **{
+                phase: _median([getattr(run.phases, phase) for run in runs])
+                for phase in PHASES
+            }
+        )
+        last.repeats = self.repeats
+        return last
+
+    def _run_once(self, scenario: BenchmarkScenario) -> BenchmarkResult:
+        """Run all phases of one scenario once."""
+        from shift_solver.solver.shift_solver import ShiftSolver
+
+        with ShiftSolver(**scenario.solver_kwargs()) as ss:
+            solved = ss.solve(
+                time_limit_seconds=self.time_limit_seconds,
+                num_workers=self.num_workers,
+                explain_infeasibility=False,
+                search_timeline=True,
+                deterministic_time_limit=self.deterministic_time_limit,
+                random_seed=self.random_seed,
+                reproducible=self.reproducible,
+            )
+        measured = solved.statistics["phases"]
+        phases = PhaseTimings(
+            feasibility=measured["feasibility"],
+            build=measured.get("build"),
+            extraction=measured.get("extraction"),
+        )
+        if solved.status_name == "INFEASIBLE_PRE_SOLVE":
+            return BenchmarkResult(
+                scenario=scenario, status="PRESOLVE_INFEASIBLE", phases=phases
+            )
+
+        timeline = solved.search_timeline
+        assert timeline is not None
+        phases.presolve = timeline.presolve_seconds
+        result = BenchmarkResult(
+            scenario=scenario,
+            status=solved.status_name,
+            phases=phases,
+            num_variables=solved.statistics["model"]["variables"],
+            num_constraints=solved.statistics["model"]["constraints"],
+            search=solved.statistics["cp_sat"],
+        )
+        if not solved.success or solved.objective_value is None:
+            return result
+
+        result.objective = solved.objective_value
+        result.best_bound = timeline.best_bound
+        phases.first_solution, phases.target_gap = _milestones(
+            timeline, self.target_gap
+        )
+        if (
+            phases.target_gap is None
+            and result.best_bound is not None
+            and gap(result.objective, result.best_bound) <= self.target_gap
+        ):
+            # Closed by the final bound after the last logged improvement
+            phases.target_gap = measured["search"]
+
+        if self.persist is not None:
+            assert solved.schedule is not None
+            start = time.perf_counter()
+            self.persist(solved.schedule)
+            phases.persistence = time.perf_counter() - start
+        return result
+
+
+def _milestones(
+    timeline: SearchTimeline, target_gap: float
+) -> tuple[float | None, float | None]:
+    """Seconds to the first solution and to target_gap in a search log."""
+    first_solution = next(
+        (event.time_seconds for event in timeline.events if event.kind == "solution"),
+        None,
+    )
+    target_reached = next(
+        (
+            event.time_seconds
+            for event in timeline.events
+            if event.objective is not None
+            and event.bound is not None
+            and gap(event.objective, event.bound) <= target_gap
+        ),
+        None,
+    )
+    return first_solution, target_reached
+
+
+def _median(values: list[float | None]) -> float | None:
+    """Median of the measured values; None if any run missed the phase."""
+    if any(value is None for value in values):
+        return None
+    return statistics.median(value for value in values if value is not None)
+
+
+def report_metadata() -> dict[str, Any]:
+    """Format version and environment of a benchmark report."""
+    from shift_solver import __version__
+
+    return {
+        "format_version": BENCHMARK_FORMAT_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "shift_solver_version": __version__,
+        "git_commit": _git_commit(),
+        "ortools_version": version("ortools"),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _git_commit() -> str | None:
+    """Commit of the working tree the benchmark runs from, if any."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    tolerance: float = 0.25,
+    min_seconds: float = 0.05,
+) -> list[Regression]:
+    """
+    Flag phases that got slower between two reports.
+
+    A phase regresses when it takes more than (1 + tolerance) times its
+    baseline time and at least min_seconds longer, or when a milestone the
+    baseline reached (first solution, target gap) is no longer reached.
+    Scenarios are matched by name; ones missing from either report are
+    skipped.
+
+    Raises:
+        ValueError: If the reports have different format versions
+    """
+    versions = {baseline.get("format_version"), current.get("format_version")}
+    if len(versions) != 1:
+        raise ValueError(
+            "Cannot compare benchmark reports of format versions "
+            f"{sorted(map(str, versions))}"
+        )
+    baseline_results = {
+        result["scenario"]["name"]: result for result in baseline["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        name = result["scenario"]["name"]
+        before = baseline_results.get(name)
+        if before is None:
+            continue
+        for phase in PHASES:
+            old = before["phases"].get(phase)
+            new = result["phases"].get(phase)
+            if old is None:
+                continue
+            if new is None or (
+                new > old * (1 + tolerance) and new - old >= min_seconds
+            ):
+                regressions.append(
+                    Regression(scenario=name, phase=phase, baseline=old, current=new)
+                )
+    return regressions
@@ -0,0 +1,361 @@
+"""Process-wide allocation of CPU cores to concurrent CP-SAT solves."""
+
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ortools.sat.python import cp_model
+
+from shift_solver.solver.result import SolverResult
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+# A resized run is not restarted when less time than this is left; the new
+# search would spend most of it in presolve again
+MIN_RESTART_SECONDS = 5.0
+
+_CPU_TOPOLOGY = Path("/sys/devices/system/cpu")
+
+
+def physical_core_count() -> int:
+    """
+    Count the physical cores this process may run on.
+
+    Hyperthread siblings share one core and count once. Without CPU
+    topology information (non-Linux hosts) every logical CPU counts.
+    """
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = list(range(os.cpu_count() or 1))
+    cores = set()
+    for cpu in cpus:
+        topology = _CPU_TOPOLOGY / f"cpu{cpu}" / "topology"
+        try:
+            cores.add((topology / "core_cpus_list").read_text().strip())
+        except OSError:
+            cores.add(str(cpu))
+    return max(1, len(cores))
+
+
+@dataclass
+class CoreLease:
+    """
+    Cores granted to one run by a CoreAllocator.
+
+    Attributes:
+        name: Label shown in the allocation (e.g. "solver-run-12")
+        max_cores: Upper bound on the run's cores (None = no bound)
+        cores: Cores the run currently uses (its CP-SAT num_workers)
+        target: Cores the allocator wants the run to use
+        resizes: Times the run switched to a new target
+        started_at: time.time() when the lease was acquired
+        resized: Set while target differs from cores
+    """
+
+    name: str
+    max_cores: int | None = None
+    cores: int = 0
+    target: int = 0
+    resizes: int = 0
+    started_at: float = field(default_factory=time.time)
+    resized: threading.Event = field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
+
+
+class CoreAllocator:
+    """
+    Divides a budget of cores among concurrently running solves.
+
+    Every active lease gets an equal share of the budget (less when its
+    max_cores is lower, the rest going to the others). Shares are
+    recomputed whenever a lease is acquired or released; runs whose share
+    changed see their resized event set and switch at their next restart
+    (see AllocatedSolver). With more runs than cores every run keeps one
+    core, so the machine is oversubscribed rather than runs queued.
+
+    Usage:
+        allocator = CoreAllocator.shared()
+        with allocator.lease("nightly", max_cores=8) as lease:
+            result = solver.solve(num_workers=lease.cores)
+    """
+
+    _shared: ClassVar["CoreAllocator | None"] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, total_cores: int | None = None) -> None:
+        """
+        Initialize the allocator.
+
+        Args:
+            total_cores: Cores to divide (default: physical_core_count())
+
+        Raises:
+            ValueError: If total_cores is below 1
+        """
+        if total_cores is not None and total_cores < 1:
+            raise ValueError("total_cores must be at least 1")
+        self.total_cores = total_cores or physical_core_count()
+        self._leases: list[CoreLease] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "CoreAllocator":
+        """Return the process-wide allocator, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def acquire(self, name: str, max_cores: int | None = None) -> CoreLease:
+        """
+        Register a run and grant it its share of the budget.
+
+        Args:
+            name: Label shown in the allocation
+            max_cores: Upper bound on the run's cores
+
+        Returns:
+            CoreLease whose cores the run should use
+
+        Raises:
+            ValueError: If max_cores is below 1
+        """
+        if max_cores is not None and max_cores < 1:
+            raise ValueError("max_cores must be at least 1")
+        lease = CoreLease(name=name, max_cores=max_cores)
+        with self._lock:
+            self._leases.append(lease)
+            self._rebalance()
+            lease.cores = lease.target
+            lease.resized.clear()
+        return lease
+
+    def release(self, lease: CoreLease) -> None:
+        """Return a run's cores to the budget and grow the remaining runs."""
+        with self._lock:
+            if lease in self._leases:
+                self._leases.remove(lease)
+                self._rebalance()
+
+    @contextmanager
+    def lease(self, name: str, max_cores: int | None = None) -> Iterator[CoreLease]:
+        """Hold a lease for the duration of a with block."""
+        lease = self.acquire(name, max_cores=max_cores)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    def accept_resize(self, lease: CoreLease) -> int:
+        """
+        Switch a run to its current target.
+
+        Returns:
+            The cores the run should restart with
+        """
+        with self._lock:
+            if lease.cores != lease.target:
+                lease.cores = lease.target
+                lease.resizes += 1
+            lease.resized.clear()
+            return lease.cores
+
+    def allocation(self) -> list[dict[str, Any]]:
+        """Snapshot of the active leases, oldest first."""
+        now = time.time()
+        with self._lock:
+            return [
+                {
+                    "name": lease.name,
+                    "cores": lease.cores,
+                    "target": lease.target,
+                    "max_cores": lease.max_cores,
+                    "resizes": lease.resizes,
+                    "running_seconds": now - lease.started_at,
+                }
+                for lease in self._leases
+            ]
+
+    def _rebalance(self) -> None:
+        """Recompute every lease's target (caller holds the lock)."""
+        # Water-filling: leases with the lowest caps take their share first,
+        # so what they cannot use is split among the others
+        by_cap = sorted(
+            self._leases,
+            key=lambda lease: lease.max_cores or self.total_cores,
+        )
+        remaining = self.total_cores
+        for i, lease in enumerate(by_cap):
+            share = max(1, remaining // (len(by_cap) - i))
+            lease.target = min(share, lease.max_cores or share)
+            remaining = max(0, remaining - lease.target)
+            if lease.target != lease.cores:
+                lease.resized.set()
+            else:
+                lease.resized.clear()
+
+
+class AllocatedSolver:
+    """
+    Solves within a CoreAllocator budget, following budget changes.
+
+    The solve runs with the lease's cores as CP-SAT num_workers. When the
+    allocator changes the lease's share (another run started or finished),
+    the search is stopped and restarted with the new worker count, hinted
+    with the best schedule found so far; restarts reuse the built model, so
+    only CP-SAT's presolve is repeated. No restart happens within
+    MIN_RESTART_SECONDS of the time limit, after cancel_event is set, or
+    once the search has finished.
+
+    Usage:
+        allocated = AllocatedSolver(shift_solver, name="run-12", max_cores=8)
+        result = allocated.solve(time_limit_seconds=60)
+        cores = result.statistics["cores"]["segments"]
+    """
+
+    def __init__(
+        self,
+        shift_solver: "ShiftSolver",
+        allocator: CoreAllocator | None = None,
+        name: str = "solve",
+        max_cores: int | None = None,
+    ) -> None:
+        """
+        Initialize the allocated solver.
+
+        Args:
+            shift_solver: Solver holding the input
+            allocator: Allocator to lease cores from (default: the shared one)
+            name: Label shown in the allocation
+            max_cores: Upper bound on this run's cores
+        """
+        self.shift_solver = shift_solver
+        self.allocator = allocator or CoreAllocator.shared()
+        self.name = name
+        self.max_cores = max_cores
+
+    def solve(
+        self,
+        time_limit_seconds: float = 300,
+        relative_gap_limit: float | None = None,
+        log_search_progress: bool | None = None,
+        solution_callback: "cp_model.CpSolverSolutionCallback | None" = None,
+        search_timeline: bool = False,
+        cancel_event: threading.Event | None = None,
+        greedy_fallback: bool = False,
+    ) -> SolverResult:
+        """
+        Solve, restarting with a hint whenever the core budget changes.
+
+        Args:
+            time_limit_seconds: Maximum time for all search segments
+            relative_gap_limit: Optimality gap tolerance (0.0 = optimal)
+            log_search_progress: Whether to log solver search progress
+            solution_callback: CP-SAT solution callback, reused by every
+                segment
+            search_timeline: Attach the last segment's SearchTimeline
+            cancel_event: Once set, the current segment is the last
+            greedy_fallback: Let a segment that finds no solution return the
+                greedy schedule (see ShiftSolver.solve())
+
+        Returns:
+            SolverResult with the best schedule of all segments; the worker
+            count of each segment is under statistics["cores"]
+        """
+        start_time = time.time()
+        deadline = start_time + time_limit_seconds
+        segments: list[int] = []
+        best: SolverResult | None = None
+
+        with self.allocator.lease(self.name, max_cores=self.max_cores) as lease:
+            cores = lease.cores
+            while True:
+                segments.append(cores)
+                restart = threading.Event()
+                stop = threading.Event()
+                finished = threading.Event()
+                watcher = threading.Thread(
+                    target=self._watch_resize,
+                    args=(lease, deadline, cancel_event, restart, stop, finished),
+                    daemon=True,
+                )
+                watcher.start()
+                try:
+                    result = self.shift_solver.solve(
+                        time_limit_seconds=max(deadline - time.time(), 0.0),
+                        num_workers=cores,
+                        relative_gap_limit=relative_gap_limit,
+                        log_search_progress=log_search_progress,
+                        solution_callback=solution_callback,
+                        search_timeline=search_timeline,
+                        hint=best.schedule if best is not None else None,
+                        greedy_fallback=greedy_fallback,
+                        stop_event=stop,
+                        reuse_model=len(segments) > 1,
+                    )
+                finally:
+                    finished.set()
+                    watcher.join()
+
+                if best is None or _better(result, best):
+                    best = result
+                if not restart.is_set() or result.status in (
+                    cp_model.OPTIMAL,
+                    cp_model.INFEASIBLE,
+                ):
+                    break
+                # Cancellation or the deadline may have come while the segment
+                # was stopping
+                if deadline - time.time() < MIN_RESTART_SECONDS or (
+                    cancel_event is not None and cancel_event.is_set()
+                ):
+                    break
+                cores = self.allocator.accept_resize(lease)
+
+        best.solve_time_seconds = time.time() - start_time
+        best.statistics = {
+            **best.statistics,
+            "cores": {"segments": segments, "restarts": len(segments) - 1},
+        }
+        return best
+
+    def _watch_resize(
+        self,
+        lease: CoreLease,
+        deadline: float,
+        cancel_event: threading.Event | None,
+        restart: threading.Event,
+        stop: threading.Event,
+        finished: threading.Event,
+    ) -> None:
+        """Stop the running segment once the lease's share changes."""
+        while not finished.is_set():
+            if not lease.resized.wait(0.1):
+                continue
+            if deadline - time.time() < MIN_RESTART_SECONDS or (
+                cancel_event is not None and cancel_event.is_set()
+            ):
+                return
+            restart.set()
+            stop.set()
+            return
+
+
+def _better(result: SolverResult, best: SolverResult) -> bool:
+    """Whether a segment's result improves on the best one so far."""
+    if not result.success:
+        return not best.success
+    if not best.success or best.objective_value is None:
+        return True
+    return (
+        result.objective_value is not None
+        and result.objective_value <= best.objective_value
+    )
@@ -0,0 +1,253 @@
+"""GreedyScheduler - fast constructive heuristic for a first schedule."""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from shift_solver.models import Availability, SchedulingRequest, ShiftType, Worker
+
+AssignmentKey = tuple[str, int, str]
+
+
+@dataclass
+class GreedySchedule:
+    """Outcome of a greedy construction.
+
+    Attributes:
+        assigned: (worker_id, period, shift_type_id) keys that are assigned
+        unfilled: (period, shift_type_id, missing) for slots that could not
+            be fully staffed
+        unmet_requests: (worker_id, period, shift_type_id) keys of hard
+            positive requests that could not be honored, because the
+            worker is forbidden from the slot or more workers are forced
+            into it than it requires
+    """
+
+    assigned: set[AssignmentKey] = field(default_factory=set)
+    unfilled: list[tuple[int, str, int]] = field(default_factory=list)
+    unmet_requests: list[AssignmentKey] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        """True when every slot is staffed and every hard request honored."""
+        return not self.unfilled and not self.unmet_requests
+
+
+class GreedyScheduler:
+    """
+    Priority-ordered greedy construction of a schedule.
+
+    Respects the hard rules the CP model always enforces: shift
+    restrictions, unavailability, applicable_days and hard requests. Slots
+    are filled scarcest first; candidates are ranked by soft requests,
+    whether they already work that period, their undesirable-shift count
+    (for undesirable shifts) and their total load.
+
+    Usage:
+        greedy = GreedyScheduler(workers, shift_types, period_dates)
+        result = greedy.construct()
+        if result.complete:
+            ...
+    """
+
+    def __init__(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+        availabilities: list[Availability] | None = None,
+        requests: list[SchedulingRequest] | None = None,
+        requests_are_hard: bool = False,
+    ) -> None:
+        """
+        Initialize the greedy scheduler.
+
+        Args:
+            workers: Workers to schedule
+            shift_types: Shift types with staffing requirements
+            period_dates: (start_date, end_date) for each period
+            availabilities: Optional availability records
+            requests: Optional scheduling requests
+            requests_are_hard: Treat requests without their own is_hard flag
+                as hard (mirrors the request constraint's config)
+        """
+        self.workers = workers
+        self.shift_types = shift_types
+        self.period_dates = period_dates
+        self.availabilities = availabilities or []
+        self.requests = requests or []
+        self.requests_are_hard = requests_are_hard
+
+    def construct(self) -> GreedySchedule:
+        """
+        Build a schedule greedily.
+
+        Returns:
+            GreedySchedule with the assigned keys, any unfilled slots and
+            any hard requests it could not honor
+        """
+        num_periods = len(self.period_dates)
+        worker_ids = [w.id for w in self.workers]
+        forbidden = self._forbidden()
+        forced, preferred, avoided = self._requests_by_slot()
+
+        result = GreedySchedule()
+        total = dict.fromkeys(worker_ids, 0)
+        undesirable = dict.fromkeys(worker_ids, 0)
+        per_period: dict[tuple[str, int], int] = {}
+
+        def assign(worker_id: str, period: int, shift_type: ShiftType) -> None:
+            result.assigned.add((worker_id, period, shift_type.id))
+            total[worker_id] += 1
+            if shift_type.is_undesirable:
+                undesirable[worker_id] += 1
+            key = (worker_id, period)
+            per_period[key] = per_period.get(key, 0) + 1
+
+        slots: list[tuple[int, int, ShiftType, list[str]]] = []
+        for period in range(num_periods):
+            for shift_type in self.shift_types:
+                required = self._required(shift_type, period)
+                must = []
+                for worker_id in forced.get((period, shift_type.id), []):
+                    if (worker_id, period, shift_type.id) in forbidden:
+                        result.unmet_requests.append(
+                            (worker_id, period, shift_type.id)
+                        )
+                    else:
+                        must.append(worker_id)
+                for worker_id in must[:required]:
+                    assign(worker_id, period, shift_type)
+                result.unmet_requests.extend(
+                    (worker_id, period, shift_type.id)
+                    for worker_id in must[required:]
+                )
+                remaining = required - min(len(must), required)
+                if remaining <= 0:
+                    continue
+                eligible = [
+                    w for w in worker_ids
+                    if (w, period, shift_type.id) not in forbidden
+                    and (w, period, shift_type.id) not in result.assigned
+                ]
+                slots.append((remaining, period, shift_type, eligible))
+
+        # Scarcest slots first: fewest spare eligible workers
+        slots.sort(key=lambda slot: (len(slot[3]) - slot[0], slot[1]))
+
+        for remaining, period, shift_type, eligible in slots:
+            wants = preferred.get((period, shift_type.id), set())
+            avoids = avoided.get((period, shift_type.id), set())
+            ranked = sorted(
+                eligible,
+                key=lambda w: (
+                    w in avoids,
+                    w not in wants,
+                    per_period.get((w, period), 0),
+                    undesirable[w] if shift_type.is_undesirable else 0,
+                    total[w],
+                ),
+            )
+            chosen = ranked[:remaining]
+            for worker_id in chosen:
+                assign(worker_id, period, shift_type)
+            if len(chosen) < remaining:
+                result.unfilled.append(
+                    (period, shift_type.id, remaining - len(chosen))
+                )
+
+        return result
+
+    def _required(self, shift_type: ShiftType, period: int) -> int:
+        """Workers required for a shift in a period (0 if it never applies)."""
+        if shift_type.applicable_days is None:
+            return shift_type.workers_required
+        start, end = self.period_dates[period]
+        day = start
+        while day <= end:
+            if shift_type.is_applicable_on(day.weekday()):
+                return shift_type.workers_required
+            day += timedelta(days=1)
+        return 0
+
+    def _periods_overlapping(self, start: date, end: date) -> list[int]:
+        """Indices of periods overlapping the date range."""
+        return [
+            idx
+            for idx, (p_start, p_end) in enumerate(self.period_dates)
+            if start <= p_end and end >= p_start
+        ]
+
+    def _forbidden(self) -> set[AssignmentKey]:
+        """Assignments ruled out by restrictions and unavailability."""
+        shift_ids = {st.id for st in self.shift_types}
+        num_periods = len(self.period_dates)
+        forbidden: set[AssignmentKey] = set()
+
+        for worker in self.workers:
+            for shift_id in worker.restricted_shifts & shift_ids:
+                forbidden.update((worker.id, p, shift_id) for p in range(num_periods))
+
+        for availability in self.availabilities:
+            if availability.availability_type != "unavailable":
+                continue
+            blocked = (
+                [availability.shift_type_id]
+                if availability.shift_type_id
+                else list(shift_ids)
+            )
+            for period in self._periods_overlapping(
+                availability.start_date, availability.end_date
+            ):
+                forbidden.update(
+                    (availability.worker_id, period, shift_id) for shift_id in blocked
+                )
+
+        for request in self.requests:
+            if request.is_positive or not self._is_hard(request):
+                continue
+            for period in self._periods_overlapping(
+                request.start_date, request.end_date
+            ):
+                forbidden.add((request.worker_id, period, request.shift_type_id))
+
+        return forbidden
+
+    def _requests_by_slot(
+        self,
+    ) -> tuple[
+        dict[tuple[int, str], list[str]],
+        dict[tuple[int, str], set[str]],
+        dict[tuple[int, str], set[str]],
+    ]:
+        """Group requests by (period, shift_type_id) slot.
+
+        Returns:
+            (forced, preferred, avoided): hard positive requests, soft
+            positive requests and soft negative requests per slot
+        """
+        worker_ids = {w.id for w in self.workers}
+        forced: dict[tuple[int, str], list[str]] = {}
+        preferred: dict[tuple[int, str], set[str]] = {}
+        avoided: dict[tuple[int, str], set[str]] = {}
+
+        for request in self.requests:
+            if request.worker_id not in worker_ids:
+                continue
+            hard = self._is_hard(request)
+            for period in self._periods_overlapping(
+                request.start_date, request.end_date
+            ):
+                slot = (period, request.shift_type_id)
+                if request.is_positive and hard:
+                    if request.worker_id not in forced.setdefault(slot, []):
+                        forced[slot].append(request.worker_id)
+                elif request.is_positive:
+                    preferred.setdefault(slot, set()).add(request.worker_id)
+                elif not hard:
+                    avoided.setdefault(slot, set()).add(request.worker_id)
+
+        return forced, preferred, avoided
+
+    def _is_hard(self, request: SchedulingRequest) -> bool:
+        """Whether a request is enforced as a hard constraint."""
+        return request.is_hard if request.is_hard is not None else self.requests_are_hard
@@ -0,0 +1,136 @@
+"""Infeasibility explanation via CP-SAT assumption literals."""
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat.python import cp_model
+
+if TYPE_CHECKING:
+    from shift_solver.constraints.base import AssumptionGroup
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+
+class InfeasibilityExplainer:
+    """Finds a minimal set of hard constraint groups that conflict.
+
+    The model is rebuilt with every coverage requirement (per shift type
+    and period), worker restriction, availability record and hard request
+    guarded by its own enforcement literal. All literals are passed to
+    CP-SAT as assumptions and one solve without an objective returns a
+    sufficient subset for infeasibility (an infeasibility core), which is
+    not necessarily minimal. The core is then shrunk by deletion: each
+    group is dropped in turn and kept only if the rest becomes feasible
+    without it. Once shrinking finishes, dropping any reported group
+    restores feasibility.
+
+    Usage:
+        explainer = InfeasibilityExplainer(shift_solver)
+        issues = explainer.explain(time_limit_seconds=30)
+    """
+
+    def __init__(self, shift_solver: "ShiftSolver") -> None:
+        """
+        Initialize the explainer.
+
+        Args:
+            shift_solver: Solver whose inputs turned out infeasible
+        """
+        self.shift_solver = shift_solver
+
+    def explain(self, time_limit_seconds: float = 30) -> list[dict[str, Any]]:
+        """
+        Compute a minimal infeasibility core.
+
+        Args:
+            time_limit_seconds: Maximum time for the core solve and the
+                shrinking solves together
+
+        Returns:
+            One issue dict per conflicting group (type, message, severity
+            and the group's details). Empty if the model is feasible or the
+            core could not be found in time. If shrinking runs out of time,
+            the groups it has not tested yet are kept, so the core is then
+            sufficient but possibly not minimal. If the conflict involves
+            only hard constraints that are not guarded, a single "other"
+            issue is returned.
+        """
+        from shift_solver.solver.shift_solver import ShiftSolver
+
+        deadline = time.time() + time_limit_seconds
+        # Rebuild on a copy so the caller's model and solver stay intact
+        ss = ShiftSolver(**self.shift_solver._solver_kwargs())
+        ss._build_model(track_assumptions=True)
+        model = ss._model
+        assert model is not None
+        groups = ss._assumption_groups
+
+        model.clear_objective()
+        model.clear_hints()
+        model.add_assumptions([group.literal for group in groups.values()])
+
+        # Cores are reported by the sequential search
+        solver = ss._create_solver(time_limit_seconds=time_limit_seconds, num_workers=1)
+        status = solver.Solve(model)
+        if status != cp_model.INFEASIBLE:
+            return []
+
+        by_index = {group.literal.index: group for group in groups.values()}
+        core = self._shrink(
+            ss,
+            [
+                by_index[index]
+                for index in solver.sufficient_assumptions_for_infeasibility()
+                if index in by_index
+            ],
+            deadline,
+        )
+        if not core:
+            return [
+                {
+                    "type": "other",
+                    "message": (
+                        "Hard constraints other than coverage, restrictions, "
+                        "availability and hard requests are infeasible"
+                    ),
+                    "severity": "error",
+                }
+            ]
+        return [
+            {
+                "type": group.constraint_id,
+                "message": group.message,
+                "severity": "error",
+                "group": group.key,
+                **group.details,
+            }
+            for group in core
+        ]
+
+    @staticmethod
+    def _shrink(
+        ss: "ShiftSolver", core: list["AssumptionGroup"], deadline: float
+    ) -> list["AssumptionGroup"]:
+        """Drop core groups the conflict does not need, until the deadline."""
+        model = ss._model
+        assert model is not None
+        kept: list[AssumptionGroup] = []
+        candidates = list(core)
+        while candidates:
+            group = candidates.pop(0)
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return [*kept, group, *candidates]
+            model.clear_assumptions()
+            model.add_assumptions([g.literal for g in [*kept, *candidates]])
+            solver = ss._create_solver(time_limit_seconds=remaining, num_workers=1)
+            status = solver.Solve(model)
+            if status == cp_model.INFEASIBLE:
+                # Still infeasible without the group; the new core may also
+                # leave out some of the untested ones
+                needed = set(solver.sufficient_assumptions_for_infeasibility())
+                candidates = [g for g in candidates if g.literal.index in needed]
+            elif status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                kept.append(group)
+            else:
+                return [*kept, group, *candidates]
+        return kept
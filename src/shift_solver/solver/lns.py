@@ -0,0 +1,295 @@
+"""Problem-aware large neighborhood search (LNS) on top of ShiftSolver."""
+
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat.python import cp_model
+
+from shift_solver.solver.result import SolverResult
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+# Neighborhood kinds: a random subset of workers across all periods, a block
+# of consecutive periods for every worker, or one shift category for a
+# random subset of workers.
+NEIGHBORHOOD_KINDS = ("workers", "periods", "category")
+
+AssignmentKey = tuple[str, int, str]
+
+
+@dataclass
+class NeighborhoodStats:
+    """Adaptive size and outcome counters for one neighborhood kind.
+
+    Attributes:
+        size: Fraction of the schedule freed by the next neighborhood
+        attempts: Number of sub-solves run for this kind
+        improvements: Number of sub-solves that improved the incumbent
+    """
+
+    size: float
+    attempts: int = 0
+    improvements: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "size": round(self.size, 3),
+            "attempts": self.attempts,
+            "improvements": self.improvements,
+        }
+
+
+@contextmanager
+def _fixed_assignments(
+    model: cp_model.CpModel,
+    assignment_vars: list[tuple[str, int, str, cp_model.IntVar]],
+    hint: dict[AssignmentKey, int],
+    frozen: dict[AssignmentKey, int],
+) -> Iterator[None]:
+    """Hint every assignment and fix the frozen ones to their values.
+
+    Frozen variables get a singleton domain directly in the model proto,
+    which lets presolve remove them (solver assumptions would disable
+    most of presolve). Domains are restored to {0, 1} on exit.
+    """
+    proto_vars = model.proto.variables
+    model.clear_hints()
+    for w, p, s, var in assignment_vars:
+        key = (w, p, s)
+        model.add_hint(var, hint[key])
+        if key in frozen:
+            domain = proto_vars[var.index].domain
+            domain[0] = domain[1] = frozen[key]
+    try:
+        yield
+    finally:
+        for w, p, s, var in assignment_vars:
+            if (w, p, s) in frozen:
+                domain = proto_vars[var.index].domain
+                domain[0], domain[1] = 0, 1
+        model.clear_hints()
+
+
+class _InitialSolutionCallback(cp_model.CpSolverSolutionCallback):
+    """Stops the initial solve at the first solution after switch_time."""
+
+    def __init__(self, switch_time: float) -> None:
+        super().__init__()
+        self.switch_time = switch_time
+        self.has_solution = False
+
+    def on_solution_callback(self) -> None:
+        self.has_solution = True
+        if time.time() >= self.switch_time:
+            self.StopSearch()
+
+    def stop_if_solved(self, solver: cp_model.CpSolver) -> None:
+        """Stop the search at switch_time if an incumbent already exists."""
+        if self.has_solution:
+            solver.stop_search()
+
+
+class LNSSolver:
+    """Large neighborhood search driver using ShiftSolver's model.
+
+    The model is built once. An initial solve produces an incumbent; each
+    iteration then hints the full incumbent, fixes every assignment outside
+    a structured neighborhood by narrowing its domain, and re-optimizes the
+    freed part. Improving solutions replace the incumbent.
+
+    Neighborhood sizes adapt per kind: a sub-problem solved to optimality
+    without improving was too small and grows, while one that hits the
+    iteration time limit was too large and shrinks.
+
+    Usage:
+        lns = LNSSolver(shift_solver, seed=1)
+        result = lns.solve(time_limit_seconds=60)
+    """
+
+    def __init__(
+        self,
+        shift_solver: "ShiftSolver",
+        seed: int = 0,
+        iteration_time_limit: float = 5.0,
+        initial_time_fraction: float = 0.2,
+        initial_size: float = 0.2,
+        min_size: float = 0.05,
+        max_size: float = 0.8,
+    ) -> None:
+        """
+        Initialize the LNS driver.
+
+        Args:
+            shift_solver: Solver whose inputs and model are optimized
+            seed: Seed for neighborhood selection
+            iteration_time_limit: Maximum seconds per neighborhood sub-solve
+            initial_time_fraction: Share of the budget for the initial solve
+            initial_size: Starting neighborhood size (fraction freed)
+            min_size: Lower bound for the adaptive neighborhood size
+            max_size: Upper bound for the adaptive neighborhood size
+
+        Raises:
+            ValueError: If a size or time parameter is out of range
+        """
+        if not 0 < min_size <= initial_size <= max_size <= 1:
+            raise ValueError(
+                "sizes must satisfy 0 < min_size <= initial_size <= max_size <= 1"
+            )
+        if iteration_time_limit <= 0:
+            raise ValueError("iteration_time_limit must be positive")
+        if not 0 < initial_time_fraction < 1:
+            raise ValueError("initial_time_fraction must be between 0 and 1")
+
+        self.shift_solver = shift_solver
+        self.iteration_time_limit = iteration_time_limit
+        self.initial_time_fraction = initial_time_fraction
+        self.min_size = min_size
+        self.max_size = max_size
+        self.neighborhoods = {
+            kind: NeighborhoodStats(size=initial_size) for kind in NEIGHBORHOOD_KINDS
+        }
+        self._rng = random.Random(seed)
+
+    def solve(
+        self, time_limit_seconds: float = 300, num_workers: int | None = None
+    ) -> SolverResult:
+        """
+        Run LNS until the time limit expires.
+
+        Args:
+            time_limit_seconds: Total wall time, including the initial solve
+            num_workers: CP-SAT search workers for each solve
+
+        Returns:
+            SolverResult for the best schedule found, with LNS counters
+            under statistics["lns"]
+        """
+        start_time = time.time()
+        deadline = start_time + time_limit_seconds
+        ss = self.shift_solver
+
+        pre_solve_failure = ss._pre_solve_failure(start_time)
+        if pre_solve_failure is not None:
+            return pre_solve_failure
+
+        ss._build_model()
+        model = ss._model
+        variables = ss._variables
+        assert model is not None and variables is not None
+        assignment_vars = list(variables.all_assignment_vars())
+
+        # Initial incumbent: a plain solve that stops once its share of the
+        # budget has elapsed and at least one solution exists
+        solver = ss._create_solver(
+            time_limit_seconds=time_limit_seconds, num_workers=num_workers
+        )
+        callback = _InitialSolutionCallback(
+            switch_time=start_time + time_limit_seconds * self.initial_time_fraction
+        )
+        timer = threading.Timer(
+            callback.switch_time - time.time(), callback.stop_if_solved, [solver]
+        )
+        timer.start()
+        try:
+            status = solver.Solve(model, callback)
+        finally:
+            timer.cancel()
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return SolverResult(
+                success=False,
+                schedule=None,
+                status=status,
+                status_name=solver.StatusName(status),
+                solve_time_seconds=time.time() - start_time,
+            )
+
+        incumbent = {(w, p, s): solver.Value(var) for w, p, s, var in assignment_vars}
+        objective = solver.ObjectiveValue()
+        initial_objective = objective
+        best_solver = solver
+        best_bound = solver.BestObjectiveBound()
+        proven_optimal = status == cp_model.OPTIMAL
+        iterations = 0
+
+        while not proven_optimal and time.time() < deadline:
+            kind = self._rng.choice(NEIGHBORHOOD_KINDS)
+            stats = self.neighborhoods[kind]
+            free = self._neighborhood(kind, stats.size)
+
+            sub_limit = min(self.iteration_time_limit, deadline - time.time())
+            if sub_limit <= 0:
+                break
+            frozen = {key: v for key, v in incumbent.items() if key not in free}
+            sub_solver = ss._create_solver(
+                time_limit_seconds=sub_limit, num_workers=num_workers
+            )
+            with _fixed_assignments(model, assignment_vars, incumbent, frozen):
+                sub_status = sub_solver.Solve(model)
+            iterations += 1
+            stats.attempts += 1
+
+            improved = (
+                sub_status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+                and sub_solver.ObjectiveValue() < objective
+            )
+            if improved:
+                incumbent = {
+                    (w, p, s): sub_solver.Value(var) for w, p, s, var in assignment_vars
+                }
+                objective = sub_solver.ObjectiveValue()
+                best_solver = sub_solver
+                stats.improvements += 1
+                proven_optimal = objective <= best_bound
+            elif sub_status == cp_model.OPTIMAL:
+                stats.size = min(self.max_size, stats.size * 1.25)
+            else:
+                stats.size = max(self.min_size, stats.size * 0.8)
+
+        ss._solver = best_solver
+
+        return SolverResult(
+            success=True,
+            schedule=ss._extract_schedule(best_solver),
+            status=int(cp_model.OPTIMAL if proven_optimal else cp_model.FEASIBLE),
+            status_name="OPTIMAL" if proven_optimal else "FEASIBLE",
+            solve_time_seconds=time.time() - start_time,
+            objective_value=objective,
+            statistics={
+                "lns": {
+                    "iterations": iterations,
+                    "initial_objective": initial_objective,
+                    "neighborhoods": {
+                        kind: stats.to_dict()
+                        for kind, stats in self.neighborhoods.items()
+                    },
+                }
+            },
+        )
+
+    def _neighborhood(self, kind: str, size: float) -> set[AssignmentKey]:
+        """Return the assignment keys freed by a neighborhood of the given size."""
+        ss = self.shift_solver
+        worker_ids = [w.id for w in ss.workers]
+        shift_ids = [st.id for st in ss.shift_types]
+
+        if kind == "periods":
+            length = max(1, round(size * ss.num_periods))
+            first = self._rng.randrange(ss.num_periods - length + 1)
+            periods = range(first, first + length)
+            return {(w, p, s) for w in worker_ids for p in periods for s in shift_ids}
+
+        count = max(1, round(size * len(worker_ids)))
+        chosen = self._rng.sample(worker_ids, count)
+        if kind == "category":
+            category = self._rng.choice(sorted({st.category for st in ss.shift_types}))
+            shift_ids = [st.id for st in ss.shift_types if st.category == category]
+        return {
+            (w, p, s) for w in chosen for p in range(ss.num_periods) for s in shift_ids
+        }
@@ -0,0 +1,344 @@
+"""Model size statistics from a build and a presolve-only CP-SAT run."""
+
+import os
+import re
+import time as time_module
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat.python import cp_model
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+# Row for the assignment variables every constraint shares
+SHARED_VARIABLES = "variables"
+
+# Constraint kinds, most common in this model first
+_KINDS = (
+    "linear",
+    "bool_or",
+    "exactly_one",
+    "at_most_one",
+    "bool_and",
+    "lin_max",
+    "bool_xor",
+    "int_prod",
+    "int_div",
+    "int_mod",
+    "element",
+    "table",
+    "automaton",
+    "all_diff",
+    "interval",
+    "no_overlap",
+    "no_overlap_2d",
+    "cumulative",
+    "circuit",
+    "routes",
+    "reservoir",
+    "inverse",
+)
+# Kinds whose terms are a literal list
+_LITERAL_KINDS = frozenset({"bool_or", "exactly_one", "at_most_one", "bool_and"})
+
+# Footprint rates calibrated against the RSS growth of building 8k-128k
+# variable models (Python variable objects plus the C++ proto)
+_BYTES_PER_VARIABLE = 400
+_BYTES_PER_CONSTRAINT = 64
+_BYTES_PER_TERM = 40
+
+_PRESOLVED_COUNT = re.compile(r"^PresolvedNum(Variables|Constraints|Terms): (\d+)$")
+_PRESOLVE_RULE = re.compile(r"^\s*- rule '(.+)' was applied (\d+) times?\.?$")
+
+
+def estimate_model_bytes(variables: int, constraints: int, terms: int) -> int:
+    """Estimated memory held by a model of the given size."""
+    return (
+        variables * _BYTES_PER_VARIABLE
+        + constraints * _BYTES_PER_CONSTRAINT
+        + terms * _BYTES_PER_TERM
+    )
+
+
+@dataclass
+class ConstraintStats:
+    """Variables and constraints one constraint_id added to the model."""
+
+    constraint_id: str
+    variables: int = 0
+    boolean_variables: int = 0
+    max_domain_size: int = 0
+    constraints: int = 0
+    terms: int = 0
+    objective_terms: int = 0
+    kinds: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def integer_variables(self) -> int:
+        """Variables with a domain larger than [0, 1]."""
+        return self.variables - self.boolean_variables
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form."""
+        return {**asdict(self), "integer_variables": self.integer_variables}
+
+
+@dataclass
+class PresolveStats:
+    """Outcome of the presolve-only CP-SAT run."""
+
+    status: str
+    time_seconds: float
+    variables: int | None = None
+    constraints: int | None = None
+    terms: int | None = None
+    rules: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form."""
+        return asdict(self)
+
+
+@dataclass
+class ModelStats:
+    """
+    Size of a solver's CP-SAT model before and after presolve.
+
+    Memory figures are estimates from the model size: the built model
+    stays alive during search, and every CP-SAT search worker loads its
+    own copy of the presolved model.
+    """
+
+    rows: list[ConstraintStats]
+    presolve: PresolveStats
+    build_time_seconds: float
+    search_workers: int
+    objective_terms: int = 0
+
+    @property
+    def variables(self) -> int:
+        """Variables in the built model."""
+        return sum(row.variables for row in self.rows)
+
+    @property
+    def boolean_variables(self) -> int:
+        """Variables with domain [0, 1] in the built model."""
+        return sum(row.boolean_variables for row in self.rows)
+
+    @property
+    def integer_variables(self) -> int:
+        """Variables with a larger domain in the built model."""
+        return self.variables - self.boolean_variables
+
+    @property
+    def max_domain_size(self) -> int:
+        """Largest variable domain in the built model."""
+        return max((row.max_domain_size for row in self.rows), default=0)
+
+    @property
+    def constraints(self) -> int:
+        """Constraints in the built model."""
+        return sum(row.constraints for row in self.rows)
+
+    @property
+    def terms(self) -> int:
+        """Variable references across all constraints of the built model."""
+        return sum(row.terms for row in self.rows)
+
+    @property
+    def model_bytes(self) -> int:
+        """Estimated memory of the built model."""
+        return estimate_model_bytes(self.variables, self.constraints, self.terms)
+
+    @property
+    def presolved_model_bytes(self) -> int:
+        """Estimated memory of one copy of the presolved model."""
+        return estimate_model_bytes(
+            self.presolve.variables or 0,
+            self.presolve.constraints or 0,
+            self.presolve.terms or 0,
+        )
+
+    @property
+    def estimated_memory_bytes(self) -> int:
+        """Estimated memory of a solve with search_workers workers."""
+        return self.model_bytes + self.search_workers * self.presolved_model_bytes
+
+    def reduction(self, attribute: str) -> float | None:
+        """
+        Fraction of variables, constraints or terms presolve removed.
+
+        Args:
+            attribute: "variables", "constraints" or "terms"
+
+        Returns:
+            Reduction in [0, 1], or None when presolve did not report a size
+        """
+        before: int = getattr(self, attribute)
+        after: int | None = getattr(self.presolve, attribute)
+        if after is None or before == 0:
+            return None
+        return 1 - after / before
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form."""
+        return {
+            "variables": self.variables,
+            "boolean_variables": self.boolean_variables,
+            "integer_variables": self.integer_variables,
+            "max_domain_size": self.max_domain_size,
+            "constraints": self.constraints,
+            "terms": self.terms,
+            "objective_terms": self.objective_terms,
+            "build_time_seconds": self.build_time_seconds,
+            "constraint_ids": [row.to_dict() for row in self.rows],
+            "presolve": {
+                **self.presolve.to_dict(),
+                "reductions": {
+                    name: self.reduction(name)
+                    for name in ("variables", "constraints", "terms")
+                },
+            },
+            "memory": {
+                "search_workers": self.search_workers,
+                "model_bytes": self.model_bytes,
+                "presolved_model_bytes": self.presolved_model_bytes,
+                "estimated_bytes": self.estimated_memory_bytes,
+            },
+        }
+
+
+class ModelAnalyzer:
+    """
+    Measures a solver's model without searching it.
+
+    Builds a copy of the solver's model sequentially, recording which
+    variables and constraints each enabled constraint_id adds, then runs
+    CP-SAT with stop_after_presolve and reads the presolved size and the
+    presolve rules that fired from the solver log.
+
+    Usage:
+        stats = ModelAnalyzer(solver).analyze()
+        print(stats.variables, stats.presolve.variables)
+    """
+
+    def __init__(self, shift_solver: "ShiftSolver"):
+        """
+        Initialize the analyzer.
+
+        Args:
+            shift_solver: Solver whose input defines the model
+        """
+        self.shift_solver = shift_solver
+
+    def analyze(
+        self, time_limit_seconds: float = 60, num_workers: int | None = None
+    ) -> ModelStats:
+        """
+        Build the model and presolve it.
+
+        Args:
+            time_limit_seconds: Time limit for presolve
+            num_workers: Search workers the memory estimate assumes
+                (default: CPU count)
+
+        Returns:
+            ModelStats for the model
+        """
+        from shift_solver.solver.objective_builder import ObjectiveBuilder
+        from shift_solver.solver.shift_solver import ShiftSolver
+
+        start = time_module.time()
+        ss = ShiftSolver(**self.shift_solver._solver_kwargs())
+        ss._build_variables()
+        model = ss._model
+        assert model is not None and ss._variables is not None
+        proto = model.proto
+        rows = [self._summarize(SHARED_VARIABLES, proto, 0, 0)]
+
+        context = ss._constraint_context()
+        objective_builder = ObjectiveBuilder(model)
+        for constraint_id, registration, config, penalized in ss._enabled_constraints():
+            first_var = len(proto.variables)
+            first_constraint = len(proto.constraints)
+            constraint = registration.constraint_class(model, ss._variables, config)
+            constraint.apply(**context)
+            if penalized:
+                objective_builder.add_constraint(constraint)
+            rows.append(
+                self._summarize(constraint_id, proto, first_var, first_constraint)
+            )
+        objective_builder.build()
+        build_time = time_module.time() - start
+
+        breakdown = objective_builder.get_objective_breakdown()
+        for row in rows:
+            row.objective_terms = len(breakdown.get(row.constraint_id, []))
+
+        return ModelStats(
+            rows=rows,
+            presolve=self._presolve(model, time_limit_seconds),
+            build_time_seconds=build_time,
+            search_workers=num_workers or os.cpu_count() or 1,
+            objective_terms=len(objective_builder.objective_terms),
+        )
+
+    @staticmethod
+    def _summarize(
+        constraint_id: str, proto: Any, first_var: int, first_constraint: int
+    ) -> ConstraintStats:
+        """Count the variables and constraints added from the given indices."""
+        row = ConstraintStats(constraint_id=constraint_id)
+        variables = proto.variables
+        for index in range(first_var, len(variables)):
+            domain = list(variables[index].domain)
+            row.variables += 1
+            if domain == [0, 1]:
+                row.boolean_variables += 1
+            row.max_domain_size = max(row.max_domain_size, _domain_size(domain))
+
+        constraints = proto.constraints
+        for index in range(first_constraint, len(constraints)):
+            constraint = constraints[index]
+            kind = next(
+                (kind for kind in _KINDS if getattr(constraint, f"has_{kind}")()),
+                "other",
+            )
+            row.constraints += 1
+            row.kinds[kind] = row.kinds.get(kind, 0) + 1
+            row.terms += len(constraint.enforcement_literal)
+            if kind == "linear":
+                row.terms += len(constraint.linear.vars)
+            elif kind in _LITERAL_KINDS:
+                row.terms += len(getattr(constraint, kind).literals)
+        return row
+
+    @staticmethod
+    def _presolve(model: cp_model.CpModel, time_limit_seconds: float) -> PresolveStats:
+        """Run presolve only and parse its outcome from the solver log."""
+        from shift_solver.solver.shift_solver import ShiftSolver
+
+        solver = ShiftSolver._create_solver(
+            time_limit_seconds,
+            log_search_progress=True,
+            parameters={"stop_after_presolve": True, "log_to_stdout": False},
+        )
+        lines: list[str] = []
+        solver.log_callback = lines.append
+        status = solver.solve(model)
+
+        presolve = PresolveStats(
+            status=solver.status_name(status), time_seconds=solver.wall_time
+        )
+        for line in "\n".join(lines).splitlines():
+            if match := _PRESOLVED_COUNT.match(line):
+                setattr(presolve, match.group(1).lower(), int(match.group(2)))
+            elif match := _PRESOLVE_RULE.match(line):
+                presolve.rules[match.group(1)] = int(match.group(2))
+        return presolve
+
+
+def _domain_size(domain: list[int]) -> int:
+    """Number of values in a flat [lo, hi, lo, hi, ...] domain."""
+    return sum(hi - lo + 1 for lo, hi in zip(domain[::2], domain[1::2], strict=True))
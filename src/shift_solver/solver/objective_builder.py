@@ -16,7 +16,7 @@ class ObjectiveTerm:
 
     constraint_id: str
     variable_name: str
-    variable: cp_model.IntVar
+    variable: cp_model.LinearExprT
     base_weight: int
     priority_multiplier: int = 1
 
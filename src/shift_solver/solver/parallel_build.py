@@ -0,0 +1,302 @@
+"""Parallel constraint model building across worker processes."""
+
+import copy
+import dataclasses
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat.python import cp_model
+from ortools.sat.python.cp_model_helper import CpModelProto, NotBooleanVariable
+
+from shift_solver.constraints.base import BaseConstraint, ConstraintConfig
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+# Constraint attributes bound to the process that built them
+_UNSHARED_ATTRIBUTES = ("model", "variables", "config")
+
+# Variable references in a CpModelProto text fragment: negative values are
+# negated literals
+_REFERENCE = re.compile(r"^(\s*(?:vars|literals|enforcement_literal): )(-?\d+)$", re.M)
+# Reference fields _REFERENCE does not cover (interval constraint indices,
+# inverse and reservoir literals, legacy element indices)
+_UNSHIFTABLE = re.compile(
+    r"^\s*(?:intervals|x_intervals|y_intervals|f_direct|f_inverse|"
+    r"active_literals|index|target): ",
+    re.M,
+)
+_VARIABLE_BLOCK = re.compile(r"^variables \{", re.M)
+_CONSTRAINT_BLOCK = re.compile(r"^constraints \{", re.M)
+
+
+@dataclass(frozen=True)
+class _VarRef:
+    """A variable (or its negation) by proto index, for crossing processes."""
+
+    index: int
+    negated: bool = False
+
+
+@dataclass(frozen=True)
+class _ConstraintRef:
+    """A model constraint by proto index, for crossing processes."""
+
+    index: int
+
+
+def _encode(value: Any) -> Any:
+    """Replace model objects in a constraint attribute by index references."""
+    if isinstance(value, NotBooleanVariable):
+        return _VarRef(value.negated().index, negated=True)
+    if isinstance(value, cp_model.IntVar):
+        return _VarRef(value.index)
+    if isinstance(value, cp_model.Constraint):
+        return _ConstraintRef(value.index)
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type(value)(_encode(item) for item in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        encoded = copy.copy(value)
+        for field in dataclasses.fields(value):
+            object.__setattr__(
+                encoded, field.name, _encode(getattr(value, field.name))
+            )
+        return encoded
+    return value
+
+
+def _decode(
+    value: Any,
+    model: cp_model.CpModel,
+    var_index: Any,
+    constraint_index: Any,
+) -> Any:
+    """Rebind index references to the merged model."""
+    if isinstance(value, _VarRef):
+        var = model.get_int_var_from_proto_index(var_index(value.index))
+        return var.negated() if value.negated else var
+    if isinstance(value, _ConstraintRef):
+        return cp_model.Constraint(model, constraint_index(value.index))
+    if isinstance(value, dict):
+        return {
+            key: _decode(item, model, var_index, constraint_index)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type(value)(
+            _decode(item, model, var_index, constraint_index) for item in value
+        )
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        decoded = copy.copy(value)
+        for field in dataclasses.fields(value):
+            object.__setattr__(
+                decoded,
+                field.name,
+                _decode(getattr(value, field.name), model, var_index, constraint_index),
+            )
+        return decoded
+    return value
+
+
+def _build_fragment(
+    solver_kwargs: dict[str, Any],
+    constraint_class: type[BaseConstraint],
+    config: ConstraintConfig,
+    track_assumptions: bool,
+    worker_activation: bool,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Apply one constraint in a worker process.
+
+    The worker rebuilds the shared variables, which get the same proto
+    indices as in the parent, and applies the constraint on top of them.
+
+    Returns:
+        The variables and constraints the constraint added, as a
+        CpModelProto in text format, and the constraint's attributes with
+        model objects replaced by index references
+
+    Raises:
+        ValueError: If the constraint adds constraints that reference
+            intervals or use reference fields the merge does not shift
+    """
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+    ss = ShiftSolver(**solver_kwargs)
+    ss._build_variables(worker_activation)
+    model = ss._model
+    assert model is not None and ss._variables is not None
+    proto = model.proto
+    first_var = len(proto.variables)
+    first_constraint = len(proto.constraints)
+
+    constraint = constraint_class(model, ss._variables, config)
+    constraint.track_assumptions = track_assumptions
+    constraint.apply(**ss._constraint_context())
+
+    # Top-level blocks sit at column 0; keep the ones the constraint added
+    text = str(proto)
+    var_starts = [m.start() for m in _VARIABLE_BLOCK.finditer(text)]
+    constraint_starts = [m.start() for m in _CONSTRAINT_BLOCK.finditer(text)]
+    constraints_begin = constraint_starts[0] if constraint_starts else len(text)
+    own_vars = (
+        var_starts[first_var] if len(var_starts) > first_var else constraints_begin
+    )
+    own_constraints = (
+        constraint_starts[first_constraint]
+        if len(constraint_starts) > first_constraint
+        else len(text)
+    )
+    fragment = text[own_vars:constraints_begin] + text[own_constraints:]
+    if _UNSHIFTABLE.search(fragment):
+        raise ValueError(
+            f"'{constraint.constraint_id}' adds constraints the parallel build "
+            f"cannot merge"
+        )
+
+    state = {
+        name: _encode(value)
+        for name, value in vars(constraint).items()
+        if name not in _UNSHARED_ATTRIBUTES
+    }
+    return fragment, state
+
+
+def _shift_fragment(text: str, first_var: int, offset: int) -> str:
+    """
+    Move a fragment's own variables past the fragments merged before it.
+
+    References below first_var are shared variables and stay; negative
+    references (negated literals) are shifted through their positive index.
+    """
+
+    def shift(match: re.Match[str]) -> str:
+        ref = int(match.group(2))
+        if ref >= first_var:
+            ref += offset
+        elif ref < -first_var:
+            ref -= offset
+        return f"{match.group(1)}{ref}"
+
+    return _REFERENCE.sub(shift, text)
+
+
+class ParallelModelBuilder:
+    """
+    Applies a solver's constraints in worker processes.
+
+    Constraint apply() calls only read the shared variables and append to
+    the model, so they are independent once the variables exist. Each
+    enabled constraint is applied in its own process against the same
+    variable layout, and emits a CpModelProto text fragment holding the
+    variables and constraints it added. The parent merges the fragments in
+    registry order as they complete, shifting references to
+    fragment-local variables past those already merged, so the result
+    equals the sequentially built model. Each constraint object is
+    recreated in the parent with its attributes rebound to the merged
+    model, then the objective is built as usual.
+
+    Every worker pays the interpreter start-up and rebuilds the shared
+    variables, and the parent parses each fragment, so this only pays off
+    on several cores with constraints whose apply() dominates (see the
+    parallel build benchmark). Constraint classes must be importable by
+    the worker processes.
+
+    Usage:
+        solver._build_variables()
+        ParallelModelBuilder(solver, processes=8).apply()
+    """
+
+    def __init__(self, shift_solver: "ShiftSolver", processes: int | None = None):
+        """
+        Initialize the builder.
+
+        Args:
+            shift_solver: Solver whose variables are already built
+            processes: Size of the process pool (default: CPU count)
+        """
+        self.shift_solver = shift_solver
+        self.processes = processes
+
+    def apply(
+        self, track_assumptions: bool = False, worker_activation: bool = False
+    ) -> None:
+        """
+        Apply every enabled constraint and build the objective.
+
+        Args:
+            track_assumptions: Guard hard constraint groups with assumption
+                literals
+            worker_activation: The solver's variables include worker
+                activation literals (workers must rebuild them)
+
+        Raises:
+            ValueError: If a constraint emits a constraint kind that cannot
+                be merged
+        """
+        from shift_solver.solver.objective_builder import ObjectiveBuilder
+
+        ss = self.shift_solver
+        model = ss._model
+        if model is None or ss._variables is None:
+            raise RuntimeError("Cannot apply constraints: variables not built")
+
+        jobs = ss._enabled_constraints()
+        processes = self.processes or os.cpu_count() or 1
+        ctx = multiprocessing.get_context("spawn")
+        solver_kwargs = ss._solver_kwargs()
+        first_var = len(model.proto.variables)
+        first_constraint = len(model.proto.constraints)
+        ss._objective_builder = ObjectiveBuilder(model)
+        with ProcessPoolExecutor(
+            max_workers=min(processes, len(jobs)) or 1, mp_context=ctx
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _build_fragment,
+                    solver_kwargs,
+                    registration.constraint_class,
+                    config,
+                    track_assumptions,
+                    worker_activation,
+                )
+                for _, registration, config, _ in jobs
+            ]
+            # Merge in order while later fragments are still being built
+            for (constraint_id, registration, config, penalized), future in zip(
+                jobs, futures, strict=True
+            ):
+                text, state = future.result()
+                var_offset = len(model.proto.variables) - first_var
+                constraint_offset = len(model.proto.constraints) - first_constraint
+                fragment = CpModelProto()
+                fragment.parse_text_format(
+                    _shift_fragment(text, first_var, var_offset) if var_offset else text
+                )
+                model.proto.merge_from(fragment)
+
+                def var_index(index: int, offset: int = var_offset) -> int:
+                    return index + offset if index >= first_var else index
+
+                def constraint_index(
+                    index: int, offset: int = constraint_offset
+                ) -> int:
+                    return index + offset if index >= first_constraint else index
+
+                constraint = registration.constraint_class(
+                    model, ss._variables, config
+                )
+                vars(constraint).update(
+                    _decode(state, model, var_index, constraint_index)
+                )
+                ss._constraints[constraint_id] = constraint
+                ss._assumption_groups.update(constraint.assumption_groups)
+                if penalized:
+                    ss._objective_builder.add_constraint(constraint)
+        ss._objective_builder.build()
@@ -0,0 +1,283 @@
+"""Portfolio solving - race several CP-SAT configurations on the same input."""
+
+import json
+import multiprocessing
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ortools.sat.python import cp_model
+
+from shift_solver.solver.result import SolverResult
+
+
+@dataclass(frozen=True)
+class PortfolioConfig:
+    """A named CP-SAT configuration raced in a portfolio.
+
+    Attributes:
+        name: Identifier used in results and win statistics
+        parameters: CP-SAT SatParameters field name to value
+    """
+
+    name: str
+    parameters: dict[str, Any] = field(default_factory=dict)
+
+
+# Complementary search strategies: the default multi-strategy search,
+# core-based lower bounding, aggressive symmetry detection, and a
+# differently seeded fixed-search run.
+DEFAULT_PORTFOLIO: tuple[PortfolioConfig, ...] = (
+    PortfolioConfig(name="default"),
+    PortfolioConfig(name="core", parameters={"optimize_with_core": True}),
+    PortfolioConfig(name="symmetry", parameters={"symmetry_level": 4}),
+    PortfolioConfig(
+        name="fixed_search",
+        parameters={"search_branching": cp_model.FIXED_SEARCH, "random_seed": 7},
+    ),
+)
+
+
+@dataclass
+class PortfolioStats:
+    """Per-configuration win statistics, persisted as JSON.
+
+    Usage:
+        stats = PortfolioStats.load(Path("portfolio_stats.json"))
+        solver.solve_portfolio(time_limit_seconds=60, stats=stats)
+        stats.save(Path("portfolio_stats.json"))
+    """
+
+    runs: dict[str, int] = field(default_factory=dict)
+    wins: dict[str, int] = field(default_factory=dict)
+
+    def record(self, winner: str | None, names: Sequence[str]) -> None:
+        """Record one portfolio run and its winning configuration."""
+        for name in names:
+            self.runs[name] = self.runs.get(name, 0) + 1
+        if winner is not None:
+            self.wins[winner] = self.wins.get(winner, 0) + 1
+
+    def win_rate(self, name: str) -> float:
+        """Return the fraction of runs a configuration won."""
+        runs = self.runs.get(name, 0)
+        return self.wins.get(name, 0) / runs if runs else 0.0
+
+    @classmethod
+    def load(cls, path: Path) -> "PortfolioStats":
+        """Load statistics from a JSON file, or start empty if it is missing."""
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text())
+        return cls(runs=dict(data.get("runs", {})), wins=dict(data.get("wins", {})))
+
+    def save(self, path: Path) -> None:
+        """Write statistics to a JSON file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"runs": self.runs, "wins": self.wins}, indent=2))
+
+
+# Shared between portfolio processes; set by _init_worker in each child
+_shared_best: Any = None
+_shared_stop: Any = None
+
+
+def _init_worker(best: Any, stop: Any) -> None:
+    """Install the shared incumbent and stop flag in a portfolio process."""
+    global _shared_best, _shared_stop
+    _shared_best = best
+    _shared_stop = stop
+
+
+class _PortfolioCallback(cp_model.CpSolverSolutionCallback):
+    """Publishes each solution to the shared incumbent.
+
+    Stops the search when another configuration has signalled completion
+    or holds an incumbent this configuration's bound proves it cannot beat.
+    """
+
+    def on_solution_callback(self) -> None:
+        objective = self.ObjectiveValue()
+        with _shared_best.get_lock():
+            if objective < _shared_best.value:
+                _shared_best.value = objective
+            incumbent = _shared_best.value
+        if _shared_stop.is_set() or (
+            objective > incumbent and self.BestObjectiveBound() >= incumbent
+        ):
+            self.StopSearch()
+
+
+def _solve_config(
+    solver_kwargs: dict[str, Any],
+    config: PortfolioConfig,
+    time_limit_seconds: int,
+    num_workers: int | None,
+    relative_gap_limit: float | None,
+) -> tuple[str, SolverResult]:
+    """Solve one portfolio configuration (runs in a child process)."""
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+    solver = ShiftSolver(**solver_kwargs)
+    finished = threading.Event()
+
+    def _watch_stop() -> None:
+        # Interrupts a search that has stopped finding solutions
+        while not finished.is_set():
+            if _shared_stop.wait(0.1):
+                break
+        # The CpSolver may not exist yet if the model is still being built
+        while not finished.wait(0.1):
+            if solver._solver is not None:
+                solver._solver.stop_search()
+
+    watcher = threading.Thread(target=_watch_stop, daemon=True)
+    watcher.start()
+    try:
+        result = solver.solve(
+            time_limit_seconds=time_limit_seconds,
+            num_workers=num_workers,
+            relative_gap_limit=relative_gap_limit,
+            solution_callback=_PortfolioCallback(),
+            parameters=config.parameters,
+        )
+    finally:
+        finished.set()
+    if result.status == cp_model.OPTIMAL:
+        _shared_stop.set()
+    return config.name, result
+
+
+class PortfolioSolver:
+    """Runs several CP-SAT configurations in parallel processes.
+
+    Each process rebuilds the model from the same solver inputs and solves
+    it with its own parameters. Processes share the best objective found so
+    far; the overall best result is returned.
+
+    Usage:
+        portfolio = PortfolioSolver(solver_kwargs=solver._solver_kwargs())
+        result = portfolio.solve(time_limit_seconds=60)
+        winner = result.statistics["portfolio"]["winner"]
+    """
+
+    def __init__(
+        self,
+        solver_kwargs: dict[str, Any],
+        configs: Sequence[PortfolioConfig] | None = None,
+        num_workers_per_config: int | None = None,
+    ) -> None:
+        """
+        Initialize the portfolio.
+
+        Args:
+            solver_kwargs: ShiftSolver constructor arguments
+            configs: Configurations to race (defaults to DEFAULT_PORTFOLIO)
+            num_workers_per_config: CP-SAT search workers per configuration;
+                defaults to an even share of the available CPUs
+
+        Raises:
+            ValueError: If configs is empty or has duplicate names
+        """
+        self.solver_kwargs = solver_kwargs
+        self.configs = list(configs if configs is not None else DEFAULT_PORTFOLIO)
+        if not self.configs:
+            raise ValueError("portfolio needs at least one configuration")
+        names = [c.name for c in self.configs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"duplicate portfolio configuration names: {names}")
+        if num_workers_per_config is None:
+            cpus = multiprocessing.cpu_count()
+            num_workers_per_config = max(1, cpus // len(self.configs))
+        self.num_workers_per_config = num_workers_per_config
+
+    def solve(
+        self,
+        time_limit_seconds: int = 300,
+        relative_gap_limit: float | None = None,
+        stats: PortfolioStats | None = None,
+    ) -> SolverResult:
+        """
+        Race all configurations and return the best result.
+
+        Args:
+            time_limit_seconds: Solve time limit of each configuration; the
+                wall time also includes spawning the processes and building
+                each model
+            relative_gap_limit: Optimality gap tolerance (0.0 = optimal)
+            stats: Optional PortfolioStats updated with the winner
+
+        Returns:
+            The winning SolverResult, with statistics["portfolio"] holding
+            the winner name and each configuration's outcome
+        """
+        start_time = time.time()
+        ctx = multiprocessing.get_context("spawn")
+        best = ctx.Value("d", float("inf"))
+        stop = ctx.Event()
+
+        results: dict[str, SolverResult] = {}
+        with ProcessPoolExecutor(
+            max_workers=len(self.configs),
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(best, stop),
+        ) as executor:
+            pending = {
+                executor.submit(
+                    _solve_config,
+                    self.solver_kwargs,
+                    config,
+                    time_limit_seconds,
+                    self.num_workers_per_config,
+                    relative_gap_limit,
+                )
+                for config in self.configs
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, result = future.result()
+                    results[name] = result
+                    if result.status == cp_model.OPTIMAL:
+                        stop.set()
+
+        winner = self._pick_winner(results)
+        runs = [
+            {
+                "name": config.name,
+                "status_name": results[config.name].status_name,
+                "objective_value": results[config.name].objective_value,
+                "solve_time_seconds": results[config.name].solve_time_seconds,
+            }
+            for config in self.configs
+        ]
+        if stats is not None:
+            stats.record(winner, [c.name for c in self.configs])
+
+        # Without a winner no configuration found a solution; report the
+        # first outcome
+        result = results[winner if winner is not None else self.configs[0].name]
+        result.solve_time_seconds = time.time() - start_time
+        result.statistics["portfolio"] = {"winner": winner, "runs": runs}
+        return result
+
+    def _pick_winner(self, results: dict[str, SolverResult]) -> str | None:
+        """Return the configuration with the best objective, earliest on ties."""
+        solved = [
+            (
+                r.objective_value if r.objective_value is not None else 0.0,
+                r.status != cp_model.OPTIMAL,
+                r.solve_time_seconds,
+                name,
+            )
+            for name, r in results.items()
+            if r.success
+        ]
+        if not solved:
+            return None
+        return min(solved)[-1]
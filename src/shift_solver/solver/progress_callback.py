@@ -14,8 +14,12 @@ class SolverProgressCallback(cp_model.CpSolverSolutionCallback):
     Args:
         cancel_event: Threading event checked each callback; triggers StopSearch() if set.
         on_progress: Callable receiving a dict of progress data, throttled to
-            once per ``throttle_seconds``.
+            once per ``throttle_seconds``. Intended for slow sinks such as
+            database checkpoints.
         throttle_seconds: Minimum interval between on_progress calls.
+        publish: Callable receiving the same progress dict on every solution,
+            unthrottled. Intended for cheap in-process fan-out (e.g. a pub/sub
+            feeding live progress streams).
     """
 
     def __init__(
@@ -23,11 +27,13 @@ class SolverProgressCallback(cp_model.CpSolverSolutionCallback):
         cancel_event: threading.Event | None = None,
         on_progress: Callable[[dict[str, Any]], None] | None = None,
         throttle_seconds: float = 1.0,
+        publish: Callable[[dict[str, Any]], None] | None = None,
     ) -> None:
         super().__init__()
         self._cancel_event = cancel_event
         self._on_progress = on_progress
         self._throttle_seconds = throttle_seconds
+        self._publish = publish
         self._solutions_found = 0
         self._last_report_time = 0.0
         self._start_time = time.monotonic()
@@ -44,25 +50,33 @@ class SolverProgressCallback(cp_model.CpSolverSolutionCallback):
             self.StopSearch()
             return
 
+        now = time.monotonic()
+        checkpoint_due = (
+            self._on_progress is not None
+            and now - self._last_report_time >= self._throttle_seconds
+        )
+        if self._publish is None and not checkpoint_due:
+            return
+
+        data = self._progress_data(now)
+        if self._publish is not None:
+            self._publish(data)
+
         # Throttled progress reporting
-        if self._on_progress is not None:
-            now = time.monotonic()
-            if now - self._last_report_time >= self._throttle_seconds:
-                self._last_report_time = now
-                objective = self.ObjectiveValue()
-                best_bound = self.BestObjectiveBound()
-                gap = (
-                    abs(objective - best_bound)
-                    / max(1.0, abs(objective))
-                    * 100
-                )
-                self._on_progress(
-                    {
-                        "phase": "solving",
-                        "solutions_found": self._solutions_found,
-                        "objective_value": objective,
-                        "best_bound": best_bound,
-                        "gap_percent": round(gap, 2),
-                        "wall_time": round(now - self._start_time, 1),
-                    }
-                )
+        if checkpoint_due and self._on_progress is not None:
+            self._last_report_time = now
+            self._on_progress(data)
+
+    def _progress_data(self, now: float) -> dict[str, Any]:
+        """Build the progress payload for the current solution."""
+        objective = self.ObjectiveValue()
+        best_bound = self.BestObjectiveBound()
+        gap = abs(objective - best_bound) / max(1.0, abs(objective)) * 100
+        return {
+            "phase": "solving",
+            "solutions_found": self._solutions_found,
+            "objective_value": objective,
+            "best_bound": best_bound,
+            "gap_percent": round(gap, 2),
+            "wall_time": round(now - self._start_time, 1),
+        }
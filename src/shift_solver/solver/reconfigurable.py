@@ -0,0 +1,173 @@
+"""Cached CP model whose constraints can be toggled and reweighted in place."""
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat.python import cp_model
+
+from shift_solver.constraints.base import BaseConstraint, ConstraintConfig
+from shift_solver.solver.constraint_registry import ConstraintRegistry
+from shift_solver.solver.objective_builder import ObjectiveBuilder, ObjectiveTerm
+from shift_solver.solver.types import SolverVariables
+from shift_solver.solver.variable_builder import VariableBuilder
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+# Constraint kinds CP-SAT accepts enforcement literals on
+ENFORCEABLE_CONSTRAINTS = ("bool_or", "bool_and", "linear")
+# Kinds that only define auxiliary variables (max/min equalities) and cannot
+# restrict assignments on their own, so they are left unguarded; any other
+# kind cannot be switched off and is rejected
+AUXILIARY_CONSTRAINTS = ("lin_max",)
+
+
+@dataclass
+class _BuiltConstraint:
+    """A constraint applied to the cached model."""
+
+    constraint: BaseConstraint
+    literal: cp_model.IntVar
+    terms: list[ObjectiveTerm]
+
+
+class ReconfigurableModel:
+    """
+    A model in which every constraint is built at most once.
+
+    A constraint is applied the first time it is enabled and guarded by
+    its own enforcement literal; its soft objective terms are kept with
+    their weights as parameters. Disabling, re-enabling and reweighting
+    then only fix a literal's domain and rewrite the objective, instead
+    of rebuilding variables and constraints. Constraints that were never
+    enabled are not built at all. A change to a built constraint's
+    is_hard flag or parameters changes its structure and still rebuilds.
+
+    Usage:
+        model = ReconfigurableModel(shift_solver)
+        model.sync()
+        shift_solver.constraint_configs["fairness"] = ConstraintConfig(
+            enabled=False, is_hard=False
+        )
+        model.sync()  # no rebuild
+        solver.Solve(model.model)
+    """
+
+    def __init__(self, shift_solver: "ShiftSolver") -> None:
+        """
+        Initialize the reconfigurable model.
+
+        Args:
+            shift_solver: Solver providing the inputs and constraint configs
+        """
+        self.shift_solver = shift_solver
+        self.model = cp_model.CpModel()
+        self.variables: SolverVariables | None = None
+        self.objective_builder = ObjectiveBuilder(self.model)
+        self.rebuilds = 0
+        self._built: dict[str, _BuiltConstraint] = {}
+        self._structure: dict[str, tuple[bool, dict[str, Any] | None]] = {}
+
+    def sync(self) -> None:
+        """
+        Bring the cached model in line with the solver's constraint configs.
+
+        Raises:
+            ValueError: If a constraint emits a CP-SAT constraint kind that
+                cannot be guarded by an enforcement literal
+        """
+        configs = self._resolve()
+        if self.variables is None or any(
+            self._structure[constraint_id]
+            != (configs[constraint_id].is_hard, configs[constraint_id].parameters)
+            for constraint_id in self._built
+        ):
+            self._build_variables()
+        for constraint_id, config in configs.items():
+            if config.enabled and constraint_id not in self._built:
+                try:
+                    self._apply(constraint_id, config)
+                except Exception:
+                    # The failed constraint may be partly applied and
+                    # unguarded; start over on the next sync
+                    self.variables = None
+                    raise
+
+        proto_vars = self.model.proto.variables
+        for constraint_id, built in self._built.items():
+            domain = proto_vars[built.literal.index].domain
+            domain[0] = domain[1] = int(configs[constraint_id].enabled)
+        self._update_objective(configs)
+
+    def _resolve(self) -> dict[str, ConstraintConfig]:
+        """Effective config of every registered constraint."""
+        return {
+            constraint_id: self.shift_solver._resolve_constraint_config(
+                constraint_id, registration
+            )
+            for constraint_id, registration in ConstraintRegistry.get_all_constraints().items()
+        }
+
+    def _build_variables(self) -> None:
+        """Start a new model with only the assignment variables."""
+        ss = self.shift_solver
+        self.model = cp_model.CpModel()
+        self.variables = VariableBuilder(
+            model=self.model,
+            workers=ss.workers,
+            shift_types=ss.shift_types,
+            num_periods=ss.num_periods,
+        ).build()
+        self.objective_builder = ObjectiveBuilder(self.model)
+        self._built = {}
+        self._structure = {}
+        self.rebuilds += 1
+
+    def _apply(self, constraint_id: str, config: ConstraintConfig) -> None:
+        """Apply one constraint to the cached model behind its literal."""
+        assert self.variables is not None
+        registration = ConstraintRegistry.get_all_constraints()[constraint_id]
+        constraint = registration.constraint_class(self.model, self.variables, config)
+        proto_constraints = self.model.proto.constraints
+        first = len(proto_constraints)
+        constraint.apply(**self.shift_solver._constraint_context())
+        literal = self.model.new_bool_var(f"enabled_{constraint_id}")
+        for index in range(first, len(proto_constraints)):
+            ct = proto_constraints[index]
+            if any(getattr(ct, f"has_{kind}")() for kind in ENFORCEABLE_CONSTRAINTS):
+                ct.enforcement_literal.append(literal.index)
+            elif not any(
+                getattr(ct, f"has_{kind}")() for kind in AUXILIARY_CONSTRAINTS
+            ):
+                raise ValueError(
+                    f"Constraint '{constraint_id}' adds a CP-SAT constraint "
+                    "that cannot be disabled in a reconfigurable model"
+                )
+
+        builder = ObjectiveBuilder(self.model)
+        builder.add_constraint(constraint)
+        builder.build()
+        self._built[constraint_id] = _BuiltConstraint(
+            constraint=constraint, literal=literal, terms=builder.objective_terms
+        )
+        self._structure[constraint_id] = (config.is_hard, config.parameters)
+
+    def _update_objective(self, configs: dict[str, ConstraintConfig]) -> None:
+        """Minimize the terms of enabled soft constraints at current weights."""
+        enabled = [
+            (built, configs[constraint_id].weight)
+            for constraint_id, built in self._built.items()
+            if configs[constraint_id].enabled
+        ]
+        terms = [
+            replace(term, base_weight=weight)
+            for built, weight in enabled
+            for term in built.terms
+        ]
+        self.objective_builder.constraints = [built.constraint for built, _ in enabled]
+        self.objective_builder.objective_terms = terms
+        self.model.clear_objective()
+        if terms:
+            self.model.minimize(
+                sum(term.variable * term.effective_weight for term in terms)
+            )
@@ -0,0 +1,270 @@
+"""Minimal-change repair of a published schedule after availability changes."""
+
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat.python import cp_model
+
+from shift_solver.models import Availability, Schedule
+from shift_solver.solver.lns import AssignmentKey, _fixed_assignments
+from shift_solver.solver.result import SolverResult
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+
+def schedule_assignment_keys(schedule: Schedule) -> set[AssignmentKey]:
+    """Return the (worker_id, period, shift_type_id) keys assigned in a schedule."""
+    return {
+        (worker_id, period.period_index, shift.shift_type_id)
+        for period in schedule.periods
+        for worker_id, shifts in period.assignments.items()
+        for shift in shifts
+    }
+
+
+class ScheduleRepairer:
+    """Repairs a published schedule with as few changes as possible.
+
+    New availability records are merged into the solver's inputs and the
+    periods where they conflict with the published assignments are found.
+    A model is built in which every assignment outside those periods (plus
+    an optional window around them) is fixed to its published value, so
+    presolve reduces it to the affected part. It is then solved
+    lexicographically: first minimizing the number of changed assignments,
+    then the usual soft-constraint objective at that number of changes.
+
+    Usage:
+        repairer = ScheduleRepairer(shift_solver, window_periods=1)
+        result = repairer.repair(schedule, new_availabilities)
+        changes = result.statistics["repair"]["changes"]
+    """
+
+    def __init__(self, shift_solver: "ShiftSolver", window_periods: int = 0) -> None:
+        """
+        Initialize the repairer.
+
+        Args:
+            shift_solver: Solver holding the inputs the schedule was built from
+            window_periods: Extra periods freed on each side of an affected one
+
+        Raises:
+            ValueError: If window_periods is negative
+        """
+        if window_periods < 0:
+            raise ValueError("window_periods must be non-negative")
+        self.shift_solver = shift_solver
+        self.window_periods = window_periods
+
+    def repair(
+        self,
+        schedule: Schedule,
+        new_availabilities: Sequence[Availability],
+        time_limit_seconds: float = 60,
+        num_workers: int | None = None,
+        solution_callback: cp_model.CpSolverSolutionCallback | None = None,
+    ) -> SolverResult:
+        """
+        Repair a schedule against new availability records.
+
+        Args:
+            schedule: Published schedule over the solver's periods
+            new_availabilities: Availability records to add to the inputs
+            time_limit_seconds: Total time for both optimization stages
+            num_workers: CP-SAT search workers for each stage
+            solution_callback: CP-SAT solution callback, used by both stages
+
+        Returns:
+            SolverResult with the repaired schedule and statistics["repair"]
+            holding the affected periods and the list of changes
+
+        Raises:
+            ValueError: If the schedule's periods do not match the solver's
+        """
+        start_time = time.time()
+        ss = self._merged_solver(schedule, new_availabilities)
+        published = schedule_assignment_keys(schedule)
+        affected = self._affected_periods(ss, published, new_availabilities)
+
+        if not affected:
+            return SolverResult(
+                success=True,
+                schedule=schedule,
+                status=int(cp_model.OPTIMAL),
+                status_name="UNCHANGED",
+                solve_time_seconds=time.time() - start_time,
+                statistics={"repair": self._statistics([], 0, [])},
+            )
+
+        pre_solve_failure = ss._pre_solve_failure(start_time)
+        if pre_solve_failure is not None:
+            return pre_solve_failure
+
+        ss._build_model()
+        model = ss._model
+        variables = ss._variables
+        objective_builder = ss._objective_builder
+        assert model is not None and variables is not None
+        assert objective_builder is not None
+        assignment_vars = list(variables.all_assignment_vars())
+        free_periods = set(affected)
+
+        original = {
+            (w, p, s): int((w, p, s) in published) for w, p, s, _ in assignment_vars
+        }
+        free = [(w, p, s, var) for w, p, s, var in assignment_vars if p in free_periods]
+        frozen = {key: v for key, v in original.items() if key[1] not in free_periods}
+        changes = sum(
+            1 - var if original[(w, p, s)] else var for w, p, s, var in free
+        )
+        soft_objective = sum(
+            term.variable * term.effective_weight
+            for term in objective_builder.objective_terms
+        )
+
+        with _fixed_assignments(model, assignment_vars, original, frozen):
+            # Stage 1: fewest changed assignments
+            model.minimize(changes)
+            solver = ss._create_solver(
+                time_limit_seconds=time_limit_seconds / 2, num_workers=num_workers
+            )
+            status = solver.Solve(model, solution_callback)
+            if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                return SolverResult(
+                    success=False,
+                    schedule=None,
+                    status=int(status),
+                    status_name=solver.StatusName(status),
+                    solve_time_seconds=time.time() - start_time,
+                    statistics={"repair": self._statistics(affected, len(free), [])},
+                )
+            min_changes = round(solver.ObjectiveValue())
+            changes_proven = status == cp_model.OPTIMAL
+
+            # Stage 2: soft objective without exceeding that many changes,
+            # skipped when stage 1 used up the time limit
+            remaining = time_limit_seconds - (time.time() - start_time)
+            if objective_builder.objective_terms and remaining > 0:
+                model.add(changes <= min_changes)
+                model.clear_hints()
+                for *_, var in assignment_vars:
+                    model.add_hint(var, solver.Value(var))
+                model.minimize(soft_objective)
+                stage2 = ss._create_solver(
+                    time_limit_seconds=remaining, num_workers=num_workers
+                )
+                stage2_status = stage2.Solve(model, solution_callback)
+                if stage2_status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                    solver, status = stage2, stage2_status
+                    objective_value = stage2.ObjectiveValue()
+                else:
+                    objective_value = solver.Value(soft_objective)
+            elif objective_builder.objective_terms:
+                # The soft objective was never optimized
+                status = cp_model.FEASIBLE
+                objective_value = solver.Value(soft_objective)
+            else:
+                objective_value = 0.0
+
+        repaired = {
+            (w, p, s) for w, p, s, var in assignment_vars if solver.Value(var)
+        }
+        changed = [
+            {
+                "worker_id": w,
+                "period": p,
+                "shift_type_id": s,
+                "action": "added" if (w, p, s) in repaired else "removed",
+            }
+            for w, p, s in sorted(repaired ^ published)
+        ]
+        ss._solver = solver
+        optimal = changes_proven and status == cp_model.OPTIMAL
+
+        return SolverResult(
+            success=True,
+            schedule=ss._extract_schedule(None, assigned=repaired),
+            status=int(cp_model.OPTIMAL if optimal else cp_model.FEASIBLE),
+            status_name="OPTIMAL" if optimal else "FEASIBLE",
+            solve_time_seconds=time.time() - start_time,
+            objective_value=objective_value,
+            statistics={"repair": self._statistics(affected, len(free), changed)},
+        )
+
+    def affected_periods(
+        self, schedule: Schedule, new_availabilities: Sequence[Availability]
+    ) -> list[int]:
+        """
+        Periods a repair would re-optimize, without building a model.
+
+        An empty list means the schedule does not conflict with the new
+        availability records and repair() would return it unchanged.
+
+        Raises:
+            ValueError: If the schedule's periods do not match the solver's
+        """
+        ss = self._merged_solver(schedule, new_availabilities)
+        return self._affected_periods(
+            ss, schedule_assignment_keys(schedule), new_availabilities
+        )
+
+    def _merged_solver(
+        self, schedule: Schedule, new_availabilities: Sequence[Availability]
+    ) -> "ShiftSolver":
+        """Copy of the base solver with the new availability records added."""
+        from shift_solver.solver.shift_solver import ShiftSolver
+
+        base = self.shift_solver
+        if schedule.num_periods != base.num_periods:
+            raise ValueError(
+                f"schedule has {schedule.num_periods} periods, "
+                f"solver has {base.num_periods}"
+            )
+        kwargs = base._solver_kwargs()
+        kwargs["availabilities"] = [*base.availabilities, *new_availabilities]
+        return ShiftSolver(**kwargs)
+
+    def _affected_periods(
+        self,
+        ss: "ShiftSolver",
+        published: set[AssignmentKey],
+        new_availabilities: Sequence[Availability],
+    ) -> list[int]:
+        """Periods where new unavailability conflicts, widened by the window."""
+        shift_ids = [st.id for st in ss.shift_types]
+        conflicts: set[int] = set()
+        for availability in new_availabilities:
+            if availability.availability_type != "unavailable":
+                continue
+            blocked = (
+                [availability.shift_type_id]
+                if availability.shift_type_id
+                else shift_ids
+            )
+            for period, (p_start, p_end) in enumerate(ss.period_dates):
+                if availability.start_date > p_end or availability.end_date < p_start:
+                    continue
+                if any(
+                    (availability.worker_id, period, s) in published for s in blocked
+                ):
+                    conflicts.add(period)
+
+        affected: set[int] = set()
+        for period in conflicts:
+            first = max(0, period - self.window_periods)
+            last = min(ss.num_periods - 1, period + self.window_periods)
+            affected.update(range(first, last + 1))
+        return sorted(affected)
+
+    @staticmethod
+    def _statistics(
+        affected: list[int], free_variables: int, changes: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Build the statistics["repair"] entry."""
+        return {
+            "affected_periods": affected,
+            "free_variables": free_variables,
+            "changed_assignments": len(changes),
+            "changes": changes,
+        }
@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from shift_solver.models import Schedule
+from shift_solver.solver.search_log import SearchTimeline
 
 
 @dataclass
@@ -17,3 +18,6 @@ class SolverResult:
     solve_time_seconds: float
     objective_value: float | None = None
     feasibility_issues: list[dict[str, Any]] | None = field(default=None)
+    statistics: dict[str, Any] = field(default_factory=dict)
+    alternatives: list[Schedule] = field(default_factory=list)
+    search_timeline: SearchTimeline | None = None
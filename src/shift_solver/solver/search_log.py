@@ -0,0 +1,224 @@
+"""Structured timeline parsed from the CP-SAT search log."""
+
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+# Progress lines: "#3  0.67s best:400  next:[0,380]  no_lp" and
+# "#Bound  1.24s best:inf  next:[0,42600]  initial_domain"
+_PROGRESS = re.compile(
+    r"^#(?P<tag>\d+|Bound|Done)\s+(?P<time>[\d.]+)s"
+    r"(?:\s+best:(?P<best>\S+)\s+next:\[(?P<next>[^\]]*)\])?\s*(?P<subsolver>.*)$"
+)
+_PRESOLVE_START = re.compile(r"^Starting presolve at ([\d.]+)s")
+_SEARCH_START = re.compile(r"^Starting search at ([\d.]+)s with (\d+) workers?")
+# Table rows: "  'rnd_var_lns':  1/1  100%  7.07e-01  0.10"
+_TABLE_ROW = re.compile(r"^\s*'(?P<name>[^']+)':\s+(?P<cells>.*)$")
+_SUMMARY_FIELD = re.compile(r"^(status|objective|best_bound|walltime): (\S+)$")
+# Subsolver names are followed by their parameters: "fj_restart(batch:1 ...)"
+_SUBSOLVER_DETAILS = re.compile(r"[ (]")
+
+
+def _number(text: str) -> float | None:
+    """Parse a logged number ("1'234", "inf", "NA") or None."""
+    try:
+        value = float(text.replace("'", ""))
+    except ValueError:
+        return None
+    return value if abs(value) != float("inf") else None
+
+
+@dataclass
+class TimelineEvent:
+    """An incumbent or bound improvement during search."""
+
+    time_seconds: float
+    kind: str  # "solution" or "bound"
+    objective: float | None
+    bound: float | None
+    subsolver: str
+
+
+@dataclass
+class LNSStats:
+    """How often one LNS neighborhood improved the incumbent."""
+
+    improvements: int
+    calls: int
+    closed_percent: float | None = None
+    difficulty: float | None = None
+
+    @property
+    def success_rate(self) -> float | None:
+        """Fraction of calls that improved the incumbent."""
+        return self.improvements / self.calls if self.calls else None
+
+
+@dataclass
+class SearchTimeline:
+    """
+    A CP-SAT solve reconstructed from its search log.
+
+    Times are seconds since the solve started. The incumbent and bound
+    histories show where the time went: a bound that stays far below a
+    flat incumbent points at the formulation (weak relaxation), a
+    steadily improving incumbent at the time limit, and improvements that
+    all come from one subsolver at the worker mix.
+    """
+
+    events: list[TimelineEvent] = field(default_factory=list)
+    presolve_seconds: float | None = None
+    search_start_seconds: float | None = None
+    num_workers: int | None = None
+    solutions_by_subsolver: dict[str, int] = field(default_factory=dict)
+    bounds_by_subsolver: dict[str, int] = field(default_factory=dict)
+    lns: dict[str, LNSStats] = field(default_factory=dict)
+    status: str | None = None
+    objective: float | None = None
+    best_bound: float | None = None
+    wall_time_seconds: float | None = None
+
+    @classmethod
+    def parse(cls, lines: list[str]) -> "SearchTimeline":
+        """
+        Build a timeline from CP-SAT log output.
+
+        Args:
+            lines: Log callback messages; a message may hold several lines
+
+        Returns:
+            SearchTimeline with whatever the log contained
+        """
+        timeline = cls()
+        presolve_start: float | None = None
+        table: str | None = None
+        for line in "\n".join(lines).splitlines():
+            if not line.strip():
+                table = None
+                continue
+            if match := _PROGRESS.match(line):
+                timeline._add_progress(match)
+            elif match := _PRESOLVE_START.match(line):
+                presolve_start = float(match.group(1))
+            elif match := _SEARCH_START.match(line):
+                timeline.search_start_seconds = float(match.group(1))
+                timeline.num_workers = int(match.group(2))
+                if presolve_start is not None:
+                    timeline.presolve_seconds = (
+                        timeline.search_start_seconds - presolve_start
+                    )
+            elif match := _SUMMARY_FIELD.match(line):
+                timeline._add_summary(match.group(1), match.group(2))
+            elif not line.startswith(" "):
+                # Table headers sit at column 0, their rows are indented
+                table = line.split("  ")[0].split(" (")[0]
+            elif table is not None and (match := _TABLE_ROW.match(line)):
+                timeline._add_table_row(table, match["name"], match["cells"].split())
+        return timeline
+
+    def _add_progress(self, match: re.Match[str]) -> None:
+        """Record an incumbent or bound improvement."""
+        tag = match["tag"]
+        if tag == "Done":
+            return
+        best = bound = None
+        # Satisfaction models log solutions without best and next
+        if match["best"] is not None:
+            best = _number(match["best"])
+            bounds = match["next"].split(",")
+            # An empty next domain means the incumbent is proven optimal
+            bound = _number(bounds[0]) if bounds[0] else best
+        self.events.append(
+            TimelineEvent(
+                time_seconds=float(match["time"]),
+                kind="bound" if tag == "Bound" else "solution",
+                objective=best,
+                bound=bound,
+                subsolver=_SUBSOLVER_DETAILS.split(match["subsolver"])[0],
+            )
+        )
+
+    def _add_summary(self, name: str, value: str) -> None:
+        """Record a field of the final response summary."""
+        if name == "status":
+            self.status = value
+        elif name == "objective":
+            self.objective = _number(value)
+        elif name == "best_bound":
+            self.best_bound = _number(value)
+        else:
+            self.wall_time_seconds = _number(value)
+
+    def _add_table_row(self, table: str, name: str, cells: list[str]) -> None:
+        """Record a row of one of the end-of-search statistics tables."""
+        if table == "Solutions":
+            self.solutions_by_subsolver[name] = int(cells[0].replace("'", ""))
+        elif table == "Objective bounds":
+            self.bounds_by_subsolver[name] = int(cells[0].replace("'", ""))
+        elif table == "LNS stats" and "/" in cells[0]:
+            improvements, calls = cells[0].replace("'", "").split("/")
+            closed, difficulty = (cells[1:3] + ["NA", "NA"])[:2]
+            self.lns[name] = LNSStats(
+                improvements=int(improvements),
+                calls=int(calls),
+                closed_percent=_number(closed.rstrip("%")),
+                difficulty=_number(difficulty),
+            )
+
+    def incumbent_history(self) -> list[tuple[float, float]]:
+        """(time, objective) at each new incumbent."""
+        return [
+            (event.time_seconds, event.objective)
+            for event in self.events
+            if event.kind == "solution" and event.objective is not None
+        ]
+
+    def bound_history(self) -> list[tuple[float, float]]:
+        """(time, bound) wherever the proven bound moved."""
+        history: list[tuple[float, float]] = []
+        for event in self.events:
+            if event.bound is None or (history and history[-1][1] == event.bound):
+                continue
+            history.append((event.time_seconds, event.bound))
+        return history
+
+    def improvements_by_subsolver(self) -> dict[str, int]:
+        """Number of new incumbents each subsolver found."""
+        counts: dict[str, int] = {}
+        for event in self.events:
+            if event.kind == "solution":
+                counts[event.subsolver] = counts.get(event.subsolver, 0) + 1
+        return counts
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form."""
+        data = asdict(self)
+        for name, stats in self.lns.items():
+            data["lns"][name]["success_rate"] = stats.success_rate
+        data["improvements_by_subsolver"] = self.improvements_by_subsolver()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SearchTimeline":
+        """Rebuild a timeline stored with to_dict()."""
+        return cls(
+            events=[TimelineEvent(**event) for event in data.get("events", [])],
+            presolve_seconds=data.get("presolve_seconds"),
+            search_start_seconds=data.get("search_start_seconds"),
+            num_workers=data.get("num_workers"),
+            solutions_by_subsolver=data.get("solutions_by_subsolver", {}),
+            bounds_by_subsolver=data.get("bounds_by_subsolver", {}),
+            lns={
+                name: LNSStats(
+                    improvements=stats["improvements"],
+                    calls=stats["calls"],
+                    closed_percent=stats.get("closed_percent"),
+                    difficulty=stats.get("difficulty"),
+                )
+                for name, stats in data.get("lns", {}).items()
+            },
+            status=data.get("status"),
+            objective=data.get("objective"),
+            best_bound=data.get("best_bound"),
+            wall_time_seconds=data.get("wall_time_seconds"),
+        )
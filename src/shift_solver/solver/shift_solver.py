@@ -1,8 +1,11 @@
 """ShiftSolver - main orchestrator for shift scheduling optimization."""
 
+import threading
 import time as time_module
+from collections.abc import Collection, Sequence
+from dataclasses import replace
 from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ortools.sat.python import cp_model
 
@@ -10,9 +13,15 @@ from shift_solver.config.schema import (
     parse_shift_frequency_requirements,
     parse_shift_order_preferences,
 )
-from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.constraints.base import (
+    AssumptionGroup,
+    BaseConstraint,
+    ConstraintConfig,
+)
+from shift_solver.constraints.coverage import CoverageConstraint
 from shift_solver.models import (
     Availability,
+    Schedule,
     SchedulingRequest,
     ShiftFrequencyRequirement,
     ShiftOrderPreference,
@@ -20,16 +29,33 @@ from shift_solver.models import (
     Worker,
 )
 from shift_solver.solver.constraint_registry import (
+    ConstraintRegistration,
     ConstraintRegistry,
     register_builtin_constraints,
 )
+from shift_solver.solver.greedy import GreedySchedule, GreedyScheduler
 from shift_solver.solver.objective_builder import ObjectiveBuilder
+from shift_solver.solver.reconfigurable import ReconfigurableModel
 from shift_solver.solver.result import SolverResult
+from shift_solver.solver.search_log import SearchTimeline
 from shift_solver.solver.solution_extractor import SolutionExtractor
 from shift_solver.solver.types import SolverVariables
 from shift_solver.solver.variable_builder import VariableBuilder
 from shift_solver.validation.feasibility import FeasibilityChecker, FeasibilityResult
 
+if TYPE_CHECKING:
+    from shift_solver.solver.batch import BatchResult, Scenario
+    from shift_solver.solver.core_allocator import CoreAllocator
+    from shift_solver.solver.model_stats import ModelStats
+    from shift_solver.solver.portfolio import PortfolioConfig, PortfolioStats
+
+# Hard constraints the greedy heuristic always respects
+GREEDY_HARD_CONSTRAINTS = frozenset({"coverage", "restriction", "availability", "request"})
+
+# Cap on the assumption solves that explain an INFEASIBLE result; they are
+# also charged to what is left of the solve's own time limit
+EXPLAIN_INFEASIBILITY_SECONDS = 10.0
+
 
 class ShiftSolver:
     """
@@ -66,6 +92,9 @@ class ShiftSolver:
         constraint_configs: dict[str, ConstraintConfig] | None = None,
         shift_frequency_requirements: list[ShiftFrequencyRequirement] | None = None,
         shift_order_preferences: list[ShiftOrderPreference] | None = None,
+        reconfigurable: bool = False,
+        build_processes: int | None = None,
+        results_only: bool = False,
     ) -> None:
         """
         Initialize the ShiftSolver.
@@ -82,6 +111,15 @@ class ShiftSolver:
                 If not provided, will be parsed from constraint_configs["shift_frequency"]
             shift_order_preferences: Optional list of shift order preferences.
                 If not provided, will be parsed from constraint_configs["shift_order_preference"]
+            reconfigurable: Build each constraint once, when it is first
+                enabled, behind an enforcement literal, and reuse that model
+                across solves.
+                Changes to a constraint's enabled flag or weight (see
+                configure_constraint) are then applied as in-place model edits.
+            build_processes: Apply constraints in this many worker processes
+                and merge their model fragments (default: build sequentially)
+            results_only: Release the model, variables and CP-SAT solver as
+                soon as solve() has extracted its result (see release)
 
         Raises:
             ValueError: If required parameters are invalid
@@ -92,6 +130,8 @@ class ShiftSolver:
             raise ValueError("shift_types list cannot be empty")
         if not period_dates:
             raise ValueError("period_dates list cannot be empty")
+        if results_only and reconfigurable:
+            raise ValueError("results_only cannot keep a reconfigurable model")
 
         self.workers = workers
         self.shift_types = shift_types
@@ -101,6 +141,9 @@ class ShiftSolver:
         self.requests = requests or []
         self.constraint_configs = constraint_configs or {}
         self.num_periods = len(period_dates)
+        self.reconfigurable = reconfigurable
+        self.build_processes = build_processes
+        self.results_only = results_only
 
         # Parse shift_frequency_requirements from config if not provided
         if shift_frequency_requirements is not None:
@@ -131,17 +174,32 @@ class ShiftSolver:
         self._variables: SolverVariables | None = None
         self._solver: cp_model.CpSolver | None = None
         self._objective_builder: ObjectiveBuilder | None = None
+        self._assumption_groups: dict[str, AssumptionGroup] = {}
+        self._constraints: dict[str, BaseConstraint] = {}
+        self._worker_active: dict[str, cp_model.IntVar] = {}
+        self._reconfigurable_model: ReconfigurableModel | None = None
 
         # Ensure constraints are registered
         register_builtin_constraints()
 
     def solve(
         self,
-        time_limit_seconds: int = 300,
+        time_limit_seconds: float = 300,
         num_workers: int | None = None,
         relative_gap_limit: float | None = None,
         log_search_progress: bool | None = None,
         solution_callback: "cp_model.CpSolverSolutionCallback | None" = None,
+        parameters: dict[str, Any] | None = None,
+        use_greedy: bool = True,
+        greedy_fallback: bool = False,
+        explain_infeasibility: bool = True,
+        search_timeline: bool = False,
+        deterministic_time_limit: float | None = None,
+        random_seed: int | None = None,
+        reproducible: bool = False,
+        hint: Schedule | None = None,
+        stop_event: threading.Event | None = None,
+        reuse_model: bool = False,
     ) -> SolverResult:
         """
         Solve the shift scheduling problem.
@@ -152,25 +210,438 @@ class ShiftSolver:
             relative_gap_limit: Optimality gap tolerance (0.0 = optimal)
             log_search_progress: Whether to log solver search progress
             solution_callback: Optional CP-SAT solution callback for progress/cancel
+            parameters: Optional extra CP-SAT parameters (SatParameters field
+                name to value), applied after the named arguments above
+            use_greedy: Seed CP-SAT with a greedy schedule as a solution hint
+            greedy_fallback: If CP-SAT finds no solution within the time
+                limit, return the greedy schedule as a successful result
+                with status_name "GREEDY_FALLBACK" instead of failing
+                (requires use_greedy)
+            explain_infeasibility: On INFEASIBLE, run extra solves with
+                assumption literals and report a minimal set of conflicting
+                coverage, restriction, availability and hard request groups
+                in feasibility_issues; they get what is left of
+                time_limit_seconds, at most EXPLAIN_INFEASIBILITY_SECONDS
+            search_timeline: Capture CP-SAT's search log through a log
+                callback and attach the parsed SearchTimeline to the result;
+                the log still goes to stdout only with log_search_progress
+            deterministic_time_limit: Stop after this much CP-SAT
+                deterministic time, which unlike wall time does not depend
+                on machine load; time_limit_seconds stays as a wall-clock
+                cap
+            random_seed: Seed for CP-SAT's randomized search
+            reproducible: Interleave parallel workers so that a run with
+                deterministic_time_limit, random_seed and a fixed
+                num_workers repeats exactly. Interleaved workers take turns
+                on one thread pool instead of racing, which costs search
+                throughput; leave off for production solves
+            hint: Schedule over the same periods to hint instead of the
+                greedy one, e.g. the incumbent of an interrupted solve (the
+                greedy schedule remains the fallback)
+            stop_event: Once set, this solve's CP-SAT search stops and the
+                result holds what was found so far; if it is set before the
+                search starts (e.g. during the model build), the search
+                returns right away
+            reuse_model: Search the model left by the previous solve again,
+                skipping the feasibility check and model build; only the
+                hint is replaced. Falls back to a full solve if no model is
+                kept (first solve, release() or results_only)
 
         Returns:
-            SolverResult with success status, schedule, and statistics
+            SolverResult with success status, schedule, and statistics;
+            CP-SAT's deterministic time, conflicts, branches and user/wall
+            time are under statistics["cp_sat"], the model's variable and
+            constraint counts under statistics["model"], and the seconds
+            spent in the feasibility, build, search and extraction phases
+            under statistics["phases"] (a phase is missing if not reached)
+
+        Raises:
+            ValueError: If parameters names an unknown CP-SAT parameter
         """
         start_time = time_module.time()
+        phases: dict[str, float] = {}
+        phase_start = time_module.perf_counter()
+
+        reuse_model = reuse_model and self._model is not None
 
         # Run pre-solve feasibility check
-        feasibility_result = self._check_feasibility()
-        if not feasibility_result.is_feasible:
-            return SolverResult(
-                success=False,
-                schedule=None,
-                status=-1,  # Custom status for pre-solve failure
-                status_name="INFEASIBLE_PRE_SOLVE",
-                solve_time_seconds=time_module.time() - start_time,
-                feasibility_issues=feasibility_result.issues,
+        if not reuse_model:
+            pre_solve_failure = self._pre_solve_failure(start_time)
+            phases["feasibility"] = time_module.perf_counter() - phase_start
+            if pre_solve_failure is not None:
+                pre_solve_failure.statistics = {"phases": phases}
+                return pre_solve_failure
+
+        try:
+            # Create model, variables and constraints
+            phase_start = time_module.perf_counter()
+            if not reuse_model:
+                if self.reconfigurable:
+                    self._sync_reconfigurable_model()
+                else:
+                    self._build_model()
+
+            # Instant first schedule, used as a hint and as a fallback
+            greedy = self._greedy_schedule() if use_greedy else None
+            if hint is not None:
+                from shift_solver.solver.repair import schedule_assignment_keys
+
+                self._add_hint(schedule_assignment_keys(hint))
+            elif greedy is not None:
+                self._add_hint(greedy.assigned)
+
+            # Create and configure solver
+            self._solver = self._create_solver(
+                time_limit_seconds=time_limit_seconds,
+                num_workers=num_workers,
+                relative_gap_limit=relative_gap_limit,
+                log_search_progress=log_search_progress,
+                parameters=parameters,
+                deterministic_time_limit=deterministic_time_limit,
+                random_seed=random_seed,
+                reproducible=reproducible,
             )
+            log_lines: list[str] = []
+            if search_timeline:
+                self._solver.parameters.log_search_progress = True
+                self._solver.parameters.log_to_stdout = bool(log_search_progress)
+                self._solver.log_callback = log_lines.append
+            assert self._model is not None
+            phases["build"] = time_module.perf_counter() - phase_start
+
+            # Solve
+            phase_start = time_module.perf_counter()
+            search_done = threading.Event()
+            if stop_event is not None:
+                if stop_event.is_set():
+                    self._solver.parameters.max_time_in_seconds = 0.0
+                threading.Thread(
+                    target=_stop_search_on_event,
+                    args=(self._solver, stop_event, search_done),
+                    daemon=True,
+                ).start()
+            try:
+                if solution_callback is not None:
+                    status = self._solver.Solve(self._model, solution_callback)
+                else:
+                    status = self._solver.Solve(self._model)
+            finally:
+                search_done.set()
+            phases["search"] = time_module.perf_counter() - phase_start
+            solve_time = time_module.time() - start_time
+            timeline = SearchTimeline.parse(log_lines) if search_timeline else None
+            statistics: dict[str, Any] = {
+                "cp_sat": self._search_statistics(self._solver),
+                "model": {
+                    "variables": len(self._model.proto.variables),
+                    "constraints": len(self._model.proto.constraints),
+                },
+                "phases": phases,
+            }
+
+            # Check result
+            if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+                # Extract schedule
+                phase_start = time_module.perf_counter()
+                schedule = self._extract_schedule(self._solver)
+                coverage_gaps = self._coverage_gaps(self._solver)
+                phases["extraction"] = time_module.perf_counter() - phase_start
+
+                return SolverResult(
+                    success=True,
+                    schedule=schedule,
+                    status=status,
+                    status_name=self._solver.StatusName(status),
+                    solve_time_seconds=solve_time,
+                    objective_value=self._solver.ObjectiveValue()
+                    if hasattr(self._solver, "ObjectiveValue")
+                    else None,
+                    statistics=(
+                        statistics
+                        if coverage_gaps is None
+                        else {**statistics, "coverage_gaps": coverage_gaps}
+                    ),
+                    search_timeline=timeline,
+                )
+            elif (
+                status == cp_model.UNKNOWN
+                and greedy_fallback
+                and greedy is not None
+                and greedy.complete
+                and self._greedy_is_valid_fallback()
+            ):
+                return SolverResult(
+                    success=True,
+                    schedule=self._extract_schedule(None, assigned=greedy.assigned),
+                    status=status,
+                    status_name="GREEDY_FALLBACK",
+                    solve_time_seconds=solve_time,
+                    statistics=statistics,
+                    search_timeline=timeline,
+                )
+            else:
+                feasibility_issues = None
+                explain_limit = min(
+                    EXPLAIN_INFEASIBILITY_SECONDS, time_limit_seconds - solve_time
+                )
+                if (
+                    status == cp_model.INFEASIBLE
+                    and explain_infeasibility
+                    and explain_limit > 0
+                ):
+                    feasibility_issues = self.explain_infeasibility(
+                        time_limit_seconds=explain_limit
+                    )
+                return SolverResult(
+                    success=False,
+                    schedule=None,
+                    status=status,
+                    status_name=self._solver.StatusName(status),
+                    solve_time_seconds=solve_time,
+                    feasibility_issues=feasibility_issues,
+                    statistics=statistics,
+                    search_timeline=timeline,
+                )
+        finally:
+            if self.results_only:
+                self.release()
+
+    def release(self) -> None:
+        """
+        Drop the model state kept from the last solve.
+
+        The CP model, its variables, constraints, objective builder, the
+        CP-SAT solver (with its response) and any cached reconfigurable
+        model are released; inputs are kept, so the next solve rebuilds
+        from scratch. Long-lived processes that reuse solver objects
+        should call this (or use the solver as a context manager, or pass
+        results_only=True) once the result is extracted.
+        """
+        self._model = None
+        self._variables = None
+        self._solver = None
+        self._objective_builder = None
+        self._assumption_groups = {}
+        self._constraints = {}
+        self._worker_active = {}
+        self._reconfigurable_model = None
+
+    def __enter__(self) -> "ShiftSolver":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+    def configure_constraint(
+        self,
+        constraint_id: str,
+        enabled: bool | None = None,
+        weight: int | None = None,
+    ) -> None:
+        """
+        Enable, disable or reweight a constraint for the next solve.
+
+        With reconfigurable=True the cached model is edited in place on the
+        next solve; otherwise the model is rebuilt as usual.
 
-        # Create model and variables
+        Args:
+            constraint_id: ID of a registered constraint
+            enabled: New enabled flag, or None to keep the current one
+            weight: New objective weight, or None to keep the current one
+
+        Raises:
+            ValueError: If constraint_id is not registered
+        """
+        registration = ConstraintRegistry.get_all_constraints().get(constraint_id)
+        if registration is None:
+            raise ValueError(f"Unknown constraint: {constraint_id}")
+        config = self._resolve_constraint_config(constraint_id, registration)
+        if enabled is not None:
+            config = replace(config, enabled=enabled)
+        if weight is not None:
+            config = replace(config, weight=weight)
+        self.constraint_configs = {**self.constraint_configs, constraint_id: config}
+
+    def explain_infeasibility(
+        self, time_limit_seconds: float = 30
+    ) -> list[dict[str, Any]]:
+        """
+        Find the hard constraint groups responsible for infeasibility.
+
+        Every coverage requirement, restriction, availability record and
+        hard request is guarded by an assumption literal; a CP-SAT solve
+        returns a subset of them that is sufficient for infeasibility, which
+        is then shrunk to a minimal one (see InfeasibilityExplainer).
+
+        Args:
+            time_limit_seconds: Maximum time for the assumption solves
+
+        Returns:
+            Issue dicts (type, message, severity, details) for the
+            conflicting groups; empty if no core was found
+        """
+        from shift_solver.solver.infeasibility import InfeasibilityExplainer
+
+        explainer = InfeasibilityExplainer(self)
+        return explainer.explain(time_limit_seconds=time_limit_seconds)
+
+    def solve_lns(
+        self,
+        time_limit_seconds: float = 300,
+        num_workers: int | None = None,
+        seed: int = 0,
+        iteration_time_limit: float = 5.0,
+    ) -> SolverResult:
+        """
+        Optimize with problem-aware large neighborhood search.
+
+        Builds the model once, finds an initial schedule, then repeatedly
+        re-optimizes worker, period-block or shift-category neighborhoods
+        while the rest of the incumbent stays fixed.
+
+        Args:
+            time_limit_seconds: Total wall time for the search
+            num_workers: CP-SAT search workers for each sub-solve
+            seed: Seed for neighborhood selection
+            iteration_time_limit: Maximum seconds per neighborhood sub-solve
+
+        Returns:
+            SolverResult for the best schedule, with LNS counters under
+            statistics["lns"]
+        """
+        from shift_solver.solver.lns import LNSSolver
+
+        lns = LNSSolver(self, seed=seed, iteration_time_limit=iteration_time_limit)
+        return lns.solve(time_limit_seconds=time_limit_seconds, num_workers=num_workers)
+
+    def solve_allocated(
+        self,
+        time_limit_seconds: float = 300,
+        allocator: "CoreAllocator | None" = None,
+        name: str = "solve",
+        max_cores: int | None = None,
+        relative_gap_limit: float | None = None,
+        log_search_progress: bool | None = None,
+        solution_callback: "cp_model.CpSolverSolutionCallback | None" = None,
+        search_timeline: bool = False,
+        cancel_event: "threading.Event | None" = None,
+        greedy_fallback: bool = False,
+    ) -> SolverResult:
+        """
+        Solve with CP-SAT workers leased from a process-wide core budget.
+
+        The number of search workers is this run's share of the allocator's
+        cores. When other runs start or finish the share changes, and the
+        search restarts with the new worker count, hinted with its best
+        schedule so far.
+
+        Args:
+            time_limit_seconds: Maximum time for the whole solve
+            allocator: Core budget to lease from (default: CoreAllocator.shared())
+            name: Label shown in the allocation
+            max_cores: Upper bound on this run's search workers
+            relative_gap_limit: Optimality gap tolerance (0.0 = optimal)
+            log_search_progress: Whether to log solver search progress
+            solution_callback: Optional CP-SAT solution callback for progress/cancel
+            search_timeline: Attach the last search's SearchTimeline
+            cancel_event: Once set, no further restarts happen
+            greedy_fallback: Return the greedy schedule if no search finds a
+                solution (see solve())
+
+        Returns:
+            SolverResult for the best schedule, with the worker count of each
+            search under statistics["cores"]
+        """
+        from shift_solver.solver.core_allocator import AllocatedSolver
+
+        allocated = AllocatedSolver(
+            self, allocator=allocator, name=name, max_cores=max_cores
+        )
+        return allocated.solve(
+            time_limit_seconds=time_limit_seconds,
+            relative_gap_limit=relative_gap_limit,
+            log_search_progress=log_search_progress,
+            solution_callback=solution_callback,
+            search_timeline=search_timeline,
+            cancel_event=cancel_event,
+            greedy_fallback=greedy_fallback,
+        )
+
+    def repair(
+        self,
+        schedule: Schedule,
+        new_availabilities: Sequence[Availability],
+        time_limit_seconds: float = 60,
+        num_workers: int | None = None,
+        window_periods: int = 0,
+        solution_callback: "cp_model.CpSolverSolutionCallback | None" = None,
+    ) -> SolverResult:
+        """
+        Repair a published schedule after availability changes.
+
+        Only the periods where the new unavailability conflicts with the
+        schedule (widened by window_periods) are re-optimized; every other
+        assignment stays fixed. The fewest changed assignments are found
+        first, then the soft-constraint objective is minimized without
+        exceeding that number of changes.
+
+        Args:
+            schedule: Published schedule built from this solver's inputs
+            new_availabilities: Availability records added since publication
+            time_limit_seconds: Total time for the repair
+            num_workers: Number of parallel search workers for CP-SAT
+            window_periods: Extra periods freed on each side of an affected one
+            solution_callback: CP-SAT solution callback for both repair stages
+
+        Returns:
+            SolverResult with the repaired schedule and the changed
+            assignments under statistics["repair"]
+        """
+        from shift_solver.solver.repair import ScheduleRepairer
+
+        repairer = ScheduleRepairer(self, window_periods=window_periods)
+        return repairer.repair(
+            schedule,
+            new_availabilities,
+            time_limit_seconds=time_limit_seconds,
+            num_workers=num_workers,
+            solution_callback=solution_callback,
+        )
+
+    def _sync_reconfigurable_model(self) -> None:
+        """Create the cached model once, then apply config changes as edits."""
+        if self._reconfigurable_model is None:
+            self._reconfigurable_model = ReconfigurableModel(self)
+        reconfigurable_model = self._reconfigurable_model
+        reconfigurable_model.sync()
+        self._model = reconfigurable_model.model
+        self._variables = reconfigurable_model.variables
+        self._objective_builder = reconfigurable_model.objective_builder
+
+    def _build_model(
+        self, track_assumptions: bool = False, worker_activation: bool = False
+    ) -> None:
+        """Create the CP model, its variables and all enabled constraints.
+
+        Args:
+            track_assumptions: Guard hard constraint groups with assumption
+                literals, collected in _assumption_groups
+            worker_activation: Create a literal per worker in _worker_active
+                that every assignment of the worker implies
+        """
+        self._build_variables(worker_activation)
+        if self.build_processes is not None and self.build_processes > 1:
+            from shift_solver.solver.parallel_build import ParallelModelBuilder
+
+            ParallelModelBuilder(self, processes=self.build_processes).apply(
+                track_assumptions=track_assumptions,
+                worker_activation=worker_activation,
+            )
+        else:
+            self._apply_constraints(track_assumptions)
+
+    def _build_variables(self, worker_activation: bool = False) -> None:
+        """Create the CP model and the variables every constraint shares."""
         self._model = cp_model.CpModel()
         builder = VariableBuilder(
             model=self._model,
@@ -179,97 +650,330 @@ class ShiftSolver:
             num_periods=self.num_periods,
         )
         self._variables = builder.build()
+        self._assumption_groups = {}
+        self._constraints = {}
+        self._worker_active = {}
+        if worker_activation:
+            for worker in self.workers:
+                self._worker_active[worker.id] = self._model.new_bool_var(
+                    f"active_{worker.id}"
+                )
+            for worker_id, _, _, var in self._variables.all_assignment_vars():
+                self._model.add_implication(var, self._worker_active[worker_id])
 
-        # Apply constraints
-        self._apply_constraints()
+    @staticmethod
+    def _create_solver(
+        time_limit_seconds: float,
+        num_workers: int | None = None,
+        relative_gap_limit: float | None = None,
+        log_search_progress: bool | None = None,
+        parameters: dict[str, Any] | None = None,
+        deterministic_time_limit: float | None = None,
+        random_seed: int | None = None,
+        reproducible: bool = False,
+    ) -> cp_model.CpSolver:
+        """
+        Create a CpSolver configured with the given parameters.
 
-        # Create and configure solver
-        self._solver = cp_model.CpSolver()
-        self._solver.parameters.max_time_in_seconds = time_limit_seconds
+        With reproducible, parallel workers are interleaved so the search
+        does not depend on thread timing (at a throughput cost); parameters
+        can still override interleave_search.
+        """
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = time_limit_seconds
         if num_workers is not None:
-            self._solver.parameters.num_workers = num_workers
+            solver.parameters.num_workers = num_workers
         if relative_gap_limit is not None:
-            self._solver.parameters.relative_gap_limit = relative_gap_limit
+            solver.parameters.relative_gap_limit = relative_gap_limit
         if log_search_progress is not None:
-            self._solver.parameters.log_search_progress = log_search_progress
+            solver.parameters.log_search_progress = log_search_progress
+        if deterministic_time_limit is not None:
+            solver.parameters.max_deterministic_time = deterministic_time_limit
+        if reproducible and num_workers != 1:
+            solver.parameters.interleave_search = True
+        if random_seed is not None:
+            solver.parameters.random_seed = random_seed
+        for name, value in (parameters or {}).items():
+            try:
+                setattr(solver.parameters, name, value)
+            except AttributeError as e:
+                raise ValueError(f"Unknown CP-SAT parameter: {name}") from e
+        return solver
 
-        # Solve
-        if solution_callback is not None:
-            status = self._solver.Solve(self._model, solution_callback)
-        else:
-            status = self._solver.Solve(self._model)
-        solve_time = time_module.time() - start_time
-
-        # Check result
-        if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-            # Extract schedule
-            extractor = SolutionExtractor(
-                solver=self._solver,
-                variables=self._variables,
-                workers=self.workers,
-                shift_types=self.shift_types,
-                period_dates=self.period_dates,
-                schedule_id=self.schedule_id,
-            )
-            schedule = extractor.extract()
-
-            return SolverResult(
-                success=True,
-                schedule=schedule,
-                status=status,
-                status_name=self._solver.StatusName(status),
-                solve_time_seconds=solve_time,
-                objective_value=self._solver.ObjectiveValue()
-                if hasattr(self._solver, "ObjectiveValue")
-                else None,
-            )
-        else:
-            return SolverResult(
-                success=False,
-                schedule=None,
-                status=status,
-                status_name=self._solver.StatusName(status),
-                solve_time_seconds=solve_time,
-            )
+    def solve_portfolio(
+        self,
+        time_limit_seconds: int = 300,
+        configs: "Sequence[PortfolioConfig] | None" = None,
+        num_workers_per_config: int | None = None,
+        relative_gap_limit: float | None = None,
+        stats: "PortfolioStats | None" = None,
+    ) -> SolverResult:
+        """
+        Race several CP-SAT configurations in parallel processes.
 
-    def _apply_constraints(self) -> None:
-        """Apply all constraints to the model."""
-        if self._model is None:
-            raise RuntimeError("Cannot apply constraints: model not initialized")
-        if self._variables is None:
-            raise RuntimeError("Cannot apply constraints: variables not initialized")
+        Each configuration solves the same input in its own process. The best
+        objective found so far is shared between them, and a configuration
+        whose proven bound cannot beat it stops early. The best result is
+        returned when the time limit expires or one configuration proves
+        optimality.
 
-        # Context for all constraints
-        constraints_context: dict[str, Any] = {
+        Args:
+            time_limit_seconds: Solve time limit of each configuration; the
+                portfolio also spends time spawning processes and building
+                each configuration's model
+            configs: Configurations to race (defaults to DEFAULT_PORTFOLIO)
+            num_workers_per_config: CP-SAT search workers per configuration
+            relative_gap_limit: Optimality gap tolerance (0.0 = optimal)
+            stats: Optional PortfolioStats updated with the winner
+
+        Returns:
+            SolverResult of the winning configuration, with per-configuration
+            outcomes under statistics["portfolio"]
+        """
+        from shift_solver.solver.portfolio import PortfolioSolver
+
+        start_time = time_module.time()
+        pre_solve_failure = self._pre_solve_failure(start_time)
+        if pre_solve_failure is not None:
+            return pre_solve_failure
+
+        portfolio = PortfolioSolver(
+            solver_kwargs=self._solver_kwargs(),
+            configs=configs,
+            num_workers_per_config=num_workers_per_config,
+        )
+        return portfolio.solve(
+            time_limit_seconds=time_limit_seconds,
+            relative_gap_limit=relative_gap_limit,
+            stats=stats,
+        )
+
+    def solve_pool(
+        self,
+        size: int = 5,
+        min_distance: int = 1,
+        time_limit_seconds: float = 300,
+        num_workers: int | None = None,
+        no_good_cuts: bool = True,
+        cancel_event: "threading.Event | None" = None,
+    ) -> SolverResult:
+        """
+        Collect several distinct good schedules in one time budget.
+
+        Args:
+            size: Number of schedules wanted
+            min_distance: Minimum number of differing assignments between
+                any two returned schedules
+            time_limit_seconds: Total time for all solves
+            num_workers: CP-SAT search workers for each solve
+            no_good_cuts: Spend the second half of the budget re-solving with
+                cuts that exclude the pooled schedules
+            cancel_event: Once set, stop collecting at the next solution
+
+        Returns:
+            SolverResult with the best schedule, the others in alternatives
+            (best first) and statistics["solution_pool"]
+
+        Raises:
+            ValueError: If size or min_distance is below 1
+        """
+        from shift_solver.solver.solution_pool import SolutionPoolSolver
+
+        pool_solver = SolutionPoolSolver(
+            self, size=size, min_distance=min_distance, no_good_cuts=no_good_cuts
+        )
+        return pool_solver.solve(
+            time_limit_seconds=time_limit_seconds,
+            num_workers=num_workers,
+            cancel_event=cancel_event,
+        )
+
+    def optimize_staffing(
+        self,
+        time_limit_seconds: float = 120,
+        num_workers: int | None = None,
+        max_penalty: float | None = None,
+    ) -> SolverResult:
+        """
+        Find the fewest workers that keep the schedule feasible.
+
+        Args:
+            time_limit_seconds: Total time for all solves
+            num_workers: CP-SAT search workers for each solve
+            max_penalty: Acceptable soft-constraint penalty; the smallest
+                headcount within it is returned (default: minimum headcount)
+
+        Returns:
+            SolverResult with the chosen schedule and the headcount/penalty
+            Pareto frontier under statistics["staffing"]
+
+        Raises:
+            ValueError: If a soft constraint that penalizes idle workers is
+                enabled
+        """
+        from shift_solver.solver.staffing import StaffingOptimizer
+
+        optimizer = StaffingOptimizer(self)
+        return optimizer.optimize(
+            time_limit_seconds=time_limit_seconds,
+            num_workers=num_workers,
+            max_penalty=max_penalty,
+        )
+
+    def solve_batch(
+        self,
+        scenarios: Sequence["Scenario"],
+        time_limit_seconds: float = 60,
+        processes: int | None = None,
+        num_workers_per_scenario: int = 1,
+    ) -> "BatchResult":
+        """
+        Solve what-if scenarios that share this solver's base model.
+
+        Args:
+            scenarios: Scenarios with unique names
+            time_limit_seconds: Time limit for each scenario
+            processes: Size of the process pool (default: a lease from
+                CoreAllocator.shared() divided by num_workers_per_scenario)
+            num_workers_per_scenario: CP-SAT search workers per scenario
+
+        Returns:
+            BatchResult with one SolverResult per scenario and a
+            comparison table()
+        """
+        from shift_solver.solver.batch import BatchSolver
+
+        batch = BatchSolver(
+            self,
+            processes=processes,
+            num_workers_per_scenario=num_workers_per_scenario,
+        )
+        return batch.solve(scenarios, time_limit_seconds=time_limit_seconds)
+
+    def analyze(
+        self, time_limit_seconds: float = 60, num_workers: int | None = None
+    ) -> "ModelStats":
+        """
+        Measure the model without searching it.
+
+        Builds the model, runs CP-SAT presolve only and reports its size.
+
+        Args:
+            time_limit_seconds: Time limit for presolve
+            num_workers: CP-SAT search workers the memory estimate assumes
+                (default: CPU count)
+
+        Returns:
+            ModelStats with variable, constraint and objective term counts
+            per constraint_id, domain sizes, presolve reductions and an
+            estimated memory footprint
+        """
+        from shift_solver.solver.model_stats import ModelAnalyzer
+
+        analyzer = ModelAnalyzer(self)
+        return analyzer.analyze(
+            time_limit_seconds=time_limit_seconds, num_workers=num_workers
+        )
+
+    def _solver_kwargs(self) -> dict[str, Any]:
+        """Return constructor arguments that rebuild this solver elsewhere."""
+        return {
             "workers": self.workers,
             "shift_types": self.shift_types,
-            "num_periods": self.num_periods,
-            "availabilities": self.availabilities,
             "period_dates": self.period_dates,
+            "schedule_id": self.schedule_id,
+            "availabilities": self.availabilities,
             "requests": self.requests,
+            "constraint_configs": self.constraint_configs,
             "shift_frequency_requirements": self.shift_frequency_requirements,
             "shift_order_preferences": self.shift_order_preferences,
         }
 
+    def _apply_constraints(self, track_assumptions: bool = False) -> None:
+        """Apply all constraints to the model."""
+        if self._model is None:
+            raise RuntimeError("Cannot apply constraints: model not initialized")
+        if self._variables is None:
+            raise RuntimeError("Cannot apply constraints: variables not initialized")
+
+        # Context for all constraints
+        constraints_context = self._constraint_context()
+
         # Initialize objective builder for soft constraints
         self._objective_builder = ObjectiveBuilder(self._model)
 
         # Apply hard constraints from registry
-        self._apply_hard_constraints(constraints_context)
+        self._apply_hard_constraints(constraints_context, track_assumptions)
 
         # Apply soft constraints from registry
-        self._apply_soft_constraints(constraints_context)
+        self._apply_soft_constraints(constraints_context, track_assumptions)
 
         # Build the objective function
         self._objective_builder.build()
 
+    def _constraint_context(self) -> dict[str, Any]:
+        """Keyword arguments passed to every constraint's apply()."""
+        return {
+            "workers": self.workers,
+            "shift_types": self.shift_types,
+            "num_periods": self.num_periods,
+            "availabilities": self.availabilities,
+            "period_dates": self.period_dates,
+            "requests": self.requests,
+            "shift_frequency_requirements": self.shift_frequency_requirements,
+            "shift_order_preferences": self.shift_order_preferences,
+            "worker_active": self._worker_active,
+        }
+
+    def _resolve_constraint_config(
+        self, constraint_id: str, registration: ConstraintRegistration
+    ) -> ConstraintConfig:
+        """Get the effective config of a registered constraint."""
+        default_config = registration.default_config
+        if constraint_id == "request" and not default_config.enabled:
+            # Enable request constraint by default if there are requests
+            default_config = ConstraintConfig(
+                enabled=bool(self.requests),
+                is_hard=False,
+                weight=default_config.weight,
+            )
+        return self._get_constraint_config(constraint_id, default_config)
+
     def _get_constraint_config(
         self, constraint_id: str, default: ConstraintConfig
     ) -> ConstraintConfig:
         """Get config for a constraint, using default if not specified."""
         return self.constraint_configs.get(constraint_id, default)
 
-    def _apply_hard_constraints(self, context: dict[str, Any]) -> None:
+    def _enabled_constraints(
+        self,
+    ) -> list[tuple[str, ConstraintRegistration, ConstraintConfig, bool]]:
+        """
+        Enabled constraints in _apply_constraints order.
+
+        Returns:
+            (constraint_id, registration, config, penalized) per constraint,
+            penalized when its terms belong in the objective
+        """
+        enabled = []
+        hard = ConstraintRegistry.get_hard_constraints()
+        soft = ConstraintRegistry.get_soft_constraints()
+        for constraint_id, registration in hard.items():
+            config = self._get_constraint_config(
+                constraint_id, registration.default_config
+            )
+            if config.enabled:
+                penalized = not config.is_hard
+                enabled.append((constraint_id, registration, config, penalized))
+        for constraint_id, registration in soft.items():
+            config = self._resolve_constraint_config(constraint_id, registration)
+            if config.enabled:
+                enabled.append((constraint_id, registration, config, True))
+        return enabled
+
+    def _apply_hard_constraints(
+        self, context: dict[str, Any], track_assumptions: bool = False
+    ) -> None:
         """Apply hard constraints from registry."""
         if self._model is None:
             raise RuntimeError("Cannot apply hard constraints: model not initialized")
@@ -288,9 +992,17 @@ class ShiftSolver:
                 self._variables,
                 config,
             )
+            constraint.track_assumptions = track_assumptions
             constraint.apply(**context)
+            self._constraints[constraint_id] = constraint
+            self._assumption_groups.update(constraint.assumption_groups)
+            # Configured soft (e.g. elastic coverage): penalize its slack
+            if not config.is_hard and self._objective_builder is not None:
+                self._objective_builder.add_constraint(constraint)
 
-    def _apply_soft_constraints(self, context: dict[str, Any]) -> None:
+    def _apply_soft_constraints(
+        self, context: dict[str, Any], track_assumptions: bool = False
+    ) -> None:
         """Apply soft constraints from registry and add them to objective builder."""
         if self._model is None:
             raise RuntimeError("Cannot apply soft constraints: model not initialized")
@@ -302,17 +1014,7 @@ class ShiftSolver:
             )
 
         for constraint_id, registration in ConstraintRegistry.get_soft_constraints().items():
-            # Get config with special handling for request constraint
-            default_config = registration.default_config
-            if constraint_id == "request" and not default_config.enabled:
-                # Enable request constraint by default if there are requests
-                default_config = ConstraintConfig(
-                    enabled=bool(self.requests),
-                    is_hard=False,
-                    weight=default_config.weight,
-                )
-
-            config = self._get_constraint_config(constraint_id, default_config)
+            config = self._resolve_constraint_config(constraint_id, registration)
             if not config.enabled:
                 continue
 
@@ -321,9 +1023,110 @@ class ShiftSolver:
                 self._variables,
                 config,
             )
+            constraint.track_assumptions = track_assumptions
             constraint.apply(**context)
+            self._constraints[constraint_id] = constraint
+            self._assumption_groups.update(constraint.assumption_groups)
             self._objective_builder.add_constraint(constraint)
 
+    def _pre_solve_failure(self, start_time: float) -> SolverResult | None:
+        """Return a failed result if the pre-solve feasibility check fails."""
+        feasibility_result = self._check_feasibility()
+        if feasibility_result.is_feasible:
+            return None
+        return SolverResult(
+            success=False,
+            schedule=None,
+            status=-1,  # Custom status for pre-solve failure
+            status_name="INFEASIBLE_PRE_SOLVE",
+            solve_time_seconds=time_module.time() - start_time,
+            feasibility_issues=feasibility_result.issues,
+        )
+
+    def _extract_schedule(
+        self,
+        solver: cp_model.CpSolver | None,
+        assigned: Collection[tuple[str, int, str]] | None = None,
+    ) -> Schedule:
+        """Extract the schedule from a solver, or from explicit assignments."""
+        if self._variables is None:
+            raise RuntimeError("Cannot extract schedule: variables not initialized")
+        extractor = SolutionExtractor(
+            solver=solver,
+            variables=self._variables,
+            workers=self.workers,
+            shift_types=self.shift_types,
+            period_dates=self.period_dates,
+            schedule_id=self.schedule_id,
+            assigned=assigned,
+        )
+        return extractor.extract()
+
+    def _greedy_schedule(self) -> GreedySchedule:
+        """Construct a schedule with the greedy heuristic."""
+        request_config = self._get_constraint_config(
+            "request", ConstraintConfig(enabled=True, is_hard=False)
+        )
+        scheduler = GreedyScheduler(
+            workers=self.workers,
+            shift_types=self.shift_types,
+            period_dates=self.period_dates,
+            availabilities=self.availabilities,
+            requests=self.requests,
+            requests_are_hard=request_config.enabled and request_config.is_hard,
+        )
+        return scheduler.construct()
+
+    def _greedy_is_valid_fallback(self) -> bool:
+        """True when every enabled hard constraint is one the greedy honors."""
+        for constraint_id, registration in ConstraintRegistry.get_all_constraints().items():
+            config = self._get_constraint_config(
+                constraint_id, registration.default_config
+            )
+            if (
+                config.enabled
+                and config.is_hard
+                and constraint_id not in GREEDY_HARD_CONSTRAINTS
+            ):
+                return False
+        return True
+
+    def _add_hint(self, assigned: Collection[tuple[str, int, str]]) -> None:
+        """Hint every assignment variable from a set of assigned keys."""
+        if self._model is None or self._variables is None:
+            raise RuntimeError("Cannot add hint: model not initialized")
+        self._model.clear_hints()
+        for worker_id, period, shift_type_id, var in self._variables.all_assignment_vars():
+            self._model.add_hint(var, (worker_id, period, shift_type_id) in assigned)
+
+    def _elastic_coverage(self) -> bool:
+        """Whether coverage is enabled as a soft [min, max] staffing range."""
+        registration = ConstraintRegistry.get_all_constraints().get("coverage")
+        if registration is None:
+            return False
+        config = self._resolve_constraint_config("coverage", registration)
+        return config.enabled and not config.is_hard
+
+    def _coverage_gaps(self, solver: cp_model.CpSolver) -> list[dict[str, Any]] | None:
+        """Under- and overstaffed shifts of a solution (None unless elastic)."""
+        if self._objective_builder is None:
+            return None
+        for constraint in self._objective_builder.constraints:
+            if isinstance(constraint, CoverageConstraint) and constraint.is_elastic:
+                return constraint.coverage_gaps(solver)
+        return None
+
+    @staticmethod
+    def _search_statistics(solver: cp_model.CpSolver) -> dict[str, Any]:
+        """CP-SAT's effort counters for the last Solve()."""
+        return {
+            "deterministic_time": solver.deterministic_time,
+            "conflicts": solver.num_conflicts,
+            "branches": solver.num_branches,
+            "user_time_seconds": solver.user_time,
+            "wall_time_seconds": solver.wall_time,
+        }
+
     def _check_feasibility(self) -> FeasibilityResult:
         """Run pre-solve feasibility check."""
         checker = FeasibilityChecker(
@@ -333,5 +1136,20 @@ class ShiftSolver:
             availabilities=self.availabilities,
             shift_frequency_requirements=self.shift_frequency_requirements,
             shift_order_preferences=self.shift_order_preferences,
+            elastic_coverage=self._elastic_coverage(),
         )
         return checker.check()
+
+
+def _stop_search_on_event(
+    solver: cp_model.CpSolver,
+    stop_event: threading.Event,
+    search_done: threading.Event,
+) -> None:
+    """Stop solver's search once stop_event is set, until search_done is."""
+    while not search_done.is_set():
+        if stop_event.wait(0.1):
+            # Solve() may not have started the search yet
+            while not search_done.wait(0.1):
+                solver.stop_search()
+            return
@@ -1,5 +1,6 @@
 """SolutionExtractor - extracts schedules from solver solutions."""
 
+from collections.abc import Collection
 from datetime import date
 from typing import Any
 
@@ -55,12 +56,13 @@ class SolutionExtractor:
 
     def __init__(
         self,
-        solver: cp_model.CpSolver,
+        solver: cp_model.CpSolver | None,
         variables: SolverVariables,
         workers: list[Worker],
         shift_types: list[ShiftType],
         period_dates: list[tuple[date, date]],
         schedule_id: str,
+        assigned: Collection[tuple[str, int, str]] | None = None,
     ) -> None:
         """
         Initialize the solution extractor.
@@ -72,11 +74,13 @@ class SolutionExtractor:
             shift_types: List of shift types
             period_dates: List of (start_date, end_date) for each period
             schedule_id: Identifier for the schedule
+            assigned: Optional (worker_id, period, shift_type_id) keys to
+                extract instead of solver values (e.g. a heuristic schedule)
 
         Raises:
             ValueError: If required parameters are missing
         """
-        if solver is None:
+        if solver is None and assigned is None:
             raise ValueError("solver cannot be None")
         if variables is None:
             raise ValueError("variables cannot be None")
@@ -87,6 +91,7 @@ class SolutionExtractor:
         self.shift_types = shift_types
         self.period_dates = period_dates
         self.schedule_id = schedule_id
+        self.assigned = assigned
 
         # Build lookup maps
         self._worker_map = {w.id: w for w in workers}
@@ -181,10 +186,7 @@ class SolutionExtractor:
 
         for shift_type in self.shift_types:
             try:
-                var = self.variables.get_assignment_var(
-                    worker_id, period_idx, shift_type.id
-                )
-                if self.solver.Value(var) == 1:
+                if self._is_assigned(worker_id, period_idx, shift_type.id):
                     shift_instance = ShiftInstance(
                         shift_type_id=shift_type.id,
                         period_index=period_idx,
@@ -198,6 +200,14 @@ class SolutionExtractor:
 
         return shifts
 
+    def _is_assigned(self, worker_id: str, period_idx: int, shift_type_id: str) -> bool:
+        """Check whether the worker holds the shift in the period."""
+        if self.assigned is not None:
+            return (worker_id, period_idx, shift_type_id) in self.assigned
+        assert self.solver is not None
+        var = self.variables.get_assignment_var(worker_id, period_idx, shift_type_id)
+        return bool(self.solver.Value(var) == 1)
+
     def _add_statistics(self, schedule: Schedule) -> None:
         """
         Calculate and add statistics to the schedule.
@@ -0,0 +1,295 @@
+"""Pool of diverse near-optimal solutions collected during search."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ortools.sat.python import cp_model
+
+from shift_solver.models import Schedule
+from shift_solver.solver.result import SolverResult
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+
+@dataclass(frozen=True)
+class PoolEntry:
+    """One pooled solution.
+
+    Attributes:
+        bits: Assignment tensor as a bitset; bit i is the value of the i-th
+            variable in VariableBuilder.all_assignment_vars() order
+        objective: Objective value of the solution
+    """
+
+    bits: int
+    objective: float
+
+    def distance(self, other: "PoolEntry") -> int:
+        """Hamming distance: number of assignments that differ."""
+        return (self.bits ^ other.bits).bit_count()
+
+
+class SolutionPool:
+    """
+    Keeps the best solutions that are pairwise at least min_distance apart.
+
+    A new solution too close to pooled ones replaces them only if it is
+    better than all of them, so each neighborhood is represented by its
+    best member. Entries are kept sorted by objective (best first).
+    """
+
+    def __init__(self, size: int, min_distance: int = 1) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            size: Maximum number of solutions kept
+            min_distance: Minimum Hamming distance between pooled solutions
+
+        Raises:
+            ValueError: If size or min_distance is below 1
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if min_distance < 1:
+            raise ValueError("min_distance must be at least 1")
+        self.size = size
+        self.min_distance = min_distance
+        self.entries: list[PoolEntry] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def full(self) -> bool:
+        """Whether the pool holds size solutions."""
+        return len(self.entries) >= self.size
+
+    def add(self, bits: int, objective: float) -> bool:
+        """
+        Offer a solution to the pool.
+
+        Returns:
+            True if the solution was pooled
+        """
+        entry = PoolEntry(bits=bits, objective=objective)
+        close = [e for e in self.entries if e.distance(entry) < self.min_distance]
+        if any(e.objective <= objective for e in close):
+            return False
+        if self.full and not close and objective >= self.entries[-1].objective:
+            return False
+        self.entries = sorted(
+            [e for e in self.entries if e not in close] + [entry],
+            key=lambda e: e.objective,
+        )[: self.size]
+        return True
+
+
+class _PoolCallback(cp_model.CpSolverSolutionCallback):
+    """Offers every solution found during search to a SolutionPool."""
+
+    def __init__(
+        self,
+        pool: SolutionPool,
+        assignment_vars: list[cp_model.IntVar],
+        has_objective: bool,
+        cancel_event: threading.Event | None = None,
+    ) -> None:
+        super().__init__()
+        self.pool = pool
+        self.assignment_vars = assignment_vars
+        self.has_objective = has_objective
+        self.cancel_event = cancel_event
+
+    def on_solution_callback(self) -> None:
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            self.StopSearch()
+        bits = 0
+        for i, var in enumerate(self.assignment_vars):
+            if self.BooleanValue(var):
+                bits |= 1 << i
+        objective = self.ObjectiveValue() if self.has_objective else 0.0
+        self.pool.add(bits, objective)
+
+
+class SolutionPoolSolver:
+    """
+    Collects a pool of diverse good schedules in one time budget.
+
+    The first solve offers every improving solution CP-SAT reports to the
+    pool through a solution callback. With no-good cuts enabled, the rest of
+    the budget re-solves the same model with one linear cut per pooled
+    solution, requiring at least min_distance assignments to differ from
+    it, so each re-solve returns the best schedule not yet represented.
+    Solutions are stored as bitsets over the assignment variables and only
+    expanded into Schedule objects for the final result.
+
+    Usage:
+        pool_solver = SolutionPoolSolver(shift_solver, size=5, min_distance=10)
+        result = pool_solver.solve(time_limit_seconds=120)
+        schedules = [result.schedule, *result.alternatives]
+    """
+
+    def __init__(
+        self,
+        shift_solver: "ShiftSolver",
+        size: int = 5,
+        min_distance: int = 1,
+        no_good_cuts: bool = True,
+    ) -> None:
+        """
+        Initialize the pool solver.
+
+        Args:
+            shift_solver: Solver holding the input
+            size: Number of schedules wanted
+            min_distance: Minimum number of differing assignments between
+                any two pooled schedules
+            no_good_cuts: Re-solve with cuts excluding pooled schedules when
+                the first search does not fill the pool
+
+        Raises:
+            ValueError: If size or min_distance is below 1
+        """
+        self.shift_solver = shift_solver
+        self.pool = SolutionPool(size=size, min_distance=min_distance)
+        self.no_good_cuts = no_good_cuts
+
+    def solve(
+        self,
+        time_limit_seconds: float = 300,
+        num_workers: int | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> SolverResult:
+        """
+        Fill the pool.
+
+        The result's status is OPTIMAL only when the first search proved
+        the best pooled schedule optimal, and FEASIBLE otherwise.
+
+        Args:
+            time_limit_seconds: Total time for all solves
+            num_workers: CP-SAT search workers for each solve
+            cancel_event: Once set, the running search stops at its next
+                solution and no further re-solve starts
+
+        Returns:
+            SolverResult with the best schedule, the other pooled schedules
+            in alternatives (best first), and statistics["solution_pool"]
+            listing each schedule's objective, distance to the best and
+            status (only the best can be OPTIMAL)
+        """
+        from shift_solver.solver.shift_solver import ShiftSolver
+
+        start_time = time.time()
+        self.pool = SolutionPool(
+            size=self.pool.size, min_distance=self.pool.min_distance
+        )
+        ss = ShiftSolver(**self.shift_solver._solver_kwargs())
+        pre_solve_failure = ss._pre_solve_failure(start_time)
+        if pre_solve_failure is not None:
+            return pre_solve_failure
+
+        ss._build_model()
+        model = ss._model
+        variables = ss._variables
+        assert model is not None and variables is not None
+        assignments = list(variables.all_assignment_vars())
+        assignment_vars = [var for *_, var in assignments]
+        callback = _PoolCallback(
+            self.pool, assignment_vars, model.proto.has_objective(), cancel_event
+        )
+        greedy = ss._greedy_schedule()
+        ss._add_hint(greedy.assigned)
+
+        def remaining() -> float:
+            return time_limit_seconds - (time.time() - start_time)
+
+        first_limit = remaining() / 2 if self.no_good_cuts else remaining()
+        first_solver = ss._create_solver(
+            time_limit_seconds=first_limit, num_workers=num_workers
+        )
+        status = first_solver.Solve(model, callback)
+        if not self.pool.entries:
+            return SolverResult(
+                success=False,
+                schedule=None,
+                status=status,
+                status_name=first_solver.StatusName(status),
+                solve_time_seconds=time.time() - start_time,
+            )
+
+        cut: set[int] = set()
+        while self.no_good_cuts and not self.pool.full and remaining() > 0.1:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            for entry in self.pool.entries:
+                if entry.bits not in cut:
+                    self._add_no_good(model, assignment_vars, entry.bits)
+                    cut.add(entry.bits)
+            model.clear_hints()
+            best = self.pool.entries[0].bits
+            for i, var in enumerate(assignment_vars):
+                model.add_hint(var, (best >> i) & 1)
+            wanted = self.pool.size - len(self.pool)
+            solver = ss._create_solver(
+                time_limit_seconds=remaining() / wanted, num_workers=num_workers
+            )
+            # Infeasible: every remaining schedule is too close to the pool
+            if solver.Solve(model, callback) == cp_model.INFEASIBLE:
+                break
+
+        schedules = [
+            self._schedule(ss, assignments, entry.bits) for entry in self.pool.entries
+        ]
+        best_entry = self.pool.entries[0]
+        # Only the first search can prove the best schedule optimal; the
+        # re-solves run on a model narrowed by no-good cuts
+        optimal = status == cp_model.OPTIMAL
+        status_name = "OPTIMAL" if optimal else "FEASIBLE"
+        return SolverResult(
+            success=True,
+            schedule=schedules[0],
+            status=int(cp_model.OPTIMAL if optimal else cp_model.FEASIBLE),
+            status_name=status_name,
+            solve_time_seconds=time.time() - start_time,
+            objective_value=best_entry.objective,
+            alternatives=schedules[1:],
+            statistics={
+                "solution_pool": [
+                    {
+                        "objective": entry.objective,
+                        "distance_to_best": entry.distance(best_entry),
+                        "status": status_name if entry is best_entry else "FEASIBLE",
+                    }
+                    for entry in self.pool.entries
+                ]
+            },
+        )
+
+    def _add_no_good(
+        self, model: cp_model.CpModel, assignment_vars: list[cp_model.IntVar], bits: int
+    ) -> None:
+        """Require min_distance assignments to differ from a pooled solution."""
+        differing = [
+            1 - var if (bits >> i) & 1 else var
+            for i, var in enumerate(assignment_vars)
+        ]
+        model.add(sum(differing) >= self.pool.min_distance)
+
+    @staticmethod
+    def _schedule(
+        ss: "ShiftSolver",
+        assignments: list[tuple[str, int, str, cp_model.IntVar]],
+        bits: int,
+    ) -> Schedule:
+        """Expand a bitset into a Schedule."""
+        assigned = {
+            (w, p, s)
+            for i, (w, p, s, _) in enumerate(assignments)
+            if (bits >> i) & 1
+        }
+        return ss._extract_schedule(None, assigned=assigned)
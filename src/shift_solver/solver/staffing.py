@@ -0,0 +1,257 @@
+"""Staffing-level optimization: fewest workers against soft-constraint penalty."""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from ortools.sat.python import cp_model
+
+from shift_solver.solver.constraint_registry import ConstraintRegistry
+from shift_solver.solver.result import SolverResult
+
+if TYPE_CHECKING:
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+# Soft constraints that penalize a worker for not working at all, which
+# would charge every inactive worker and distort the frontier
+ACTIVATION_UNAWARE_CONSTRAINTS = ("frequency", "max_absence", "shift_frequency")
+
+
+@dataclass
+class StaffingPoint:
+    """One point of the headcount / penalty frontier.
+
+    Attributes:
+        headcount: Number of workers with at least one assignment
+        penalty: Soft-constraint objective with that many workers
+        proven: Whether CP-SAT proved the penalty optimal for the headcount
+        workers: IDs of the workers with assignments
+    """
+
+    headcount: int
+    penalty: float
+    proven: bool
+    workers: list[str]
+
+
+class StaffingOptimizer:
+    """
+    Finds the fewest workers that keep the schedule feasible, and the
+    Pareto frontier of headcount against soft-constraint penalty.
+
+    One model is built with an activation literal per worker, implied by
+    each of the worker's assignments. The minimum headcount is found by
+    minimizing the number of active workers under the hard constraints.
+    Then, on the same model, an upper bound on the headcount is tightened
+    in place and the soft objective minimized for each bound, from the
+    minimum upward, until the penalty of the full team is reached. Bounds
+    that do not lower the penalty are dominated and left off the frontier.
+
+    Usage:
+        optimizer = StaffingOptimizer(shift_solver)
+        result = optimizer.optimize(time_limit_seconds=120, max_penalty=500)
+        frontier = result.statistics["staffing"]["frontier"]
+    """
+
+    def __init__(self, shift_solver: "ShiftSolver") -> None:
+        """
+        Initialize the optimizer.
+
+        Args:
+            shift_solver: Solver holding the full team and the inputs
+
+        Raises:
+            ValueError: If a soft constraint that penalizes idle workers
+                (frequency, max_absence, shift_frequency) is enabled
+        """
+        self.shift_solver = shift_solver
+        registrations = ConstraintRegistry.get_all_constraints()
+        for constraint_id in ACTIVATION_UNAWARE_CONSTRAINTS:
+            registration = registrations.get(constraint_id)
+            if registration is None:
+                continue
+            config = shift_solver._resolve_constraint_config(
+                constraint_id, registration
+            )
+            if config.enabled:
+                raise ValueError(
+                    f"staffing optimization does not support the "
+                    f"'{constraint_id}' constraint"
+                )
+
+    def optimize(
+        self,
+        time_limit_seconds: float = 120,
+        num_workers: int | None = None,
+        max_penalty: float | None = None,
+    ) -> SolverResult:
+        """
+        Optimize the staffing level.
+
+        Args:
+            time_limit_seconds: Total time for all solves
+            num_workers: CP-SAT search workers for each solve
+            max_penalty: Acceptable soft-constraint penalty; the returned
+                schedule is the smallest frontier headcount within it
+                (default: the minimum headcount)
+
+        Returns:
+            SolverResult with the chosen schedule and statistics["staffing"]
+            holding minimum_headcount and the frontier points
+        """
+        from shift_solver.solver.shift_solver import ShiftSolver
+
+        start_time = time.time()
+        ss = ShiftSolver(**self.shift_solver._solver_kwargs())
+        pre_solve_failure = ss._pre_solve_failure(start_time)
+        if pre_solve_failure is not None:
+            return pre_solve_failure
+
+        ss._build_model(worker_activation=True)
+        model = ss._model
+        variables = ss._variables
+        objective_builder = ss._objective_builder
+        assert model is not None and variables is not None
+        assert objective_builder is not None
+        active = ss._worker_active
+        headcount = sum(active.values())
+        soft_objective = sum(
+            term.variable * term.effective_weight
+            for term in objective_builder.objective_terms
+        )
+        assignment_vars = list(variables.all_assignment_vars())
+
+        def remaining() -> float:
+            return max(time_limit_seconds - (time.time() - start_time), 0.0)
+
+        # Stage 1: fewest active workers under the hard constraints
+        model.clear_objective()
+        model.minimize(headcount)
+        solver = ss._create_solver(
+            time_limit_seconds=remaining() / 2, num_workers=num_workers
+        )
+        status = solver.Solve(model)
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return SolverResult(
+                success=False,
+                schedule=None,
+                status=int(status),
+                status_name=solver.StatusName(status),
+                solve_time_seconds=time.time() - start_time,
+            )
+        minimum = round(solver.ObjectiveValue())
+        minimum_proven = status == cp_model.OPTIMAL
+
+        # Stage 2: soft objective per headcount bound, patched in place
+        bound = model.add(headcount <= len(active))
+        bound_domain = model.proto.constraints[bound.index].linear.domain
+        model.clear_objective()
+        if objective_builder.objective_terms:
+            model.minimize(soft_objective)
+
+        def solve_at(
+            limit: int, time_limit: float, hint: cp_model.CpSolver
+        ) -> tuple[int, cp_model.CpSolver]:
+            bound_domain[1] = limit
+            model.clear_hints()
+            for _, _, _, var in assignment_vars:
+                model.add_hint(var, hint.Value(var))
+            sub_solver = ss._create_solver(
+                time_limit_seconds=time_limit, num_workers=num_workers
+            )
+            return sub_solver.Solve(model), sub_solver
+
+        def penalty_of(sub_solver: cp_model.CpSolver) -> float:
+            if not objective_builder.objective_terms:
+                return 0.0
+            return float(sub_solver.ObjectiveValue())
+
+        # The full team's penalty is the best any headcount can reach
+        full_penalty = None
+        if remaining() > 0:
+            full_status, full_solver = solve_at(len(active), remaining() / 4, solver)
+            if full_status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                full_penalty = penalty_of(full_solver)
+
+        frontier: list[StaffingPoint] = []
+        solutions: list[set[tuple[str, int, str]]] = []
+        for limit in range(minimum, len(active) + 1):
+            if remaining() <= 0:
+                break
+            budget = remaining() / (len(active) - limit + 1)
+            sub_status, sub_solver = solve_at(limit, budget, solver)
+            if sub_status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                continue
+            solver = sub_solver
+            penalty = penalty_of(solver)
+            if frontier and penalty >= frontier[-1].penalty:
+                continue
+            assigned = {
+                (w, p, s) for w, p, s, var in assignment_vars if solver.Value(var)
+            }
+            used = sorted({w for w, _, _ in assigned})
+            frontier.append(
+                StaffingPoint(
+                    headcount=len(used),
+                    penalty=penalty,
+                    proven=sub_status == cp_model.OPTIMAL,
+                    workers=used,
+                )
+            )
+            solutions.append(assigned)
+            if penalty == 0 or (full_penalty is not None and penalty <= full_penalty):
+                break
+
+        if not frontier:
+            # No headcount was re-optimized in time; fall back to the stage 1
+            # schedule, whose penalty was not minimized
+            assigned = {
+                (w, p, s) for w, p, s, var in assignment_vars if solver.Value(var)
+            }
+            used = sorted({w for w, _, _ in assigned})
+            penalty = (
+                float(solver.Value(soft_objective))
+                if objective_builder.objective_terms
+                else 0.0
+            )
+            frontier.append(
+                StaffingPoint(
+                    headcount=len(used), penalty=penalty, proven=False, workers=used
+                )
+            )
+            solutions.append(assigned)
+
+        index = 0
+        if max_penalty is not None:
+            index = next(
+                (i for i, p in enumerate(frontier) if p.penalty <= max_penalty),
+                len(frontier) - 1,
+            )
+        chosen = frontier[index]
+
+        return SolverResult(
+            success=True,
+            schedule=ss._extract_schedule(None, assigned=solutions[index]),
+            status=int(cp_model.OPTIMAL if chosen.proven else cp_model.FEASIBLE),
+            status_name="OPTIMAL" if chosen.proven else "FEASIBLE",
+            solve_time_seconds=time.time() - start_time,
+            objective_value=chosen.penalty,
+            statistics={
+                "staffing": self._statistics(minimum, minimum_proven, chosen, frontier)
+            },
+        )
+
+    @staticmethod
+    def _statistics(
+        minimum: int,
+        minimum_proven: bool,
+        chosen: StaffingPoint,
+        frontier: list[StaffingPoint],
+    ) -> dict[str, Any]:
+        """Build the statistics["staffing"] entry."""
+        return {
+            "minimum_headcount": minimum,
+            "minimum_proven": minimum_proven,
+            "chosen_headcount": chosen.headcount,
+            "frontier": [asdict(point) for point in frontier],
+        }
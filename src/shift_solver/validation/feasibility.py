@@ -4,6 +4,9 @@ from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Any
 
+import numpy as np
+from ortools.graph.python import max_flow
+
 from shift_solver.models import (
     Availability,
     ShiftFrequencyRequirement,
@@ -15,6 +18,10 @@ from shift_solver.utils import get_logger
 
 logger = get_logger("validation.feasibility")
 
+# Up to this many shift types, the capacity check enumerates every subset of
+# shift types at once (2**n subsets); beyond it, a max-flow runs per period.
+MAX_ENUMERATED_SHIFT_TYPES = 12
+
 
 @dataclass
 class FeasibilityResult:
@@ -40,6 +47,15 @@ class FeasibilityResult:
             {"type": issue_type, "message": message, "severity": "warning", **details}
         )
 
+    @property
+    def bottlenecks(self) -> dict[int, list[str]]:
+        """Period index to the shift type IDs that cannot be staffed together."""
+        return {
+            issue["period_index"]: issue["shift_type_ids"]
+            for issue in self.issues
+            if issue["type"] == "capacity"
+        }
+
 
 class FeasibilityChecker:
     """
@@ -50,6 +66,8 @@ class FeasibilityChecker:
     - No periods where all workers are unavailable
     - Worker restrictions don't make shifts unfillable
     - Valid date ranges and periods
+    - Per-period worker-to-shift capacity (bipartite max-flow), which
+      catches shift types that compete for the same few eligible workers
     """
 
     def __init__(
@@ -60,6 +78,8 @@ class FeasibilityChecker:
         availabilities: list[Availability] | None = None,
         shift_frequency_requirements: list[ShiftFrequencyRequirement] | None = None,
         shift_order_preferences: list[ShiftOrderPreference] | None = None,
+        max_shifts_per_period: int | None = None,
+        elastic_coverage: bool = False,
     ) -> None:
         """
         Initialize the feasibility checker.
@@ -71,6 +91,10 @@ class FeasibilityChecker:
             availabilities: Optional list of availability records
             shift_frequency_requirements: Optional list of shift frequency requirements
             shift_order_preferences: Optional list of shift order preferences
+            max_shifts_per_period: Optional limit on shifts one worker can take
+                in a period for the capacity check (default: no limit)
+            elastic_coverage: Coverage is a penalized staffing range, so
+                understaffing is not infeasible; skips the staffing checks
         """
         self.workers = workers
         self.shift_types = shift_types
@@ -78,6 +102,8 @@ class FeasibilityChecker:
         self.availabilities = availabilities or []
         self.shift_frequency_requirements = shift_frequency_requirements or []
         self.shift_order_preferences = shift_order_preferences or []
+        self.max_shifts_per_period = max_shifts_per_period
+        self.elastic_coverage = elastic_coverage
 
     def check(self) -> FeasibilityResult:
         """
@@ -90,10 +116,12 @@ class FeasibilityChecker:
 
         # Run all checks
         self._check_period_dates(result)
-        self._check_basic_coverage(result)
-        self._check_restrictions(result)
-        self._check_availability_conflicts(result)
-        self._check_combined_feasibility(result)
+        if not self.elastic_coverage:
+            self._check_basic_coverage(result)
+            self._check_restrictions(result)
+            self._check_availability_conflicts(result)
+            self._check_combined_feasibility(result)
+            self._check_period_capacity(result)
         self._check_shift_frequency_requirements(result)
         self._check_shift_order_preferences(result)
 
@@ -269,6 +297,200 @@ class FeasibilityChecker:
                         workers_required=shift_type.workers_required,
                     )
 
+    def _eligibility(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Build the eligibility and demand arrays for all periods at once.
+
+        Returns:
+            (eligible, required): eligible[p, w, s] is True when worker w may
+            work shift type s in period p (restrictions and unavailability);
+            required[p, s] is the head count shift type s needs in period p
+            (0 when it has no applicable days in the period)
+        """
+        num_periods = len(self.period_dates)
+        worker_index = {w.id: i for i, w in enumerate(self.workers)}
+        shift_index = {st.id: i for i, st in enumerate(self.shift_types)}
+
+        can_work = np.array(
+            [[w.can_work_shift(st.id) for st in self.shift_types] for w in self.workers],
+            dtype=bool,
+        ).reshape(len(self.workers), len(self.shift_types))
+        eligible = np.broadcast_to(can_work, (num_periods, *can_work.shape)).copy()
+
+        starts = np.array([start for start, _ in self.period_dates], dtype="datetime64[D]")
+        ends = np.array([end for _, end in self.period_dates], dtype="datetime64[D]")
+        for avail in self.availabilities:
+            if avail.availability_type != "unavailable":
+                continue
+            w = worker_index.get(avail.worker_id)
+            if w is None:
+                continue
+            overlaps = (np.datetime64(avail.start_date, "D") <= ends) & (
+                np.datetime64(avail.end_date, "D") >= starts
+            )
+            if avail.shift_type_id:
+                s = shift_index.get(avail.shift_type_id)
+                if s is not None:
+                    eligible[overlaps, w, s] = False
+            else:
+                eligible[overlaps, w, :] = False
+
+        required = np.array(
+            [
+                [
+                    st.workers_required
+                    if self._count_applicable_days(st, start, end) > 0
+                    else 0
+                    for st in self.shift_types
+                ]
+                for start, end in self.period_dates
+            ],
+            dtype=np.int64,
+        ).reshape(num_periods, len(self.shift_types))
+        return eligible, required
+
+    def _check_period_capacity(self, result: FeasibilityResult) -> None:
+        """
+        Check each period with a worker-to-shift max-flow.
+
+        Source -> worker (capacity: shifts a worker may take per period),
+        worker -> eligible shift type (capacity 1), shift type -> sink
+        (capacity: workers required). By max-flow/min-cut, a period is
+        infeasible exactly when some set of shift types demands more than
+        its eligible workers can supply; that set is reported as the
+        bottleneck.
+        """
+        if result.issues or not self.period_dates or not self.shift_types:
+            return
+
+        eligible, required = self._eligibility()
+        capacity = self.max_shifts_per_period or len(self.shift_types)
+
+        if len(self.shift_types) <= MAX_ENUMERATED_SHIFT_TYPES:
+            bottlenecks = self._enumerated_bottlenecks(eligible, required, capacity)
+        else:
+            bottlenecks = self._max_flow_bottlenecks(eligible, required, capacity)
+
+        for period_idx, shift_idxs, demand, supply in bottlenecks:
+            shift_ids = [self.shift_types[s].id for s in shift_idxs]
+            start, end = self.period_dates[period_idx]
+            result.add_issue(
+                "capacity",
+                f"Period {period_idx} ({start} to {end}): shifts {shift_ids} "
+                f"need {demand} assignments but eligible workers can cover "
+                f"only {supply}",
+                period_index=period_idx,
+                shift_type_ids=shift_ids,
+                workers_required=demand,
+                workers_available=supply,
+            )
+
+    @staticmethod
+    def _enumerated_bottlenecks(
+        eligible: np.ndarray, required: np.ndarray, capacity: int
+    ) -> list[tuple[int, list[int], int, int]]:
+        """
+        Find each period's most violated Hall condition by subset enumeration.
+
+        For every subset S of shift types (as a bit mask), supply is
+        sum over workers of min(capacity, |eligible shifts in S|) and demand
+        is the total requirement of S; all periods are evaluated together.
+
+        Returns:
+            (period, shift indices, demand, supply) per infeasible period,
+            using the largest deficit and then the fewest shift types
+        """
+        num_periods, num_workers, num_shifts = eligible.shape
+        subsets = (
+            (np.arange(1 << num_shifts)[:, None] >> np.arange(num_shifts)) & 1
+        ).astype(np.int32)
+        demand = required @ subsets.T
+
+        # Chunk subsets to bound the (period, worker, subset) intermediate
+        chunk = max(1, 4_000_000 // max(1, num_periods * num_workers))
+        supply = np.empty_like(demand)
+        as_int = eligible.astype(np.int32)
+        for first in range(0, len(subsets), chunk):
+            counts = as_int @ subsets[first : first + chunk].T
+            supply[:, first : first + chunk] = np.minimum(counts, capacity).sum(axis=1)
+
+        deficit = demand - supply
+        # Prefer the largest deficit, then the smallest subset
+        sizes = subsets.sum(axis=1)
+        score = deficit * (num_shifts + 1) - sizes
+        best = score.argmax(axis=1)
+
+        bottlenecks = []
+        for period_idx in np.flatnonzero(deficit[np.arange(num_periods), best] > 0):
+            subset = best[period_idx]
+            bottlenecks.append(
+                (
+                    int(period_idx),
+                    [int(s) for s in np.flatnonzero(subsets[subset])],
+                    int(demand[period_idx, subset]),
+                    int(supply[period_idx, subset]),
+                )
+            )
+        return bottlenecks
+
+    @staticmethod
+    def _max_flow_bottlenecks(
+        eligible: np.ndarray, required: np.ndarray, capacity: int
+    ) -> list[tuple[int, list[int], int, int]]:
+        """
+        Solve one max-flow per period and read the bottleneck off the min cut.
+
+        Shift types on the (smallest) sink side of the minimum cut form the
+        set whose demand exceeds what their eligible workers can supply.
+
+        Returns:
+            (period, shift indices, demand, supply) per infeasible period
+        """
+        num_periods, num_workers, num_shifts = eligible.shape
+        source, sink = 0, 1 + num_workers + num_shifts
+        bottlenecks = []
+        for period_idx in range(num_periods):
+            total = int(required[period_idx].sum())
+            if total == 0:
+                continue
+            flow = max_flow.SimpleMaxFlow()
+            workers = np.arange(num_workers)
+            flow.add_arcs_with_capacity(
+                np.zeros(num_workers, dtype=np.int64),
+                1 + workers,
+                np.full(num_workers, capacity, dtype=np.int64),
+            )
+            w_idx, s_idx = np.nonzero(eligible[period_idx])
+            flow.add_arcs_with_capacity(
+                1 + w_idx,
+                1 + num_workers + s_idx,
+                np.ones(len(w_idx), dtype=np.int64),
+            )
+            flow.add_arcs_with_capacity(
+                1 + num_workers + np.arange(num_shifts),
+                np.full(num_shifts, sink, dtype=np.int64),
+                required[period_idx].astype(np.int64),
+            )
+            if flow.solve(source, sink) != flow.OPTIMAL:
+                continue
+            if flow.optimal_flow() >= total:
+                continue
+
+            sink_side = set(flow.get_sink_side_min_cut())
+            shift_idxs = [
+                s
+                for s in range(num_shifts)
+                if 1 + num_workers + s in sink_side and required[period_idx, s]
+            ]
+            demand = int(required[period_idx, shift_idxs].sum())
+            supply = int(
+                np.minimum(
+                    eligible[period_idx][:, shift_idxs].sum(axis=1), capacity
+                ).sum()
+            )
+            bottlenecks.append((period_idx, shift_idxs, demand, supply))
+        return bottlenecks
+
     def _check_shift_frequency_requirements(self, result: FeasibilityResult) -> None:
         """Check that shift frequency requirements are satisfiable."""
         if not self.shift_frequency_requirements:
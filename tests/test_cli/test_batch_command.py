@@ -0,0 +1,109 @@
+"""Tests for solve-batch CLI command."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from shift_solver.cli.main import cli
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def workers_file(tmp_path: Path) -> Path:
+    """Create a workers CSV file."""
+    workers_file = tmp_path / "workers.csv"
+    rows = "".join(f"W{i},Worker {i}\n" for i in range(6))
+    workers_file.write_text("id,name\n" + rows)
+    return workers_file
+
+
+@pytest.fixture
+def scenarios_file(tmp_path: Path) -> Path:
+    """Create a scenarios YAML file."""
+    scenarios_file = tmp_path / "scenarios.yaml"
+    scenarios_file.write_text(
+        """
+scenarios:
+  - name: baseline
+  - name: two_nights
+    workers_required: {night: 2}
+  - name: leave
+    availability:
+      - {worker_id: W1, start_date: 2026-01-05, end_date: 2026-01-11}
+"""
+    )
+    return scenarios_file
+
+
+def _args(scenarios: Path, workers: Path, *extra: str) -> list[str]:
+    """Build solve-batch arguments for a two-week schedule."""
+    return [
+        "--config",
+        "missing.yaml",
+        "solve-batch",
+        "--scenarios",
+        str(scenarios),
+        "--workers",
+        str(workers),
+        "--start-date",
+        "2026-01-05",
+        "--end-date",
+        "2026-01-18",
+        "--time-limit",
+        "10",
+        "--processes",
+        "2",
+        *extra,
+    ]
+
+
+class TestSolveBatchCommand:
+    """Test the solve-batch command."""
+
+    def test_solve_batch_help(self, runner: CliRunner) -> None:
+        """Solve-batch command shows help."""
+        result = runner.invoke(cli, ["solve-batch", "--help"])
+        assert result.exit_code == 0
+        assert "--scenarios" in result.output
+
+    def test_solve_batch_writes_comparison(
+        self,
+        runner: CliRunner,
+        scenarios_file: Path,
+        workers_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Every scenario gets a row in the printed and written table."""
+        output = tmp_path / "comparison.json"
+
+        result = runner.invoke(
+            cli, _args(scenarios_file, workers_file, "-o", str(output))
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "two_nights" in result.output
+        rows = json.loads(output.read_text())["scenarios"]
+        assert [row["scenario"] for row in rows] == ["baseline", "two_nights", "leave"]
+        assert all(row["status"] == "OPTIMAL" for row in rows)
+
+    def test_solve_batch_rejects_bad_scenarios(
+        self,
+        runner: CliRunner,
+        workers_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """A scenarios file without a list is rejected."""
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("scenarios: nope\n")
+
+        result = runner.invoke(cli, _args(bad, workers_file))
+
+        assert result.exit_code != 0
+        assert "Error loading scenarios" in result.output
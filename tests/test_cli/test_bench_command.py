@@ -0,0 +1,133 @@
+"""Tests for bench CLI command."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from shift_solver.cli.main import cli
+from shift_solver.solver.benchmark import BENCHMARK_FORMAT_VERSION
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+def _args(*extra: str) -> list[str]:
+    """Bench arguments for the constraint mix family."""
+    return [
+        "bench",
+        "--family",
+        "constraints",
+        "--time-limit",
+        "2",
+        "--num-workers",
+        "1",
+        *extra,
+    ]
+
+
+class TestBenchCommand:
+    """Test the bench command."""
+
+    def test_bench_help(self, runner: CliRunner) -> None:
+        """Bench command shows help."""
+        result = runner.invoke(cli, ["bench", "--help"])
+        assert result.exit_code == 0
+        assert "--baseline" in result.output
+
+    def test_bench_writes_report(self, runner: CliRunner, tmp_path: Path) -> None:
+        """The report is versioned JSON with one result per scenario."""
+        output = tmp_path / "bench.json"
+
+        result = runner.invoke(cli, _args("--output", str(output)))
+
+        assert result.exit_code == 0, result.output
+        assert "constraints-full" in result.output
+        report = json.loads(output.read_text())
+        assert report["format_version"] == BENCHMARK_FORMAT_VERSION
+        assert [r["scenario"]["name"] for r in report["results"]] == [
+            "constraints-hard",
+            "constraints-default",
+            "constraints-full",
+        ]
+        assert report["results"][0]["phases"]["persistence"] is not None
+
+    def test_bench_deterministic_time(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """--deterministic-time, --seed and --reproducible are recorded."""
+        output = tmp_path / "bench.json"
+
+        result = runner.invoke(
+            cli,
+            _args(
+                "--deterministic-time",
+                "0.5",
+                "--seed",
+                "3",
+                "--reproducible",
+                "--output",
+                str(output),
+            ),
+        )
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(output.read_text())
+        assert report["settings"]["deterministic_time_limit"] == 0.5
+        assert report["settings"]["random_seed"] == 3
+        assert report["settings"]["reproducible"] is True
+        assert "deterministic_time" in report["results"][0]["search"]
+
+    def test_bench_fails_on_regression(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """A baseline far faster than the current run fails the command."""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(
+            json.dumps(
+                {
+                    "format_version": BENCHMARK_FORMAT_VERSION,
+                    "results": [
+                        {
+                            "scenario": {"name": "constraints-full"},
+                            "phases": {"build": 0.0001},
+                        }
+                    ],
+                }
+            )
+        )
+
+        result = runner.invoke(
+            cli, _args("--baseline", str(baseline), "--min-delta", "0")
+        )
+
+        assert result.exit_code != 0
+        assert "REGRESSION constraints-full: build" in result.output
+
+    def test_bench_rejects_invalid_baseline(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """A baseline that is not a report is rejected before running."""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text("[]")
+
+        result = runner.invoke(cli, _args("--baseline", str(baseline)))
+
+        assert result.exit_code != 0
+        assert "Error loading baseline report" in result.output
+
+    def test_bench_rejects_baseline_without_format_version(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """A baseline written before reports were versioned is rejected."""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"results": []}))
+
+        result = runner.invoke(cli, _args("--baseline", str(baseline)))
+
+        assert result.exit_code != 0
+        assert "missing format_version" in result.output
@@ -137,6 +137,34 @@ class TestGenerateCommandIntegration:
         # Should have multiple periods
         assert len(data["periods"]) >= 3
 
+    def test_generate_reproducible_solve(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Seeded deterministic-time solves write the same schedule."""
+        outputs = [tmp_path / "first.json", tmp_path / "second.json"]
+
+        for output_file in outputs:
+            result = runner.invoke(
+                cli,
+                [
+                    "-v",
+                    "generate",
+                    "--start-date", "2026-02-02",
+                    "--end-date", "2026-02-15",
+                    "--output", str(output_file),
+                    "--demo",
+                    "--deterministic-time", "0.5",
+                    "--seed", "3",
+                    "--num-workers", "1",
+                    "--reproducible",
+                ],
+            )
+            assert result.exit_code == 0, f"Failed: {result.output}"
+            assert "deterministic time" in result.output
+
+        first, second = (output_file.read_text() for output_file in outputs)
+        assert first == second
+
     def test_generate_verbose_output(
         self, runner: CliRunner, tmp_path: Path
     ) -> None:
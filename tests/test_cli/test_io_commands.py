@@ -125,6 +125,34 @@ class TestGenerateSamplesCommand:
         assert workers1 == workers2
 
 
+    def test_generate_samples_bulk(self, tmp_path: Path) -> None:
+        """Bulk mode streams a reproducible corpus in the same layout."""
+        runner = CliRunner()
+        args = [
+            "generate-samples",
+            "--bulk",
+            "--num-workers",
+            "1200",
+            "--months",
+            "2",
+            "--requests-per-day",
+            "0.1",
+            "--seed",
+            "9",
+        ]
+
+        first = runner.invoke(cli, [*args, "--output-dir", str(tmp_path / "a")])
+        second = runner.invoke(cli, [*args, "--output-dir", str(tmp_path / "b")])
+
+        assert first.exit_code == 0, first.output
+        assert second.exit_code == 0, second.output
+        workers = (tmp_path / "a" / "workers.csv").read_text().splitlines()
+        assert len(workers) == 1201
+        assert (tmp_path / "a" / "requests.csv").read_text() == (
+            tmp_path / "b" / "requests.csv"
+        ).read_text()
+
+
 class TestImportDataCommand:
     """Tests for import-data command."""
 
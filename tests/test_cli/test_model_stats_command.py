@@ -0,0 +1,81 @@
+"""Tests for model-stats CLI command."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from shift_solver.cli.main import cli
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def workers_file(tmp_path: Path) -> Path:
+    """Create a workers CSV file."""
+    workers_file = tmp_path / "workers.csv"
+    rows = "".join(f"W{i},Worker {i}\n" for i in range(6))
+    workers_file.write_text("id,name\n" + rows)
+    return workers_file
+
+
+def _args(workers: Path, *extra: str) -> list[str]:
+    """Build model-stats arguments for a two-week schedule."""
+    return [
+        "--config",
+        "missing.yaml",
+        "model-stats",
+        "--workers",
+        str(workers),
+        "--start-date",
+        "2026-01-05",
+        "--end-date",
+        "2026-01-18",
+        "--num-workers",
+        "4",
+        *extra,
+    ]
+
+
+class TestModelStatsCommand:
+    """Test the model-stats command."""
+
+    def test_model_stats_help(self, runner: CliRunner) -> None:
+        """Model-stats command shows help."""
+        result = runner.invoke(cli, ["model-stats", "--help"])
+        assert result.exit_code == 0
+        assert "--time-limit" in result.output
+
+    def test_model_stats_prints_summary(
+        self, runner: CliRunner, workers_file: Path
+    ) -> None:
+        """The table lists each constraint, then presolve and memory."""
+        result = runner.invoke(cli, _args(workers_file))
+
+        assert result.exit_code == 0, result.output
+        assert "coverage" in result.output
+        assert "Presolve: " in result.output
+        assert "Estimated memory: " in result.output
+        assert "4 x presolved" in result.output
+
+    def test_model_stats_writes_json(
+        self, runner: CliRunner, workers_file: Path, tmp_path: Path
+    ) -> None:
+        """The JSON output matches the model that was analyzed."""
+        output = tmp_path / "stats.json"
+
+        result = runner.invoke(cli, _args(workers_file, "-o", str(output)))
+
+        assert result.exit_code == 0, result.output
+        stats = json.loads(output.read_text())
+        rows = stats["constraint_ids"]
+        assert rows[0]["constraint_id"] == "variables"
+        assert "coverage" in [row["constraint_id"] for row in rows]
+        assert stats["variables"] == sum(row["variables"] for row in rows)
+        assert stats["presolve"]["status"] == "UNKNOWN"
+        assert stats["memory"]["search_workers"] == 4
@@ -0,0 +1,156 @@
+"""Tests for repair CLI command."""
+
+import json
+from datetime import date, time, timedelta
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from shift_solver.cli.commands.generate import _build_output_data
+from shift_solver.cli.main import cli
+from shift_solver.models import ShiftType, Worker
+from shift_solver.solver import ShiftSolver
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    """Create a config file with a single day shift."""
+    yaml_content = """
+shift_types:
+  - id: day
+    name: Day Shift
+    category: day
+    start_time: "07:00"
+    end_time: "15:00"
+    duration_hours: 8.0
+    workers_required: 2
+"""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml_content)
+    return config_file
+
+
+@pytest.fixture
+def workers_file(tmp_path: Path) -> Path:
+    """Create a workers CSV file."""
+    csv_content = """id,name
+W1,Alice
+W2,Bob
+W3,Charlie
+W4,Dana
+"""
+    workers_file = tmp_path / "workers.csv"
+    workers_file.write_text(csv_content)
+    return workers_file
+
+
+@pytest.fixture
+def schedule_file(tmp_path: Path) -> Path:
+    """Solve a three-week schedule and write it as JSON."""
+    base = date(2026, 1, 5)
+    solver = ShiftSolver(
+        workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 5)],
+        shift_types=[
+            ShiftType(
+                id="day",
+                name="Day Shift",
+                category="day",
+                start_time=time(7, 0),
+                end_time=time(15, 0),
+                duration_hours=8.0,
+                workers_required=2,
+            )
+        ],
+        period_dates=[
+            (base + timedelta(weeks=i), base + timedelta(weeks=i, days=6))
+            for i in range(3)
+        ],
+        schedule_id="SCH-REPAIR",
+    )
+    result = solver.solve(time_limit_seconds=10)
+    assert result.schedule is not None
+    schedule_file = tmp_path / "schedule.json"
+    schedule_file.write_text(json.dumps(_build_output_data(result.schedule)))
+    return schedule_file
+
+
+def _assigned_in_first_period(schedule_file: Path) -> str:
+    """Return a worker assigned in the schedule's first period."""
+    data = json.loads(schedule_file.read_text())
+    return next(w for w, shifts in data["periods"][0]["assignments"].items() if shifts)
+
+
+class TestRepairCommand:
+    """Test the repair command."""
+
+    def test_repair_help(self, runner: CliRunner) -> None:
+        """Repair command shows help."""
+        result = runner.invoke(cli, ["repair", "--help"])
+        assert result.exit_code == 0
+        assert "--new-availability" in result.output
+
+    def test_repair_requires_new_availability(
+        self, runner: CliRunner, schedule_file: Path, tmp_path: Path
+    ) -> None:
+        """Repair command requires the availability changes."""
+        result = runner.invoke(
+            cli,
+            ["repair", "--schedule", str(schedule_file), "-o", str(tmp_path / "o")],
+        )
+        assert result.exit_code != 0
+
+    def test_repair_writes_minimal_change_schedule(
+        self,
+        runner: CliRunner,
+        schedule_file: Path,
+        config_file: Path,
+        workers_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """The absent worker is replaced and other periods are untouched."""
+        worker_id = _assigned_in_first_period(schedule_file)
+        new_availability = tmp_path / "new_availability.csv"
+        new_availability.write_text(
+            "worker_id,start_date,end_date,availability_type\n"
+            f"{worker_id},2026-01-05,2026-01-11,unavailable\n"
+        )
+        output = tmp_path / "repaired.json"
+
+        result = runner.invoke(
+            cli,
+            [
+                "repair",
+                "--schedule",
+                str(schedule_file),
+                "--new-availability",
+                str(new_availability),
+                "--config",
+                str(config_file),
+                "--workers",
+                str(workers_file),
+                "--time-limit",
+                "10",
+                "-o",
+                str(output),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Changed assignments: 2" in result.output
+        original = json.loads(schedule_file.read_text())
+        repaired = json.loads(output.read_text())
+        assert repaired["repair"]["affected_periods"] == [0]
+        assert worker_id not in {
+            w for w, shifts in repaired["periods"][0]["assignments"].items() if shifts
+        }
+        for before, after in zip(
+            original["periods"][1:], repaired["periods"][1:], strict=True
+        ):
+            assert before["assignments"] == after["assignments"]
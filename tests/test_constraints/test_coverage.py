@@ -721,3 +721,87 @@ class TestCoverageApplicableDays:
                 for w in workers
             )
             assert weekend_count == 1
+
+
+class TestElasticCoverage:
+    """Tests for soft coverage with a [min_workers, max_workers] range."""
+
+    SOFT = ConstraintConfig(
+        enabled=True,
+        is_hard=False,
+        parameters={"understaffing_weight": 5, "overstaffing_weight": 2},
+    )
+
+    @staticmethod
+    def _shift(workers_required: int, **kwargs: int) -> ShiftType:
+        return ShiftType(
+            id="day",
+            name="Day",
+            category="day",
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            duration_hours=8.0,
+            workers_required=workers_required,
+            **kwargs,
+        )
+
+    def test_understaffing_is_a_gap_not_infeasible(self) -> None:
+        """Too few workers leave a penalized shortfall instead of INFEASIBLE."""
+        model = cp_model.CpModel()
+        workers = [Worker(id="W001", name="Solo")]
+        shift_types = [self._shift(2)]
+        variables = VariableBuilder(model, workers, shift_types, num_periods=1).build()
+        constraint = CoverageConstraint(model, variables, self.SOFT)
+        constraint.apply(workers=workers, shift_types=shift_types, num_periods=1)
+        model.minimize(sum(constraint.violation_variables.values()))
+
+        solver = cp_model.CpSolver()
+        status = solver.Solve(model)
+
+        assert status == cp_model.OPTIMAL
+        assert not constraint.staffing_constraints
+        assert constraint.coverage_gaps(solver) == [
+            {
+                "period_index": 0,
+                "shift_type_id": "day",
+                "shortfall": 1,
+                "excess": 0,
+                "min_workers": 2,
+                "max_workers": 2,
+            }
+        ]
+
+    @pytest.mark.parametrize(("staffed", "excess"), [(1, 0), (3, 0), (4, 1)])
+    def test_staffing_within_range_is_free(self, staffed: int, excess: int) -> None:
+        """Only staffing outside [min, max] produces slack."""
+        model = cp_model.CpModel()
+        workers = [Worker(id=f"W{i}", name=f"W{i}") for i in range(4)]
+        shift_types = [self._shift(2, min_workers=1, max_workers=3)]
+        variables = VariableBuilder(model, workers, shift_types, num_periods=1).build()
+        constraint = CoverageConstraint(model, variables, self.SOFT)
+        constraint.apply(workers=workers, shift_types=shift_types, num_periods=1)
+        assignment_vars = [
+            variables.get_assignment_var(w.id, 0, "day") for w in workers
+        ]
+        model.add(sum(assignment_vars) == staffed)
+        model.minimize(sum(constraint.violation_variables.values()))
+
+        solver = cp_model.CpSolver()
+        assert solver.Solve(model) == cp_model.OPTIMAL
+
+        gaps = constraint.coverage_gaps(solver)
+        assert [g["excess"] for g in gaps] == ([excess] if excess else [])
+
+    def test_slack_weights_are_priorities(self) -> None:
+        """Under- and overstaffing weights become violation priorities."""
+        model = cp_model.CpModel()
+        workers = [Worker(id="W001", name="Solo")]
+        shift_types = [self._shift(1)]
+        variables = VariableBuilder(model, workers, shift_types, num_periods=1).build()
+        constraint = CoverageConstraint(model, variables, self.SOFT)
+        constraint.apply(workers=workers, shift_types=shift_types, num_periods=1)
+
+        assert constraint.violation_priorities == {
+            "short_day_p0": 5,
+            "excess_day_p0": 2,
+        }
@@ -319,3 +319,97 @@ class TestFairnessVariableTypeMetadata:
         ]
         assert len(fairness_terms) == 1
         assert fairness_terms[0].variable_name == "spread"
+
+
+class TestFairnessEncodings:
+    """Tests for the selectable fairness encodings."""
+
+    @pytest.mark.parametrize("encoding", ["spread", "deviation", "lexicographic"])
+    def test_encoding_balances_undesirable_shifts(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        encoding: str,
+    ) -> None:
+        """Every encoding spreads 8 undesirable shifts as 3/3/2."""
+        model = cp_model.CpModel()
+        variables = VariableBuilder(model, workers, shift_types, num_periods=4).build()
+        config = ConstraintConfig(
+            enabled=True, is_hard=False, weight=1000, parameters={"encoding": encoding}
+        )
+        constraint = FairnessConstraint(model, variables, config)
+        constraint.apply(workers=workers, shift_types=shift_types, num_periods=4)
+        for period in range(4):
+            for shift_type in shift_types:
+                model.add(
+                    sum(
+                        variables.get_assignment_var(w.id, period, shift_type.id)
+                        for w in workers
+                    )
+                    == shift_type.workers_required
+                )
+        builder = ObjectiveBuilder(model)
+        builder.add_constraint(constraint)
+        builder.build()
+
+        solver = cp_model.CpSolver()
+        assert solver.solve(model) == cp_model.OPTIMAL
+
+        totals = sorted(
+            solver.value(variables.get_undesirable_total_var(w.id)) for w in workers
+        )
+        assert totals == [2, 3, 3]
+
+    def test_deviation_has_one_term_per_worker(
+        self,
+        model_and_variables: tuple[cp_model.CpModel, SolverVariables],
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+    ) -> None:
+        """The deviation encoding adds no max/min helpers."""
+        model, variables = model_and_variables
+        config = ConstraintConfig(
+            enabled=True, is_hard=False, parameters={"encoding": "deviation"}
+        )
+        constraint = FairnessConstraint(model, variables, config)
+
+        constraint.apply(workers=workers, shift_types=shift_types, num_periods=4)
+
+        assert set(constraint.violation_variable_types.values()) == {
+            "objective_target"
+        }
+        assert len(constraint.violation_variables) == len(workers)
+
+    def test_unknown_encoding_raises(
+        self,
+        model_and_variables: tuple[cp_model.CpModel, SolverVariables],
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+    ) -> None:
+        """An unknown encoding is rejected."""
+        model, variables = model_and_variables
+        config = ConstraintConfig(enabled=True, parameters={"encoding": "gini"})
+        constraint = FairnessConstraint(model, variables, config)
+
+        with pytest.raises(ValueError, match="Unknown fairness encoding"):
+            constraint.apply(workers=workers, shift_types=shift_types, num_periods=4)
+
+    def test_deviation_rejects_worker_activation(
+        self,
+        model_and_variables: tuple[cp_model.CpModel, SolverVariables],
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+    ) -> None:
+        """The mean over active workers is not linear."""
+        model, variables = model_and_variables
+        config = ConstraintConfig(enabled=True, parameters={"encoding": "deviation"})
+        constraint = FairnessConstraint(model, variables, config)
+        active = {w.id: model.new_bool_var(f"active_{w.id}") for w in workers}
+
+        with pytest.raises(ValueError, match="worker activation"):
+            constraint.apply(
+                workers=workers,
+                shift_types=shift_types,
+                num_periods=4,
+                worker_active=active,
+            )
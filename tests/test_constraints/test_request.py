@@ -850,12 +850,12 @@ class TestRequestConstraintViolationVariableCoupling:
             viol_value = solver.value(viol_var)
 
             # Parse the variable name to extract worker, shift_type, period
-            # Format: req_viol_{worker_id}_{shift_type_id}_p{period}_r{idx}
+            # Format: req_viol_{worker_id}_{shift_type_id}_p{period}_{pos|neg}
             parts = var_name.replace("req_viol_", "").split("_")
             worker_id = parts[0]
             shift_type_id = parts[1]
             period = int(parts[2][1:])  # Remove 'p' prefix
-            request_idx = int(parts[3][1:])  # Remove 'r' prefix
+            is_positive = parts[3] == "pos"
 
             assignment_var = variables.get_assignment_var(
                 worker_id, period, shift_type_id
@@ -863,8 +863,7 @@ class TestRequestConstraintViolationVariableCoupling:
             assignment_value = solver.value(assignment_var)
 
             # Determine expected violation based on request type
-            request = requests[request_idx]
-            if request.is_positive:
+            if is_positive:
                 # Positive: violation=1 if NOT assigned
                 expected_viol = 0 if assignment_value >= 1 else 1
             else:
@@ -874,7 +873,7 @@ class TestRequestConstraintViolationVariableCoupling:
             assert viol_value == expected_viol, (
                 f"Violation mismatch for {var_name}: "
                 f"expected={expected_viol}, actual={viol_value}, "
-                f"assignment={assignment_value}, is_positive={request.is_positive}"
+                f"assignment={assignment_value}, is_positive={is_positive}"
             )
 
     def test_violation_coupling_bidirectional_soundness(
@@ -961,6 +960,88 @@ class TestRequestConstraintViolationVariableCoupling:
         assert solver2.value(vars2.get_assignment_var("W001", 0, "day")) >= 1
 
 
+class TestRequestViolationTerms:
+    """Tests for literal violation terms without auxiliary variables."""
+
+    def test_soft_requests_add_no_variables_or_constraints(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Violations are assignment literals, not reified helper bools."""
+        model = cp_model.CpModel()
+        variables = VariableBuilder(model, workers, shift_types, num_periods=4).build()
+        num_vars = len(model.proto.variables)
+        num_constraints = len(model.proto.constraints)
+        requests = [
+            SchedulingRequest(
+                worker_id="W001",
+                start_date=date(2026, 1, 5),
+                end_date=date(2026, 2, 1),
+                request_type=request_type,
+                shift_type_id=shift_type_id,
+                priority=1,
+            )
+            for request_type, shift_type_id in (
+                ("positive", "day"),
+                ("negative", "night"),
+            )
+        ]
+
+        constraint = RequestConstraint(
+            model, variables, ConstraintConfig(enabled=True, is_hard=False)
+        )
+        constraint.apply(
+            workers=workers,
+            shift_types=shift_types,
+            num_periods=4,
+            requests=requests,
+            period_dates=period_dates,
+        )
+
+        assert len(constraint.violation_variables) == 8
+        assert len(model.proto.variables) == num_vars
+        assert len(model.proto.constraints) == num_constraints
+
+    def test_duplicate_requests_share_one_term(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Overlapping requests for the same cell sum their priorities."""
+        model = cp_model.CpModel()
+        variables = VariableBuilder(model, workers, shift_types, num_periods=4).build()
+        requests = [
+            SchedulingRequest(
+                worker_id="W001",
+                start_date=date(2026, 1, 5),
+                end_date=end_date,
+                request_type="negative",
+                shift_type_id="night",
+                priority=priority,
+            )
+            for end_date, priority in ((date(2026, 1, 11), 2), (date(2026, 1, 18), 3))
+        ]
+
+        constraint = RequestConstraint(
+            model, variables, ConstraintConfig(enabled=True, is_hard=False)
+        )
+        constraint.apply(
+            workers=workers,
+            shift_types=shift_types,
+            num_periods=4,
+            requests=requests,
+            period_dates=period_dates,
+        )
+
+        assert constraint.violation_priorities == {
+            "req_viol_W001_night_p0_neg": 5,
+            "req_viol_W001_night_p1_neg": 3,
+        }
+
+
 class TestHardVsSoftRequestSemantics:
     """
     Tests for hard vs soft request constraint enforcement semantics (scheduler-69).
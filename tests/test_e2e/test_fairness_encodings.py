@@ -0,0 +1,172 @@
+"""Benchmark of the fairness encodings.
+
+Solves one instance per encoding and records how the incumbent objective
+and the best bound converge, and how long each encoding takes to reach an
+incumbent within 1% of its optimum. Run with -s to see the table.
+"""
+
+import time as time_module
+from dataclasses import dataclass, field
+from datetime import time
+
+import pytest
+from ortools.sat.python import cp_model
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.constraints.fairness import FAIRNESS_ENCODINGS
+from shift_solver.models import SchedulingRequest, ShiftType, Worker
+from shift_solver.solver import ShiftSolver
+
+from .conftest import create_period_dates
+
+TIME_LIMIT_SECONDS = 10
+
+
+@dataclass
+class _Trace:
+    """Incumbent and bound timelines of one solve."""
+
+    start: float = field(default_factory=time_module.time)
+    incumbents: list[tuple[float, float]] = field(default_factory=list)
+    bounds: list[tuple[float, float]] = field(default_factory=list)
+
+    def time_within(self, target: float, tolerance: float = 0.01) -> float | None:
+        """Seconds until an incumbent came within tolerance of target."""
+        for elapsed, objective in self.incumbents:
+            if objective <= target + abs(target) * tolerance:
+                return elapsed
+        return None
+
+    def bound_time(self, target: float) -> float | None:
+        """Seconds until the bound reached target (optimality proof)."""
+        for elapsed, bound in self.bounds:
+            if bound >= target:
+                return elapsed
+        return None
+
+
+class _TraceCallback(cp_model.CpSolverSolutionCallback):
+    """Records the incumbent objective of every solution."""
+
+    def __init__(self, trace: _Trace) -> None:
+        super().__init__()
+        self.trace = trace
+
+    def on_solution_callback(self) -> None:
+        self.trace.incumbents.append(
+            (time_module.time() - self.trace.start, self.ObjectiveValue())
+        )
+
+
+def _instance(encoding: str) -> ShiftSolver:
+    """Twelve workers over eight weeks with nights, weekends and requests."""
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=3,
+        ),
+        ShiftType(
+            id="night",
+            name="Night",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=2,
+            is_undesirable=True,
+        ),
+        ShiftType(
+            id="weekend",
+            name="Weekend",
+            category="weekend",
+            start_time=time(8, 0),
+            end_time=time(20, 0),
+            duration_hours=12.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    workers = [Worker(id=f"W{i:03d}", name=f"Worker {i}") for i in range(12)]
+    period_dates = create_period_dates(num_periods=8)
+    # Night requests pull the distribution away from the even split
+    requests = [
+        SchedulingRequest(
+            worker_id=f"W{i:03d}",
+            start_date=period_dates[0][0],
+            end_date=period_dates[-1][1],
+            request_type="positive" if i % 2 else "negative",
+            shift_type_id="night",
+            priority=1 + i % 3,
+        )
+        for i in range(0, 12, 3)
+    ]
+    return ShiftSolver(
+        workers=workers,
+        shift_types=shift_types,
+        period_dates=period_dates,
+        schedule_id=f"FAIR-{encoding}",
+        requests=requests,
+        constraint_configs={
+            "fairness": ConstraintConfig(
+                enabled=True,
+                is_hard=False,
+                weight=1000,
+                parameters={"encoding": encoding},
+            ),
+            "request": ConstraintConfig(enabled=True, is_hard=False, weight=150),
+        },
+    )
+
+
+@pytest.mark.e2e
+@pytest.mark.slow
+class TestFairnessEncodingBenchmark:
+    """Bound convergence and time to 1% of optimal per fairness encoding."""
+
+    def test_encodings_converge(self) -> None:
+        """Every encoding reaches 1% of its optimum within the time limit."""
+        rows = []
+        for encoding in FAIRNESS_ENCODINGS:
+            ss = _instance(encoding)
+            ss._build_model()
+            trace = _Trace()
+            solver = ShiftSolver._create_solver(
+                time_limit_seconds=TIME_LIMIT_SECONDS, num_workers=8
+            )
+            solver.best_bound_callback = lambda bound, trace=trace: (
+                trace.bounds.append((time_module.time() - trace.start, bound))
+            )
+            trace.start = time_module.time()
+            status = solver.Solve(ss._model, _TraceCallback(trace))
+
+            assert status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+            best = solver.ObjectiveValue()
+            within = trace.time_within(best)
+            assert within is not None
+            rows.append(
+                (
+                    encoding,
+                    solver.StatusName(status),
+                    best,
+                    solver.BestObjectiveBound(),
+                    within,
+                    trace.bound_time(best),
+                    len(trace.incumbents),
+                )
+            )
+
+        print(
+            f"\n{'encoding':<14} {'status':<9} {'objective':>10} {'bound':>10} "
+            f"{'t(1%)':>7} {'t(proof)':>9} {'sols':>5}"
+        )
+        for encoding, status_name, best, bound, within, proof, sols in rows:
+            proof_cell = "-" if proof is None else f"{proof:.2f}"
+            print(
+                f"{encoding:<14} {status_name:<9} {best:>10.0f} {bound:>10.0f} "
+                f"{within:>7.2f} {proof_cell:>9} {sols:>5}"
+            )
@@ -0,0 +1,120 @@
+"""Memory regression benchmark for long-lived solver processes.
+
+Solves instances of increasing size in one process, re-solving each
+solver object a few times the way the web app reuses them, and records
+the tracemalloc peak and the memory still retained after each solve.
+tracemalloc only sees Python allocations; the model protos live in
+OR-Tools' C++ heap but are freed together with their Python owners.
+Run with -s to see the table.
+"""
+
+import gc
+import tracemalloc
+from datetime import time
+
+import pytest
+
+from shift_solver.models import ShiftType, Worker
+from shift_solver.solver import ShiftSolver
+
+from .conftest import create_period_dates
+
+WORKER_COUNTS = (10, 20, 40, 80)
+SOLVES_PER_SOLVER = 3
+# Allowance for interpreter-level caches that grow slowly across solves
+RETAINED_LIMIT_BYTES = 64 * 1024
+
+
+def _instance(num_workers: int, results_only: bool) -> ShiftSolver:
+    """num_workers workers over num_workers / 2 weeks with day and night."""
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=max(1, num_workers // 6),
+        ),
+        ShiftType(
+            id="night",
+            name="Night",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=max(1, num_workers // 10),
+            is_undesirable=True,
+        ),
+    ]
+    workers = [Worker(id=f"W{i:03d}", name=f"Worker {i}") for i in range(num_workers)]
+    return ShiftSolver(
+        workers=workers,
+        shift_types=shift_types,
+        period_dates=create_period_dates(num_periods=num_workers // 2),
+        schedule_id=f"MEM-{num_workers}",
+        results_only=results_only,
+    )
+
+
+def _profile(results_only: bool) -> list[tuple[int, int, int, int]]:
+    """(workers, solve, retained, peak) in bytes above the solver's inputs."""
+    rows = []
+    for num_workers in WORKER_COUNTS:
+        ss = _instance(num_workers, results_only)
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for solve in range(SOLVES_PER_SOLVER):
+            tracemalloc.reset_peak()
+            # Like the web runner, fall back to the greedy schedule when the
+            # search finds nothing in time
+            result = ss.solve(
+                time_limit_seconds=10, num_workers=1, greedy_fallback=True
+            )
+            assert result.success
+            del result
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            rows.append((num_workers, solve, current - baseline, peak - baseline))
+        del ss
+    return rows
+
+
+@pytest.mark.e2e
+@pytest.mark.slow
+class TestMemoryBenchmark:
+    """Peak and retained memory across repeated solves in one process."""
+
+    def test_results_only_retains_nothing(self) -> None:
+        """Released solvers keep no model state between or after solves."""
+        # Warm up imports and registries outside the measurement
+        _instance(WORKER_COUNTS[0], results_only=True).solve(time_limit_seconds=10)
+        tracemalloc.start()
+        try:
+            released = _profile(results_only=True)
+            kept = _profile(results_only=False)
+        finally:
+            tracemalloc.stop()
+
+        for _, _, retained, _ in released:
+            assert retained < RETAINED_LIMIT_BYTES
+        # Without release the last model stays alive; it grows with the instance
+        kept_retained = {(n, solve): retained for n, solve, retained, _ in kept}
+        largest = WORKER_COUNTS[-1]
+        assert kept_retained[(largest, 0)] > 4 * RETAINED_LIMIT_BYTES
+        # Repeated solves replace the kept model rather than adding to it
+        for n in WORKER_COUNTS:
+            growth = kept_retained[(n, SOLVES_PER_SOLVER - 1)] - kept_retained[(n, 0)]
+            assert growth < RETAINED_LIMIT_BYTES
+
+        print(
+            f"\n{'mode':<13} {'workers':>7} {'solve':>5} "
+            f"{'retained':>10} {'peak':>10}"
+        )
+        for mode, rows in (("results_only", released), ("kept", kept)):
+            for n, solve, retained, peak in rows:
+                print(
+                    f"{mode:<13} {n:>7} {solve:>5} "
+                    f"{retained / 1024:>8.0f}KB {peak / 1024:>8.0f}KB"
+                )
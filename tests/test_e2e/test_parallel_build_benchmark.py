@@ -0,0 +1,127 @@
+"""Benchmark of parallel constraint model building.
+
+Builds one instance sequentially and with 1-16 build processes (up to
+the cores available, but at least 2), checks every merged model equals
+the sequential one, and records the build time and speedup per process
+count. Run with -s to see the table.
+"""
+
+import os
+import time as time_module
+from datetime import time
+
+import pytest
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.models import SchedulingRequest, ShiftType, Worker
+from shift_solver.solver import ShiftSolver
+
+from .conftest import create_period_dates
+
+PROCESS_COUNTS = (1, 2, 4, 8, 16)
+
+
+def _instance(build_processes: int | None) -> ShiftSolver:
+    """Sixty workers over 26 weeks with the soft constraint families on."""
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=4,
+        ),
+        ShiftType(
+            id="evening",
+            name="Evening",
+            category="evening",
+            start_time=time(15, 0),
+            end_time=time(23, 0),
+            duration_hours=8.0,
+            workers_required=3,
+        ),
+        ShiftType(
+            id="night",
+            name="Night",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=2,
+            is_undesirable=True,
+        ),
+    ]
+    workers = [Worker(id=f"W{i:03d}", name=f"Worker {i}") for i in range(60)]
+    period_dates = create_period_dates(num_periods=26)
+    requests = [
+        SchedulingRequest(
+            worker_id=f"W{i:03d}",
+            start_date=period_dates[0][0],
+            end_date=period_dates[-1][1],
+            request_type="negative",
+            shift_type_id="night",
+            priority=1,
+        )
+        for i in range(0, 60, 4)
+    ]
+    return ShiftSolver(
+        workers=workers,
+        shift_types=shift_types,
+        period_dates=period_dates,
+        schedule_id="PARALLEL-BENCH",
+        requests=requests,
+        constraint_configs={
+            "fairness": ConstraintConfig(enabled=True, is_hard=False, weight=1000),
+            "frequency": ConstraintConfig(
+                enabled=True,
+                is_hard=False,
+                weight=50,
+                parameters={"max_periods_between": 4},
+            ),
+            "sequence": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+            "max_absence": ConstraintConfig(
+                enabled=True,
+                is_hard=False,
+                weight=50,
+                parameters={"max_periods_absent": 6},
+            ),
+            "request": ConstraintConfig(enabled=True, is_hard=False, weight=150),
+        },
+        build_processes=build_processes,
+    )
+
+
+def _timed_build(build_processes: int | None) -> tuple[float, str]:
+    """Build the instance and return the build time and the model text."""
+    ss = _instance(build_processes)
+    start = time_module.time()
+    ss._build_model()
+    elapsed = time_module.time() - start
+    assert ss._model is not None
+    return elapsed, str(ss._model.proto)
+
+
+@pytest.mark.e2e
+@pytest.mark.slow
+class TestParallelBuildBenchmark:
+    """Build time and speedup per number of build processes."""
+
+    def test_build_scaling(self) -> None:
+        """Every process count builds the sequential model."""
+        cores = os.cpu_count() or 1
+        sequential_time, expected = _timed_build(None)
+        rows = []
+        for processes in [p for p in PROCESS_COUNTS if p <= max(cores, 2)]:
+            elapsed, text = _timed_build(processes)
+            assert text == expected
+            rows.append((processes, elapsed, sequential_time / elapsed))
+
+        print(
+            f"\ncores={cores} constraints={expected.count('constraints {')}"
+            f" sequential={sequential_time:.2f}s"
+        )
+        print(f"{'processes':>9} {'build (s)':>10} {'speedup':>8}")
+        for processes, elapsed, speedup in rows:
+            print(f"{processes:>9} {elapsed:>10.2f} {speedup:>8.2f}")
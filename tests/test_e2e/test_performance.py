@@ -78,6 +78,60 @@ class TestLargeScaleScheduling:
         assert len(result.schedule.periods) == 12
         assert len(result.schedule.workers) == 50
 
+    def test_50_workers_12_weeks_lns_vs_plain(self, worker_factory) -> None:
+        """LNS is at least as good as plain CP-SAT at equal wall time."""
+        workers = [worker_factory() for _ in range(50)]
+        shift_types = [
+            ShiftType(
+                id="day",
+                name="Day",
+                category="day",
+                start_time=time(7, 0),
+                end_time=time(15, 0),
+                duration_hours=8.0,
+                workers_required=5,
+            ),
+            ShiftType(
+                id="evening",
+                name="Evening",
+                category="evening",
+                start_time=time(15, 0),
+                end_time=time(23, 0),
+                duration_hours=8.0,
+                workers_required=4,
+            ),
+            ShiftType(
+                id="night",
+                name="Night",
+                category="night",
+                start_time=time(23, 0),
+                end_time=time(7, 0),
+                duration_hours=8.0,
+                workers_required=3,
+                is_undesirable=True,
+            ),
+        ]
+        constraint_configs = {
+            "coverage": ConstraintConfig(enabled=True, is_hard=True),
+            "fairness": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+        }
+
+        def make_solver() -> ShiftSolver:
+            return ShiftSolver(
+                workers=workers,
+                shift_types=shift_types,
+                period_dates=create_period_dates(num_periods=12),
+                schedule_id="LNS-PERF",
+                constraint_configs=constraint_configs,
+            )
+
+        plain = make_solver().solve(time_limit_seconds=30)
+        lns = make_solver().solve_lns(time_limit_seconds=30)
+
+        assert plain.success and lns.success
+        assert lns.solve_time_seconds < 35
+        assert lns.objective_value <= plain.objective_value
+
     def test_75_workers_8_weeks(self, worker_factory) -> None:
         """75 workers over 8 weeks."""
         workers = [worker_factory() for _ in range(75)]
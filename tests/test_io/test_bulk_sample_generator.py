@@ -0,0 +1,111 @@
+"""Tests for the bulk sample generator."""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from shift_solver.io import CSVLoader, ExcelLoader
+from shift_solver.io.sample_generator import BulkSampleGenerator
+from shift_solver.io.sample_generator.bulk import BLOCK_WORKERS
+
+START = date(2026, 1, 5)
+END = date(2026, 12, 27)
+
+
+def _concat(chunks) -> pd.DataFrame:
+    return pd.concat(list(chunks), ignore_index=True)
+
+
+class TestBulkSampleGenerator:
+    """Tests for BulkSampleGenerator."""
+
+    def test_same_seed_same_corpus(self) -> None:
+        """Generation is reproducible from the seed."""
+        first = BulkSampleGenerator(seed=5).iter_requests(50, START, END)
+        second = BulkSampleGenerator(seed=5).iter_requests(50, START, END)
+        other = BulkSampleGenerator(seed=6).iter_requests(50, START, END)
+
+        expected = _concat(first)
+        assert expected.equals(_concat(second))
+        assert not expected.equals(_concat(other))
+
+    def test_smaller_corpus_is_prefix_of_larger(self) -> None:
+        """Blocks draw from their own streams, so corpora nest."""
+        small = _concat(BulkSampleGenerator(seed=1).iter_workers(BLOCK_WORKERS))
+        large = _concat(BulkSampleGenerator(seed=1).iter_workers(BLOCK_WORKERS + 10))
+
+        assert len(large) == BLOCK_WORKERS + 10
+        # IDs widen with the corpus size; names and attributes match
+        columns = ["name", "worker_type", "restricted_shifts"]
+        assert large[columns].head(BLOCK_WORKERS).equals(small[columns])
+
+    def test_rates_drive_row_counts(self) -> None:
+        """Row counts follow the configured per-worker rates."""
+        generator = BulkSampleGenerator(
+            seed=2, requests_per_day=0.2, vacations_per_year=5
+        )
+        days = (END - START).days + 1
+
+        requests = _concat(generator.iter_requests(200, START, END))
+        availability = _concat(generator.iter_availability(200, START, END))
+
+        assert len(requests) == pytest.approx(200 * days * 0.2, rel=0.05)
+        assert len(availability) == pytest.approx(200 * 5 * days / 365, rel=0.15)
+        assert requests["start_date"].min() >= START.isoformat()
+        assert availability["end_date"].max() <= END.isoformat()
+
+    def test_staffing_ratio_scales_requirements(self) -> None:
+        """Requirements add up to the requested share of the workers."""
+        generator = BulkSampleGenerator(industry="warehouse", staffing_ratio=0.5)
+
+        shift_types = generator.generate_shift_types(1000)
+
+        assert sum(st.workers_required for st in shift_types) == 500
+
+    def test_invalid_rate_raises(self) -> None:
+        """Negative rates are rejected."""
+        with pytest.raises(ValueError, match="must be >= 0"):
+            BulkSampleGenerator(requests_per_day=-1)
+
+    def test_csv_round_trips_through_loader(self, tmp_path: Path) -> None:
+        """Streamed CSV files load with CSVLoader."""
+        generator = BulkSampleGenerator(seed=3, requests_per_day=0.05)
+
+        counts = generator.generate_to_csv(tmp_path, 1500, START, END)
+
+        loader = CSVLoader()
+        assert len(loader.load_workers(tmp_path / "workers.csv")) == 1500
+        assert len(loader.load_requests(tmp_path / "requests.csv")) == counts[
+            "requests.csv"
+        ]
+        assert (
+            len(loader.load_availability(tmp_path / "availability.csv"))
+            == counts["availability.csv"]
+        )
+        assert (tmp_path / "shift_types.csv").read_text().startswith("id,name")
+
+    def test_excel_round_trips_through_loader(self, tmp_path: Path) -> None:
+        """The streamed workbook loads with ExcelLoader."""
+        output = tmp_path / "bulk.xlsx"
+
+        counts = BulkSampleGenerator(seed=4).generate_to_excel(output, 40, START, END)
+
+        data = ExcelLoader().load_all(output)
+        assert len(data["workers"]) == counts["Workers"] == 40
+        assert len(data["requests"]) == counts["Requests"]
+        assert len(data["availability"]) == counts["Availability"]
+
+    def test_solver_inputs_build_solvable_instance(self) -> None:
+        """solver_inputs feed ShiftSolver directly."""
+        from shift_solver.solver import ShiftSolver
+
+        kwargs = BulkSampleGenerator(
+            industry="healthcare", seed=1, staffing_ratio=0.5
+        ).solver_inputs(24, START, date(2026, 3, 1))
+
+        assert len(kwargs["period_dates"]) == 8
+        assert len(kwargs["workers"]) == 24
+        result = ShiftSolver(**kwargs).solve(time_limit_seconds=20)
+        assert result.success
@@ -0,0 +1,47 @@
+"""Tests for the search progress chart."""
+
+import plotly.graph_objects as go
+
+from shift_solver.io.plotly_handler.charts.search_progress import (
+    create_search_progress_chart,
+)
+from shift_solver.solver.search_log import SearchTimeline, TimelineEvent
+
+
+def _timeline() -> SearchTimeline:
+    return SearchTimeline(
+        events=[
+            TimelineEvent(0.1, "bound", None, 0.0, "initial_domain"),
+            TimelineEvent(0.3, "solution", 640.0, 0.0, "fj_restart"),
+            TimelineEvent(0.5, "bound", 640.0, 100.0, "max_lp"),
+            TimelineEvent(0.9, "solution", 400.0, 100.0, "no_lp"),
+        ],
+        search_start_seconds=0.1,
+        wall_time_seconds=2.0,
+    )
+
+
+class TestSearchProgressChart:
+    def test_returns_figure(self) -> None:
+        """create_search_progress_chart returns a plotly Figure."""
+        fig = create_search_progress_chart(_timeline())
+        assert isinstance(fig, go.Figure)
+
+    def test_incumbent_and_bound_steps(self) -> None:
+        """Both histories are step lines held until the end of the solve."""
+        fig = create_search_progress_chart(_timeline())
+
+        incumbent, bound = fig.data
+        assert incumbent.name == "Incumbent"
+        assert list(incumbent.x) == [0.3, 0.9, 2.0]
+        assert list(incumbent.y) == [640.0, 400.0, 400.0]
+        assert list(incumbent.hovertext) == ["fj_restart", "no_lp", ""]
+        assert bound.name == "Bound"
+        assert list(bound.x) == [0.1, 0.5, 2.0]
+        assert list(bound.y) == [0.0, 100.0, 100.0]
+        assert incumbent.line.shape == bound.line.shape == "hv"
+
+    def test_empty_timeline(self) -> None:
+        """A timeline without events still renders."""
+        fig = create_search_progress_chart(SearchTimeline())
+        assert all(len(trace.x) == 0 for trace in fig.data)
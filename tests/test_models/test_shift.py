@@ -399,6 +399,53 @@ class TestShiftTypeApplicableDays:
         assert hash(shift1) != hash(shift2)
 
 
+class TestShiftTypeStaffingRange:
+    """Tests for ShiftType min_workers / max_workers."""
+
+    @staticmethod
+    def _shift(**kwargs: int | None) -> ShiftType:
+        return ShiftType(
+            id="day",
+            name="Day",
+            category="day",
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            duration_hours=8.0,
+            workers_required=2,
+            **kwargs,
+        )
+
+    def test_range_defaults_to_workers_required(self) -> None:
+        """Without bounds the range is exactly workers_required."""
+        assert self._shift().staffing_range == (2, 2)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"min_workers": 1, "max_workers": 3}, (1, 3)),
+            ({"min_workers": 3}, (3, 3)),
+            ({"min_workers": 0}, (0, 2)),
+            ({"max_workers": 1}, (1, 1)),
+            ({"max_workers": 4}, (2, 4)),
+        ],
+    )
+    def test_one_sided_bounds(
+        self, kwargs: dict[str, int], expected: tuple[int, int]
+    ) -> None:
+        """A single bound is widened against workers_required, never inverted."""
+        assert self._shift(**kwargs).staffing_range == expected
+
+    def test_min_cannot_exceed_max(self) -> None:
+        """Explicit bounds must be ordered."""
+        with pytest.raises(ValueError, match="cannot exceed max_workers"):
+            self._shift(min_workers=3, max_workers=2)
+
+    def test_equality_includes_bounds(self) -> None:
+        """Shift types with different bounds differ."""
+        assert self._shift(max_workers=3) != self._shift()
+        assert hash(self._shift(min_workers=1)) != hash(self._shift())
+
+
 class TestShiftInstanceValidation:
     """Tests for ShiftInstance validation."""
 
@@ -0,0 +1,190 @@
+"""Tests for scenario batch solving."""
+
+from dataclasses import replace
+from datetime import date, time, timedelta
+
+import pytest
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.models import Availability, ShiftType, Worker
+from shift_solver.solver.batch import BatchSolver, Scenario
+from shift_solver.solver.core_allocator import CoreAllocator
+from shift_solver.solver.shift_solver import ShiftSolver
+
+BASE = date(2026, 1, 5)
+
+
+@pytest.fixture
+def solver() -> ShiftSolver:
+    """Six workers, a day and a night shift over four weeks."""
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=2,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    return ShiftSolver(
+        workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 7)],
+        shift_types=shift_types,
+        period_dates=[
+            (BASE + timedelta(weeks=i), BASE + timedelta(weeks=i, days=6))
+            for i in range(4)
+        ],
+        schedule_id="BATCH-001",
+        constraint_configs={
+            "fairness": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+        },
+    )
+
+
+def _kwargs_with(solver: ShiftSolver, **changes: object) -> ShiftSolver:
+    """Build a solver from scratch with some inputs replaced."""
+    return ShiftSolver(**{**solver._solver_kwargs(), **changes})
+
+
+class TestScenario:
+    """Tests for Scenario parsing."""
+
+    def test_from_dict(self) -> None:
+        """Scenario fields are parsed from a mapping."""
+        scenario = Scenario.from_dict(
+            {
+                "name": "holiday",
+                "workers_required": {"night": "2"},
+                "removed_workers": ["W1"],
+                "availability": [
+                    {
+                        "worker_id": "W2",
+                        "start_date": "2026-01-05",
+                        "end_date": "2026-01-06",
+                    }
+                ],
+            }
+        )
+
+        assert scenario.workers_required == {"night": 2}
+        assert scenario.removed_workers == frozenset({"W1"})
+        assert scenario.availabilities[0].availability_type == "unavailable"
+        assert scenario.availabilities[0].end_date == date(2026, 1, 6)
+
+
+class TestBatchSolver:
+    """Tests for ShiftSolver.solve_batch."""
+
+    def test_scenarios_match_individual_solves(self, solver: ShiftSolver) -> None:
+        """Patched scenarios reach the same optimum as rebuilt models."""
+        leave = Availability(
+            worker_id="W1",
+            start_date=BASE,
+            end_date=BASE + timedelta(days=13),
+            availability_type="unavailable",
+        )
+        scenarios = [
+            Scenario(name="base"),
+            Scenario(name="two_nights", workers_required={"night": 2}),
+            Scenario(name="small_team", removed_workers=frozenset({"W5", "W6"})),
+            Scenario(name="leave", availabilities=(leave,)),
+        ]
+        night2 = [
+            replace(st, workers_required=2) if st.id == "night" else st
+            for st in solver.shift_types
+        ]
+        references = {
+            "base": solver,
+            "two_nights": _kwargs_with(solver, shift_types=night2),
+            "small_team": _kwargs_with(solver, workers=solver.workers[:4]),
+            "leave": _kwargs_with(solver, availabilities=[leave]),
+        }
+
+        batch = solver.solve_batch(scenarios, time_limit_seconds=20, processes=2)
+
+        for name, reference in references.items():
+            expected = reference.solve(time_limit_seconds=20)
+            assert batch.results[name].objective_value == expected.objective_value
+        leave_schedule = batch.results["leave"].schedule
+        assert leave_schedule is not None
+        assert not leave_schedule.periods[0].assignments.get("W1")
+        table = batch.table()
+        assert [row["scenario"] for row in table] == [s.name for s in scenarios]
+        assert all(row["status"] == "OPTIMAL" for row in table)
+        assert table[0]["max_assignments"] is not None
+
+    def test_infeasible_scenario_is_reported(self, solver: ShiftSolver) -> None:
+        """A scenario without a solution gets an unsolved row."""
+        batch = solver.solve_batch(
+            [Scenario(name="too_many", workers_required={"day": 7})],
+            time_limit_seconds=10,
+            processes=1,
+        )
+
+        row = batch.table()[0]
+        assert row["status"] == "INFEASIBLE"
+        assert row["objective"] is None
+        assert not batch.results["too_many"].success
+
+    def test_pool_sized_from_core_lease(
+        self, solver: ShiftSolver, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without processes the pool gets the batch's share of the cores."""
+        allocator = CoreAllocator(total_cores=4)
+        allocator.acquire("other")
+        sizes = []
+        run_jobs = BatchSolver._run_jobs
+
+        def _record(
+            self: BatchSolver, jobs: list, processes: int, time_limit_seconds: float
+        ) -> list:
+            sizes.append((processes, allocator.allocation()[-1]["cores"]))
+            return run_jobs(self, jobs, processes, time_limit_seconds)
+
+        monkeypatch.setattr(BatchSolver, "_run_jobs", _record)
+        batch = BatchSolver(solver, num_workers_per_scenario=2, allocator=allocator)
+        result = batch.solve(
+            [Scenario(name="base"), Scenario(name="two", workers_required={"night": 2})],
+            time_limit_seconds=10,
+        )
+
+        assert sizes == [(1, 2)]
+        assert all(r.success for r in result.results.values())
+        assert [lease["name"] for lease in allocator.allocation()] == ["other"]
+
+    def test_rejects_unknown_shift_type(self, solver: ShiftSolver) -> None:
+        """Deltas must refer to existing shift types."""
+        with pytest.raises(ValueError, match="Unknown shift types"):
+            solver.solve_batch([Scenario(name="x", workers_required={"swing": 1})])
+
+    def test_rejects_duplicate_names(self, solver: ShiftSolver) -> None:
+        """Scenario names must be unique."""
+        with pytest.raises(ValueError, match="unique"):
+            solver.solve_batch([Scenario(name="a"), Scenario(name="a")])
+
+    def test_rejects_staffing_deltas_with_elastic_coverage(
+        self, solver: ShiftSolver
+    ) -> None:
+        """Elastic coverage has no staffing equality to patch."""
+        elastic = _kwargs_with(
+            solver,
+            constraint_configs={
+                **solver.constraint_configs,
+                "coverage": ConstraintConfig(enabled=True, is_hard=False),
+            },
+        )
+        with pytest.raises(ValueError, match="need hard coverage"):
+            elastic.solve_batch(
+                [Scenario(name="x", workers_required={"night": 2})], processes=1
+            )
@@ -0,0 +1,162 @@
+"""Tests for the benchmark suite."""
+
+import json
+
+import pytest
+
+from shift_solver.solver.benchmark import (
+    BENCHMARK_FORMAT_VERSION,
+    PHASES,
+    SCENARIO_FAMILIES,
+    BenchmarkRunner,
+    BenchmarkScenario,
+    compare_reports,
+)
+
+
+def _report(**phases: float | None) -> dict:
+    """A one-scenario report with the given phase timings."""
+    return {
+        "format_version": BENCHMARK_FORMAT_VERSION,
+        "results": [{"scenario": {"name": "s"}, "phases": phases}],
+    }
+
+
+class TestBenchmarkScenario:
+    """Tests for scenario generation."""
+
+    def test_generation_is_deterministic(self) -> None:
+        """The same scenario always generates the same requests."""
+        scenario = BenchmarkScenario(name="s", request_density=0.5, seed=3)
+
+        first = scenario.solver_kwargs()
+        second = scenario.solver_kwargs()
+
+        assert first["requests"] == second["requests"]
+        assert len(first["requests"]) > 0
+        assert len(first["workers"]) == 20
+        assert len(first["period_dates"]) == 8
+
+    def test_shift_types_cycle_templates(self) -> None:
+        """More shift types than templates get distinct IDs."""
+        shift_types = BenchmarkScenario(name="s", num_shift_types=6).shift_types()
+
+        ids = [st.id for st in shift_types]
+        assert len(set(ids)) == 6
+        assert ids[4] == "day_2"
+
+    def test_unknown_constraint_mix_raises(self) -> None:
+        """An unknown constraint mix is rejected."""
+        with pytest.raises(ValueError, match="Unknown constraint mix"):
+            BenchmarkScenario(name="s", constraint_mix="bogus").solver_kwargs()
+
+    def test_industry_uses_bulk_generator(self) -> None:
+        """Industry scenarios take shift types from the preset."""
+        kwargs = BenchmarkScenario(
+            name="s", num_workers=30, industry="warehouse"
+        ).solver_kwargs()
+
+        assert [st.id for st in kwargs["shift_types"]] == ["first", "second", "third"]
+        assert len(kwargs["workers"]) == 30
+        assert len(kwargs["period_dates"]) == 8
+        assert kwargs["schedule_id"] == "BENCH-s"
+
+    def test_families_vary_one_dimension(self) -> None:
+        """Each family is a scaling curve with unique scenario names."""
+        names = [s.name for family in SCENARIO_FAMILIES.values() for s in family]
+        workers = [s.num_workers for s in SCENARIO_FAMILIES["workers"]]
+
+        assert len(names) == len(set(names))
+        assert workers == sorted(workers)
+        assert {s.num_periods for s in SCENARIO_FAMILIES["workers"]} == {8}
+
+
+class TestBenchmarkRunner:
+    """Tests for BenchmarkRunner."""
+
+    def test_measures_every_phase(self) -> None:
+        """A solved scenario has a timing for every phase."""
+        persisted = []
+        runner = BenchmarkRunner(
+            time_limit_seconds=10, num_workers=1, persist=persisted.append
+        )
+
+        report = runner.run([BenchmarkScenario(name="small", num_workers=6)])
+
+        assert report["format_version"] == BENCHMARK_FORMAT_VERSION
+        result = report["results"][0]
+        assert result["status"] == "OPTIMAL"
+        assert result["num_variables"] > 0
+        for phase in PHASES:
+            assert result["phases"][phase] is not None
+            assert result["phases"][phase] >= 0
+        assert len(persisted) == 1
+        assert persisted[0].schedule_id == "BENCH-small"
+        json.dumps(report)
+
+    def test_deterministic_runs_repeat(self) -> None:
+        """Seeded deterministic-time runs repeat status, objective and counters."""
+        runner = BenchmarkRunner(
+            time_limit_seconds=10,
+            num_workers=1,
+            deterministic_time_limit=0.5,
+            random_seed=3,
+        )
+        scenario = BenchmarkScenario(name="small", num_workers=6)
+
+        first, second = (runner.run([scenario]) for _ in range(2))
+
+        assert first["settings"]["deterministic_time_limit"] == 0.5
+        assert first["settings"]["random_seed"] == 3
+        results = [report["results"][0] for report in (first, second)]
+        search = [result["search"] for result in results]
+        assert search[0]["branches"] > 0
+        for key in ("deterministic_time", "conflicts", "branches"):
+            assert search[0][key] == search[1][key]
+        assert results[0]["objective"] == results[1]["objective"]
+
+    def test_repeats_must_be_positive(self) -> None:
+        """repeats below 1 is rejected."""
+        with pytest.raises(ValueError, match="repeats"):
+            BenchmarkRunner(repeats=0)
+
+
+class TestCompareReports:
+    """Tests for regression detection."""
+
+    def test_flags_slower_phase(self) -> None:
+        """A phase beyond tolerance and min_seconds is a regression."""
+        regressions = compare_reports(
+            _report(build=1.0, presolve=1.0), _report(build=1.5, presolve=1.1)
+        )
+
+        assert [(r.scenario, r.phase) for r in regressions] == [("s", "build")]
+        assert "1.50x" in regressions[0].describe()
+
+    def test_ignores_small_absolute_slowdown(self) -> None:
+        """Doubling a millisecond phase is noise, not a regression."""
+        assert compare_reports(_report(build=0.001), _report(build=0.002)) == []
+
+    def test_flags_milestone_no_longer_reached(self) -> None:
+        """Missing the target gap the baseline reached is a regression."""
+        regressions = compare_reports(
+            _report(target_gap=2.0), _report(target_gap=None)
+        )
+
+        assert regressions[0].phase == "target_gap"
+        assert "no longer reached" in regressions[0].describe()
+
+    def test_rejects_other_format_version(self) -> None:
+        """Reports of different format versions are not compared."""
+        old = {**_report(build=1.0), "format_version": BENCHMARK_FORMAT_VERSION - 1}
+
+        with pytest.raises(ValueError, match="format versions"):
+            compare_reports(old, _report(build=1.0))
+
+    def test_rejects_report_without_format_version(self) -> None:
+        """A report predating format versions is rejected, not mis-sorted."""
+        old = _report(build=1.0)
+        del old["format_version"]
+
+        with pytest.raises(ValueError, match=r"\['2', 'None'\]"):
+            compare_reports(old, _report(build=1.0))
@@ -0,0 +1,203 @@
+"""Tests for the process-wide core allocator."""
+
+import threading
+from typing import Any
+
+import pytest
+
+from shift_solver.solver import core_allocator
+from shift_solver.solver.benchmark import BenchmarkScenario
+from shift_solver.solver.core_allocator import (
+    AllocatedSolver,
+    CoreAllocator,
+    physical_core_count,
+)
+from shift_solver.solver.progress_callback import SolverProgressCallback
+from shift_solver.solver.shift_solver import ShiftSolver
+
+
+class TestCoreAllocator:
+    """Tests for CoreAllocator shares and resizes."""
+
+    def test_single_run_gets_every_core(self) -> None:
+        """A lone run leases the whole budget."""
+        allocator = CoreAllocator(total_cores=8)
+
+        with allocator.lease("a") as lease:
+            assert lease.cores == 8
+            assert not lease.resized.is_set()
+
+        assert allocator.allocation() == []
+
+    def test_new_run_shrinks_running_ones(self) -> None:
+        """Runs split the budget equally; older runs are flagged to resize."""
+        allocator = CoreAllocator(total_cores=8)
+        first = allocator.acquire("a")
+        second = allocator.acquire("b")
+
+        assert second.cores == 4
+        assert (first.cores, first.target) == (8, 4)
+        assert first.resized.is_set()
+        assert allocator.accept_resize(first) == 4
+        assert first.resizes == 1
+        assert not first.resized.is_set()
+
+    def test_release_grows_remaining_runs(self) -> None:
+        """A finished run's cores go back to the others."""
+        allocator = CoreAllocator(total_cores=8)
+        first = allocator.acquire("a")
+        second = allocator.acquire("b")
+        allocator.accept_resize(first)
+
+        allocator.release(first)
+
+        assert (second.cores, second.target) == (4, 8)
+        assert second.resized.is_set()
+        assert [lease["name"] for lease in allocator.allocation()] == ["b"]
+
+    def test_capped_runs_leave_cores_to_others(self) -> None:
+        """What a capped run cannot use is shared by the rest."""
+        allocator = CoreAllocator(total_cores=8)
+        capped = allocator.acquire("capped", max_cores=2)
+        allocator.acquire("b")
+        third = allocator.acquire("c")
+
+        assert capped.target == 2
+        assert third.target == 3
+        assert sum(lease["target"] for lease in allocator.allocation()) == 8
+
+    def test_oversubscribed_runs_keep_one_core(self) -> None:
+        """With more runs than cores every run still gets one."""
+        allocator = CoreAllocator(total_cores=2)
+        leases = [allocator.acquire(name) for name in "abc"]
+
+        assert [lease.target for lease in leases] == [1, 1, 1]
+
+    def test_invalid_budgets(self) -> None:
+        """Budgets and caps below one core are rejected."""
+        with pytest.raises(ValueError, match="total_cores"):
+            CoreAllocator(total_cores=0)
+        with pytest.raises(ValueError, match="max_cores"):
+            CoreAllocator(total_cores=2).acquire("a", max_cores=0)
+
+    def test_default_budget_is_physical_cores(self) -> None:
+        """The shared allocator divides the physical cores."""
+        assert physical_core_count() >= 1
+        assert CoreAllocator.shared() is CoreAllocator.shared()
+        assert CoreAllocator().total_cores == physical_core_count()
+
+
+class TestAllocatedSolver:
+    """Tests for ShiftSolver.solve_allocated()."""
+
+    @pytest.fixture
+    def solver(self) -> ShiftSolver:
+        """A scenario that is not solved to optimality within a second."""
+        scenario = BenchmarkScenario(
+            name="alloc", num_workers=12, num_periods=6, constraint_mix="full"
+        )
+        return ShiftSolver(**scenario.solver_kwargs())
+
+    def test_solves_with_its_share(self, solver: ShiftSolver) -> None:
+        """Without competing runs the solve runs once with the whole budget."""
+        allocator = CoreAllocator(total_cores=2)
+
+        result = solver.solve_allocated(time_limit_seconds=2, allocator=allocator)
+
+        assert result.success
+        assert result.statistics["cores"] == {"segments": [2], "restarts": 0}
+        assert "cp_sat" in result.statistics
+        assert allocator.allocation() == []
+
+    def test_restarts_when_share_changes(
+        self, solver: ShiftSolver, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A run started mid-search halves the workers after a hinted restart."""
+        monkeypatch.setattr(core_allocator, "MIN_RESTART_SECONDS", 0.0)
+        allocator = CoreAllocator(total_cores=4)
+        competing = []
+
+        class _StartCompetingRun(SolverProgressCallback):
+            def on_solution_callback(self) -> None:
+                super().on_solution_callback()
+                if not competing:
+                    competing.append(allocator.acquire("other"))
+
+        result = solver.solve_allocated(
+            time_limit_seconds=8,
+            allocator=allocator,
+            solution_callback=_StartCompetingRun(),
+        )
+
+        assert result.success
+        assert result.statistics["cores"] == {"segments": [4, 2], "restarts": 1}
+        assert result.solve_time_seconds <= 9
+        assert [lease["name"] for lease in allocator.allocation()] == ["other"]
+
+    def test_no_restart_after_cancel_during_stop(
+        self, solver: ShiftSolver, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A cancel that arrives while a resized segment stops ends the solve."""
+        monkeypatch.setattr(core_allocator, "MIN_RESTART_SECONDS", 0.0)
+        allocator = CoreAllocator(total_cores=4)
+        cancel_event = threading.Event()
+        competing = []
+        watch_resize = AllocatedSolver._watch_resize
+
+        def _cancel_after_watch(self: AllocatedSolver, *args: Any) -> None:
+            watch_resize(self, *args)
+            if competing:
+                cancel_event.set()
+
+        monkeypatch.setattr(AllocatedSolver, "_watch_resize", _cancel_after_watch)
+
+        class _StartCompetingRun(SolverProgressCallback):
+            def on_solution_callback(self) -> None:
+                super().on_solution_callback()
+                if not competing:
+                    competing.append(allocator.acquire("other"))
+
+        result = solver.solve_allocated(
+            time_limit_seconds=4,
+            allocator=allocator,
+            solution_callback=_StartCompetingRun(),
+            cancel_event=cancel_event,
+        )
+
+        assert result.success
+        assert result.statistics["cores"] == {"segments": [4], "restarts": 0}
+        assert [lease["name"] for lease in allocator.allocation()] == ["other"]
+
+    def test_resize_during_model_build_restarts(
+        self, solver: ShiftSolver, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A share change before the search starts still restarts the run."""
+        monkeypatch.setattr(core_allocator, "MIN_RESTART_SECONDS", 0.0)
+        allocator = CoreAllocator(total_cores=4)
+        competing = []
+        builds = []
+        watched = threading.Event()
+        build_model = ShiftSolver._build_model
+        watch_resize = AllocatedSolver._watch_resize
+
+        def _watch_and_signal(self: AllocatedSolver, *args: Any) -> None:
+            watch_resize(self, *args)
+            watched.set()
+
+        def _build_and_start_competing_run(self: ShiftSolver) -> None:
+            build_model(self)
+            builds.append(self._model)
+            if not competing:
+                competing.append(allocator.acquire("other"))
+                # Let the watcher act before the search starts
+                assert watched.wait(5)
+
+        monkeypatch.setattr(AllocatedSolver, "_watch_resize", _watch_and_signal)
+        monkeypatch.setattr(ShiftSolver, "_build_model", _build_and_start_competing_run)
+
+        result = solver.solve_allocated(time_limit_seconds=4, allocator=allocator)
+
+        assert result.success
+        assert result.statistics["cores"] == {"segments": [4, 2], "restarts": 1}
+        # The restart searches the model built for the first segment again
+        assert len(builds) == 1
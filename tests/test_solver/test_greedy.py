@@ -0,0 +1,343 @@
+"""Tests for the greedy constructive heuristic."""
+
+from datetime import date, time, timedelta
+
+import pytest
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.models import Availability, SchedulingRequest, ShiftType, Worker
+from shift_solver.solver.greedy import GreedyScheduler
+from shift_solver.solver.shift_solver import ShiftSolver
+
+BASE = date(2026, 1, 5)  # Monday
+
+
+@pytest.fixture
+def workers() -> list[Worker]:
+    """Create six workers, one of whom cannot work nights."""
+    return [
+        Worker(id="W001", name="Alice", restricted_shifts=frozenset(["night"])),
+        *[Worker(id=f"W{i:03d}", name=f"Worker {i}") for i in range(2, 7)],
+    ]
+
+
+@pytest.fixture
+def shift_types() -> list[ShiftType]:
+    """Create day, night and weekend-only shift types."""
+    return [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=2,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+        ShiftType(
+            id="weekend",
+            name="Weekend Shift",
+            category="day",
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            applicable_days=frozenset([5, 6]),
+        ),
+    ]
+
+
+@pytest.fixture
+def period_dates() -> list[tuple[date, date]]:
+    """Create four weekly periods plus a weekday-only period."""
+    weeks = [
+        (BASE + timedelta(weeks=i), BASE + timedelta(weeks=i, days=6))
+        for i in range(4)
+    ]
+    weekdays = (BASE + timedelta(weeks=4), BASE + timedelta(weeks=4, days=4))
+    return [*weeks, weekdays]
+
+
+def _hard_night_request(worker_id: str) -> SchedulingRequest:
+    """Hard request to work the first period's night shift."""
+    return SchedulingRequest(
+        worker_id=worker_id,
+        start_date=BASE,
+        end_date=BASE,
+        request_type="positive",
+        shift_type_id="night",
+        is_hard=True,
+    )
+
+
+class TestGreedyScheduler:
+    """Tests for GreedyScheduler."""
+
+    def test_fills_every_slot(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Every applicable slot receives exactly workers_required workers."""
+        result = GreedyScheduler(workers, shift_types, period_dates).construct()
+
+        assert result.complete
+        for period in range(len(period_dates)):
+            for st in shift_types:
+                count = sum(1 for _, p, s in result.assigned if (p, s) == (period, st.id))
+                expected = 0 if (st.id == "weekend" and period == 4) else st.workers_required
+                assert count == expected
+
+    def test_respects_restrictions_and_unavailability(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Restricted shifts and unavailable periods are never assigned."""
+        availabilities = [
+            Availability(
+                worker_id="W002",
+                start_date=BASE,
+                end_date=BASE + timedelta(days=13),
+                availability_type="unavailable",
+            )
+        ]
+
+        result = GreedyScheduler(
+            workers, shift_types, period_dates, availabilities=availabilities
+        ).construct()
+
+        assert not any(w == "W001" and s == "night" for w, _, s in result.assigned)
+        assert not any(w == "W002" and p in (0, 1) for w, p, _ in result.assigned)
+
+    def test_hard_requests_are_honored(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Hard positive requests are forced and hard negatives are excluded."""
+        requests = [
+            SchedulingRequest(
+                worker_id="W006",
+                start_date=BASE,
+                end_date=BASE,
+                request_type="positive",
+                shift_type_id="night",
+                is_hard=True,
+            ),
+            SchedulingRequest(
+                worker_id="W003",
+                start_date=BASE,
+                end_date=BASE + timedelta(days=27),
+                request_type="negative",
+                shift_type_id="day",
+                is_hard=True,
+            ),
+        ]
+
+        result = GreedyScheduler(
+            workers, shift_types, period_dates, requests=requests
+        ).construct()
+
+        assert ("W006", 0, "night") in result.assigned
+        assert not any(
+            w == "W003" and s == "day" and p < 4 for w, p, s in result.assigned
+        )
+
+    def test_reports_hard_requests_beyond_requirement(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """More forced workers than a slot requires leaves the extra unmet."""
+        requests = [
+            _hard_night_request(worker_id) for worker_id in ("W005", "W006")
+        ]
+
+        result = GreedyScheduler(
+            workers, shift_types, period_dates, requests=requests
+        ).construct()
+
+        assert ("W005", 0, "night") in result.assigned
+        assert result.unmet_requests == [("W006", 0, "night")]
+        assert not result.complete
+
+    def test_reports_hard_requests_for_forbidden_slots(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """A forced worker who is restricted from the shift is reported."""
+        result = GreedyScheduler(
+            workers,
+            shift_types,
+            period_dates,
+            requests=[_hard_night_request("W001")],
+        ).construct()
+
+        assert ("W001", 0, "night") not in result.assigned
+        assert result.unmet_requests == [("W001", 0, "night")]
+        assert not result.complete
+
+    def test_balances_undesirable_shifts(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Undesirable shifts are spread across eligible workers."""
+        result = GreedyScheduler(workers, shift_types, period_dates).construct()
+
+        nights: dict[str, int] = {}
+        for w, _, s in result.assigned:
+            if s == "night":
+                nights[w] = nights.get(w, 0) + 1
+        assert max(nights.values()) == 1
+
+    def test_reports_unfilled_slots(
+        self, shift_types: list[ShiftType], period_dates: list[tuple[date, date]]
+    ) -> None:
+        """Slots without enough eligible workers are reported."""
+        workers = [Worker(id="W001", name="Alice")]
+
+        result = GreedyScheduler(workers, shift_types, period_dates).construct()
+
+        assert not result.complete
+        assert (0, "day", 1) in result.unfilled
+
+
+class TestGreedyIntegration:
+    """Tests for greedy hinting and fallback in ShiftSolver."""
+
+    def test_fallback_when_cp_sat_finds_nothing(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """An UNKNOWN solve returns the greedy schedule when asked to."""
+        solver = ShiftSolver(
+            workers=workers,
+            shift_types=shift_types,
+            period_dates=period_dates,
+            schedule_id="GREEDY-001",
+        )
+
+        result = solver.solve(
+            time_limit_seconds=10,
+            parameters={"stop_after_presolve": True},
+            greedy_fallback=True,
+        )
+
+        assert result.success
+        assert result.status_name == "GREEDY_FALLBACK"
+        assert result.schedule is not None
+        assert len(result.schedule.periods) == len(period_dates)
+
+    def test_no_fallback_by_default(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Without greedy_fallback an UNKNOWN solve still fails."""
+        solver = ShiftSolver(
+            workers=workers,
+            shift_types=shift_types,
+            period_dates=period_dates,
+            schedule_id="GREEDY-004",
+        )
+
+        result = solver.solve(
+            time_limit_seconds=10, parameters={"stop_after_presolve": True}
+        )
+
+        assert not result.success
+        assert result.status_name == "UNKNOWN"
+        assert result.schedule is None
+
+    def test_no_fallback_with_other_hard_constraints(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """The greedy schedule is not returned if it may break hard rules."""
+        solver = ShiftSolver(
+            workers=workers,
+            shift_types=shift_types,
+            period_dates=period_dates,
+            schedule_id="GREEDY-002",
+            constraint_configs={
+                "fairness": ConstraintConfig(enabled=True, is_hard=True),
+            },
+        )
+
+        result = solver.solve(
+            time_limit_seconds=10,
+            parameters={"stop_after_presolve": True},
+            greedy_fallback=True,
+        )
+
+        assert result.status_name != "GREEDY_FALLBACK"
+
+    def test_no_fallback_with_unmet_hard_requests(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """A greedy schedule that breaks hard requests is not returned."""
+        solver = ShiftSolver(
+            workers=workers,
+            shift_types=shift_types,
+            period_dates=period_dates,
+            schedule_id="GREEDY-005",
+            requests=[_hard_night_request("W005"), _hard_night_request("W006")],
+        )
+
+        # Without presolve the conflict is not proven before the search stops
+        result = solver.solve(
+            time_limit_seconds=10,
+            parameters={"stop_after_presolve": True, "cp_model_presolve": False},
+            greedy_fallback=True,
+        )
+
+        assert not result.success
+        assert result.status_name != "GREEDY_FALLBACK"
+
+    def test_hinted_solve_still_optimal(
+        self,
+        workers: list[Worker],
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Hinting does not change the optimum."""
+        def make() -> ShiftSolver:
+            return ShiftSolver(
+                workers=workers,
+                shift_types=shift_types,
+                period_dates=period_dates,
+                schedule_id="GREEDY-003",
+            )
+
+        hinted = make().solve(time_limit_seconds=30)
+        plain = make().solve(time_limit_seconds=30, use_greedy=False)
+
+        assert hinted.status_name == plain.status_name == "OPTIMAL"
+        assert hinted.objective_value == plain.objective_value
@@ -0,0 +1,213 @@
+"""Tests for infeasibility core extraction."""
+
+import time as time_module
+from datetime import date, time
+from typing import Any
+
+import pytest
+from ortools.sat.python import cp_model
+
+from shift_solver.constraints.base import AssumptionGroup
+from shift_solver.models import Availability, SchedulingRequest, ShiftType, Worker
+from shift_solver.solver.infeasibility import InfeasibilityExplainer
+from shift_solver.solver.shift_solver import (
+    EXPLAIN_INFEASIBILITY_SECONDS,
+    ShiftSolver,
+)
+
+PERIOD = (date(2026, 1, 5), date(2026, 1, 11))
+
+
+def _day_shift(workers_required: int) -> ShiftType:
+    """Create a day shift requiring the given number of workers."""
+    return ShiftType(
+        id="day",
+        name="Day Shift",
+        category="day",
+        start_time=time(7, 0),
+        end_time=time(15, 0),
+        duration_hours=8.0,
+        workers_required=workers_required,
+    )
+
+
+def _hard_request(worker_id: str) -> SchedulingRequest:
+    """Create a hard request to work the day shift in the period."""
+    return SchedulingRequest(
+        worker_id=worker_id,
+        start_date=PERIOD[0],
+        end_date=PERIOD[1],
+        request_type="positive",
+        shift_type_id="day",
+        is_hard=True,
+    )
+
+
+class TestInfeasibilityExplainer:
+    """Tests for InfeasibilityExplainer."""
+
+    def test_core_names_restriction_availability_and_coverage(self) -> None:
+        """The conflicting restriction, availability and coverage are reported."""
+        solver = ShiftSolver(
+            workers=[
+                Worker(id="W1", name="W1", restricted_shifts=frozenset({"day"})),
+                Worker(id="W2", name="W2"),
+                Worker(id="W3", name="W3"),
+            ],
+            shift_types=[_day_shift(2)],
+            period_dates=[PERIOD],
+            schedule_id="INFEASIBLE-001",
+            availabilities=[
+                Availability(
+                    worker_id="W2",
+                    start_date=PERIOD[0],
+                    end_date=PERIOD[1],
+                    availability_type="unavailable",
+                )
+            ],
+        )
+
+        issues = InfeasibilityExplainer(solver).explain(time_limit_seconds=10)
+
+        assert {issue["group"] for issue in issues} == {
+            "coverage:day:p0",
+            "restriction:W1:day",
+            "availability:0",
+        }
+        assert all(issue["severity"] == "error" for issue in issues)
+        coverage = next(i for i in issues if i["type"] == "coverage")
+        assert coverage["period_index"] == 0
+        assert coverage["workers_required"] == 2
+
+    def test_solve_reports_conflicting_hard_requests(self) -> None:
+        """An INFEASIBLE solve carries the core in feasibility_issues."""
+        solver = ShiftSolver(
+            workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 4)],
+            shift_types=[_day_shift(1)],
+            period_dates=[PERIOD],
+            schedule_id="INFEASIBLE-002",
+            requests=[_hard_request("W1"), _hard_request("W2")],
+        )
+
+        result = solver.solve(time_limit_seconds=10)
+
+        assert result.status == cp_model.INFEASIBLE
+        assert result.feasibility_issues is not None
+        assert {issue["group"] for issue in result.feasibility_issues} == {
+            "coverage:day:p0",
+            "request:0",
+            "request:1",
+        }
+
+    def test_shrink_reduces_a_sufficient_set_to_minimal(self) -> None:
+        """Deletion drops groups the conflict does not need."""
+        solver = ShiftSolver(
+            workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 5)],
+            shift_types=[_day_shift(1)],
+            period_dates=[PERIOD],
+            schedule_id="INFEASIBLE-005",
+            availabilities=[
+                Availability(
+                    worker_id="W4",
+                    start_date=PERIOD[0],
+                    end_date=PERIOD[1],
+                    availability_type="unavailable",
+                )
+            ],
+            requests=[_hard_request(f"W{i}") for i in range(1, 4)],
+        )
+        solver._build_model(track_assumptions=True)
+        assert solver._model is not None
+        solver._model.clear_objective()
+        every_group = list(solver._assumption_groups.values())
+
+        core = InfeasibilityExplainer._shrink(
+            solver, every_group, deadline=time_module.time() + 10
+        )
+
+        keys = {group.key for group in core}
+        assert len(every_group) == 5
+        assert len(keys) == 3
+        assert "coverage:day:p0" in keys
+        assert all(key.startswith(("coverage", "request")) for key in keys)
+
+    def test_shrinking_stops_at_the_deadline(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without time left the untested groups are kept."""
+        solver = ShiftSolver(
+            workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 5)],
+            shift_types=[_day_shift(1)],
+            period_dates=[PERIOD],
+            schedule_id="INFEASIBLE-006",
+            requests=[_hard_request(f"W{i}") for i in range(1, 4)],
+        )
+        shrink = InfeasibilityExplainer._shrink
+        cores: list[list[str]] = []
+
+        def _shrink_without_time(
+            ss: ShiftSolver, core: list[AssumptionGroup], _deadline: float
+        ) -> list[AssumptionGroup]:
+            cores.append([group.key for group in core])
+            return shrink(ss, core, deadline=0.0)
+
+        monkeypatch.setattr(
+            InfeasibilityExplainer, "_shrink", staticmethod(_shrink_without_time)
+        )
+
+        issues = InfeasibilityExplainer(solver).explain(time_limit_seconds=10)
+
+        assert [issue["group"] for issue in issues] == cores[0]
+
+    def test_solve_can_skip_explanation(self) -> None:
+        """explain_infeasibility=False leaves feasibility_issues unset."""
+        solver = ShiftSolver(
+            workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 4)],
+            shift_types=[_day_shift(1)],
+            period_dates=[PERIOD],
+            schedule_id="INFEASIBLE-003",
+            requests=[_hard_request("W1"), _hard_request("W2")],
+        )
+
+        result = solver.solve(time_limit_seconds=10, explain_infeasibility=False)
+
+        assert result.status == cp_model.INFEASIBLE
+        assert result.feasibility_issues is None
+
+    def test_explanation_shares_the_time_limit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The assumption solve gets the remaining budget, capped."""
+        solver = ShiftSolver(
+            workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 4)],
+            shift_types=[_day_shift(1)],
+            period_dates=[PERIOD],
+            schedule_id="INFEASIBLE-004",
+            requests=[_hard_request("W1"), _hard_request("W2")],
+        )
+        limits: list[float] = []
+
+        def explain(time_limit_seconds: float) -> list[dict[str, Any]]:
+            limits.append(time_limit_seconds)
+            return []
+
+        monkeypatch.setattr(solver, "explain_infeasibility", explain)
+
+        solver.solve(time_limit_seconds=300)
+        solver.solve(time_limit_seconds=2)
+
+        assert limits[0] == EXPLAIN_INFEASIBILITY_SECONDS
+        assert 0 < limits[1] <= 2
+
+    def test_feasible_model_has_no_core(self) -> None:
+        """A feasible model yields no issues and no guard literals by default."""
+        solver = ShiftSolver(
+            workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 4)],
+            shift_types=[_day_shift(1)],
+            period_dates=[PERIOD],
+            schedule_id="FEASIBLE-001",
+        )
+
+        assert InfeasibilityExplainer(solver).explain(time_limit_seconds=10) == []
+        assert solver.solve(time_limit_seconds=10).success
+        assert solver._assumption_groups == {}
@@ -0,0 +1,154 @@
+"""Tests for the large neighborhood search driver."""
+
+from datetime import date, time, timedelta
+
+import pytest
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.models import ShiftType, Worker
+from shift_solver.solver.benchmark import BenchmarkScenario
+from shift_solver.solver.lns import (
+    NEIGHBORHOOD_KINDS,
+    LNSSolver,
+    _fixed_assignments,
+)
+from shift_solver.solver.shift_solver import ShiftSolver
+
+
+@pytest.fixture
+def solver() -> ShiftSolver:
+    """Create a small solver with a soft fairness objective."""
+    workers = [Worker(id=f"W{i:03d}", name=f"Worker {i}") for i in range(1, 7)]
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=2,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    base = date(2026, 1, 5)
+    period_dates = [
+        (base + timedelta(weeks=i), base + timedelta(weeks=i, days=6))
+        for i in range(6)
+    ]
+    return ShiftSolver(
+        workers=workers,
+        shift_types=shift_types,
+        period_dates=period_dates,
+        schedule_id="LNS-001",
+        constraint_configs={
+            "fairness": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+        },
+    )
+
+
+class TestLNSSolver:
+    """Tests for LNSSolver."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_size": 0.0},
+            {"initial_size": 0.9, "max_size": 0.8},
+            {"iteration_time_limit": 0},
+            {"initial_time_fraction": 1.0},
+        ],
+    )
+    def test_rejects_invalid_parameters(
+        self, solver: ShiftSolver, kwargs: dict[str, float]
+    ) -> None:
+        """Out-of-range sizes and time settings are rejected."""
+        with pytest.raises(ValueError):
+            LNSSolver(solver, **kwargs)
+
+    def test_solve_lns_beats_plain_solve(self) -> None:
+        """On an instance that does not close, LNS improves on a plain solve."""
+        scenario = BenchmarkScenario(
+            name="lns", num_workers=12, num_periods=6, constraint_mix="full"
+        )
+        plain = ShiftSolver(**scenario.solver_kwargs()).solve(
+            time_limit_seconds=4, num_workers=1
+        )
+
+        result = ShiftSolver(**scenario.solver_kwargs()).solve_lns(
+            time_limit_seconds=4, num_workers=1, seed=3, iteration_time_limit=0.5
+        )
+
+        assert plain.status_name == "FEASIBLE"
+        assert result.success
+        assert result.schedule is not None
+        assert result.objective_value <= plain.objective_value
+        lns = result.statistics["lns"]
+        assert set(lns["neighborhoods"]) == set(NEIGHBORHOOD_KINDS)
+        assert lns["initial_objective"] > result.objective_value
+
+    def test_worker_neighborhood_frees_whole_workers(
+        self, solver: ShiftSolver
+    ) -> None:
+        """A worker neighborhood frees every period and shift of its workers."""
+        lns = LNSSolver(solver, seed=1)
+
+        free = lns._neighborhood("workers", 0.5)
+
+        workers = {w for w, _, _ in free}
+        assert len(workers) == 3
+        assert len(free) == 3 * solver.num_periods * len(solver.shift_types)
+
+    def test_period_neighborhood_is_consecutive_block(
+        self, solver: ShiftSolver
+    ) -> None:
+        """A period neighborhood frees a consecutive block for all workers."""
+        lns = LNSSolver(solver, seed=1)
+
+        free = lns._neighborhood("periods", 0.5)
+
+        periods = sorted({p for _, p, _ in free})
+        assert len(periods) == 3
+        assert periods == list(range(periods[0], periods[0] + 3))
+        assert {w for w, _, _ in free} == {w.id for w in solver.workers}
+
+    def test_category_neighborhood_frees_one_category(
+        self, solver: ShiftSolver
+    ) -> None:
+        """A category neighborhood frees only shifts of a single category."""
+        lns = LNSSolver(solver, seed=1)
+
+        free = lns._neighborhood("category", 0.5)
+
+        assert len({s for _, _, s in free}) == 1
+
+    def test_fixed_assignments_restores_domains(self, solver: ShiftSolver) -> None:
+        """Frozen domains are restored to {0, 1} after the sub-solve."""
+        solver._build_model()
+        assert solver._model is not None and solver._variables is not None
+        assignment_vars = list(solver._variables.all_assignment_vars())
+        values = {(w, p, s): 1 for w, p, s, _ in assignment_vars}
+        frozen = dict(list(values.items())[:5])
+        proto_vars = solver._model.proto.variables
+
+        with _fixed_assignments(solver._model, assignment_vars, values, frozen):
+            fixed = [
+                list(proto_vars[var.index].domain)
+                for w, p, s, var in assignment_vars
+                if (w, p, s) in frozen
+            ]
+            assert fixed == [[1, 1]] * 5
+
+        assert all(
+            list(proto_vars[var.index].domain) == [0, 1]
+            for _, _, _, var in assignment_vars
+        )
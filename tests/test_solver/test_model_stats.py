@@ -0,0 +1,164 @@
+"""Tests for model statistics and presolve-only analysis."""
+
+from datetime import date, time, timedelta
+
+import pytest
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.models import SchedulingRequest, ShiftType, Worker
+from shift_solver.solver.model_stats import (
+    SHARED_VARIABLES,
+    _domain_size,
+    estimate_model_bytes,
+)
+from shift_solver.solver.shift_solver import ShiftSolver
+
+BASE = date(2026, 1, 5)
+
+
+def _solver(workers_required: int = 2) -> ShiftSolver:
+    """Six workers over four weeks with fairness and requests enabled."""
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=workers_required,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    period_dates = [
+        (BASE + timedelta(weeks=i), BASE + timedelta(weeks=i, days=6))
+        for i in range(4)
+    ]
+    return ShiftSolver(
+        workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 7)],
+        shift_types=shift_types,
+        period_dates=period_dates,
+        schedule_id="STATS-001",
+        requests=[
+            SchedulingRequest(
+                worker_id="W2",
+                start_date=BASE,
+                end_date=BASE + timedelta(weeks=4),
+                request_type="negative",
+                shift_type_id="night",
+                priority=2,
+            )
+        ],
+        constraint_configs={
+            "fairness": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+            "sequence": ConstraintConfig(enabled=True, is_hard=False, weight=10),
+        },
+    )
+
+
+class TestModelAnalyzer:
+    """Tests for ShiftSolver.analyze()."""
+
+    def test_rows_add_up_to_built_model(self) -> None:
+        """Per-constraint rows cover exactly the model solve() would build."""
+        ss = _solver()
+        stats = ss.analyze(num_workers=1)
+
+        ss._build_model()
+        assert ss._model is not None
+        proto = ss._model.proto
+        assert stats.variables == len(proto.variables)
+        assert stats.constraints == len(proto.constraints)
+        assert stats.boolean_variables + stats.integer_variables == stats.variables
+
+    def test_rows_follow_enabled_constraints(self) -> None:
+        """The shared variables come first, then constraints in build order."""
+        ss = _solver()
+        stats = ss.analyze(num_workers=1)
+
+        assert [row.constraint_id for row in stats.rows] == [SHARED_VARIABLES] + [
+            constraint_id for constraint_id, _, _, _ in ss._enabled_constraints()
+        ]
+        shared = stats.rows[0]
+        # One Boolean per worker, period and shift type
+        assert shared.boolean_variables == 6 * 4 * 2
+        coverage = next(row for row in stats.rows if row.constraint_id == "coverage")
+        assert coverage.variables == 0
+        assert coverage.constraints == 4 * 2
+        assert coverage.kinds == {"linear": 8}
+
+    def test_objective_terms_per_constraint(self) -> None:
+        """Objective terms are attributed to the constraint that owns them."""
+        ss = _solver()
+        stats = ss.analyze(num_workers=1)
+
+        by_id = {row.constraint_id: row.objective_terms for row in stats.rows}
+        assert by_id["coverage"] == 0
+        assert by_id["fairness"] > 0
+        assert by_id["request"] > 0
+        assert stats.objective_terms == sum(by_id.values())
+
+    def test_presolve_only(self) -> None:
+        """Presolve shrinks the model and no search runs."""
+        stats = _solver().analyze(num_workers=1)
+
+        presolve = stats.presolve
+        assert presolve.status == "UNKNOWN"
+        assert presolve.variables is not None
+        assert presolve.variables <= stats.variables
+        assert presolve.constraints is not None
+        assert presolve.terms is not None
+        assert presolve.rules
+        reduction = stats.reduction("variables")
+        assert reduction is not None and 0 <= reduction <= 1
+
+    def test_presolve_infeasible(self) -> None:
+        """A model presolve refutes reports no presolved size."""
+        stats = _solver(workers_required=8).analyze(num_workers=1)
+
+        assert stats.presolve.status == "INFEASIBLE"
+        assert stats.presolve.variables is None
+        assert stats.reduction("variables") is None
+        assert stats.presolved_model_bytes == 0
+
+    def test_memory_estimate_scales_with_search_workers(self) -> None:
+        """Each search worker adds a copy of the presolved model."""
+        one = _solver().analyze(num_workers=1)
+        four = _solver().analyze(num_workers=4)
+
+        assert one.model_bytes == estimate_model_bytes(
+            one.variables, one.constraints, one.terms
+        )
+        assert four.search_workers == 4
+        assert four.estimated_memory_bytes - one.estimated_memory_bytes == (
+            3 * one.presolved_model_bytes
+        )
+        assert four.to_dict()["memory"]["estimated_bytes"] == (
+            four.estimated_memory_bytes
+        )
+
+    def test_leaves_solver_model_untouched(self) -> None:
+        """Analysis builds its own model rather than the solver's."""
+        ss = _solver()
+        ss.analyze(num_workers=1)
+
+        assert ss._model is None
+        assert ss._variables is None
+
+
+@pytest.mark.parametrize(
+    ("domain", "size"),
+    [([0, 1], 2), ([0, 8], 9), ([0, 2, 5, 6], 5), ([-3, -3], 1)],
+)
+def test_domain_size(domain: list[int], size: int) -> None:
+    """Domain sizes count every value of every interval."""
+    assert _domain_size(domain) == size
@@ -0,0 +1,192 @@
+"""Tests for parallel constraint model building."""
+
+from datetime import date, time, timedelta
+
+import pytest
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.constraints.coverage import CoverageConstraint
+from shift_solver.models import (
+    Availability,
+    SchedulingRequest,
+    ShiftFrequencyRequirement,
+    ShiftOrderPreference,
+    ShiftType,
+    Worker,
+)
+from shift_solver.solver.parallel_build import _shift_fragment
+from shift_solver.solver.shift_solver import ShiftSolver
+
+BASE = date(2026, 1, 5)
+
+
+def _solver(build_processes: int | None, elastic: bool = False) -> ShiftSolver:
+    """Six workers over six weeks with every constraint family enabled."""
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=2,
+            max_workers=3,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    period_dates = [
+        (BASE + timedelta(weeks=i), BASE + timedelta(weeks=i, days=6))
+        for i in range(6)
+    ]
+    return ShiftSolver(
+        workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 7)],
+        shift_types=shift_types,
+        period_dates=period_dates,
+        schedule_id="PARALLEL-001",
+        availabilities=[
+            Availability(
+                worker_id="W1",
+                start_date=BASE,
+                end_date=BASE + timedelta(days=6),
+                availability_type="unavailable",
+            )
+        ],
+        requests=[
+            SchedulingRequest(
+                worker_id="W2",
+                start_date=BASE,
+                end_date=BASE + timedelta(weeks=6),
+                request_type="negative",
+                shift_type_id="night",
+                priority=2,
+            )
+        ],
+        constraint_configs={
+            "coverage": ConstraintConfig(enabled=True, is_hard=not elastic),
+            "fairness": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+            "frequency": ConstraintConfig(
+                enabled=True,
+                is_hard=False,
+                weight=10,
+                parameters={"max_periods_between": 3},
+            ),
+            "sequence": ConstraintConfig(enabled=True, is_hard=False, weight=10),
+            "max_absence": ConstraintConfig(
+                enabled=True,
+                is_hard=False,
+                weight=10,
+                parameters={"max_periods_absent": 3},
+            ),
+            "shift_frequency": ConstraintConfig(
+                enabled=True, is_hard=False, weight=50
+            ),
+            "shift_order_preference": ConstraintConfig(
+                enabled=True, is_hard=False, weight=20
+            ),
+        },
+        shift_frequency_requirements=[
+            ShiftFrequencyRequirement(
+                worker_id="W3", shift_types=frozenset({"night"}), max_periods_between=2
+            )
+        ],
+        shift_order_preferences=[
+            ShiftOrderPreference(
+                rule_id="day_after_night",
+                trigger_type="shift_type",
+                trigger_value="night",
+                direction="after",
+                preferred_type="shift_type",
+                preferred_value="day",
+            )
+        ],
+        build_processes=build_processes,
+    )
+
+
+class TestParallelModelBuilder:
+    """Tests for ShiftSolver(build_processes=...)."""
+
+    @pytest.mark.parametrize(
+        ("elastic", "track_assumptions", "worker_activation"),
+        [(False, True, False), (True, False, True)],
+    )
+    def test_merged_model_equals_sequential(
+        self, elastic: bool, track_assumptions: bool, worker_activation: bool
+    ) -> None:
+        """Fragments merge into exactly the sequentially built model."""
+        sequential = _solver(build_processes=None, elastic=elastic)
+        parallel = _solver(build_processes=3, elastic=elastic)
+        for solver in (sequential, parallel):
+            solver._build_model(
+                track_assumptions=track_assumptions,
+                worker_activation=worker_activation,
+            )
+        assert sequential._model is not None and parallel._model is not None
+        assert sequential._objective_builder is not None
+        assert parallel._objective_builder is not None
+
+        assert str(parallel._model.proto) == str(sequential._model.proto)
+        assert list(parallel._constraints) == list(sequential._constraints)
+        assert set(parallel._assumption_groups) == set(
+            sequential._assumption_groups
+        )
+        assert [
+            (term.constraint_id, term.variable.index, term.effective_weight)
+            for term in parallel._objective_builder.objective_terms
+        ] == [
+            (term.constraint_id, term.variable.index, term.effective_weight)
+            for term in sequential._objective_builder.objective_terms
+        ]
+        coverage = parallel._constraints["coverage"]
+        assert isinstance(coverage, CoverageConstraint)
+        assert coverage.is_elastic == elastic
+        assert len(coverage.staffing_constraints) == (0 if elastic else 12)
+
+    def test_solves_to_sequential_optimum(self) -> None:
+        """A model built in parallel solves to the same optimum."""
+        expected = _solver(build_processes=None).solve(time_limit_seconds=20)
+        result = _solver(build_processes=2).solve(time_limit_seconds=20)
+
+        assert result.success
+        assert result.status_name == expected.status_name == "OPTIMAL"
+        assert result.objective_value == expected.objective_value
+
+
+class TestShiftFragment:
+    """Tests for fragment reference shifting."""
+
+    def test_shifts_only_fragment_local_references(self) -> None:
+        """Shared variables stay; own variables and their negations move."""
+        text = (
+            "constraints {\n"
+            "  enforcement_literal: -12\n"
+            "  linear {\n"
+            "    vars: 3\n"
+            "    vars: 10\n"
+            "  }\n"
+            "}\n"
+            "constraints {\n"
+            "  bool_or {\n"
+            "    literals: -4\n"
+            "    literals: 11\n"
+            "  }\n"
+            "}\n"
+        )
+
+        shifted = _shift_fragment(text, first_var=10, offset=5)
+
+        assert "enforcement_literal: -17\n" in shifted
+        assert "vars: 3\n" in shifted
+        assert "vars: 15\n" in shifted
+        assert "literals: -4\n" in shifted
+        assert "literals: 16\n" in shifted
@@ -0,0 +1,148 @@
+"""Tests for portfolio solving."""
+
+from datetime import date, time, timedelta
+from pathlib import Path
+
+import pytest
+
+from shift_solver.models import ShiftType, Worker
+from shift_solver.solver.portfolio import (
+    DEFAULT_PORTFOLIO,
+    PortfolioConfig,
+    PortfolioSolver,
+    PortfolioStats,
+)
+from shift_solver.solver.shift_solver import ShiftSolver
+
+
+@pytest.fixture
+def solver() -> ShiftSolver:
+    """Create a small solver instance."""
+    workers = [Worker(id=f"W{i:03d}", name=f"Worker {i}") for i in range(1, 5)]
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=1,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    base = date(2026, 1, 5)
+    period_dates = [
+        (base + timedelta(weeks=i), base + timedelta(weeks=i, days=6))
+        for i in range(3)
+    ]
+    return ShiftSolver(
+        workers=workers,
+        shift_types=shift_types,
+        period_dates=period_dates,
+        schedule_id="PORTFOLIO-001",
+    )
+
+
+class TestPortfolioStats:
+    """Tests for PortfolioStats."""
+
+    def test_record_counts_runs_and_wins(self) -> None:
+        """Every configuration gets a run; only the winner gets a win."""
+        stats = PortfolioStats()
+        stats.record("core", ["default", "core"])
+        stats.record(None, ["default", "core"])
+
+        assert stats.runs == {"default": 2, "core": 2}
+        assert stats.wins == {"core": 1}
+        assert stats.win_rate("core") == 0.5
+        assert stats.win_rate("default") == 0.0
+        assert stats.win_rate("unknown") == 0.0
+
+    def test_save_and_load_roundtrip(self, tmp_path: Path) -> None:
+        """Statistics survive a save/load cycle."""
+        path = tmp_path / "stats" / "portfolio.json"
+        stats = PortfolioStats()
+        stats.record("default", ["default", "core"])
+        stats.save(path)
+
+        loaded = PortfolioStats.load(path)
+
+        assert loaded == stats
+
+    def test_load_missing_file_is_empty(self, tmp_path: Path) -> None:
+        """Loading a missing file starts with empty statistics."""
+        assert PortfolioStats.load(tmp_path / "missing.json") == PortfolioStats()
+
+
+class TestPortfolioSolver:
+    """Tests for PortfolioSolver."""
+
+    def test_rejects_empty_portfolio(self, solver: ShiftSolver) -> None:
+        """An empty configuration list is rejected."""
+        with pytest.raises(ValueError, match="at least one"):
+            PortfolioSolver(solver_kwargs=solver._solver_kwargs(), configs=[])
+
+    def test_rejects_duplicate_names(self, solver: ShiftSolver) -> None:
+        """Configuration names must be unique."""
+        configs = [PortfolioConfig(name="a"), PortfolioConfig(name="a")]
+        with pytest.raises(ValueError, match="duplicate"):
+            PortfolioSolver(solver_kwargs=solver._solver_kwargs(), configs=configs)
+
+    def test_default_portfolio_names_are_unique(self) -> None:
+        """The built-in portfolio has distinct configuration names."""
+        names = [c.name for c in DEFAULT_PORTFOLIO]
+        assert len(names) == len(set(names))
+
+    def test_solve_portfolio_returns_best_result(self, solver: ShiftSolver) -> None:
+        """The portfolio returns the best solution and records the winner."""
+        configs = [
+            PortfolioConfig(name="default"),
+            PortfolioConfig(name="core", parameters={"optimize_with_core": True}),
+        ]
+        stats = PortfolioStats()
+
+        result = solver.solve_portfolio(
+            time_limit_seconds=30,
+            configs=configs,
+            num_workers_per_config=1,
+            stats=stats,
+        )
+        reference = solver.solve(time_limit_seconds=30)
+
+        assert result.success
+        assert result.schedule is not None
+        assert result.objective_value == reference.objective_value
+        portfolio = result.statistics["portfolio"]
+        assert portfolio["winner"] in {"default", "core"}
+        assert [run["name"] for run in portfolio["runs"]] == ["default", "core"]
+        assert sum(stats.wins.values()) == 1
+        assert stats.runs == {"default": 1, "core": 1}
+
+
+class TestSolverParameters:
+    """Tests for extra CP-SAT parameters on ShiftSolver.solve."""
+
+    def test_extra_parameters_are_applied(self, solver: ShiftSolver) -> None:
+        """Named CP-SAT parameters are set on the solver."""
+        result = solver.solve(
+            time_limit_seconds=30, parameters={"random_seed": 11, "num_workers": 1}
+        )
+
+        assert result.success
+        assert solver._solver is not None
+        assert solver._solver.parameters.random_seed == 11
+
+    def test_unknown_parameter_raises(self, solver: ShiftSolver) -> None:
+        """Unknown CP-SAT parameter names raise ValueError."""
+        with pytest.raises(ValueError, match="not_a_parameter"):
+            solver.solve(time_limit_seconds=5, parameters={"not_a_parameter": 1})
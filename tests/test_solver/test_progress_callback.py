@@ -108,3 +108,18 @@ class TestSolverProgressCallback:
         cb.on_solution_callback()
         assert cb._stopped
         assert len(received) == 0  # Progress not called after cancel
+
+    def test_publish_called_on_every_solution(self):
+        """publish is unthrottled while on_progress stays throttled."""
+        published = []
+        checkpoints = []
+        cb = FakeCallback(
+            on_progress=lambda data: checkpoints.append(data),
+            throttle_seconds=10.0,
+            publish=lambda data: published.append(data),
+        )
+        cb.on_solution_callback()
+        cb.on_solution_callback()
+        cb.on_solution_callback()
+        assert [d["solutions_found"] for d in published] == [1, 2, 3]
+        assert len(checkpoints) == 1
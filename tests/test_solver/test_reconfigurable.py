@@ -0,0 +1,145 @@
+"""Tests for the reconfigurable model."""
+
+from datetime import date, time, timedelta
+from typing import Any
+
+import pytest
+
+from shift_solver.constraints.base import BaseConstraint, ConstraintConfig
+from shift_solver.models import ShiftType, Worker
+from shift_solver.solver.constraint_registry import ConstraintRegistry
+from shift_solver.solver.shift_solver import ShiftSolver
+
+
+def _solver(reconfigurable: bool) -> ShiftSolver:
+    """Five workers sharing one undesirable night shift over three weeks."""
+    shift_types = [
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    base = date(2026, 1, 5)
+    return ShiftSolver(
+        workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 6)],
+        shift_types=shift_types,
+        period_dates=[
+            (base + timedelta(weeks=i), base + timedelta(weeks=i, days=6))
+            for i in range(3)
+        ],
+        schedule_id="RECONFIG-001",
+        constraint_configs={
+            "fairness": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+        },
+        reconfigurable=reconfigurable,
+    )
+
+
+class TestReconfigurableModel:
+    """Tests for ShiftSolver(reconfigurable=True)."""
+
+    def test_toggles_match_rebuilt_model(self) -> None:
+        """Toggled and reweighted solves match solves of freshly built models."""
+        cached = _solver(reconfigurable=True)
+        rebuilt = _solver(reconfigurable=False)
+
+        for enabled, weight in [(True, 100), (False, 100), (True, 300)]:
+            for solver in (cached, rebuilt):
+                solver.configure_constraint("fairness", enabled=enabled, weight=weight)
+            expected = rebuilt.solve(time_limit_seconds=10).objective_value
+            result = cached.solve(time_limit_seconds=10)
+
+            assert result.success
+            assert result.objective_value == expected
+
+        assert expected == 300
+        assert cached._reconfigurable_model is not None
+        assert cached._reconfigurable_model.rebuilds == 1
+
+    def test_disabled_hard_constraint_is_not_enforced(self) -> None:
+        """Disabling coverage lifts the staffing requirement."""
+        solver = _solver(reconfigurable=True)
+        solver.configure_constraint("coverage", enabled=False)
+
+        result = solver.solve(time_limit_seconds=10)
+
+        assert result.success
+        assert result.objective_value == 0
+
+    def test_structural_change_rebuilds(self) -> None:
+        """Changing is_hard cannot be edited in place and rebuilds the model."""
+        solver = _solver(reconfigurable=True)
+        solver.solve(time_limit_seconds=10)
+        solver.constraint_configs = {
+            "fairness": ConstraintConfig(enabled=True, is_hard=True),
+        }
+
+        assert solver.solve(time_limit_seconds=10).success
+        assert solver._reconfigurable_model is not None
+        assert solver._reconfigurable_model.rebuilds == 2
+
+    def test_disabled_constraints_are_not_built(self) -> None:
+        """A disabled constraint with invalid parameters does not break solves."""
+        solver = _solver(reconfigurable=True)
+        solver.constraint_configs = {
+            "fairness": ConstraintConfig(
+                enabled=False, is_hard=False, parameters={"encoding": "bogus"}
+            ),
+        }
+
+        assert solver.solve(time_limit_seconds=10).success
+        model = solver._reconfigurable_model
+        assert model is not None
+        assert "fairness" not in model._built
+
+        solver.configure_constraint("fairness", enabled=True)
+        with pytest.raises(ValueError, match="encoding"):
+            solver.solve(time_limit_seconds=10)
+
+    def test_enabling_builds_without_rebuild(self) -> None:
+        """A constraint enabled after the first solve is added in place."""
+        solver = _solver(reconfigurable=True)
+        solver.configure_constraint("fairness", enabled=False)
+        solver.solve(time_limit_seconds=10)
+
+        solver.configure_constraint("fairness", enabled=True)
+        result = solver.solve(time_limit_seconds=10)
+
+        assert result.objective_value == 100
+        assert solver._reconfigurable_model is not None
+        assert solver._reconfigurable_model.rebuilds == 1
+        assert "fairness" in solver._reconfigurable_model._built
+
+    def test_unguardable_constraint_kind_raises(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Constraint kinds without enforcement literals are rejected."""
+        restriction = ConstraintRegistry.get_all_constraints()["restriction"]
+        apply = restriction.constraint_class.apply
+
+        def _apply_with_at_most_one(self: BaseConstraint, **context: Any) -> None:
+            apply(self, **context)
+            self.model.add_at_most_one(
+                var for *_, var in self.variables.all_assignment_vars()
+            )
+
+        monkeypatch.setattr(
+            restriction.constraint_class, "apply", _apply_with_at_most_one
+        )
+        solver = _solver(reconfigurable=True)
+
+        with pytest.raises(ValueError, match="'restriction'.*cannot be disabled"):
+            solver.solve(time_limit_seconds=10)
+        assert solver._reconfigurable_model is not None
+        assert solver._reconfigurable_model.variables is None
+
+    def test_configure_unknown_constraint_raises(self) -> None:
+        """Only registered constraints can be configured."""
+        with pytest.raises(ValueError, match="Unknown constraint"):
+            _solver(reconfigurable=True).configure_constraint("nope", enabled=False)
@@ -0,0 +1,197 @@
+"""Tests for minimal-change schedule repair."""
+
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from ortools.sat.python import cp_model
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.models import Availability, ShiftType, Worker
+from shift_solver.solver import repair as repair_module
+from shift_solver.solver.repair import ScheduleRepairer, schedule_assignment_keys
+from shift_solver.solver.shift_solver import ShiftSolver
+
+
+@pytest.fixture
+def solver() -> ShiftSolver:
+    """Create a small solver with a soft fairness objective."""
+    workers = [Worker(id=f"W{i:03d}", name=f"Worker {i}") for i in range(1, 7)]
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=2,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    base = date(2026, 1, 5)
+    period_dates = [
+        (base + timedelta(weeks=i), base + timedelta(weeks=i, days=6))
+        for i in range(6)
+    ]
+    return ShiftSolver(
+        workers=workers,
+        shift_types=shift_types,
+        period_dates=period_dates,
+        schedule_id="REPAIR-001",
+        constraint_configs={
+            "fairness": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+        },
+    )
+
+
+def _unavailable(worker_id: str, solver: ShiftSolver, period: int) -> Availability:
+    """Mark a worker unavailable for a whole period."""
+    start, end = solver.period_dates[period]
+    return Availability(
+        worker_id=worker_id,
+        start_date=start,
+        end_date=end,
+        availability_type="unavailable",
+    )
+
+
+class TestScheduleRepairer:
+    """Tests for ScheduleRepairer."""
+
+    def test_rejects_negative_window(self, solver: ShiftSolver) -> None:
+        """A negative window is rejected."""
+        with pytest.raises(ValueError, match="window_periods"):
+            ScheduleRepairer(solver, window_periods=-1)
+
+    def test_rejects_mismatched_periods(self, solver: ShiftSolver) -> None:
+        """The schedule must cover the solver's periods."""
+        published = solver.solve(time_limit_seconds=10).schedule
+        assert published is not None
+        published.periods = published.periods[:-1]
+
+        with pytest.raises(ValueError, match="periods"):
+            solver.repair(published, [])
+
+    def test_no_conflict_returns_schedule_unchanged(self, solver: ShiftSolver) -> None:
+        """Availability that does not clash with the schedule changes nothing."""
+        published = solver.solve(time_limit_seconds=10).schedule
+        assert published is not None
+        idle = next(
+            w.id
+            for w in solver.workers
+            if not published.periods[0].get_worker_shifts(w.id)
+        )
+
+        result = solver.repair(published, [_unavailable(idle, solver, 0)])
+
+        assert result.success
+        assert result.status_name == "UNCHANGED"
+        assert result.schedule is published
+        assert result.statistics["repair"]["changed_assignments"] == 0
+        assert ScheduleRepairer(solver).affected_periods(
+            published, [_unavailable(idle, solver, 0)]
+        ) == []
+
+    def test_repairs_only_affected_period(self, solver: ShiftSolver) -> None:
+        """Conflicting assignments move; other periods stay identical."""
+        published = solver.solve(time_limit_seconds=10).schedule
+        assert published is not None
+        original = schedule_assignment_keys(published)
+        worker_id, period, _ = min(k for k in original if k[1] == 2)
+
+        result = solver.repair(
+            published, [_unavailable(worker_id, solver, period)], time_limit_seconds=10
+        )
+
+        assert result.success
+        assert result.schedule is not None
+        repaired = schedule_assignment_keys(result.schedule)
+        assert not any(k[0] == worker_id and k[1] == period for k in repaired)
+        assert {k for k in repaired if k[1] != period} == {
+            k for k in original if k[1] != period
+        }
+        stats = result.statistics["repair"]
+        assert stats["affected_periods"] == [period]
+        assert ScheduleRepairer(solver).affected_periods(
+            published, [_unavailable(worker_id, solver, period)]
+        ) == [period]
+        # Each removed shift is replaced by exactly one other worker
+        removed = [c for c in stats["changes"] if c["action"] == "removed"]
+        added = [c for c in stats["changes"] if c["action"] == "added"]
+        assert len(removed) == len(added) == stats["changed_assignments"] // 2
+        assert all(c["worker_id"] == worker_id for c in removed)
+
+    def test_spent_budget_skips_soft_objective_stage(
+        self, solver: ShiftSolver, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """When stage 1 uses up the time limit, stage 2 does not run."""
+        published = solver.solve(time_limit_seconds=10).schedule
+        assert published is not None
+        worker_id, period, _ = min(schedule_assignment_keys(published))
+        clock = iter([0.0])
+        monkeypatch.setattr(
+            repair_module, "time", SimpleNamespace(time=lambda: next(clock, 100.0))
+        )
+        limits = []
+        create_solver = ShiftSolver._create_solver
+
+        def _recording_create_solver(**kwargs: Any) -> cp_model.CpSolver:
+            limits.append(kwargs["time_limit_seconds"])
+            return create_solver(**kwargs)
+
+        monkeypatch.setattr(
+            ShiftSolver, "_create_solver", staticmethod(_recording_create_solver)
+        )
+
+        result = solver.repair(
+            published, [_unavailable(worker_id, solver, period)], time_limit_seconds=10
+        )
+
+        assert result.success
+        assert limits == [5]
+        assert result.status_name == "FEASIBLE"
+        assert result.objective_value is not None
+
+    def test_window_frees_neighbouring_periods(self, solver: ShiftSolver) -> None:
+        """window_periods widens the re-optimized range."""
+        published = solver.solve(time_limit_seconds=10).schedule
+        assert published is not None
+        worker_id, period, _ = min(
+            k for k in schedule_assignment_keys(published) if k[1] == 2
+        )
+
+        result = solver.repair(
+            published,
+            [_unavailable(worker_id, solver, period)],
+            time_limit_seconds=10,
+            window_periods=1,
+        )
+
+        assert result.success
+        assert result.statistics["repair"]["affected_periods"] == [1, 2, 3]
+
+    def test_infeasible_repair_fails(self, solver: ShiftSolver) -> None:
+        """A period nobody can staff cannot be repaired."""
+        published = solver.solve(time_limit_seconds=10).schedule
+        assert published is not None
+        workers = [w.id for w in solver.workers]
+
+        result = solver.repair(
+            published,
+            [_unavailable(w, solver, 1) for w in workers[:5]],
+            time_limit_seconds=10,
+        )
+
+        assert not result.success
+        assert result.schedule is None
@@ -0,0 +1,148 @@
+"""Tests for the CP-SAT search log timeline."""
+
+from shift_solver.solver.search_log import SearchTimeline
+
+# Excerpt of a CP-SAT 9.15 log with 8 workers
+LOG = """
+Starting CP-SAT solver v9.15.6755
+Parameters: max_time_in_seconds: 5 num_workers: 8 log_search_progress: true
+
+Starting presolve at 0.02s
+  3.04e-04s  0.00e+00d  [DetectDominanceRelations]
+
+Presolve summary:
+  - rule 'linear: empty' was applied 24 times.
+
+#Bound   0.17s best:inf   next:[0,42'600]  initial_domain
+#Model   0.17s var:1832/1832 constraints:1028/1028
+
+Starting search at 0.19s with 8 workers.
+6 full problem subsolvers: [core, default_lp, max_lp_sym, no_lp, quick_restart]
+
+#1       0.27s best:640   next:[0,620]    fj_restart(batch:1 lin{mvs:254} #w_updates:7)
+#2       0.42s best:420   next:[0,400]    rnd_var_lns (d=5.00e-01 s=9 t=0.10 p=0.00)
+#Bound   0.50s best:420   next:[100,400]  max_lp
+#3       0.67s best:400   next:[100,380]  no_lp
+#4       0.81s best:380   next:[]         no_lp
+#Done    0.81s no_lp
+
+LNS stats           Improv/Calls  Closed  Difficulty  TimeLimit
+  'graph_arc_lns':           0/0      0%    5.00e-01       0.10
+  'rnd_var_lns':             1/4     25%    7.07e-01       0.10
+
+Solutions (4)       Num   Rank
+     'fj_restart':    2  [0,1]
+          'no_lp':    8  [2,6]
+    'rnd_var_lns':    2  [1,2]
+
+Objective bounds     Num
+  'initial_domain':    1
+          'max_lp':    1
+
+CpSolverResponse summary:
+status: OPTIMAL
+objective: 380
+best_bound: 380
+walltime: 0.8123
+"""
+
+
+def _timeline() -> SearchTimeline:
+    return SearchTimeline.parse([LOG])
+
+
+class TestSearchTimeline:
+    """Tests for SearchTimeline.parse and its histories."""
+
+    def test_phases(self) -> None:
+        """Presolve runs from its start to the start of search."""
+        timeline = _timeline()
+
+        assert timeline.search_start_seconds == 0.19
+        assert timeline.presolve_seconds is not None
+        assert abs(timeline.presolve_seconds - 0.17) < 1e-9
+        assert timeline.num_workers == 8
+
+    def test_events(self) -> None:
+        """Solutions and bound moves are recorded in log order."""
+        timeline = _timeline()
+
+        assert [(e.kind, e.subsolver) for e in timeline.events] == [
+            ("bound", "initial_domain"),
+            ("solution", "fj_restart"),
+            ("solution", "rnd_var_lns"),
+            ("bound", "max_lp"),
+            ("solution", "no_lp"),
+            ("solution", "no_lp"),
+        ]
+        assert timeline.events[0].objective is None
+
+    def test_histories(self) -> None:
+        """The bound history skips repeats and closes on optimality."""
+        timeline = _timeline()
+
+        assert timeline.incumbent_history() == [
+            (0.27, 640.0),
+            (0.42, 420.0),
+            (0.67, 400.0),
+            (0.81, 380.0),
+        ]
+        assert timeline.bound_history() == [(0.17, 0.0), (0.5, 100.0), (0.81, 380.0)]
+
+    def test_subsolver_tables(self) -> None:
+        """Solution, bound and LNS tables are read per subsolver."""
+        timeline = _timeline()
+
+        assert timeline.solutions_by_subsolver == {
+            "fj_restart": 2,
+            "no_lp": 8,
+            "rnd_var_lns": 2,
+        }
+        assert timeline.bounds_by_subsolver == {"initial_domain": 1, "max_lp": 1}
+        assert timeline.improvements_by_subsolver() == {
+            "fj_restart": 1,
+            "rnd_var_lns": 1,
+            "no_lp": 2,
+        }
+        lns = timeline.lns["rnd_var_lns"]
+        assert (lns.improvements, lns.calls, lns.closed_percent) == (1, 4, 25.0)
+        assert lns.success_rate == 0.25
+        assert timeline.lns["graph_arc_lns"].success_rate is None
+
+    def test_summary(self) -> None:
+        """The final response summary is kept."""
+        timeline = _timeline()
+
+        assert timeline.status == "OPTIMAL"
+        assert timeline.objective == 380.0
+        assert timeline.best_bound == 380.0
+        assert timeline.wall_time_seconds == 0.8123
+
+    def test_round_trip(self) -> None:
+        """from_dict restores what to_dict stored."""
+        timeline = _timeline()
+        data = timeline.to_dict()
+
+        assert data["lns"]["rnd_var_lns"]["success_rate"] == 0.25
+        assert SearchTimeline.from_dict(data) == timeline
+
+    def test_one_message_per_line(self) -> None:
+        """Messages split across callback calls parse the same."""
+        assert SearchTimeline.parse(LOG.splitlines()) == _timeline()
+
+    def test_satisfaction_model(self) -> None:
+        """Solutions without an objective are still recorded."""
+        timeline = SearchTimeline.parse(["#1       0.00s main [hint]"])
+
+        assert [(e.kind, e.subsolver) for e in timeline.events] == [
+            ("solution", "main")
+        ]
+        assert timeline.incumbent_history() == []
+
+    def test_empty_log(self) -> None:
+        """A log without search leaves every field empty."""
+        timeline = SearchTimeline.parse([])
+
+        assert timeline.events == []
+        assert timeline.presolve_seconds is None
+        assert timeline.bound_history() == []
@@ -4,6 +4,7 @@ from datetime import date, time, timedelta
 
 import pytest
 
+from shift_solver.constraints.base import ConstraintConfig
 from shift_solver.models import Availability, Schedule, ShiftType, Worker
 from shift_solver.solver.shift_solver import ShiftSolver
 
@@ -203,6 +204,10 @@ class TestShiftSolver:
 
         assert result.solve_time_seconds >= 0
         assert result.status_name is not None
+        phases = result.statistics["phases"]
+        assert list(phases) == ["feasibility", "build", "search", "extraction"]
+        assert all(seconds >= 0 for seconds in phases.values())
+        assert result.statistics["model"]["variables"] > 0
 
     def test_solve_infeasible_returns_failure(self) -> None:
         """Infeasible problem returns success=False."""
@@ -333,6 +338,7 @@ class TestShiftSolverPreSolveFeasibility:
         assert len(result.feasibility_issues) > 0
         # Should identify the restriction issue
         assert any(i["type"] == "restriction" for i in result.feasibility_issues)
+        assert list(result.statistics["phases"]) == ["feasibility"]
 
     def test_infeasible_message_identifies_shift_type(self) -> None:
         """Feasibility error message identifies which shift type is infeasible."""
@@ -367,6 +373,109 @@ class TestShiftSolverPreSolveFeasibility:
         assert "Night Shift" in issue["message"]
 
 
+class TestShiftSolverElasticCoverage:
+    """Tests for soft coverage, which never makes the solve infeasible."""
+
+    @pytest.mark.parametrize("reconfigurable", [False, True])
+    def test_understaffed_instance_returns_schedule_and_gaps(
+        self, reconfigurable: bool
+    ) -> None:
+        """Restricted nights are reported as gaps instead of failing."""
+        workers = [
+            Worker(id="W1", name="Alice", restricted_shifts=frozenset(["night"])),
+            Worker(id="W2", name="Bob"),
+            Worker(id="W3", name="Charlie"),
+        ]
+        shift_types = [
+            ShiftType(
+                id="day",
+                name="Day Shift",
+                category="day",
+                start_time=time(7, 0),
+                end_time=time(15, 0),
+                duration_hours=8.0,
+                workers_required=1,
+                max_workers=2,
+            ),
+            ShiftType(
+                id="night",
+                name="Night Shift",
+                category="night",
+                start_time=time(23, 0),
+                end_time=time(7, 0),
+                duration_hours=8.0,
+                workers_required=3,
+                min_workers=2,
+            ),
+        ]
+        period_dates = [
+            (date(2026, 1, 5), date(2026, 1, 11)),
+            (date(2026, 1, 12), date(2026, 1, 18)),
+        ]
+
+        solver = ShiftSolver(
+            workers=workers,
+            shift_types=shift_types,
+            period_dates=period_dates,
+            schedule_id="TEST-ELASTIC",
+            constraint_configs={
+                "coverage": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+            },
+            reconfigurable=reconfigurable,
+        )
+
+        result = solver.solve(time_limit_seconds=10)
+
+        assert result.success
+        assert result.status_name == "OPTIMAL"
+        # Two unrestricted workers reach min_workers=2 on nights, no gaps
+        assert result.statistics["coverage_gaps"] == []
+        assert result.objective_value == 0
+
+    def test_gap_when_minimum_is_unreachable(self) -> None:
+        """Shortfall below min_workers is listed per period."""
+        workers = [
+            Worker(id="W1", name="Alice", restricted_shifts=frozenset(["night"])),
+            Worker(id="W2", name="Bob"),
+        ]
+        shift_types = [
+            ShiftType(
+                id="night",
+                name="Night Shift",
+                category="night",
+                start_time=time(23, 0),
+                end_time=time(7, 0),
+                duration_hours=8.0,
+                workers_required=2,
+            ),
+        ]
+
+        solver = ShiftSolver(
+            workers=workers,
+            shift_types=shift_types,
+            period_dates=[(date(2026, 1, 5), date(2026, 1, 11))],
+            schedule_id="TEST-ELASTIC",
+            constraint_configs={
+                "coverage": ConstraintConfig(enabled=True, is_hard=False, weight=100),
+            },
+        )
+
+        result = solver.solve(time_limit_seconds=10)
+
+        assert result.success
+        assert result.objective_value == 100
+        assert result.statistics["coverage_gaps"] == [
+            {
+                "period_index": 0,
+                "shift_type_id": "night",
+                "shortfall": 1,
+                "excess": 0,
+                "min_workers": 2,
+                "max_workers": 2,
+            }
+        ]
+
+
 class TestShiftSolverRequestConstraintConfig:
     """Tests for RequestConstraint config handling (scheduler-56)."""
 
@@ -698,3 +807,222 @@ class TestShiftSolverParameters:
         )
         assert result.success
         assert callback.solutions_found >= 1
+
+    def test_search_timeline_captured(
+        self, simple_solver: ShiftSolver, capfd: pytest.CaptureFixture[str]
+    ) -> None:
+        """search_timeline parses the log without printing it."""
+        result = simple_solver.solve(time_limit_seconds=10, search_timeline=True)
+
+        assert result.success
+        timeline = result.search_timeline
+        assert timeline is not None
+        assert timeline.status == result.status_name
+        assert timeline.presolve_seconds is not None
+        assert [event.kind for event in timeline.events] == ["solution"]
+        assert "Starting search" not in capfd.readouterr().out
+
+    def test_search_timeline_off_by_default(self, simple_solver: ShiftSolver) -> None:
+        """Without search_timeline no log is captured."""
+        result = simple_solver.solve(time_limit_seconds=10)
+
+        assert result.search_timeline is None
+        assert simple_solver._solver is not None
+        assert simple_solver._solver.parameters.log_search_progress is False
+
+    def test_search_statistics_reported(self, simple_solver: ShiftSolver) -> None:
+        """CP-SAT's effort counters are reported with the result."""
+        result = simple_solver.solve(time_limit_seconds=10)
+
+        search = result.statistics["cp_sat"]
+        assert set(search) == {
+            "deterministic_time",
+            "conflicts",
+            "branches",
+            "user_time_seconds",
+            "wall_time_seconds",
+        }
+        assert search["deterministic_time"] >= 0
+        assert search["wall_time_seconds"] <= result.solve_time_seconds
+
+    def test_deterministic_time_limit_and_seed(self, simple_solver: ShiftSolver) -> None:
+        """Only reproducible solves interleave parallel workers."""
+        result = simple_solver.solve(
+            time_limit_seconds=10,
+            num_workers=2,
+            deterministic_time_limit=2.5,
+            random_seed=7,
+        )
+
+        assert result.success
+        assert simple_solver._solver is not None
+        params = simple_solver._solver.parameters
+        assert params.max_deterministic_time == 2.5
+        assert params.random_seed == 7
+        assert params.interleave_search is False
+
+        simple_solver.solve(
+            time_limit_seconds=10,
+            num_workers=2,
+            deterministic_time_limit=2.5,
+            random_seed=7,
+            reproducible=True,
+        )
+        assert simple_solver._solver.parameters.interleave_search is True
+
+    def test_deterministic_runs_repeat(self) -> None:
+        """Seeded runs with a deterministic limit explore the same search."""
+        from shift_solver.solver.benchmark import BenchmarkScenario
+
+        runs = []
+        for _ in range(2):
+            ss = ShiftSolver(**BenchmarkScenario(name="base").solver_kwargs())
+            result = ss.solve(
+                time_limit_seconds=30,
+                num_workers=2,
+                deterministic_time_limit=0.3,
+                random_seed=3,
+                reproducible=True,
+            )
+            search = result.statistics["cp_sat"]
+            runs.append(
+                (
+                    result.status_name,
+                    result.objective_value,
+                    search["deterministic_time"],
+                    search["conflicts"],
+                    search["branches"],
+                )
+            )
+
+        assert runs[0] == runs[1]
+
+    def test_stop_event_set_before_search(self) -> None:
+        """A stop requested before the search starts ends the solve at once."""
+        import threading
+
+        from shift_solver.solver.benchmark import BenchmarkScenario
+
+        scenario = BenchmarkScenario(
+            name="stop", num_workers=12, num_periods=6, constraint_mix="full"
+        )
+        ss = ShiftSolver(**scenario.solver_kwargs())
+        stop_event = threading.Event()
+        stop_event.set()
+
+        result = ss.solve(time_limit_seconds=60, stop_event=stop_event)
+
+        assert result.status_name == "UNKNOWN"
+        assert result.solve_time_seconds < 30
+
+    def test_reuse_model_skips_build(self, simple_solver: ShiftSolver) -> None:
+        """reuse_model searches the kept model again with the new hint."""
+        first = simple_solver.solve(time_limit_seconds=10)
+        model = simple_solver._model
+
+        result = simple_solver.solve(
+            time_limit_seconds=10, hint=first.schedule, reuse_model=True
+        )
+
+        assert result.success
+        assert simple_solver._model is model
+        assert list(result.statistics["phases"]) == ["build", "search", "extraction"]
+
+
+class TestShiftSolverRelease:
+    """Tests for releasing model state after solves."""
+
+    @pytest.fixture
+    def solver_kwargs(self) -> dict:
+        """Inputs of a small feasible instance."""
+        return {
+            "workers": [Worker(id="W1", name="Alice"), Worker(id="W2", name="Bob")],
+            "shift_types": [
+                ShiftType(
+                    id="day",
+                    name="Day",
+                    category="day",
+                    start_time=time(7, 0),
+                    end_time=time(15, 0),
+                    duration_hours=8.0,
+                    workers_required=1,
+                ),
+            ],
+            "period_dates": [
+                (date(2026, 1, 5), date(2026, 1, 11)),
+                (date(2026, 1, 12), date(2026, 1, 18)),
+            ],
+            "schedule_id": "TEST-RELEASE",
+        }
+
+    @staticmethod
+    def _assert_released(solver: ShiftSolver) -> None:
+        assert solver._model is None
+        assert solver._variables is None
+        assert solver._solver is None
+        assert solver._objective_builder is None
+        assert solver._constraints == {}
+        assert solver._assumption_groups == {}
+
+    def test_release_drops_model_state(self, solver_kwargs: dict) -> None:
+        """release() drops the model and the model can be garbage collected."""
+        import gc
+        import weakref
+
+        solver = ShiftSolver(**solver_kwargs)
+        assert solver.solve(time_limit_seconds=10).success
+        model_ref = weakref.ref(solver._model)
+
+        solver.release()
+        gc.collect()
+
+        self._assert_released(solver)
+        assert model_ref() is None
+
+    def test_solve_after_release_rebuilds(self, solver_kwargs: dict) -> None:
+        """A released solver solves again from its inputs."""
+        solver = ShiftSolver(**solver_kwargs)
+        first = solver.solve(time_limit_seconds=10)
+        solver.release()
+        second = solver.solve(time_limit_seconds=10)
+
+        assert second.success
+        assert second.objective_value == first.objective_value
+
+    def test_context_manager_releases(self, solver_kwargs: dict) -> None:
+        """Leaving the with block releases the model state."""
+        with ShiftSolver(**solver_kwargs) as solver:
+            result = solver.solve(time_limit_seconds=10)
+            assert solver._model is not None
+
+        assert result.success
+        self._assert_released(solver)
+
+    def test_results_only_releases_after_solve(self, solver_kwargs: dict) -> None:
+        """results_only keeps the result and drops the model state."""
+        solver = ShiftSolver(**solver_kwargs, results_only=True)
+
+        result = solver.solve(time_limit_seconds=10)
+
+        assert result.success
+        assert result.schedule is not None
+        assert len(result.schedule.periods) == 2
+        self._assert_released(solver)
+
+    def test_results_only_releases_after_failure(self, solver_kwargs: dict) -> None:
+        """results_only also releases when CP-SAT returns no schedule."""
+        solver = ShiftSolver(**solver_kwargs, results_only=True)
+
+        result = solver.solve(
+            time_limit_seconds=10,
+            use_greedy=False,
+            parameters={"stop_after_presolve": True},
+        )
+
+        assert not result.success
+        self._assert_released(solver)
+
+    def test_results_only_rejects_reconfigurable(self, solver_kwargs: dict) -> None:
+        """A reconfigurable model exists to be kept, so the two conflict."""
+        with pytest.raises(ValueError, match="reconfigurable"):
+            ShiftSolver(**solver_kwargs, results_only=True, reconfigurable=True)
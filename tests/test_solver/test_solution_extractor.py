@@ -276,6 +276,37 @@ class TestSolutionExtractorValidation:
             )
 
 
+    def test_extracts_explicit_assignments_without_solver(self) -> None:
+        """Explicit assignment keys are extracted when no solver is given."""
+        model = cp_model.CpModel()
+        workers = [Worker(id="W001", name="A"), Worker(id="W002", name="B")]
+        shift_types = [
+            ShiftType(
+                id="s",
+                name="S",
+                category="x",
+                start_time=time(0, 0),
+                end_time=time(8, 0),
+                duration_hours=8.0,
+                workers_required=1,
+            ),
+        ]
+        variables = VariableBuilder(model, workers, shift_types, num_periods=1).build()
+
+        schedule = SolutionExtractor(
+            solver=None,
+            variables=variables,
+            workers=workers,
+            shift_types=shift_types,
+            period_dates=[(date(2026, 1, 5), date(2026, 1, 11))],
+            schedule_id="TEST",
+            assigned={("W002", 0, "s")},
+        ).extract()
+
+        assert list(schedule.periods[0].assignments) == ["W002"]
+        assert schedule.statistics["W002"]["total_shifts"] == 1
+
+
 class TestSolutionExtractorStatistics:
     """Tests for statistics calculation."""
 
@@ -0,0 +1,126 @@
+"""Tests for the diverse solution pool."""
+
+from datetime import date, time, timedelta
+
+import pytest
+
+from shift_solver.models import Schedule, ShiftType, Worker
+from shift_solver.solver.shift_solver import ShiftSolver
+from shift_solver.solver.solution_pool import SolutionPool
+
+BASE = date(2026, 1, 5)
+
+
+@pytest.fixture
+def solver() -> ShiftSolver:
+    """Six workers, a day and an undesirable night shift over four weeks."""
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=2,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    return ShiftSolver(
+        workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 7)],
+        shift_types=shift_types,
+        period_dates=[
+            (BASE + timedelta(weeks=i), BASE + timedelta(weeks=i, days=6))
+            for i in range(4)
+        ],
+        schedule_id="POOL-001",
+    )
+
+
+def _assigned(schedule: Schedule | None) -> set[tuple[str, int, str]]:
+    """Flatten a schedule into (worker, period, shift) triples."""
+    assert schedule is not None
+    return {
+        (worker_id, period.period_index, shift.shift_type_id)
+        for period in schedule.periods
+        for worker_id, shifts in period.assignments.items()
+        for shift in shifts
+    }
+
+
+class TestSolutionPool:
+    """Tests for SolutionPool bookkeeping."""
+
+    def test_keeps_best_entries_sorted(self) -> None:
+        """The pool holds the best size entries, best first."""
+        pool = SolutionPool(size=2)
+
+        assert pool.add(0b001, 5.0)
+        assert pool.add(0b010, 3.0)
+        assert pool.add(0b100, 4.0)
+        assert not pool.add(0b111, 9.0)
+
+        assert [e.objective for e in pool.entries] == [3.0, 4.0]
+
+    def test_close_solution_replaces_only_when_better(self) -> None:
+        """Within min_distance, only a better solution displaces pooled ones."""
+        pool = SolutionPool(size=3, min_distance=2)
+        pool.add(0b0011, 5.0)
+
+        assert not pool.add(0b0111, 6.0)
+        assert pool.add(0b0111, 4.0)
+        assert [e.bits for e in pool.entries] == [0b0111]
+
+    def test_rejects_invalid_sizes(self) -> None:
+        """Size and distance must be positive."""
+        with pytest.raises(ValueError, match="size"):
+            SolutionPool(size=0)
+        with pytest.raises(ValueError, match="min_distance"):
+            SolutionPool(size=1, min_distance=0)
+
+
+class TestSolvePool:
+    """Tests for ShiftSolver.solve_pool."""
+
+    def test_pool_is_diverse_and_ranked(self, solver: ShiftSolver) -> None:
+        """Schedules differ pairwise by min_distance and start at the optimum."""
+        result = solver.solve_pool(size=4, min_distance=3, time_limit_seconds=20)
+
+        assert result.success
+        assert result.objective_value == solver.solve(
+            time_limit_seconds=20
+        ).objective_value
+        schedules = [result.schedule, *result.alternatives]
+        assert len(schedules) == 4
+        triples = [_assigned(schedule) for schedule in schedules]
+        for i, a in enumerate(triples):
+            for b in triples[i + 1 :]:
+                assert len(a ^ b) >= 3
+        pooled = result.statistics["solution_pool"]
+        objectives = [entry["objective"] for entry in pooled]
+        assert objectives == sorted(objectives)
+        assert pooled[0]["distance_to_best"] == 0
+        assert [entry["status"] for entry in pooled] == [
+            result.status_name,
+            "FEASIBLE",
+            "FEASIBLE",
+            "FEASIBLE",
+        ]
+
+    def test_without_cuts_uses_callback_only(self, solver: ShiftSolver) -> None:
+        """Without no-good cuts the pool holds what the search reported."""
+        result = solver.solve_pool(
+            size=4, time_limit_seconds=10, no_good_cuts=False
+        )
+
+        assert result.success
+        assert len(result.alternatives) < 4
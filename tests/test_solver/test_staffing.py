@@ -0,0 +1,109 @@
+"""Tests for staffing-level optimization."""
+
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from shift_solver.constraints.base import ConstraintConfig
+from shift_solver.models import ShiftType, Worker
+from shift_solver.solver import staffing as staffing_module
+from shift_solver.solver.shift_solver import ShiftSolver
+
+BASE = date(2026, 1, 5)
+
+
+def _solver(**constraint_configs: ConstraintConfig) -> ShiftSolver:
+    """Eight workers, a day and an undesirable night shift over five weeks."""
+    shift_types = [
+        ShiftType(
+            id="day",
+            name="Day Shift",
+            category="day",
+            start_time=time(7, 0),
+            end_time=time(15, 0),
+            duration_hours=8.0,
+            workers_required=2,
+        ),
+        ShiftType(
+            id="night",
+            name="Night Shift",
+            category="night",
+            start_time=time(23, 0),
+            end_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=1,
+            is_undesirable=True,
+        ),
+    ]
+    return ShiftSolver(
+        workers=[Worker(id=f"W{i}", name=f"W{i}") for i in range(1, 9)],
+        shift_types=shift_types,
+        period_dates=[
+            (BASE + timedelta(weeks=i), BASE + timedelta(weeks=i, days=6))
+            for i in range(5)
+        ],
+        schedule_id="STAFF-001",
+        constraint_configs=constraint_configs or None,
+    )
+
+
+class TestStaffingOptimizer:
+    """Tests for ShiftSolver.optimize_staffing."""
+
+    def test_minimum_headcount_and_frontier(self) -> None:
+        """The frontier starts at the minimum and its penalty falls."""
+        result = _solver().optimize_staffing(time_limit_seconds=30)
+
+        assert result.success
+        staffing = result.statistics["staffing"]
+        # Each period needs three slots, which two workers can fill
+        assert staffing["minimum_headcount"] == 2
+        assert staffing["minimum_proven"]
+        frontier = staffing["frontier"]
+        assert frontier[0]["headcount"] == 2
+        penalties = [point["penalty"] for point in frontier]
+        assert penalties == sorted(penalties, reverse=True)
+        assert len(set(penalties)) == len(penalties)
+        assert staffing["chosen_headcount"] == 2
+        assert result.schedule is not None
+        used = {
+            worker_id
+            for period in result.schedule.periods
+            for worker_id, shifts in period.assignments.items()
+            if shifts
+        }
+        assert len(used) == 2
+
+    def test_max_penalty_selects_larger_team(self) -> None:
+        """An acceptable penalty picks the smallest headcount within it."""
+        result = _solver().optimize_staffing(time_limit_seconds=30, max_penalty=0)
+
+        staffing = result.statistics["staffing"]
+        assert result.objective_value == 0
+        assert staffing["chosen_headcount"] == staffing["frontier"][-1]["headcount"]
+        assert staffing["chosen_headcount"] > staffing["minimum_headcount"]
+
+    def test_spent_budget_returns_first_stage_schedule(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Once the time limit is used up no further headcounts are solved."""
+        clock = iter([0.0, 0.0])
+        monkeypatch.setattr(
+            staffing_module, "time", SimpleNamespace(time=lambda: next(clock, 100.0))
+        )
+
+        result = _solver().optimize_staffing(time_limit_seconds=10)
+
+        assert result.success
+        assert result.status_name == "FEASIBLE"
+        staffing = result.statistics["staffing"]
+        assert [point["proven"] for point in staffing["frontier"]] == [False]
+        assert staffing["chosen_headcount"] == staffing["minimum_headcount"]
+
+    def test_rejects_idle_penalizing_constraints(self) -> None:
+        """Soft constraints that charge idle workers are not supported."""
+        solver = _solver(frequency=ConstraintConfig(enabled=True, is_hard=False))
+
+        with pytest.raises(ValueError, match="frequency"):
+            solver.optimize_staffing()
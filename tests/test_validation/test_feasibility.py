@@ -148,6 +148,21 @@ class TestCoverageChecks:
         result = checker.check()
         assert result.is_feasible
 
+    def test_elastic_coverage_skips_staffing_checks(
+        self,
+        shift_types: list[ShiftType],
+        period_dates: list[tuple[date, date]],
+    ) -> None:
+        """Understaffing is not infeasible when coverage is elastic."""
+        checker = FeasibilityChecker(
+            workers=[Worker(id="W1", name="Alice")],
+            shift_types=shift_types,
+            period_dates=period_dates,
+            elastic_coverage=True,
+        )
+        result = checker.check()
+        assert result.is_feasible
+
     def test_empty_workers_list(
         self,
         shift_types: list[ShiftType],
@@ -959,3 +974,124 @@ class TestShiftOrderPreferenceFeasibility:
             w["type"] == "shift_order_preference" and "restricted" in w["message"]
             for w in result.warnings
         )
+
+
+def _shift(shift_id: str, **kwargs: object) -> ShiftType:
+    """Create a one-worker shift type."""
+    return ShiftType(
+        id=shift_id,
+        name=f"Shift {shift_id}",
+        category=shift_id,
+        start_time=time(7, 0),
+        end_time=time(15, 0),
+        duration_hours=8.0,
+        workers_required=1,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestPeriodCapacityChecks:
+    """Test the per-period worker-to-shift max-flow check."""
+
+    @pytest.fixture
+    def capacity_inputs(self) -> dict[str, object]:
+        """Three shifts W1-W3 compete for; D is covered by W4 alone.
+
+        W2 is unavailable in period 1, so with one shift per worker the
+        three shifts A, B and C share only W1 and W3.
+        """
+        return {
+            "workers": [
+                Worker(id="W1", name="A", restricted_shifts=frozenset(["C", "D"])),
+                Worker(id="W2", name="B", restricted_shifts=frozenset(["C", "D"])),
+                Worker(id="W3", name="C", restricted_shifts=frozenset(["D"])),
+                Worker(id="W4", name="D", restricted_shifts=frozenset(["A", "B", "C"])),
+            ],
+            "shift_types": [_shift("A"), _shift("B"), _shift("C"), _shift("D")],
+            "period_dates": [
+                (date(2026, 1, 5), date(2026, 1, 11)),
+                (date(2026, 1, 12), date(2026, 1, 18)),
+            ],
+            "availabilities": [
+                Availability(
+                    worker_id="W2",
+                    start_date=date(2026, 1, 12),
+                    end_date=date(2026, 1, 18),
+                    availability_type="unavailable",
+                ),
+            ],
+        }
+
+    @pytest.mark.parametrize("enumerate_subsets", [True, False])
+    def test_reports_exact_bottleneck(
+        self,
+        capacity_inputs: dict[str, object],
+        enumerate_subsets: bool,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Only the competing shifts in the short-staffed period are reported."""
+        if not enumerate_subsets:
+            monkeypatch.setattr(
+                "shift_solver.validation.feasibility.MAX_ENUMERATED_SHIFT_TYPES", 0
+            )
+        checker = FeasibilityChecker(**capacity_inputs, max_shifts_per_period=1)  # type: ignore[arg-type]
+
+        result = checker.check()
+
+        assert not result.is_feasible
+        assert result.bottlenecks == {1: ["A", "B", "C"]}
+        issue = result.issues[0]
+        assert issue["type"] == "capacity"
+        assert issue["workers_required"] == 3
+        assert issue["workers_available"] == 2
+
+    def test_per_shift_counts_pass_without_limit(
+        self, capacity_inputs: dict[str, object]
+    ) -> None:
+        """Without a per-period limit a worker may cover several shifts."""
+        checker = FeasibilityChecker(**capacity_inputs)  # type: ignore[arg-type]
+
+        result = checker.check()
+
+        assert result.is_feasible
+        assert result.bottlenecks == {}
+
+    def test_shift_specific_unavailability_blocks_only_that_shift(self) -> None:
+        """Unavailability for one shift type leaves the others staffable."""
+        checker = FeasibilityChecker(
+            workers=[Worker(id="W1", name="A"), Worker(id="W2", name="B")],
+            shift_types=[_shift("A"), _shift("B")],
+            period_dates=[(date(2026, 1, 5), date(2026, 1, 11))],
+            availabilities=[
+                Availability(
+                    worker_id="W1",
+                    start_date=date(2026, 1, 5),
+                    end_date=date(2026, 1, 11),
+                    availability_type="unavailable",
+                    shift_type_id="A",
+                ),
+            ],
+            max_shifts_per_period=1,
+        )
+
+        eligible, _ = checker._eligibility()
+
+        assert eligible[0].tolist() == [[False, True], [True, True]]
+        assert checker.check().is_feasible
+
+    def test_shift_without_applicable_days_needs_no_workers(self) -> None:
+        """A shift that never applies in a period adds no demand."""
+        checker = FeasibilityChecker(
+            workers=[Worker(id="W1", name="A")],
+            shift_types=[
+                _shift("A"),
+                # Saturday only; the period runs Monday to Friday
+                _shift("B", applicable_days=frozenset([5])),
+            ],
+            period_dates=[(date(2026, 1, 5), date(2026, 1, 9))],
+            max_shifts_per_period=1,
+        )
+
+        result = checker.check()
+
+        assert result.is_feasible
@@ -61,3 +61,24 @@ class TestDjangoAdmin:
         from core.models import Assignment
 
         assert Assignment in admin.site._registry
+
+    def test_solver_run_admin_shows_allocated_cores(self) -> None:
+        """Running solves show their share of the core budget."""
+        from unittest.mock import patch
+
+        from django.contrib import admin
+
+        from core.models import SolverRun
+        from core.solver_runner import core_lease_name
+        from shift_solver.solver.core_allocator import CoreAllocator
+
+        run_admin = admin.site._registry[SolverRun]
+        allocator = CoreAllocator(total_cores=4)
+        with patch.object(CoreAllocator, "_shared", allocator):
+            allocator.acquire(core_lease_name(7))
+            assert run_admin.allocated_cores(SolverRun(pk=7)) == "4/4"
+            allocator.acquire("other")
+            assert run_admin.allocated_cores(SolverRun(pk=7)) == (
+                "4/4 (resizing to 2)"
+            )
+            assert run_admin.allocated_cores(SolverRun(pk=8)) == "-"
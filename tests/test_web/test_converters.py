@@ -1,6 +1,7 @@
 """Tests for domain dataclass conversion layer (scheduler-112)."""
 
 from datetime import date, time
+from typing import Any
 
 import pytest
 
@@ -100,6 +101,26 @@ class TestShiftTypeConversion:
         assert domain_shift.duration_hours == 8.0
         assert domain_shift.workers_required == 2
 
+    def test_orm_shift_type_to_domain_repairs_staffing_range(self) -> None:
+        """Legacy rows with an invalid staffing range still convert."""
+        from core.converters import orm_shift_type_to_domain
+
+        orm_shift = ORMShiftType.objects.create(
+            shift_type_id="day",
+            name="Day Shift",
+            start_time=time(7, 0),
+            duration_hours=8.0,
+            workers_required=2,
+            min_workers=3,
+            max_workers=2,
+        )
+        assert orm_shift_type_to_domain(orm_shift).staffing_range == (2, 2)
+
+        orm_shift.min_workers = -1
+        orm_shift.max_workers = 0
+        domain_shift = orm_shift_type_to_domain(orm_shift)
+        assert (domain_shift.min_workers, domain_shift.max_workers) == (0, None)
+
     def test_shift_type_round_trip(self) -> None:
         """ORM -> domain -> ORM preserves all fields."""
         from core.converters import domain_shift_type_to_orm, orm_shift_type_to_domain
@@ -306,6 +327,128 @@ class TestSolverResultConversion:
             assert assignment.solver_run == run
 
 
+class TestBulkWriteAssignments:
+    """Tests for the batched Assignment write path."""
+
+    def _make_schedule(self, worker_ids: list[str], days: int) -> Any:
+        from datetime import timedelta
+
+        from shift_solver.models import PeriodAssignment, Schedule, ShiftInstance
+
+        start = date(2026, 3, 2)
+        periods = []
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            periods.append(
+                PeriodAssignment(
+                    period_index=offset,
+                    period_start=day,
+                    period_end=day,
+                    assignments={
+                        wid: [
+                            ShiftInstance(
+                                shift_type_id="day",
+                                period_index=offset,
+                                date=day,
+                                worker_id=wid,
+                            )
+                        ]
+                        for wid in worker_ids
+                    },
+                )
+            )
+        return Schedule(
+            schedule_id="test",
+            start_date=start,
+            end_date=start + timedelta(days=days),
+            period_type="day",
+            periods=periods,
+            workers=[],
+            shift_types=[],
+        )
+
+    def _make_run(self) -> ORMSolverRun:
+        request = ORMScheduleRequest.objects.create(
+            name="Test", start_date=date(2026, 3, 2), end_date=date(2026, 3, 8),
+        )
+        return ORMSolverRun.objects.create(schedule_request=request)
+
+    def test_writes_all_rows_in_batches(self) -> None:
+        """All assignments are persisted when batch size is smaller than rows."""
+        from core.converters import write_solver_result_assignments
+        from core.models import Assignment as ORMAssignment
+
+        ORMWorker.objects.create(worker_id="W001", name="Alice")
+        ORMWorker.objects.create(worker_id="W002", name="Bob")
+        ORMShiftType.objects.create(
+            shift_type_id="day", name="Day", start_time=time(7, 0),
+            duration_hours=8.0,
+        )
+        run = self._make_run()
+
+        stats = write_solver_result_assignments(
+            run, self._make_schedule(["W001", "W002"], days=5), batch_size=3
+        )
+
+        assert stats["assignment_count"] == 10
+        assert ORMAssignment.objects.filter(solver_run=run).count() == 10
+
+    def test_reports_rows_per_second(self) -> None:
+        """Write stats include timing and throughput."""
+        from core.converters import write_solver_result_assignments
+
+        ORMWorker.objects.create(worker_id="W001", name="Alice")
+        ORMShiftType.objects.create(
+            shift_type_id="day", name="Day", start_time=time(7, 0),
+            duration_hours=8.0,
+        )
+        run = self._make_run()
+
+        stats = write_solver_result_assignments(
+            run, self._make_schedule(["W001"], days=3)
+        )
+
+        assert stats["persist_time_seconds"] >= 0
+        assert stats["persist_rows_per_second"] is None or (
+            stats["persist_rows_per_second"] > 0
+        )
+
+    def test_only_referenced_workers_loaded(self) -> None:
+        """Workers not referenced by the schedule are not fetched."""
+        from core.converters import solver_result_to_assignments
+
+        ORMWorker.objects.create(worker_id="W001", name="Alice")
+        for i in range(20):
+            ORMWorker.objects.create(worker_id=f"X{i:03d}", name=f"Other {i}")
+        ORMShiftType.objects.create(
+            shift_type_id="day", name="Day", start_time=time(7, 0),
+            duration_hours=8.0,
+        )
+        run = self._make_run()
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as ctx:
+            assignments = solver_result_to_assignments(
+                run, self._make_schedule(["W001"], days=2)
+            )
+
+        assert len(assignments) == 2
+        worker_query = next(q["sql"] for q in ctx if "core_worker" in q["sql"])
+        assert "IN" in worker_query
+
+    def test_invalid_batch_size_raises(self) -> None:
+        """A non-positive batch size is rejected."""
+        from core.converters import write_solver_result_assignments
+
+        run = self._make_run()
+        with pytest.raises(ValueError, match="batch_size"):
+            write_solver_result_assignments(
+                run, self._make_schedule([], days=1), batch_size=0
+            )
+
+
 class TestAvailabilityConversion:
     """Tests for Availability ORM -> domain conversion."""
 
@@ -0,0 +1,236 @@
+"""Query-count and query-plan audit for every view in core/urls.py.
+
+Each view is requested against a small dataset and again after the dataset
+has grown. A view whose query count grows with the data has an N+1 pattern.
+Every captured SELECT is also run through EXPLAIN QUERY PLAN, and a full
+table scan of a table that grows with schedule size fails the audit.
+"""
+
+import datetime
+import re
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from core import urls as core_urls
+from core.models import (
+    Assignment,
+    Availability,
+    ConstraintConfig,
+    ScheduleRequest,
+    ShiftType,
+    SolverRun,
+    SolverSettings,
+    Worker,
+    WorkerRequest,
+)
+
+pytestmark = pytest.mark.django_db
+
+# Tables whose row counts grow with schedule size and must never be scanned
+LARGE_TABLES = ("core_assignment", "core_availability", "core_workerrequest")
+
+_SCAN_RE = re.compile(r"^SCAN (\w+)")
+
+# URL name -> path builder (GET). POST-only endpoints are requested with GET,
+# which exercises their guard path.
+VIEW_CASES: dict[str, Callable[[dict[str, Any]], str]] = {
+    "worker-list": lambda _d: "/workers/",
+    "worker-create": lambda _d: "/workers/create/",
+    "worker-update": lambda d: f"/workers/{d['worker'].pk}/edit/",
+    "worker-delete": lambda d: f"/workers/{d['worker'].pk}/delete/",
+    "shift-list": lambda _d: "/shifts/",
+    "shift-create": lambda _d: "/shifts/create/",
+    "shift-update": lambda d: f"/shifts/{d['shift'].pk}/edit/",
+    "shift-delete": lambda d: f"/shifts/{d['shift'].pk}/delete/",
+    "availability-page": lambda _d: "/availability/",
+    "availability-events": lambda d: (
+        f"/availability/events/?worker_id={d['worker'].pk}"
+        "&start=2026-03-01&end=2026-04-01"
+    ),
+    "availability-update": lambda _d: "/availability/update/",
+    "constraint-list": lambda _d: "/constraints/",
+    "constraint-update": lambda d: f"/constraints/{d['constraint'].pk}/edit/",
+    "constraint-seed": lambda _d: "/constraints/seed/",
+    "request-list": lambda _d: "/requests/",
+    "request-create": lambda _d: "/requests/create/",
+    "request-detail": lambda d: f"/requests/{d['request'].pk}/",
+    "request-update": lambda d: f"/requests/{d['request'].pk}/edit/",
+    "request-delete": lambda d: f"/requests/{d['request'].pk}/delete/",
+    "worker-request-list": lambda d: (
+        f"/requests/{d['request'].pk}/worker-requests/"
+    ),
+    "worker-request-create": lambda d: (
+        f"/requests/{d['request'].pk}/worker-requests/create/"
+    ),
+    "worker-request-update": lambda d: (
+        f"/requests/{d['request'].pk}/worker-requests/"
+        f"{d['worker_request'].pk}/edit/"
+    ),
+    "worker-request-delete": lambda d: (
+        f"/requests/{d['request'].pk}/worker-requests/"
+        f"{d['worker_request'].pk}/delete/"
+    ),
+    "solver-settings": lambda d: f"/requests/{d['request'].pk}/settings/",
+    "solver-settings-edit": lambda d: f"/requests/{d['request'].pk}/settings/edit/",
+    "solve-launch": lambda d: f"/requests/{d['request'].pk}/solve/",
+    "solve-launch-modal": lambda d: f"/requests/{d['request'].pk}/solve/modal/",
+    "solve-progress": lambda d: f"/solver-runs/{d['run'].pk}/progress/",
+    "solve-progress-bar": lambda d: f"/solver-runs/{d['run'].pk}/progress-bar/",
+    "solve-progress-stream": lambda d: (
+        f"/solver-runs/{d['run'].pk}/progress/stream/"
+    ),
+    "solve-results": lambda d: f"/solver-runs/{d['run'].pk}/results/",
+    "solve-cancel": lambda d: f"/solver-runs/{d['run'].pk}/cancel/",
+    "solve-validation": lambda d: f"/solver-runs/{d['run'].pk}/validation/",
+    "solve-repair": lambda d: f"/solver-runs/{d['run'].pk}/repair/",
+    "solve-alternatives": lambda d: f"/solver-runs/{d['run'].pk}/alternatives/",
+    "schedule-view": lambda d: f"/solver-runs/{d['run'].pk}/schedule/",
+    "schedule-events": lambda d: (
+        f"/solver-runs/{d['run'].pk}/schedule/events/"
+        "?start=2026-03-01&end=2026-04-01"
+    ),
+    "chart-page": lambda d: f"/solver-runs/{d['run'].pk}/charts/",
+    "chart-download": lambda d: f"/solver-runs/{d['run'].pk}/charts/download/",
+    "chart-download-single": lambda d: (
+        f"/solver-runs/{d['run'].pk}/charts/download/heatmap/"
+    ),
+    "chart-view": lambda d: f"/solver-runs/{d['run'].pk}/charts/heatmap/",
+    "import-page": lambda _d: "/import/",
+    "import-upload": lambda _d: "/import/upload/",
+    "import-confirm": lambda _d: "/import/confirm/",
+    "export-page": lambda d: f"/solver-runs/{d['run'].pk}/export/",
+    "export-download": lambda d: f"/solver-runs/{d['run'].pk}/export/json/",
+}
+
+
+def _add_data(data: dict[str, Any], num_workers: int, num_days: int) -> None:
+    """Add workers, shift types, requests and assignments to the dataset."""
+    request: ScheduleRequest = data["request"]
+    run: SolverRun = data["run"]
+    start = datetime.date(2026, 3, 2)
+    offset = Worker.objects.count()
+
+    shift = ShiftType.objects.create(
+        shift_type_id=f"S{offset}",
+        name=f"Shift {offset}",
+        category=f"cat{offset % 2}",
+        start_time=datetime.time(7, 0),
+        duration_hours=8.0,
+    )
+    request.shift_types.add(shift)
+
+    for i in range(num_workers):
+        worker = Worker.objects.create(
+            worker_id=f"W{offset + i:04d}", name=f"Worker {offset + i}"
+        )
+        request.workers.add(worker)
+        WorkerRequest.objects.create(
+            schedule_request=request,
+            worker=worker,
+            shift_type=shift,
+            start_date=start,
+            end_date=start,
+        )
+        for day in range(num_days):
+            date = start + datetime.timedelta(days=day)
+            Availability.objects.create(worker=worker, date=date, is_available=False)
+            Assignment.objects.create(
+                solver_run=run, worker=worker, shift_type=shift, date=date
+            )
+
+    ScheduleRequest.objects.create(
+        name=f"Other {offset}",
+        start_date=start,
+        end_date=start + datetime.timedelta(days=6),
+    )
+    data.setdefault("worker", Worker.objects.order_by("pk").first())
+    data.setdefault("shift", shift)
+    data.setdefault(
+        "worker_request", WorkerRequest.objects.order_by("pk").first()
+    )
+
+
+@pytest.fixture
+def dataset() -> dict[str, Any]:
+    """Create a small, fully linked dataset with a completed solver run."""
+    request = ScheduleRequest.objects.create(
+        name="Audit",
+        start_date=datetime.date(2026, 3, 2),
+        end_date=datetime.date(2026, 3, 15),
+    )
+    SolverSettings.objects.create(schedule_request=request)
+    run = SolverRun.objects.create(
+        schedule_request=request,
+        status="completed",
+        progress_percent=100,
+        result_json={"status": "OPTIMAL"},
+    )
+    constraint = ConstraintConfig.objects.create(constraint_type="coverage")
+    data: dict[str, Any] = {"request": request, "run": run, "constraint": constraint}
+    _add_data(data, num_workers=2, num_days=3)
+    return data
+
+
+def _run_view(client: Client, path: str) -> list[dict[str, str]]:
+    """Request a view and return the captured queries."""
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(path)
+        if response.streaming:
+            b"".join(response.streaming_content)
+    assert response.status_code < 500, f"{path} returned {response.status_code}"
+    return list(ctx.captured_queries)
+
+
+def _full_scans(queries: list[dict[str, str]]) -> list[str]:
+    """Return EXPLAIN QUERY PLAN details that scan a large table."""
+    scans = []
+    with connection.cursor() as cursor:
+        for query in queries:
+            sql = query["sql"]
+            if not sql.lstrip().upper().startswith("SELECT"):
+                continue
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            for row in cursor.fetchall():
+                detail = str(row[-1])
+                match = _SCAN_RE.match(detail)
+                if match and match.group(1) in LARGE_TABLES:
+                    scans.append(f"{detail} :: {sql[:200]}")
+    return scans
+
+
+class TestQueryPlanAudit:
+    """Guards against N+1 queries and full scans in core views."""
+
+    def test_every_url_is_audited(self) -> None:
+        """Each named URL in core/urls.py has an audit case."""
+        names = {p.name for p in core_urls.urlpatterns}
+        assert names == set(VIEW_CASES)
+
+    @pytest.mark.parametrize("url_name", sorted(VIEW_CASES))
+    def test_query_count_does_not_grow(
+        self, client: Client, dataset: dict[str, Any], url_name: str
+    ) -> None:
+        """Query count is independent of the number of rows."""
+        path = VIEW_CASES[url_name](dataset)
+        small = _run_view(client, path)
+
+        _add_data(dataset, num_workers=6, num_days=5)
+        large = _run_view(client, path)
+
+        assert len(large) == len(small), (
+            f"{url_name}: {len(small)} queries grew to {len(large)}"
+        )
+
+    @pytest.mark.parametrize("url_name", sorted(VIEW_CASES))
+    def test_no_full_scans_of_large_tables(
+        self, client: Client, dataset: dict[str, Any], url_name: str
+    ) -> None:
+        """No captured query performs a full scan of a large table."""
+        path = VIEW_CASES[url_name](dataset)
+        scans = _full_scans(_run_view(client, path))
+        assert not scans, f"{url_name} full scans:\n" + "\n".join(scans)
@@ -178,3 +178,87 @@ class TestScheduleEventsEndpoint:
         for event in data:
             assert "color" in event
             assert event["color"].startswith("#")
+
+
+class TestScheduleEventsWindowing:
+    """Tests for range-windowed, paginated and cached schedule events."""
+
+    def test_events_honor_visible_range(self, client: Client) -> None:
+        """Only assignments within [start, end) are returned."""
+        run, _, _ = _make_completed_run()
+        response = client.get(
+            f"/solver-runs/{run.pk}/schedule/events/"
+            "?start=2026-03-02T00:00:00Z&end=2026-03-09T00:00:00Z"
+        )
+        data = response.json()
+        assert len(data) == 2
+        assert all(e["start"].startswith("2026-03-02") for e in data)
+
+    def test_range_end_is_exclusive(self, client: Client) -> None:
+        """The end boundary follows FullCalendar's exclusive semantics."""
+        run, _, _ = _make_completed_run()
+        response = client.get(
+            f"/solver-runs/{run.pk}/schedule/events/?start=2026-03-01&end=2026-03-02"
+        )
+        assert len(response.json()) == 2
+
+    def test_invalid_range_returns_400(self, client: Client) -> None:
+        """Malformed range parameters are rejected."""
+        run, _, _ = _make_completed_run()
+        response = client.get(
+            f"/solver-runs/{run.pk}/schedule/events/?start=not-a-date"
+        )
+        assert response.status_code == 400
+
+    def test_pagination_with_limit_and_offset(self, client: Client) -> None:
+        """Pages are stable and the next offset is advertised."""
+        run, _, _ = _make_completed_run()
+        url = f"/solver-runs/{run.pk}/schedule/events/"
+        first = client.get(f"{url}?limit=3")
+        assert len(first.json()) == 3
+        assert first["X-Next-Offset"] == "3"
+
+        second = client.get(f"{url}?limit=3&offset=3")
+        assert len(second.json()) == 1
+        assert "X-Next-Offset" not in second
+
+    def test_compact_format_deduplicates_lookups(self, client: Client) -> None:
+        """Compact payload carries worker/shift lookup tables and tuple rows."""
+        run, workers, shifts = _make_completed_run()
+        response = client.get(
+            f"/solver-runs/{run.pk}/schedule/events/?format=compact"
+        )
+        data = response.json()
+        assert len(data["events"]) == 4
+        assert set(data["workers"]) == {str(w.pk) for w in workers}
+        assert set(data["shift_types"]) == {str(s.pk) for s in shifts}
+        assert data["shift_types"][str(shifts[0].pk)]["start_time"] == "07:00"
+        assert data["events"][0] == [workers[0].pk, shifts[0].pk, "2026-03-01"]
+        assert data["next_offset"] is None
+
+    def test_completed_run_supports_etag(self, client: Client) -> None:
+        """Completed runs return an ETag and honor If-None-Match."""
+        run, _, _ = _make_completed_run()
+        url = f"/solver-runs/{run.pk}/schedule/events/"
+        response = client.get(url)
+        etag = response["ETag"]
+        assert etag
+
+        cached = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert cached.status_code == 304
+
+    def test_etag_varies_with_query(self, client: Client) -> None:
+        """Different ranges produce different ETags."""
+        run, _, _ = _make_completed_run()
+        url = f"/solver-runs/{run.pk}/schedule/events/"
+        a = client.get(f"{url}?start=2026-03-01&end=2026-03-02")["ETag"]
+        b = client.get(f"{url}?start=2026-03-02&end=2026-03-03")["ETag"]
+        assert a != b
+
+    def test_running_run_has_no_etag(self, client: Client) -> None:
+        """Runs that may still change are not cached."""
+        run, _, _ = _make_completed_run()
+        run.status = "running"
+        run.save()
+        response = client.get(f"/solver-runs/{run.pk}/schedule/events/")
+        assert "ETag" not in response
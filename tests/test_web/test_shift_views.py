@@ -281,6 +281,34 @@ class TestShiftTypeFormNewFields:
         assert response.status_code == 200  # re-rendered form with errors
         assert ShiftType.objects.count() == 0
 
+    @pytest.mark.parametrize(
+        ("min_workers", "max_workers", "field"),
+        [
+            ("-1", "", "min_workers"),
+            ("1", "0", "max_workers"),
+            ("3", "2", "min_workers"),
+        ],
+    )
+    def test_rejects_invalid_staffing_range(
+        self, client: Client, min_workers: str, max_workers: str, field: str
+    ) -> None:
+        """Staffing ranges the solver's ShiftType rejects are form errors."""
+        data = {
+            "shift_type_id": "DAY",
+            "name": "Day Shift",
+            "start_time": "07:00",
+            "duration_hours": "8.0",
+            "min_workers": min_workers,
+            "max_workers": max_workers,
+            "workers_required": "1",
+            "is_active": "on",
+            "required_attributes": "{}",
+        }
+        response = client.post("/shifts/create/", data)
+        assert response.status_code == 200  # re-rendered form with errors
+        assert field in response.context["form"].errors
+        assert ShiftType.objects.count() == 0
+
     def test_update_preserves_applicable_days(self, client: Client) -> None:
         """Checkboxes are pre-checked on edit for existing applicable_days."""
         shift = ShiftType.objects.create(
@@ -154,6 +154,62 @@ class TestSolverRunner:
         assert "solve_time_seconds" in run.result_json
         assert "assignment_count" in run.result_json
 
+    def test_solver_run_stores_search_timeline(self, setup_solver_data):
+        """The parsed CP-SAT search log is kept with the result."""
+        from core.solver_runner import SolverRunner
+
+        run = setup_solver_data
+        runner = SolverRunner(solver_run_id=run.id)
+        runner._execute()
+
+        run.refresh_from_db()
+        timeline = run.result_json["search_timeline"]
+        assert timeline["status"] == run.result_json["status"]
+        assert timeline["presolve_seconds"] is not None
+        assert timeline["events"]
+
+    def test_solver_run_stores_search_statistics(self, setup_solver_data):
+        """CP-SAT's deterministic time and search counters are kept."""
+        from core.solver_runner import SolverRunner
+
+        run = setup_solver_data
+        runner = SolverRunner(solver_run_id=run.id)
+        runner._execute()
+
+        run.refresh_from_db()
+        search = run.result_json["cp_sat"]
+        assert search["deterministic_time"] >= 0
+        assert search["branches"] >= 0
+
+    def test_solver_run_records_core_allocation(self, setup_solver_data):
+        """The run leases its cores and releases them when done."""
+        from core.solver_runner import SolverRunner
+        from shift_solver.solver.core_allocator import CoreAllocator
+
+        run = setup_solver_data
+        allocator = CoreAllocator(total_cores=2)
+        with patch.object(CoreAllocator, "_shared", allocator):
+            SolverRunner(solver_run_id=run.id)._execute()
+
+        run.refresh_from_db()
+        assert run.result_json["cores"] == {"segments": [2], "restarts": 0}
+        assert allocator.allocation() == []
+
+    def test_solver_run_reports_write_throughput(self, setup_solver_data):
+        """result_json records assignment persistence rows/sec."""
+        from core.solver_runner import SolverRunner
+
+        run = setup_solver_data
+        runner = SolverRunner(solver_run_id=run.id)
+        runner._execute()
+
+        run.refresh_from_db()
+        assert "persist_time_seconds" in run.result_json
+        assert "persist_rows_per_second" in run.result_json
+        assert run.result_json["assignment_count"] == Assignment.objects.filter(
+            solver_run=run
+        ).count()
+
     def test_solver_runner_starts_background_thread(self, setup_solver_data):
         """SolverRunner.run() starts execution in a background thread."""
         from core.solver_runner import SolverRunner
@@ -205,8 +261,12 @@ class TestSolverRunner:
             assert avail_list[0].worker_id == "W001"
 
     def test_solver_runner_passes_all_settings(self, setup_solver_data):
-        """All SolverSettings fields are forwarded to solver.solve()."""
+        """All SolverSettings fields are forwarded to solver.solve().
+
+        num_search_workers caps the run's share of the core budget.
+        """
         from core.solver_runner import SolverRunner
+        from shift_solver.solver.core_allocator import CoreAllocator
 
         run = setup_solver_data
         settings = SolverSettings.objects.get(schedule_request=run.schedule_request)
@@ -220,7 +280,9 @@ class TestSolverRunner:
             return_value=None,
         ), patch(
             "shift_solver.solver.shift_solver.ShiftSolver.solve",
-        ) as mock_solve:
+        ) as mock_solve, patch.object(
+            CoreAllocator, "_shared", CoreAllocator(total_cores=16)
+        ):
             from shift_solver.solver.result import SolverResult
 
             mock_solve.return_value = SolverResult(
@@ -236,6 +298,39 @@ class TestSolverRunner:
             assert call_kwargs.kwargs.get("log_search_progress") is False
 
 
+    def test_alternatives_run_stops_when_cancelled(self, setup_solver_data):
+        """A cancelled alternatives run keeps its schedule and adds no runs."""
+        from core.solver_runner import SolverRunner
+
+        run = setup_solver_data
+        source = SolverRun.objects.create(
+            schedule_request=run.schedule_request, status="completed"
+        )
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        SolverRunner(
+            solver_run_id=run.id, action="alternatives", source_run_id=source.id
+        )._execute(cancel_event)
+
+        run.refresh_from_db()
+        source.refresh_from_db()
+        assert run.status == "cancelled"
+        assert run.result_json["status"] == "CANCELLED_WITH_SOLUTION"
+        assert run.result_json["alternative"]["source_run"] == source.id
+        assert source.result_json is None
+        assert SolverRun.objects.count() == 2
+
+    def test_rejects_unknown_action(self):
+        """Actions other than solve need a source run and must be known."""
+        from core.solver_runner import SolverRunner
+
+        with pytest.raises(ValueError, match="Unknown"):
+            SolverRunner(solver_run_id=1, action="optimize")
+        with pytest.raises(ValueError, match="source_run_id"):
+            SolverRunner(solver_run_id=1, action="repair")
+
+
 class TestSolverRunnerCancel:
     """Tests for SolverRunner cancel registry."""
 
@@ -8,6 +8,7 @@ from django.test import Client
 
 from core.models import (
     Assignment,
+    Availability,
     ScheduleRequest,
     ShiftType,
     SolverRun,
@@ -232,6 +233,72 @@ class TestSolveProgressView:
         assert "Cancel Solve" in content
 
 
+class TestSolveProgressStream:
+    """Tests for the Server-Sent Events progress stream."""
+
+    def test_stream_headers(self, client: Client) -> None:
+        """Stream is served as uncached text/event-stream."""
+        req = _make_request()
+        run = SolverRun.objects.create(schedule_request=req, status="completed")
+
+        response = client.get(f"/solver-runs/{run.pk}/progress/stream/")
+
+        assert response.streaming
+        assert response["Content-Type"] == "text/event-stream"
+        assert response["Cache-Control"] == "no-cache"
+
+    def test_completed_run_sends_progress_then_done(self, client: Client) -> None:
+        """A finished run yields its progress snapshot and a done event."""
+        req = _make_request()
+        run = SolverRun.objects.create(
+            schedule_request=req, status="completed", progress_percent=100
+        )
+
+        response = client.get(f"/solver-runs/{run.pk}/progress/stream/")
+        body = b"".join(response.streaming_content).decode()
+
+        assert body.startswith("event: progress\ndata: ")
+        assert body.endswith("event: done\ndata: \n\n")
+
+    def test_running_run_streams_published_updates(self, client: Client) -> None:
+        """Bus updates are pushed until the run finishes."""
+        from core.progress_bus import ProgressBus
+
+        req = _make_request()
+        run = SolverRun.objects.create(
+            schedule_request=req,
+            status="running",
+            progress_json={"phase": "preparing"},
+        )
+
+        response = client.get(f"/solver-runs/{run.pk}/progress/stream/")
+        events = iter(response.streaming_content)
+        assert "1.5%" not in next(events).decode()
+
+        ProgressBus.publish(
+            run.pk,
+            {"phase": "solving", "solutions_found": 7, "gap_percent": 1.5},
+        )
+        update = next(events).decode()
+        assert update.startswith("event: progress")
+        assert "1.5%" in update
+
+        SolverRun.objects.filter(pk=run.pk).update(status="completed")
+        ProgressBus.discard(run.pk)
+        rest = b"".join(events).decode()
+        assert rest.endswith("event: done\ndata: \n\n")
+
+    def test_progress_page_connects_to_stream(self, client: Client) -> None:
+        """Progress page subscribes to the stream instead of polling."""
+        req = _make_request()
+        run = SolverRun.objects.create(schedule_request=req, status="running")
+
+        content = client.get(f"/solver-runs/{run.pk}/progress/").content.decode()
+
+        assert f"/solver-runs/{run.pk}/progress/stream/" in content
+        assert "every 2s" not in content
+
+
 class TestSolveCancelView:
     """Tests for the solve cancel view."""
 
@@ -273,6 +340,183 @@ class TestSolveCancelView:
         assert "not found" in run.error_message.lower()
 
 
+class TestSolveRepairView:
+    """Tests for the minimal-change repair action."""
+
+    @pytest.fixture(autouse=True)
+    def _run_synchronously(self, monkeypatch):
+        """Execute the background run in the test's thread."""
+        monkeypatch.setattr(
+            "core.solver_runner.SolverRunner.run", lambda self: self._execute()
+        )
+
+    def _published_run(self) -> tuple[SolverRun, list[Worker]]:
+        """Create a completed two-week run with one day shift per week."""
+        req = _make_request(
+            start_date=datetime.date(2026, 3, 2),
+            end_date=datetime.date(2026, 3, 15),
+        )
+        SolverSettings.objects.create(schedule_request=req, time_limit_seconds=10)
+        shift = _make_shift_type(workers_required=1)
+        workers = [
+            _make_worker(worker_id=f"W{i}", name=f"Worker {i}") for i in range(1, 4)
+        ]
+        req.workers.add(*workers)
+        req.shift_types.add(shift)
+        run = SolverRun.objects.create(
+            schedule_request=req, status="completed", result_json={"status": "OPTIMAL"}
+        )
+        for worker, day in ((workers[0], 2), (workers[1], 9)):
+            Assignment.objects.create(
+                solver_run=run,
+                worker=worker,
+                shift_type=shift,
+                date=datetime.date(2026, 3, day),
+            )
+        return run, workers
+
+    def test_repair_requires_post(self, client: Client) -> None:
+        """Repair endpoint rejects GET requests."""
+        run, _ = self._published_run()
+
+        response = client.get(f"/solver-runs/{run.pk}/repair/")
+
+        assert response.status_code == 405
+
+    def test_repair_redirects_non_completed(self, client: Client) -> None:
+        """Only completed runs can be repaired."""
+        req = _make_request()
+        run = SolverRun.objects.create(schedule_request=req, status="running")
+
+        response = client.post(f"/solver-runs/{run.pk}/repair/")
+
+        assert response.status_code == 302
+        assert f"/solver-runs/{run.pk}/results/" in response["Location"]
+        assert SolverRun.objects.count() == 1
+
+    def test_repair_creates_minimally_changed_run(self, client: Client) -> None:
+        """An absent worker is replaced; the unaffected week is kept."""
+        run, workers = self._published_run()
+        for day in range(2, 9):
+            Availability.objects.create(
+                worker=workers[0],
+                date=datetime.date(2026, 3, day),
+                is_available=False,
+            )
+
+        response = client.post(f"/solver-runs/{run.pk}/repair/")
+
+        repaired = SolverRun.objects.exclude(pk=run.pk).get()
+        assert response.status_code == 302
+        assert f"/solver-runs/{repaired.pk}/progress/" in response["Location"]
+        assert repaired.status == "completed"
+        assert repaired.result_json["repair"] == {
+            "source_run": run.pk,
+            "affected_periods": [0],
+            "changed_assignments": 2,
+        }
+        week1 = set(
+            repaired.assignments.filter(date__lte=datetime.date(2026, 3, 8))
+            .values_list("worker__worker_id", flat=True)
+        )
+        week2 = set(
+            repaired.assignments.filter(date__gte=datetime.date(2026, 3, 9))
+            .values_list("worker__worker_id", flat=True)
+        )
+        assert "W1" not in week1 and len(week1) == 1
+        assert week2 == {"W2"}
+
+        results = client.get(f"/solver-runs/{repaired.pk}/results/")
+        assert f"Run #{run.pk}" in results.content.decode()
+
+    def test_repair_without_conflicts_creates_no_run(self, client: Client) -> None:
+        """A schedule that still fits availability is not re-solved."""
+        run, _ = self._published_run()
+
+        response = client.post(f"/solver-runs/{run.pk}/repair/")
+
+        assert response.status_code == 302
+        assert response["Location"].endswith(
+            f"/solver-runs/{run.pk}/results/?repair=unchanged"
+        )
+        assert SolverRun.objects.count() == 1
+        results = client.get(response["Location"])
+        assert "Nothing To Repair" in results.content.decode()
+
+
+class TestSolveAlternativesView:
+    """Tests for the alternative schedules action."""
+
+    @pytest.fixture(autouse=True)
+    def _run_synchronously(self, monkeypatch):
+        """Execute the background run in the test's thread."""
+        monkeypatch.setattr(
+            "core.solver_runner.SolverRunner.run", lambda self: self._execute()
+        )
+
+    def _completed_run(self) -> SolverRun:
+        """Create a completed two-week run with three workers."""
+        req = _make_request(
+            start_date=datetime.date(2026, 3, 2),
+            end_date=datetime.date(2026, 3, 15),
+        )
+        SolverSettings.objects.create(schedule_request=req, time_limit_seconds=10)
+        req.workers.add(
+            *(_make_worker(worker_id=f"W{i}", name=f"Worker {i}") for i in range(1, 4))
+        )
+        req.shift_types.add(_make_shift_type(workers_required=1))
+        return SolverRun.objects.create(
+            schedule_request=req, status="completed", result_json={"status": "OPTIMAL"}
+        )
+
+    def test_alternatives_requires_post(self, client: Client) -> None:
+        """Alternatives endpoint rejects GET requests."""
+        run = self._completed_run()
+
+        response = client.get(f"/solver-runs/{run.pk}/alternatives/")
+
+        assert response.status_code == 405
+
+    def test_alternatives_creates_distinct_runs(self, client: Client) -> None:
+        """Each pooled schedule becomes a run listed on the source results."""
+        run = self._completed_run()
+
+        response = client.post(f"/solver-runs/{run.pk}/alternatives/")
+
+        alternatives = SolverRun.objects.exclude(pk=run.pk).order_by("pk")
+        assert response.status_code == 302
+        assert (
+            f"/solver-runs/{alternatives[0].pk}/progress/" in response["Location"]
+        )
+        run.refresh_from_db()
+        assert run.result_json == {"status": "OPTIMAL"}
+        assert [alt.result_json["alternative"]["rank"] for alt in alternatives] == [
+            1,
+            2,
+            3,
+        ]
+        assert [alt.result_json["status"] for alt in alternatives][1:] == [
+            "FEASIBLE",
+            "FEASIBLE",
+        ]
+        schedules = []
+        for alternative_run in alternatives:
+            assert alternative_run.status == "completed"
+            assert alternative_run.result_json["alternative"]["source_run"] == run.pk
+            schedules.append(
+                set(
+                    alternative_run.assignments.values_list(
+                        "worker__worker_id", "date"
+                    )
+                )
+            )
+        assert len({frozenset(schedule) for schedule in schedules}) == 3
+
+        results = client.get(f"/solver-runs/{run.pk}/results/")
+        assert "Alternatives" in results.content.decode()
+        assert f"Run #{alternatives[1].pk}" in results.content.decode()
+
+
 class TestSolveResultsView:
     """Tests for the solve results view."""
 
@@ -335,6 +579,96 @@ class TestSolveResultsView:
         content = response.content.decode()
         assert "12.5" in content
 
+    def test_results_lists_coverage_gaps(self, client: Client) -> None:
+        """Elastic coverage runs list their under- and overstaffed shifts."""
+        req = _make_request()
+        run = SolverRun.objects.create(
+            schedule_request=req,
+            status="completed",
+            progress_percent=100,
+            result_json={
+                "status": "OPTIMAL",
+                "assignment_count": 0,
+                "coverage_gaps": [
+                    {
+                        "period_index": 3,
+                        "shift_type_id": "night_icu",
+                        "shortfall": 1,
+                        "excess": 0,
+                        "min_workers": 2,
+                        "max_workers": 4,
+                    }
+                ],
+            },
+        )
+
+        response = client.get(f"/solver-runs/{run.pk}/results/")
+
+        content = response.content.decode()
+        assert "Coverage Gaps" in content
+        assert "night_icu" in content
+        assert "2&ndash;4" in content
+
+    def test_results_plots_search_progress(self, client: Client) -> None:
+        """Runs with a search timeline plot objective against bound."""
+        req = _make_request()
+        run = SolverRun.objects.create(
+            schedule_request=req,
+            status="completed",
+            progress_percent=100,
+            result_json={
+                "status": "FEASIBLE",
+                "assignment_count": 0,
+                "search_timeline": {
+                    "events": [
+                        {
+                            "time_seconds": 0.3,
+                            "kind": "solution",
+                            "objective": 640.0,
+                            "bound": 0.0,
+                            "subsolver": "rnd_var_lns",
+                        }
+                    ],
+                    "presolve_seconds": 0.25,
+                    "num_workers": 8,
+                    "solutions_by_subsolver": {"rnd_var_lns": 2},
+                    "lns": {
+                        "rnd_var_lns": {
+                            "improvements": 1,
+                            "calls": 4,
+                            "closed_percent": 25.0,
+                            "difficulty": 0.7,
+                            "success_rate": 0.25,
+                        }
+                    },
+                    "wall_time_seconds": 1.0,
+                },
+            },
+        )
+
+        response = client.get(f"/solver-runs/{run.pk}/results/")
+
+        content = response.content.decode()
+        assert "Search Progress" in content
+        assert "Presolve 0.25s" in content
+        assert "Objective and Bound Over Time" in content
+        assert "1 / 4" in content
+        assert "25%" in content
+
+    def test_results_without_search_timeline(self, client: Client) -> None:
+        """Runs stored before timelines existed show no progress section."""
+        req = _make_request()
+        run = SolverRun.objects.create(
+            schedule_request=req,
+            status="completed",
+            progress_percent=100,
+            result_json={"status": "OPTIMAL", "assignment_count": 0},
+        )
+
+        response = client.get(f"/solver-runs/{run.pk}/results/")
+
+        assert "Search Progress" not in response.content.decode()
+
     def test_failed_run_shows_error(self, client: Client) -> None:
         """Results page for failed run shows error message."""
         req = _make_request()
@@ -350,6 +684,31 @@ class TestSolveResultsView:
         content = response.content.decode()
         assert "Solver infeasible" in content
 
+    def test_failed_run_lists_conflicting_constraints(self, client: Client) -> None:
+        """Results page lists the infeasibility core of a failed run."""
+        req = _make_request()
+        run = SolverRun.objects.create(
+            schedule_request=req,
+            status="failed",
+            error_message="Solver status: INFEASIBLE",
+            result_json={
+                "status": "INFEASIBLE",
+                "feasibility_issues": [
+                    {
+                        "type": "restriction",
+                        "message": "Worker 'W1' is restricted from shift 'day'",
+                        "severity": "error",
+                    }
+                ],
+            },
+        )
+
+        response = client.get(f"/solver-runs/{run.pk}/results/")
+
+        content = response.content.decode()
+        assert "Conflicting constraints" in content
+        assert "restricted from shift" in content
+
     def test_cancelled_run_shows_banner(self, client: Client) -> None:
         """Results page shows cancelled banner for cancelled run."""
         req = _make_request()
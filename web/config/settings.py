@@ -82,3 +82,14 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Rows per INSERT batch when persisting solver assignments
+SOLVER_ASSIGNMENT_BATCH_SIZE = int(
+    os.environ.get("SOLVER_ASSIGNMENT_BATCH_SIZE", "1000")
+)
+
+# Seconds between solver progress checkpoints written to the database;
+# live progress is pushed over Server-Sent Events in between
+SOLVER_PROGRESS_CHECKPOINT_SECONDS = float(
+    os.environ.get("SOLVER_PROGRESS_CHECKPOINT_SECONDS", "10")
+)
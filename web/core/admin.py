@@ -13,6 +13,8 @@ from core.models import (
     Worker,
     WorkerRequest,
 )
+from core.solver_runner import core_lease_name
+from shift_solver.solver.core_allocator import CoreAllocator
 
 
 @admin.register(Worker)
@@ -60,8 +62,25 @@ class ScheduleRequestAdmin(ModelAdmin):  # type: ignore[type-arg]
 
 @admin.register(SolverRun)
 class SolverRunAdmin(ModelAdmin):  # type: ignore[type-arg]
-    list_display = ["id", "schedule_request", "status", "progress_percent", "started_at"]
+    list_display = [
+        "id", "schedule_request", "status", "progress_percent", "started_at",
+        "allocated_cores",
+    ]
     list_filter = ["status"]
+    readonly_fields = ["allocated_cores"]
+
+    @admin.display(description="Cores")
+    def allocated_cores(self, obj: SolverRun) -> str:
+        """Search workers of a running solve out of the server's core budget."""
+        allocator = CoreAllocator.shared()
+        name = core_lease_name(obj.pk)
+        for lease in allocator.allocation():
+            if lease["name"] == name:
+                cores = f"{lease['cores']}/{allocator.total_cores}"
+                if lease["target"] != lease["cores"]:
+                    cores += f" (resizing to {lease['target']})"
+                return cores
+        return "-"
 
 
 @admin.register(WorkerRequest)
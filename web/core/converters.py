@@ -1,9 +1,14 @@
 """Conversion layer between Django ORM models and domain dataclasses."""
 
+import contextlib
+import time as time_module
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import timedelta
 from typing import Any
 
+from django.db import connection, transaction
+
 from core import models as orm
 from shift_solver.constraints.base import ConstraintConfig as DomainConstraintConfig
 from shift_solver.models import ShiftType as DomainShiftType
@@ -13,6 +18,8 @@ from shift_solver.models.data_models import SchedulingRequest
 from shift_solver.models.schedule import PeriodAssignment, Schedule
 from shift_solver.models.shift import ShiftInstance
 
+DEFAULT_ASSIGNMENT_BATCH_SIZE = 1000
+
 
 def orm_worker_to_domain(orm_worker: orm.Worker) -> DomainWorker:
     """Convert Django Worker ORM instance to domain Worker dataclass."""
@@ -54,6 +61,7 @@ def orm_shift_type_to_domain(orm_shift: orm.ShiftType) -> DomainShiftType:
     if orm_shift.applicable_days is not None:
         applicable_days = frozenset(orm_shift.applicable_days)
 
+    min_workers, max_workers = _staffing_bounds(orm_shift)
     return DomainShiftType(
         id=str(orm_shift.shift_type_id),
         name=str(orm_shift.name),
@@ -65,9 +73,26 @@ def orm_shift_type_to_domain(orm_shift: orm.ShiftType) -> DomainShiftType:
         workers_required=int(str(orm_shift.workers_required)),
         required_attributes=dict(orm_shift.required_attributes or {}),
         applicable_days=applicable_days,
+        min_workers=min_workers,
+        max_workers=max_workers,
     )
 
 
+def _staffing_bounds(orm_shift: orm.ShiftType) -> tuple[int, int | None]:
+    """Read a shift's staffing range, repairing rows the domain would reject.
+
+    Rows saved before ShiftTypeForm validated the range may have a
+    max_workers below 1 (treated as unset) or a min_workers that is
+    negative or above max_workers (clamped into range).
+    """
+    min_workers = max(0, int(str(orm_shift.min_workers)))
+    max_workers = None
+    if orm_shift.max_workers is not None and int(str(orm_shift.max_workers)) >= 1:
+        max_workers = int(str(orm_shift.max_workers))
+        min_workers = min(min_workers, max_workers)
+    return min_workers, max_workers
+
+
 def domain_shift_type_to_orm(domain_shift: DomainShiftType) -> orm.ShiftType:
     """Convert domain ShiftType dataclass to unsaved Django ShiftType ORM instance."""
     applicable_days = None
@@ -84,6 +109,8 @@ def domain_shift_type_to_orm(domain_shift: DomainShiftType) -> orm.ShiftType:
         workers_required=domain_shift.workers_required,
         required_attributes=domain_shift.required_attributes,
         applicable_days=applicable_days,
+        min_workers=domain_shift.staffing_range[0],
+        max_workers=domain_shift.max_workers,
     )
 
 
@@ -226,14 +253,28 @@ def solver_result_to_assignments(
 ) -> list[orm.Assignment]:
     """Convert solver Schedule result to Django Assignment ORM instances.
 
-    Returns unsaved Assignment instances (caller should bulk_create them).
+    Only the workers and shift types referenced by the schedule are loaded.
+    Returns unsaved Assignment instances (see write_solver_result_assignments
+    for the batched, transactional write path).
     """
+    # Collect the IDs actually referenced by the schedule
+    worker_ids: set[str] = set()
+    shift_type_ids: set[str] = set()
+    for period in schedule.periods:
+        for worker_id, shift_instances in period.assignments.items():
+            if shift_instances:
+                worker_ids.add(worker_id)
+            for shift_instance in shift_instances:
+                shift_type_ids.add(shift_instance.shift_type_id)
+
     # Build lookup maps for ORM instances
     worker_map = {
-        str(w.worker_id): w for w in orm.Worker.objects.all()
+        str(w.worker_id): w
+        for w in orm.Worker.objects.filter(worker_id__in=worker_ids)
     }
     shift_map = {
-        str(s.shift_type_id): s for s in orm.ShiftType.objects.all()
+        str(s.shift_type_id): s
+        for s in orm.ShiftType.objects.filter(shift_type_id__in=shift_type_ids)
     }
 
     assignments = []
@@ -258,6 +299,68 @@ def solver_result_to_assignments(
     return assignments
 
 
+@contextlib.contextmanager
+def _sqlite_bulk_write_pragmas() -> Iterator[None]:
+    """Switch SQLite to WAL with synchronous=NORMAL for the duration of a write.
+
+    journal_mode cannot be changed inside a transaction, so this is a no-op
+    when already in an atomic block (e.g. under test transactions) or when
+    the backend is not SQLite. WAL is persistent and left enabled; the
+    previous synchronous level is restored on exit.
+    """
+    if connection.vendor != "sqlite" or connection.in_atomic_block:
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous")
+        previous_synchronous = cursor.fetchone()[0]
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA synchronous={int(previous_synchronous)}")
+
+
+def write_solver_result_assignments(
+    solver_run: orm.SolverRun,
+    schedule: Schedule,
+    batch_size: int = DEFAULT_ASSIGNMENT_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Persist a solver Schedule as Assignment rows in a single transaction.
+
+    Rows are inserted in chunks of ``batch_size``. On SQLite the write runs
+    with WAL journaling and synchronous=NORMAL.
+
+    Returns a dict with assignment_count, persist_time_seconds and
+    persist_rows_per_second, suitable for merging into result_json.
+
+    Raises:
+        ValueError: If batch_size is not positive
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    start = time_module.perf_counter()
+    assignments = solver_result_to_assignments(solver_run, schedule)
+    with _sqlite_bulk_write_pragmas(), transaction.atomic():
+        for offset in range(0, len(assignments), batch_size):
+            orm.Assignment.objects.bulk_create(
+                assignments[offset : offset + batch_size]
+            )
+    elapsed = time_module.perf_counter() - start
+
+    return {
+        "assignment_count": len(assignments),
+        "persist_time_seconds": round(elapsed, 4),
+        "persist_rows_per_second": (
+            round(len(assignments) / elapsed, 1) if elapsed > 0 else None
+        ),
+    }
+
+
 def solver_run_to_schedule(solver_run: orm.SolverRun) -> Schedule:
     """Reconstruct a domain Schedule from a completed SolverRun's assignments.
 
@@ -323,7 +323,7 @@ class ShiftTypeForm(forms.ModelForm):
             "max_workers": forms.NumberInput(
                 attrs={
                     "class": CSS_INPUT,
-                    "min": "0",
+                    "min": "1",
                 }
             ),
             "workers_required": forms.NumberInput(
@@ -373,6 +373,25 @@ class ShiftTypeForm(forms.ModelForm):
             raise forms.ValidationError("Must be a JSON object.")
         return parsed
 
+    def clean(self) -> dict:
+        """Validate that the staffing range is one the solver accepts."""
+        cleaned_data = super().clean()
+        min_workers = cleaned_data.get("min_workers")
+        max_workers = cleaned_data.get("max_workers")
+        if min_workers is not None and min_workers < 0:
+            self.add_error("min_workers", "Min workers cannot be negative.")
+        if max_workers is not None and max_workers < 1:
+            self.add_error("max_workers", "Max workers must be at least 1.")
+        elif (
+            min_workers is not None
+            and max_workers is not None
+            and min_workers > max_workers
+        ):
+            self.add_error(
+                "min_workers", "Min workers cannot exceed max workers."
+            )
+        return cleaned_data
+
 
 class ScheduleRequestForm(forms.ModelForm):
     """ModelForm for creating and editing ScheduleRequest instances."""
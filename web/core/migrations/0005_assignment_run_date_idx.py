@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_solverrun_progress_json_cancelled'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['solver_run', 'date'], name='assignment_run_date_idx'),
+        ),
+    ]
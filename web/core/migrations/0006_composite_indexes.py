@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_assignment_run_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['worker', 'date'], name='assignment_worker_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='availability',
+            index=models.Index(fields=['worker', 'date'], name='availability_worker_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workerrequest',
+            index=models.Index(fields=['schedule_request', 'created_at'], name='workerreq_sched_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workerrequest',
+            index=models.Index(fields=['worker', 'start_date'], name='workerreq_worker_date_idx'),
+        ),
+    ]
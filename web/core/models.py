@@ -66,6 +66,11 @@ class Availability(models.Model):
 
     class Meta:
         ordering = ["date"]
+        indexes = [
+            models.Index(
+                fields=["worker", "date"], name="availability_worker_date_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         status = "Available" if self.is_available else "Unavailable"
@@ -145,6 +150,15 @@ class WorkerRequest(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["schedule_request", "created_at"],
+                name="workerreq_sched_created_idx",
+            ),
+            models.Index(
+                fields=["worker", "start_date"], name="workerreq_worker_date_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.worker} - {self.shift_type} ({self.request_type})"
@@ -209,6 +223,14 @@ class Assignment(models.Model):
 
     class Meta:
         ordering = ["date", "worker"]
+        indexes = [
+            models.Index(
+                fields=["solver_run", "date"], name="assignment_run_date_idx"
+            ),
+            models.Index(
+                fields=["worker", "date"], name="assignment_worker_date_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.worker} - {self.shift_type} on {self.date}"
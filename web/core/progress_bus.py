@@ -0,0 +1,63 @@
+"""In-process publish/subscribe channel for live solver progress."""
+
+import threading
+from typing import Any
+
+
+class ProgressBus:
+    """Conflating pub/sub channel keyed by solver run id.
+
+    The solver thread publishes progress dicts; subscribers (SSE streams)
+    wait for a version newer than the last one they saw and receive only
+    the latest state, so slow readers never build up a backlog.
+
+    Usage:
+        ProgressBus.publish(run_id, {"phase": "solving", ...})
+        update = ProgressBus.wait_for_update(run_id, after_version=0, timeout=15)
+        if update is not None:
+            version, data = update
+    """
+
+    _latest: dict[int, tuple[int, dict[str, Any]]] = {}
+    _version = 0
+    _condition = threading.Condition()
+
+    @classmethod
+    def publish(cls, run_id: int, data: dict[str, Any]) -> None:
+        """Publish the latest progress for a run and wake subscribers."""
+        with cls._condition:
+            cls._version += 1
+            cls._latest[run_id] = (cls._version, dict(data))
+            cls._condition.notify_all()
+
+    @classmethod
+    def latest(cls, run_id: int) -> tuple[int, dict[str, Any]] | None:
+        """Return (version, data) of the most recent publish, if any."""
+        with cls._condition:
+            return cls._latest.get(run_id)
+
+    @classmethod
+    def wait_for_update(
+        cls, run_id: int, after_version: int, timeout: float
+    ) -> tuple[int, dict[str, Any]] | None:
+        """Block until a version newer than after_version is published.
+
+        Returns None on timeout or when the run is discarded while waiting.
+        """
+        with cls._condition:
+            cls._condition.wait_for(
+                lambda: cls._latest.get(run_id, (0, {}))[0] > after_version
+                or (after_version > 0 and run_id not in cls._latest),
+                timeout=timeout,
+            )
+            entry = cls._latest.get(run_id)
+            if entry is None or entry[0] <= after_version:
+                return None
+            return entry
+
+    @classmethod
+    def discard(cls, run_id: int) -> None:
+        """Drop a finished run's state and wake its subscribers."""
+        with cls._condition:
+            cls._latest.pop(run_id, None)
+            cls._condition.notify_all()
@@ -3,14 +3,44 @@
 import contextlib
 import logging
 import threading
+from typing import TYPE_CHECKING, Any
 
+from django.conf import settings as django_settings
 from django.utils import timezone
 
-from core.converters import build_schedule_input, solver_result_to_assignments
-from core.models import Assignment, SolverRun, SolverSettings
+from core.converters import (
+    DEFAULT_ASSIGNMENT_BATCH_SIZE,
+    build_schedule_input,
+    solver_run_to_schedule,
+    write_solver_result_assignments,
+)
+from core.models import SolverRun, SolverSettings
+from core.progress_bus import ProgressBus
+from shift_solver.solver.core_allocator import CoreAllocator
+
+if TYPE_CHECKING:
+    from shift_solver.models import Schedule
+    from shift_solver.solver.result import SolverResult
 
 logger = logging.getLogger(__name__)
 
+# Interval between progress checkpoints written to SolverRun.progress_json
+DEFAULT_PROGRESS_CHECKPOINT_SECONDS = 10.0
+
+# What a run computes: a fresh solve, a minimal-change repair of the source
+# run, or a pool of alternatives to the source run's schedule
+RUN_ACTIONS = ("solve", "repair", "alternatives")
+
+# Schedules collected by the alternatives action, and the minimum number of
+# assignments in which any two of them differ
+ALTERNATIVES_POOL_SIZE = 3
+ALTERNATIVES_MIN_DISTANCE = 4
+
+
+def core_lease_name(solver_run_id: int) -> str:
+    """Name of a solver run's lease in the shared CoreAllocator."""
+    return f"solver-run-{solver_run_id}"
+
 
 class SolverRunner:
     """Runs the CP-SAT solver in a background thread.
@@ -19,14 +49,32 @@ class SolverRunner:
         runner = SolverRunner(solver_run_id=run.id)
         runner.run()  # Non-blocking, starts background thread
 
+        # Repair a completed run into a new pending one
+        SolverRunner(new_run.id, action="repair", source_run_id=run.id).run()
+
+    With action="alternatives" the pending run receives the best pooled
+    schedule and every other pooled schedule is saved as a further run;
+    each carries result_json["alternative"] pointing at the source run.
+
     For testing, call _execute() directly (synchronous).
     """
 
     _active_runs: dict[int, threading.Event] = {}
     _lock = threading.Lock()
 
-    def __init__(self, solver_run_id: int) -> None:
+    def __init__(
+        self,
+        solver_run_id: int,
+        action: str = "solve",
+        source_run_id: int | None = None,
+    ) -> None:
+        if action not in RUN_ACTIONS:
+            raise ValueError(f"Unknown solver run action: {action}")
+        if action != "solve" and source_run_id is None:
+            raise ValueError(f"The {action} action needs a source_run_id")
         self.solver_run_id = solver_run_id
+        self.action = action
+        self.source_run_id = source_run_id
 
     def run(self) -> None:
         """Start solver in background thread."""
@@ -57,6 +105,96 @@ class SolverRunner:
         with cls._lock:
             cls._active_runs.pop(solver_run_id, None)
 
+    @staticmethod
+    def _write_assignments(
+        solver_run: SolverRun, schedule: "Schedule"
+    ) -> dict[str, Any]:
+        """Persist assignments using the configured batch size."""
+        batch_size = getattr(
+            django_settings,
+            "SOLVER_ASSIGNMENT_BATCH_SIZE",
+            DEFAULT_ASSIGNMENT_BATCH_SIZE,
+        )
+        return write_solver_result_assignments(
+            solver_run, schedule, batch_size=batch_size
+        )
+
+    def _set_phase(self, phase: str) -> None:
+        """Record a phase change in the database and on the progress bus."""
+        SolverRun.objects.filter(id=self.solver_run_id).update(
+            progress_json={"phase": phase}
+        )
+        ProgressBus.publish(self.solver_run_id, {"phase": phase})
+
+    def _source_schedule(self) -> "Schedule":
+        """The schedule of the run a repair or alternatives run starts from."""
+        return solver_run_to_schedule(SolverRun.objects.get(id=self.source_run_id))
+
+    def _action_result(
+        self, solver_run: SolverRun, result: "SolverResult"
+    ) -> dict[str, Any]:
+        """result_json entries describing a repair or alternatives run.
+
+        For alternatives, every pooled schedule after the best is saved as
+        a run of its own here; the source run is left untouched.
+        """
+        if self.action == "repair":
+            repair = result.statistics.get("repair", {})
+            return {
+                "repair": {
+                    "source_run": self.source_run_id,
+                    "affected_periods": repair.get("affected_periods", []),
+                    "changed_assignments": repair.get("changed_assignments", 0),
+                }
+            }
+        if self.action != "alternatives":
+            return {}
+
+        pooled = result.statistics.get("solution_pool", [])
+        if result.schedule is not None:
+            for rank, (schedule, stats) in enumerate(
+                zip(result.alternatives, pooled[1:], strict=True), start=2
+            ):
+                self._save_alternative(solver_run, schedule, stats, rank, result)
+        best = pooled[0] if pooled else {"distance_to_best": 0}
+        return {
+            "alternative": {
+                "source_run": self.source_run_id,
+                "rank": 1,
+                "distance_to_best": best["distance_to_best"],
+            }
+        }
+
+    def _save_alternative(
+        self,
+        solver_run: SolverRun,
+        schedule: "Schedule",
+        stats: dict[str, Any],
+        rank: int,
+        result: "SolverResult",
+    ) -> None:
+        """Save one further pooled schedule as a completed run."""
+        alternative_run = SolverRun.objects.create(
+            schedule_request=solver_run.schedule_request,
+            status="completed",
+            started_at=solver_run.started_at,
+            completed_at=timezone.now(),
+            progress_percent=100,
+        )
+        write_stats = self._write_assignments(alternative_run, schedule)
+        alternative_run.result_json = {
+            "status": stats["status"],
+            "objective_value": stats["objective"],
+            "solve_time_seconds": result.solve_time_seconds,
+            "alternative": {
+                "source_run": self.source_run_id,
+                "rank": rank,
+                "distance_to_best": stats["distance_to_best"],
+            },
+            **write_stats,
+        }
+        alternative_run.save()
+
     def _execute(self, cancel_event: threading.Event | None = None) -> None:
         """Main solver execution - can be called directly for testing."""
         from django.db import connection
@@ -70,6 +208,7 @@ class SolverRunner:
             solver_run.started_at = timezone.now()
             solver_run.progress_json = {"phase": "preparing"}
             solver_run.save()
+            ProgressBus.publish(self.solver_run_id, solver_run.progress_json)
 
             # Get solver settings
             try:
@@ -91,7 +230,14 @@ class SolverRunner:
                 schedule_id=schedule_input["schedule_id"],
                 constraint_configs=schedule_input["constraint_configs"],
                 requests=schedule_input.get("requests"),
-                availabilities=schedule_input.get("availabilities"),
+                # A repair adds the availability records itself to find
+                # the periods that conflict with them
+                availabilities=(
+                    None
+                    if self.action == "repair"
+                    else schedule_input.get("availabilities")
+                ),
+                results_only=True,
             )
 
             # Read all solver settings with defaults
@@ -114,42 +260,78 @@ class SolverRunner:
                 with contextlib.suppress(Exception):
                     SolverRun.objects.filter(id=run_id).update(progress_json=data)
 
+            def _publish(data: dict) -> None:
+                ProgressBus.publish(run_id, data)
+
+            # Live updates go through the in-process bus on every solution;
+            # the database only receives a coarse checkpoint.
             callback = SolverProgressCallback(
                 cancel_event=cancel_event,
                 on_progress=_on_progress,
+                throttle_seconds=getattr(
+                    django_settings,
+                    "SOLVER_PROGRESS_CHECKPOINT_SECONDS",
+                    DEFAULT_PROGRESS_CHECKPOINT_SECONDS,
+                ),
+                publish=_publish,
             )
 
             # Update phase to solving
-            SolverRun.objects.filter(id=self.solver_run_id).update(
-                progress_json={"phase": "solving"}
-            )
+            self._set_phase("solving")
 
-            result = solver.solve(
-                time_limit_seconds=time_limit,
-                num_workers=num_workers,
-                relative_gap_limit=optimality_tolerance,
-                log_search_progress=log_search,
-                solution_callback=callback,
-            )
+            if self.action == "solve":
+                # Search workers are this run's share of the server's cores
+                # (capped by num_search_workers) and follow it as runs come
+                # and go
+                result = solver.solve_allocated(
+                    time_limit_seconds=time_limit,
+                    name=core_lease_name(self.solver_run_id),
+                    max_cores=num_workers,
+                    relative_gap_limit=optimality_tolerance,
+                    log_search_progress=log_search,
+                    solution_callback=callback,
+                    search_timeline=True,
+                    cancel_event=cancel_event,
+                    # Show the instant greedy schedule rather than nothing
+                    # when a large instance times out before a solution
+                    greedy_fallback=True,
+                )
+            else:
+                # Multi-stage searches keep the share they started with
+                with CoreAllocator.shared().lease(
+                    core_lease_name(self.solver_run_id), max_cores=num_workers
+                ) as lease:
+                    if self.action == "repair":
+                        result = solver.repair(
+                            self._source_schedule(),
+                            schedule_input.get("availabilities") or [],
+                            time_limit_seconds=time_limit,
+                            num_workers=lease.cores,
+                            solution_callback=callback,
+                        )
+                    else:
+                        result = solver.solve_pool(
+                            size=ALTERNATIVES_POOL_SIZE,
+                            min_distance=ALTERNATIVES_MIN_DISTANCE,
+                            time_limit_seconds=time_limit,
+                            num_workers=lease.cores,
+                            cancel_event=cancel_event,
+                        )
 
             # Check if cancelled
             if cancel_event is not None and cancel_event.is_set():
                 if result.success and result.schedule:
                     # Save partial results
-                    SolverRun.objects.filter(id=self.solver_run_id).update(
-                        progress_json={"phase": "extracting"}
-                    )
-                    assignments = solver_result_to_assignments(
-                        solver_run, result.schedule
-                    )
-                    Assignment.objects.bulk_create(assignments)
+                    self._set_phase("extracting")
+                    write_stats = self._write_assignments(solver_run, result.schedule)
                     solver_run.status = "cancelled"
                     solver_run.result_json = {
                         "status": "CANCELLED_WITH_SOLUTION",
                         "objective_value": result.objective_value,
                         "solve_time_seconds": result.solve_time_seconds,
-                        "assignment_count": len(assignments),
                         "solutions_found": callback.solutions_found,
+                        **write_stats,
+                        **self._action_result(solver_run, result),
                     }
                 else:
                     solver_run.status = "cancelled"
@@ -157,25 +339,41 @@ class SolverRunner:
                         "status": "CANCELLED",
                         "solve_time_seconds": result.solve_time_seconds,
                         "solutions_found": callback.solutions_found,
+                        **self._action_result(solver_run, result),
                     }
             elif result.success and result.schedule:
-                SolverRun.objects.filter(id=self.solver_run_id).update(
-                    progress_json={"phase": "extracting"}
-                )
-                assignments = solver_result_to_assignments(
-                    solver_run, result.schedule
-                )
-                Assignment.objects.bulk_create(assignments)
+                self._set_phase("extracting")
+                write_stats = self._write_assignments(solver_run, result.schedule)
                 solver_run.status = "completed"
                 solver_run.result_json = {
                     "status": result.status_name,
                     "objective_value": result.objective_value,
                     "solve_time_seconds": result.solve_time_seconds,
-                    "assignment_count": len(assignments),
+                    **write_stats,
+                    **self._action_result(solver_run, result),
                 }
+                if "coverage_gaps" in result.statistics:
+                    solver_run.result_json["coverage_gaps"] = result.statistics[
+                        "coverage_gaps"
+                    ]
             else:
                 solver_run.status = "failed"
                 solver_run.error_message = f"Solver status: {result.status_name}"
+                solver_run.result_json = {
+                    "status": result.status_name,
+                    "solve_time_seconds": result.solve_time_seconds,
+                    "feasibility_issues": result.feasibility_issues or [],
+                    **self._action_result(solver_run, result),
+                }
+
+            if result.search_timeline is not None:
+                solver_run.result_json["search_timeline"] = (
+                    result.search_timeline.to_dict()
+                )
+            if "cp_sat" in result.statistics:
+                solver_run.result_json["cp_sat"] = result.statistics["cp_sat"]
+            if "cores" in result.statistics:
+                solver_run.result_json["cores"] = result.statistics["cores"]
 
             solver_run.progress_percent = 100
             solver_run.completed_at = timezone.now()
@@ -190,3 +388,5 @@ class SolverRunner:
             solver_run.save()
         finally:
             self._unregister(self.solver_run_id)
+            ProgressBus.publish(self.solver_run_id, {"phase": "done"})
+            ProgressBus.discard(self.solver_run_id)
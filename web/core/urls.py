@@ -49,11 +49,14 @@ from core.views.shift_views import (
     shift_update,
 )
 from core.views.solver_views import (
+    solve_alternatives,
     solve_cancel,
     solve_launch,
     solve_launch_modal,
     solve_progress,
     solve_progress_bar,
+    solve_progress_stream,
+    solve_repair,
     solve_results,
     solve_validation,
 )
@@ -130,6 +133,11 @@ urlpatterns = [
         solve_progress_bar,
         name="solve-progress-bar",
     ),
+    path(
+        "solver-runs/<int:pk>/progress/stream/",
+        solve_progress_stream,
+        name="solve-progress-stream",
+    ),
     path(
         "solver-runs/<int:pk>/results/", solve_results, name="solve-results"
     ),
@@ -143,6 +151,16 @@ urlpatterns = [
         solve_validation,
         name="solve-validation",
     ),
+    path(
+        "solver-runs/<int:pk>/repair/",
+        solve_repair,
+        name="solve-repair",
+    ),
+    path(
+        "solver-runs/<int:pk>/alternatives/",
+        solve_alternatives,
+        name="solve-alternatives",
+    ),
     path(
         "solver-runs/<int:pk>/schedule/",
         schedule_view,
@@ -1,12 +1,21 @@
 """Schedule visualization views with FullCalendar integration."""
 
 import datetime
+import hashlib
 
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, render
+from django.views.decorators.http import condition
 
 from core.models import ShiftType, SolverRun, Worker
 
+# Default and maximum number of events returned per page
+EVENTS_PAGE_SIZE = 2000
+EVENTS_MAX_PAGE_SIZE = 10000
+
+# Runs whose assignments can no longer change (safe to cache by ETag)
+IMMUTABLE_RUN_STATUSES = ("completed", "cancelled")
+
 # Consistent color palette for shift categories
 CATEGORY_COLORS = [
     "#3b82f6",  # blue
@@ -55,12 +64,81 @@ def schedule_view(request: HttpRequest, pk: int) -> HttpResponse:
     )
 
 
+def _parse_range_date(value: str | None) -> datetime.date | None:
+    """Parse a FullCalendar range boundary (ISO date or datetime) to a date.
+
+    Raises:
+        ValueError: If the value is not an ISO date/datetime
+    """
+    if not value:
+        return None
+    return datetime.date.fromisoformat(value[:10])
+
+
+def _parse_page_param(value: str | None, default: int, maximum: int) -> int:
+    """Parse a non-negative integer pagination param, clamped to maximum.
+
+    Raises:
+        ValueError: If the value is not a non-negative integer
+    """
+    if value is None or value == "":
+        return default
+    parsed = int(value)
+    if parsed < 0:
+        raise ValueError(f"expected a non-negative integer, got {value}")
+    return min(parsed, maximum)
+
+
+def _schedule_events_etag(request: HttpRequest, pk: int) -> str | None:
+    """Return an ETag for immutable (finished) runs, None otherwise.
+
+    Assignments of completed or cancelled runs never change, so the run id,
+    its completion timestamp and the query string identify the payload.
+    """
+    run = (
+        SolverRun.objects.filter(pk=pk)
+        .values_list("status", "completed_at")
+        .first()
+    )
+    if run is None or run[0] not in IMMUTABLE_RUN_STATUSES:
+        return None
+    completed_at = run[1].isoformat() if run[1] else ""
+    key = f"{pk}:{completed_at}:{request.GET.urlencode()}"
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+@condition(etag_func=_schedule_events_etag)
 def schedule_events(request: HttpRequest, pk: int) -> HttpResponse:
-    """Return schedule assignments as FullCalendar-compatible JSON events."""
+    """Return schedule assignments for the visible range as JSON events.
+
+    Query params:
+        start: range start (ISO date/datetime, inclusive)
+        end: range end (ISO date/datetime, exclusive, as sent by FullCalendar)
+        worker_id: filter by worker primary key
+        shift_type_id: filter by shift type primary key
+        limit: page size (default EVENTS_PAGE_SIZE, max EVENTS_MAX_PAGE_SIZE)
+        offset: number of events to skip
+        format: "compact" for deduplicated lookup tables, otherwise a
+            FullCalendar event list (next page offset in X-Next-Offset)
+    """
     solver_run = get_object_or_404(SolverRun, pk=pk)
-    assignments = solver_run.assignments.select_related(
-        "worker", "shift_type"
-    ).all()
+    assignments = solver_run.assignments.all()
+
+    try:
+        range_start = _parse_range_date(request.GET.get("start"))
+        range_end = _parse_range_date(request.GET.get("end"))
+        limit = _parse_page_param(
+            request.GET.get("limit"), EVENTS_PAGE_SIZE, EVENTS_MAX_PAGE_SIZE
+        )
+        offset = _parse_page_param(request.GET.get("offset"), 0, 2**31)
+    except ValueError as e:
+        return JsonResponse({"error": f"Invalid query parameter: {e}"}, status=400)
+
+    # Restrict to the visible date range
+    if range_start is not None:
+        assignments = assignments.filter(date__gte=range_start)
+    if range_end is not None:
+        assignments = assignments.filter(date__lt=range_end)
 
     # Apply filters
     worker_id = request.GET.get("worker_id")
@@ -71,6 +149,15 @@ def schedule_events(request: HttpRequest, pk: int) -> HttpResponse:
     if shift_type_id:
         assignments = assignments.filter(shift_type_id=shift_type_id)
 
+    # Fetch one extra row to detect whether another page follows
+    rows = list(
+        assignments.order_by("date", "pk").values_list(
+            "worker_id", "shift_type_id", "date"
+        )[offset : offset + limit + 1]
+    )
+    next_offset = offset + limit if len(rows) > limit else None
+    rows = rows[:limit]
+
     # Build category color map
     categories = list(
         ShiftType.objects.filter(
@@ -82,15 +169,50 @@ def schedule_events(request: HttpRequest, pk: int) -> HttpResponse:
         .distinct()
     )
 
+    # Deduplicated lookups for the workers and shift types on this page
+    workers = {
+        w.pk: w
+        for w in Worker.objects.filter(pk__in={row[0] for row in rows}).only(
+            "pk", "name"
+        )
+    }
+    shifts = {
+        st.pk: st
+        for st in ShiftType.objects.filter(pk__in={row[1] for row in rows}).only(
+            "pk", "name", "category", "start_time", "duration_hours"
+        )
+    }
+
+    if request.GET.get("format") == "compact":
+        return JsonResponse(
+            {
+                "workers": {pk: {"name": w.name} for pk, w in workers.items()},
+                "shift_types": {
+                    pk: {
+                        "name": st.name,
+                        "category": st.category or "Uncategorized",
+                        "color": _color_for_category(
+                            st.category or "Uncategorized", categories
+                        ),
+                        "start_time": st.start_time.strftime("%H:%M"),
+                        "duration_hours": st.duration_hours,
+                    }
+                    for pk, st in shifts.items()
+                },
+                "events": [
+                    [w_pk, st_pk, day.isoformat()] for w_pk, st_pk, day in rows
+                ],
+                "next_offset": next_offset,
+            }
+        )
+
     events = []
-    for assignment in assignments:
-        shift = assignment.shift_type
-        worker = assignment.worker
+    for w_pk, st_pk, day in rows:
+        shift = shifts[st_pk]
+        worker = workers[w_pk]
 
         # Calculate start/end datetime
-        start_dt = datetime.datetime.combine(
-            assignment.date, shift.start_time
-        )
+        start_dt = datetime.datetime.combine(day, shift.start_time)
         end_dt = start_dt + datetime.timedelta(hours=shift.duration_hours)
 
         category = shift.category or "Uncategorized"
@@ -112,4 +234,7 @@ def schedule_events(request: HttpRequest, pk: int) -> HttpResponse:
             }
         )
 
-    return JsonResponse(events, safe=False)
+    response = JsonResponse(events, safe=False)
+    if next_offset is not None:
+        response["X-Next-Offset"] = str(next_offset)
+    return response
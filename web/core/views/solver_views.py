@@ -1,13 +1,34 @@
 """Solver execution views: launch, progress tracking, and results."""
 
-from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
+from django.urls import reverse
 
 from core.converters import build_schedule_input, solver_run_to_schedule
 from core.models import ScheduleRequest, SolverRun, SolverSettings, Worker
+from core.progress_bus import ProgressBus
 from core.solver_runner import SolverRunner
 from shift_solver.validation.schedule_validator.validator import ScheduleValidator
 
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# Seconds a progress stream waits for a published update before re-reading
+# the database checkpoint (covers runs executing in another process)
+PROGRESS_STREAM_HEARTBEAT_SECONDS = 15.0
+
+# Maximum lifetime of one progress stream; EventSource reconnects on close
+PROGRESS_STREAM_MAX_SECONDS = 300.0
+
 
 def _is_htmx(request: HttpRequest) -> bool:
     """Check if the request was made via HTMX."""
@@ -108,7 +129,7 @@ def solve_progress_bar(request: HttpRequest, pk: int) -> HttpResponse:
     """Return progress bar partial for HTMX polling."""
     solver_run = get_object_or_404(SolverRun, pk=pk)
 
-    if solver_run.status in ("completed", "failed", "cancelled"):
+    if solver_run.status in TERMINAL_STATUSES:
         response = render(
             request,
             "solver/solve_progress_bar.html",
@@ -124,6 +145,58 @@ def solve_progress_bar(request: HttpRequest, pk: int) -> HttpResponse:
     )
 
 
+def _sse_event(event: str, data: str) -> str:
+    """Format a Server-Sent Event, prefixing every data line."""
+    lines = "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+    return f"event: {event}\n{lines}\n"
+
+
+def _progress_events(request: HttpRequest, solver_run: SolverRun) -> Iterator[str]:
+    """Yield rendered progress bar updates until the run finishes."""
+
+    def render_bar() -> str:
+        return render_to_string(
+            "solver/solve_progress_bar.html", {"run": solver_run}, request=request
+        )
+
+    yield _sse_event("progress", render_bar())
+
+    version = 0
+    deadline = time.monotonic() + PROGRESS_STREAM_MAX_SECONDS
+    while solver_run.status not in TERMINAL_STATUSES:
+        if time.monotonic() >= deadline:
+            return
+        update = ProgressBus.wait_for_update(
+            solver_run.pk, version, timeout=PROGRESS_STREAM_HEARTBEAT_SECONDS
+        )
+        if update is not None and update[1].get("phase") != "done":
+            version, solver_run.progress_json = update
+            yield _sse_event("progress", render_bar())
+            continue
+
+        # Heartbeat, run finished, or no in-process publisher: use the DB
+        solver_run.refresh_from_db(fields=["status", "progress_json"])
+        yield _sse_event("progress", render_bar())
+
+    yield _sse_event("done", "")
+
+
+def solve_progress_stream(request: HttpRequest, pk: int) -> HttpResponse:
+    """Stream solver progress as Server-Sent Events.
+
+    Emits ``progress`` events carrying the rendered progress bar partial,
+    fed from the in-process ProgressBus, and a final ``done`` event once
+    the run reaches a terminal status.
+    """
+    solver_run = get_object_or_404(SolverRun, pk=pk)
+    response = StreamingHttpResponse(
+        _progress_events(request, solver_run), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 def solve_cancel(request: HttpRequest, pk: int) -> HttpResponse:
     """Cancel a running solver run."""
     if request.method != "POST":
@@ -156,6 +229,12 @@ def solve_results(request: HttpRequest, pk: int) -> HttpResponse:
     objective_value = result_json.get("objective_value")
     status_name = result_json.get("status", solver_run.status)
     solutions_found = result_json.get("solutions_found")
+    repair = result_json.get("repair")
+    feasibility_issues = result_json.get("feasibility_issues", [])
+    alternatives = _alternatives_of(solver_run)
+    alternative = result_json.get("alternative")
+    coverage_gaps = result_json.get("coverage_gaps")
+    search_progress = _search_progress(result_json.get("search_timeline"))
 
     # Count assignments by shift type
     shift_counts: dict[str, int] = {}
@@ -180,10 +259,146 @@ def solve_results(request: HttpRequest, pk: int) -> HttpResponse:
             "shift_counts": shift_counts,
             "solutions_found": solutions_found,
             "has_solution": has_solution,
+            "repair": repair,
+            "repair_unchanged": request.GET.get("repair") == "unchanged",
+            "feasibility_issues": feasibility_issues,
+            "alternatives": alternatives,
+            "alternative": alternative,
+            "coverage_gaps": coverage_gaps,
+            "search_progress": search_progress,
         },
     )
 
 
+def _search_progress(data: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Chart and subsolver tables for a stored search timeline."""
+    if not data:
+        return None
+    from shift_solver.io.plotly_handler.charts.search_progress import (
+        create_search_progress_chart,
+    )
+    from shift_solver.solver.search_log import SearchTimeline
+
+    timeline = SearchTimeline.from_dict(data)
+    fig = create_search_progress_chart(timeline)
+    improvements = timeline.improvements_by_subsolver()
+    subsolvers = sorted(set(improvements) | set(timeline.solutions_by_subsolver))
+    return {
+        "chart_html": fig.to_html(include_plotlyjs="cdn", full_html=False),
+        "presolve_seconds": timeline.presolve_seconds,
+        "num_workers": timeline.num_workers,
+        "best_bound": timeline.best_bound,
+        "subsolvers": [
+            {
+                "name": name,
+                "improvements": improvements.get(name, 0),
+                "solutions": timeline.solutions_by_subsolver.get(name, 0),
+            }
+            for name in subsolvers
+        ],
+        "lns": [
+            {
+                "name": name,
+                "improvements": stats.improvements,
+                "calls": stats.calls,
+            }
+            for name, stats in sorted(timeline.lns.items())
+            if stats.calls
+        ],
+    }
+
+
+def solve_repair(request: HttpRequest, pk: int) -> HttpResponse:
+    """Repair a completed run against the current availability records.
+
+    Only periods where the schedule now conflicts with availability are
+    re-optimized, changing as few assignments as possible. The repair runs
+    in the background as a new run; when nothing conflicts no run is
+    created and the source results page says so.
+    """
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+
+    solver_run = get_object_or_404(SolverRun, pk=pk)
+    if solver_run.status != "completed":
+        return redirect("solve-results", pk=solver_run.pk)
+
+    from shift_solver.solver.repair import ScheduleRepairer
+    from shift_solver.solver.shift_solver import ShiftSolver
+
+    schedule_input = build_schedule_input(solver_run.schedule_request)
+    solver = ShiftSolver(
+        workers=schedule_input["workers"],
+        shift_types=schedule_input["shift_types"],
+        period_dates=schedule_input["period_dates"],
+        schedule_id=schedule_input["schedule_id"],
+        constraint_configs=schedule_input["constraint_configs"],
+        requests=schedule_input.get("requests"),
+    )
+    affected = ScheduleRepairer(solver).affected_periods(
+        solver_run_to_schedule(solver_run),
+        schedule_input.get("availabilities") or [],
+    )
+    if not affected:
+        url = reverse("solve-results", kwargs={"pk": solver_run.pk})
+        return redirect(f"{url}?repair=unchanged")
+
+    repair_run = SolverRun.objects.create(
+        schedule_request=solver_run.schedule_request, status="pending"
+    )
+    runner = SolverRunner(
+        solver_run_id=repair_run.id, action="repair", source_run_id=solver_run.id
+    )
+    runner.run()
+
+    return redirect("solve-progress", pk=repair_run.pk)
+
+
+def solve_alternatives(request: HttpRequest, pk: int) -> HttpResponse:
+    """Collect alternative schedules for the request of a completed run.
+
+    One pooled search runs in the background and finds several good
+    schedules that pairwise differ in a minimum number of assignments
+    (see core.solver_runner). Each is saved as a new run pointing back at the source
+    run, whose results page lists them.
+    """
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+
+    solver_run = get_object_or_404(SolverRun, pk=pk)
+    if solver_run.status != "completed":
+        return redirect("solve-results", pk=solver_run.pk)
+
+    alternatives_run = SolverRun.objects.create(
+        schedule_request=solver_run.schedule_request, status="pending"
+    )
+    runner = SolverRunner(
+        solver_run_id=alternatives_run.id,
+        action="alternatives",
+        source_run_id=solver_run.id,
+    )
+    runner.run()
+
+    return redirect("solve-progress", pk=alternatives_run.pk)
+
+
+def _alternatives_of(solver_run: SolverRun) -> list[dict[str, Any]]:
+    """Runs created by the alternatives action for a source run."""
+    runs = SolverRun.objects.filter(
+        result_json__alternative__source_run=solver_run.pk
+    ).order_by("pk")
+    return [
+        {
+            "run": run.pk,
+            "status": run.status,
+            "rank": run.result_json["alternative"]["rank"],
+            "objective_value": run.result_json.get("objective_value"),
+            "distance_to_best": run.result_json["alternative"]["distance_to_best"],
+        }
+        for run in runs
+    ]
+
+
 def solve_validation(request: HttpRequest, pk: int) -> HttpResponse:
     """Show post-solve validation results for a solver run."""
     solver_run = get_object_or_404(SolverRun, pk=pk)
@@ -16,9 +16,16 @@ document.addEventListener("DOMContentLoaded", function () {
     var workerFilter = document.getElementById("worker-filter");
     var shiftTypeCheckboxes = document.querySelectorAll(".shift-type-filter");
 
-    function buildEventsUrl() {
+    function buildEventsUrl(info, offset) {
         var url = eventsUrl + "?";
-        var params = [];
+        var params = ["format=compact"];
+
+        // Only request the visible date range
+        params.push("start=" + encodeURIComponent(info.startStr.slice(0, 10)));
+        params.push("end=" + encodeURIComponent(info.endStr.slice(0, 10)));
+        if (offset) {
+            params.push("offset=" + offset);
+        }
 
         if (workerFilter && workerFilter.value) {
             params.push("worker_id=" + encodeURIComponent(workerFilter.value));
@@ -49,6 +56,56 @@ document.addEventListener("DOMContentLoaded", function () {
         return url + params.join("&");
     }
 
+    function pad(n) {
+        return n < 10 ? "0" + n : "" + n;
+    }
+
+    // Expand a compact [worker, shift_type, date] row into a FullCalendar event
+    function expandEvent(row, workers, shiftTypes) {
+        var worker = workers[row[0]];
+        var shift = shiftTypes[row[1]];
+        var startStr = row[2] + "T" + shift.start_time + ":00";
+        var start = new Date(startStr);
+        var end = new Date(start.getTime() + shift.duration_hours * 3600000);
+        var endStr =
+            end.getFullYear() + "-" + pad(end.getMonth() + 1) + "-" +
+            pad(end.getDate()) + "T" + pad(end.getHours()) + ":" +
+            pad(end.getMinutes()) + ":00";
+
+        return {
+            title: worker.name + " - " + shift.name,
+            start: startStr,
+            end: endStr,
+            color: shift.color,
+            extendedProps: {
+                worker_id: row[0],
+                worker_name: worker.name,
+                shift_type: shift.name,
+                shift_type_id: row[1],
+                shift_category: shift.category,
+            },
+        };
+    }
+
+    // Fetch all pages for the visible range
+    function fetchEvents(info, offset, collected) {
+        return fetch(buildEventsUrl(info, offset))
+            .then(function (response) {
+                return response.json();
+            })
+            .then(function (page) {
+                page.events.forEach(function (row) {
+                    collected.push(
+                        expandEvent(row, page.workers, page.shift_types)
+                    );
+                });
+                if (page.next_offset !== null) {
+                    return fetchEvents(info, page.next_offset, collected);
+                }
+                return collected;
+            });
+    }
+
     var calendar = new FullCalendar.Calendar(calendarEl, {
         initialView: "dayGridMonth",
         initialDate: initialDate || undefined,
@@ -58,10 +115,7 @@ document.addEventListener("DOMContentLoaded", function () {
             right: "dayGridMonth,timeGridWeek,timeGridDay,listMonth",
         },
         events: function (info, successCallback, failureCallback) {
-            fetch(buildEventsUrl())
-                .then(function (response) {
-                    return response.json();
-                })
+            fetchEvents(info, 0, [])
                 .then(function (data) {
                     // Client-side filtering for multiple shift types
                     var checkedTypes = [];